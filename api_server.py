@@ -3,6 +3,7 @@ MJU Univ Auth API Server (v2)
 FastAPI를 사용하여 명지대학교 학생 인증 API를 제공합니다.
 저수준 컴포넌트(Authenticator, Fetcher)를 사용하여 세션 관리 및 데이터 조회의 유연성을 확보합니다.
 """
+import os
 import time
 import uuid
 import hashlib
@@ -11,11 +12,11 @@ import random
 import anyio
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple, TypeVar, Generic
+from typing import Dict, Any, List, Optional, Tuple, TypeVar, Generic
 from importlib.metadata import version
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from loguru import logger
@@ -38,6 +39,14 @@ from mju_univ_auth import (
 from mju_univ_auth import (
     # authenticator
     StandardAuthenticator,
+    LoginContextPool,
+    SessionKeyPool,
+    use_session_key_pool,
+    use_parser_backend,
+    ParseCache,
+    use_parse_cache,
+    ParsePool,
+    use_parse_pool,
     # fetcher
     StudentBasicInfoFetcher,
     StudentChangeLogFetcher,
@@ -104,6 +113,47 @@ except Exception:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # --- [Startup: 서버 시작 시 실행] ---
+    # 로그인 컨텍스트 풀: 로그인 페이지를 미리 받아 두어 로그인 1단계 왕복을 숨깁니다. (설정 시에만)
+    if Config.LOGIN_CONTEXT_POOL_SIZE > 0:
+        auth_service.context_pool = LoginContextPool(
+            services=('msi',),
+            size=Config.LOGIN_CONTEXT_POOL_SIZE,
+            ttl=Config.LOGIN_CONTEXT_TTL_SECONDS,
+            stream_pages=Config.STREAM_PAGES,
+        )
+        auth_service.context_pool.start()
+        logger.info(
+            f"✅ Login context pool started (size={Config.LOGIN_CONTEXT_POOL_SIZE}, "
+            f"ttl={Config.LOGIN_CONTEXT_TTL_SECONDS}s)"
+        )
+
+    # 세션키 풀: 로그인마다 하는 세션키 생성(PBKDF2)을 백그라운드 스레드가 미리 해 둡니다. (설정 시에만)
+    if Config.SESSION_KEY_POOL_SIZE > 0:
+        auth_service.session_key_pool = SessionKeyPool(size=Config.SESSION_KEY_POOL_SIZE)
+        auth_service.session_key_pool.start()
+        use_session_key_pool(auth_service.session_key_pool)
+        logger.info(f"✅ Session key pool started (size={Config.SESSION_KEY_POOL_SIZE})")
+
+    use_parser_backend(Config.PARSER_BACKEND)
+    logger.info(f"✅ Parser backend: {Config.PARSER_BACKEND}")
+
+    # 파싱 결과 메모 캐시: 바이트 단위로 같은 본문은 다시 파싱하지 않습니다. (설정 시에만)
+    if Config.PARSE_CACHE_SIZE > 0:
+        auth_service.parse_cache = ParseCache(
+            max_entries=Config.PARSE_CACHE_SIZE,
+            max_bytes=Config.PARSE_CACHE_MB * 1024 * 1024,
+        )
+        use_parse_cache(auth_service.parse_cache)
+        logger.info(f"✅ Parse cache enabled (entries={Config.PARSE_CACHE_SIZE}, {Config.PARSE_CACHE_MB}MB)")
+
+    # 파싱 프로세스 풀: 페이지 파싱을 워커 프로세스에서 하고, 포화되면 요청 스레드에서 합니다. (설정 시에만)
+    if Config.PARSE_POOL_WORKERS > 0:
+        auth_service.parse_pool = ParsePool(workers=Config.PARSE_POOL_WORKERS, max_queue=Config.PARSE_POOL_QUEUE)
+        auth_service.parse_pool.start()
+        use_parse_pool(auth_service.parse_pool)
+        metrics = auth_service.parse_pool.metrics()
+        logger.info(f"✅ Parse pool started (workers={metrics.workers}, max_queue={metrics.max_queue})")
+
     # AnyIO(FastAPI 비동기 엔진)의 기본 스레드 풀 제한을 가져옵니다.
     limiter = anyio.to_thread.current_default_thread_limiter()
     
@@ -116,6 +166,40 @@ async def lifespan(app: FastAPI):
     
     # --- [Shutdown: 서버 종료 시 실행] ---
     logger.info("⛔ Server shutting down...")
+    if auth_service.context_pool is not None:
+        metrics = auth_service.context_pool.metrics()
+        logger.info(
+            f"Login context pool: hit_rate={metrics.hit_rate:.2%}, "
+            f"mean_age_at_use={metrics.mean_age_at_use:.1f}s, expired={metrics.expired}"
+        )
+        auth_service.context_pool.close()
+        auth_service.context_pool = None
+    if auth_service.session_key_pool is not None:
+        metrics = auth_service.session_key_pool.metrics()
+        logger.info(
+            f"Session key pool: hit_rate={metrics.hit_rate:.2%}, "
+            f"exhausted={metrics.exhausted}, min_ready={metrics.min_ready}"
+        )
+        use_session_key_pool(None)
+        auth_service.session_key_pool.close()
+        auth_service.session_key_pool = None
+    if auth_service.parse_cache is not None:
+        metrics = auth_service.parse_cache.metrics()
+        logger.info(
+            f"Parse cache: hit_rate={metrics.hit_rate:.2%}, "
+            f"entries={metrics.entries}, evictions={metrics.evictions}"
+        )
+        use_parse_cache(None)
+        auth_service.parse_cache = None
+    if auth_service.parse_pool is not None:
+        metrics = auth_service.parse_pool.metrics()
+        logger.info(
+            f"Parse pool: utilization={metrics.utilization:.2%}, "
+            f"fallbacks={metrics.fallbacks}, max_queue_depth={metrics.max_queue_depth}"
+        )
+        use_parse_pool(None)
+        auth_service.parse_pool.close()
+        auth_service.parse_pool = None
 
 
 app = FastAPI(
@@ -129,6 +213,8 @@ app = FastAPI(
 class AuthRequest(BaseModel):
     user_id: str
     user_pw: str
+    # 조회할 필드 경로 (예: ["student_profile.student_id"]). 없으면 전부 조회
+    fields: Optional[List[str]] = None
 
 T = TypeVar('T')
 
@@ -203,6 +289,21 @@ class MockProvider:
 class Config:
     SESSION_TIMEOUT_SECONDS = 1800  # 30분
     DATA_CACHE_TIMEOUT_SECONDS = 1200  # 20분
+    # 미리 받아 둘 로그인 컨텍스트 수 (0이면 사용하지 않음)
+    LOGIN_CONTEXT_POOL_SIZE = int(os.getenv("MJU_LOGIN_CONTEXT_POOL_SIZE", "0"))
+    LOGIN_CONTEXT_TTL_SECONDS = float(os.getenv("MJU_LOGIN_CONTEXT_TTL_SECONDS", "60"))
+    # 미리 생성해 둘 세션키 수 (0이면 사용하지 않음)
+    SESSION_KEY_POOL_SIZE = int(os.getenv("MJU_SESSION_KEY_POOL_SIZE", "0"))
+    # 로그인 페이지를 공개키/CSRF 토큰/폼 액션이 나올 때까지만 읽을지 여부
+    STREAM_PAGES = os.getenv("MJU_STREAM_PAGES", "0") == "1"
+    # HTML 파서 백엔드 (bs4/lxml, HTMLParser 폴백과 Fetcher 페이지 파싱에 사용. 모든 페이지를 지원해야 함)
+    PARSER_BACKEND = os.getenv("MJU_PARSER_BACKEND", "lxml")
+    # 파싱 결과 메모 캐시 항목 수 (0이면 사용하지 않음)와 결과 크기 합 상한 (MB)
+    PARSE_CACHE_SIZE = int(os.getenv("MJU_PARSE_CACHE_SIZE", "0"))
+    PARSE_CACHE_MB = int(os.getenv("MJU_PARSE_CACHE_MB", "32"))
+    # 파싱 워커 프로세스 수 (0이면 사용하지 않음)와 빈 워커를 기다리게 할 최대 파싱 수 (비우면 워커 수와 같음)
+    PARSE_POOL_WORKERS = int(os.getenv("MJU_PARSE_POOL_WORKERS", "0"))
+    PARSE_POOL_QUEUE = int(os.getenv("MJU_PARSE_POOL_QUEUE") or PARSE_POOL_WORKERS)
 
 class PasswordManager:
     """비밀번호 해싱 및 검증을 담당합니다."""
@@ -322,9 +423,21 @@ class MjuAuthService:
     인증 및 데이터 조회를 위한 핵심 서비스.
     세션 및 데이터 캐싱과 저수준 컴포넌트 호출을 관리합니다.
     """
-    def __init__(self, session_cache: SessionCache, data_cache: DataCache):
+    def __init__(
+        self,
+        session_cache: SessionCache,
+        data_cache: DataCache,
+        context_pool: Optional[LoginContextPool] = None,
+        session_key_pool: Optional[SessionKeyPool] = None,
+        parse_cache: Optional[ParseCache] = None,
+        parse_pool: Optional[ParsePool] = None,
+    ):
         self._session_cache = session_cache
         self._data_cache = data_cache
+        self.context_pool = context_pool
+        self.session_key_pool = session_key_pool
+        self.parse_cache = parse_cache
+        self.parse_pool = parse_pool
 
     def _raise_from_result(self, result):
         """결과 객체를 기반으로 특정 예외를 발생시킵니다."""
@@ -369,7 +482,9 @@ class MjuAuthService:
 
             self._session_cache.invalidate(user_id)
             
-            authenticator = StandardAuthenticator(user_id=user_id, user_pw=user_pw)
+            authenticator = StandardAuthenticator(
+                user_id=user_id, user_pw=user_pw, context_pool=self.context_pool, stream_pages=Config.STREAM_PAGES,
+            )
             login_result = authenticator.login(service='msi')
 
             if not login_result.success:
@@ -382,21 +497,52 @@ class MjuAuthService:
             self._session_cache.set(user_id, session, password_hash)
             return session
 
-    def _fetch_with_retry(self, user_id: str, password: str, fetcher_cls, **kwargs):
-        """데이터 조회를 재시도 로직과 함께 수행합니다."""
+    def _reauthenticate(self, user_id: str, user_pw: str, session: Session) -> Optional[Session]:
+        """
+        서비스 세션이 만료된 세션을 SSO 세션 쿠키로 조용히 복구합니다.
+        비밀번호 암호화/로그인 POST 없이 msi의 auth_url 리다이렉트 체인만 다시 따라가며,
+        SSO 세션까지 만료되었으면 같은 세션으로 자격 증명 로그인을 수행합니다.
+        복구하지 못하면 None을 반환합니다.
+        """
+        password_hash = PasswordManager.hash_password(user_pw)
+
+        with self._session_cache.get_lock(user_id):
+            authenticator = StandardAuthenticator(user_id=user_id, user_pw=user_pw)
+            reauth_result = authenticator.reauthenticate(session, service='msi')
+
+            if not reauth_result.success:
+                if getattr(reauth_result, 'error_code', None) == ErrorCode.INVALID_CREDENTIALS_ERROR:
+                    self._session_cache.invalidate(user_id)
+                    self._data_cache.invalidate_user(user_id)
+                    self._raise_from_result(reauth_result)
+                return None
+
+            self._session_cache.set(user_id, session, password_hash)
+            return session
+
+    def _fetch_with_retry(self, user_id: str, password: str, fetcher_cls, fields=None, **kwargs):
+        """데이터 조회를 재시도 로직과 함께 수행합니다. (fields는 Fetcher.fetch(fields)의 필드 프로젝션)"""
         try:
             session = self._get_valid_session(user_id, password)
             fetcher = fetcher_cls(session=session, **kwargs)
-            result = fetcher.fetch()
+            result = fetcher.fetch(fields)
 
             if result.success:
                 return result.data
 
-            # 세션 만료 등으로 조회가 실패했을 수 있으므로 세션을 무효화하고 재시도합니다.
+            # 서비스 세션이 만료되었으면 먼저 SSO 세션 쿠키로 조용히 재인증하여 재시도합니다.
+            if getattr(result, 'error_code', None) == ErrorCode.SESSION_EXPIRED_ERROR:
+                reauthenticated = self._reauthenticate(user_id, password, session)
+                if reauthenticated is not None:
+                    result = fetcher_cls(session=reauthenticated, **kwargs).fetch(fields)
+                    if result.success:
+                        return result.data
+
+            # 세션 만료 등으로 조회가 실패했을 수 있으므로 세션을 무효화하고 전체 로그인으로 재시도합니다.
             self._session_cache.invalidate(user_id)
             session = self._get_valid_session(user_id, password)
             fetcher = fetcher_cls(session=session, **kwargs)
-            result = fetcher.fetch()
+            result = fetcher.fetch(fields)
 
             if result.success:
                 return result.data
@@ -406,6 +552,15 @@ class MjuAuthService:
         except MjuUnivAuthError as e:
             raise e
     
+    @staticmethod
+    def _data_type(name: str, fetcher_cls, fields: Optional[List[str]]) -> str:
+        """데이터 캐시 키 (필드 프로젝션 결과는 전체 결과와 따로 저장). 모델에 없는 필드면 422"""
+        try:
+            parts = fetcher_cls.page_parts(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e))
+        return name if parts is None else f"{name}:{','.join(sorted(set(fields)))}"
+
     # Helper method
     def _is_test_user(self, user_id: str) -> bool:
         return user_id.startswith("TEST_")
@@ -424,14 +579,14 @@ class MjuAuthService:
         )
         test_logger.info(message)
     
-    def get_student_basicinfo(self, user_id: str, user_pw: str) -> StudentBasicInfo:
+    def get_student_basicinfo(self, user_id: str, user_pw: str, fields: Optional[List[str]] = None) -> StudentBasicInfo:
         # [Test Hook]
         if self._is_test_user(user_id):
             return MockProvider.get_basic_info(user_id)
         
         """학적기본정보를 조회하고 결과를 캐싱합니다."""
         password_hash = PasswordManager.hash_password(user_pw)
-        data_type = "student-basicinfo"
+        data_type = self._data_type("student-basicinfo", StudentBasicInfoFetcher, fields)
 
         with self._data_cache.get_lock(user_id):
             cached_entry = self._data_cache.get(user_id, data_type)
@@ -439,12 +594,12 @@ class MjuAuthService:
                 return cached_entry["data"]
 
             data = self._fetch_with_retry(
-                user_id, user_pw, StudentBasicInfoFetcher
+                user_id, user_pw, StudentBasicInfoFetcher, fields
             )
             self._data_cache.set(user_id, data_type, data, password_hash)
             return data
 
-    def get_student_changelog(self, user_id: str, user_pw: str) -> StudentChangeLog:
+    def get_student_changelog(self, user_id: str, user_pw: str, fields: Optional[List[str]] = None) -> StudentChangeLog:
         # [Test Hook]
         if self._is_test_user(user_id):
             return MockProvider.get_basic_info(user_id)
@@ -452,7 +607,7 @@ class MjuAuthService:
         
         """학적변동내역을 조회하고 결과를 캐싱합니다."""
         password_hash = PasswordManager.hash_password(user_pw)
-        data_type = "student-changelog"
+        data_type = self._data_type("student-changelog", StudentChangeLogFetcher, fields)
 
         with self._data_cache.get_lock(user_id):
             cached_entry = self._data_cache.get(user_id, data_type)
@@ -460,12 +615,12 @@ class MjuAuthService:
                 return cached_entry["data"]
 
             data = self._fetch_with_retry(
-                user_id, user_pw, StudentChangeLogFetcher
+                user_id, user_pw, StudentChangeLogFetcher, fields
             )
             self._data_cache.set(user_id, data_type, data, password_hash)
             return data
 
-    def get_student_card(self, user_id: str, user_pw: str) -> StudentCard:
+    def get_student_card(self, user_id: str, user_pw: str, fields: Optional[List[str]] = None) -> StudentCard:
         # [Test Hook]
         if self._is_test_user(user_id):
             return MockProvider.get_basic_info(user_id)
@@ -473,7 +628,7 @@ class MjuAuthService:
         
         """학생증 정보를 조회하고 결과를 캐싱합니다."""
         password_hash = PasswordManager.hash_password(user_pw)
-        data_type = "student-card"
+        data_type = self._data_type("student-card", StudentCardFetcher, fields)
 
         with self._data_cache.get_lock(user_id):
             cached_entry = self._data_cache.get(user_id, data_type)
@@ -481,7 +636,7 @@ class MjuAuthService:
                 return cached_entry["data"]
 
             data = self._fetch_with_retry(
-                user_id, user_pw, StudentCardFetcher, user_pw=user_pw
+                user_id, user_pw, StudentCardFetcher, fields, user_pw=user_pw
             )
             self._data_cache.set(user_id, data_type, data, password_hash)
             return data
@@ -607,6 +762,69 @@ def root():
     }
 
 
+@app.get("/api/v1/metrics/login-context-pool", summary="로그인 컨텍스트 풀 지표", include_in_schema=True)
+def get_login_context_pool_metrics():
+    """
+    로그인 컨텍스트 풀의 적중률과 사용 시점의 컨텍스트 나이(staleness)를 반환합니다.
+    풀을 사용하지 않으면(MJU_LOGIN_CONTEXT_POOL_SIZE=0) enabled=false를 반환합니다.
+    """
+    if auth_service.context_pool is None:
+        return {"enabled": False}
+    metrics = auth_service.context_pool.metrics()
+    return {
+        "enabled": True,
+        **vars(metrics),
+        "hit_rate": metrics.hit_rate,
+        "mean_age_at_use": metrics.mean_age_at_use,
+    }
+
+
+@app.get("/api/v1/metrics/session-key-pool", summary="세션키 풀 지표", include_in_schema=True)
+def get_session_key_pool_metrics():
+    """
+    세션키 풀의 적중률과 고갈 횟수를 반환합니다.
+    풀을 사용하지 않으면(MJU_SESSION_KEY_POOL_SIZE=0) enabled=false를 반환합니다.
+    """
+    if auth_service.session_key_pool is None:
+        return {"enabled": False}
+    metrics = auth_service.session_key_pool.metrics()
+    return {"enabled": True, **vars(metrics), "hit_rate": metrics.hit_rate}
+
+
+@app.get("/api/v1/metrics/parse-cache", summary="파싱 결과 메모 캐시 지표", include_in_schema=True)
+def get_parse_cache_metrics():
+    """
+    파싱 결과 메모 캐시의 적중률(전체/파싱 종류별)과 사용량을 반환합니다.
+    캐시를 사용하지 않으면(MJU_PARSE_CACHE_SIZE=0) enabled=false를 반환합니다.
+    """
+    if auth_service.parse_cache is None:
+        return {"enabled": False}
+    metrics = auth_service.parse_cache.metrics()
+    return {
+        "enabled": True,
+        **vars(metrics),
+        "hit_rate": metrics.hit_rate,
+        "hit_rate_by_kind": {kind: metrics.hit_rate_of(kind) for kind in metrics.misses_by_kind},
+    }
+
+
+@app.get("/api/v1/metrics/parse-pool", summary="파싱 프로세스 풀 지표", include_in_schema=True)
+def get_parse_pool_metrics():
+    """
+    파싱 프로세스 풀의 대기열 깊이와 워커 사용률, 요청 스레드 폴백 횟수를 반환합니다.
+    풀을 사용하지 않으면(MJU_PARSE_POOL_WORKERS=0) enabled=false를 반환합니다.
+    """
+    if auth_service.parse_pool is None:
+        return {"enabled": False}
+    metrics = auth_service.parse_pool.metrics()
+    return {
+        "enabled": True,
+        **vars(metrics),
+        "utilization": metrics.utilization,
+        "offload_rate": metrics.offload_rate,
+    }
+
+
 @app.post(
     "/api/v1/student-basicinfo",
     summary="학생 기본 정보 조회",
@@ -618,8 +836,9 @@ def get_student_basicinfo(req: AuthRequest):
     사용자 인증 후 학적변동내역을 조회합니다.
     - **user_id**: 학번
     - **user_pw**: 비밀번호
+    - **fields**: 조회할 필드 경로 목록 (선택, 없으면 전부. 빠진 필드는 파싱하지 않고 기본값)
     """
-    data = auth_service.get_student_basicinfo(req.user_id, req.user_pw)
+    data = auth_service.get_student_basicinfo(req.user_id, req.user_pw, req.fields)
     return {"data": data}
 
 
@@ -634,8 +853,9 @@ def get_student_changelog(req: AuthRequest):
     사용자 인증 후 학적변동내역을 조회합니다.
     - **user_id**: 학번
     - **user_pw**: 비밀번호
+    - **fields**: 조회할 필드 경로 목록 (선택, 없으면 전부. 빠진 필드는 파싱하지 않고 기본값)
     """
-    data = auth_service.get_student_changelog(req.user_id, req.user_pw)
+    data = auth_service.get_student_changelog(req.user_id, req.user_pw, req.fields)
     return {"data": data}
 
 @app.post(
@@ -649,8 +869,9 @@ def get_student_card(req: AuthRequest):
     사용자 인증 후 학생증 정보를 조회합니다.
     - **user_id**: 학번
     - **user_pw**: 비밀번호
+    - **fields**: 조회할 필드 경로 목록 (선택, 없으면 전부. 빠진 필드는 파싱하지 않고 기본값)
     """
-    data = auth_service.get_student_card(req.user_id, req.user_pw)
+    data = auth_service.get_student_card(req.user_id, req.user_pw, req.fields)
     return {"data": data}
 
 
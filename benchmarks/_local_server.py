@@ -0,0 +1,130 @@
+"""
+벤치마크용 로컬 대역 서버
+========================
+sso.mju.ac.kr / msi.mju.ac.kr 대신 사용할 로컬 HTTP(S) 서버입니다.
+새로 맺어진 TCP 커넥션 수를 세어, 커넥션 재사용 효과를 확인할 수 있습니다.
+"""
+
+import datetime
+import socket
+import ssl
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+# (status, body, extra headers)
+Route = Callable[[BaseHTTPRequestHandler], Tuple[int, bytes, Dict[str, str]]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive 허용
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.stats_lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        with self.server.stats_lock:
+            self.server.requests += 1
+
+        route = self.server.routes.get(self.path.split('?')[0]) or self.server.default_route
+        status, body, headers = route(self)
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Content-Type', headers.pop('Content-Type', 'text/html; charset=utf-8'))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+
+
+def _self_signed_context() -> ssl.SSLContext:
+    """localhost용 임시 자체 서명 인증서로 SSLContext 생성"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+
+    tmp = Path(tempfile.mkdtemp())
+    cert_path, key_path = tmp / 'cert.pem', tmp / 'key.pem'
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+class LocalServer:
+    """스레드에서 동작하는 로컬 대역 서버"""
+
+    def __init__(self, routes: Optional[Dict[str, Route]] = None, tls: bool = False):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.routes = routes or {}
+        self._server.default_route = lambda handler: (200, b'<html>ok</html>', {})
+        self._server.stats_lock = threading.Lock()
+        self._server.connections = 0
+        self._server.requests = 0
+        self.tls = tls
+        if tls:
+            context = _self_signed_context()
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        scheme = 'https' if self.tls else 'http'
+        return f"{scheme}://localhost:{self._server.server_address[1]}"
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    def reset_stats(self) -> None:
+        with self._server.stats_lock:
+            self._server.connections = 0
+            self._server.requests = 0
+
+    def __enter__(self) -> 'LocalServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,126 @@
+"""
+암호화 기본 연산 벤치마크
+========================
+로그인마다 실행되는 `generate_session_key`, `encrypt_with_rsa`, `encrypt_with_aes`의
+초당 처리량(ops/sec)과 p50/p99 지연을 1, 4, N(CPU 수) 스레드에서 측정합니다.
+
+스레드 수를 늘렸을 때의 처리량 비율(scaling)로 `cryptography` 호출이 GIL을 놓는지 확인합니다.
+- scaling이 min(스레드 수, CPU 수)에 가까우면 GIL을 놓고 병렬로 실행되는 것입니다.
+- scaling이 1 근처에 머물면 GIL에 묶여 스레드를 늘려도 처리량이 늘지 않습니다. (프로세스로 나눠야 함)
+CPU가 1개인 환경에서는 scaling이 항상 1 근처이므로 GIL 여부를 판단할 수 없습니다.
+
+로그인 폭주에 필요한 CPU 산정: 로그인 1회 ≈ 세 연산을 한 번씩 (RSA 키 로드는 캐시됨)
+네트워크 없이 실행됩니다.
+
+실행:
+- `python benchmarks/bench_crypto.py`
+- `python benchmarks/bench_crypto.py --ops 2000 --threads 1 2 4 8 16`
+- `python benchmarks/bench_crypto.py --only generate_session_key`
+"""
+
+import argparse
+import base64
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.infrastructure.crypto import (  # noqa: E402
+    clear_rsa_key_cache,
+    encrypt_with_aes,
+    encrypt_with_rsa,
+    generate_session_key,
+)
+
+
+def make_public_key() -> str:
+    """로그인 페이지의 public-key 값과 같은 형식 (PEM 헤더 없는 Base64 DER)"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    der = key.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return base64.b64encode(der).decode('ascii')
+
+
+def primitives(public_key: str) -> Dict[str, Callable[[], object]]:
+    key_info = generate_session_key(32)
+    rsa_payload = f"{key_info['keyStr']},{int(time.time() * 1000)}"
+
+    def rsa_uncached():
+        clear_rsa_key_cache()
+        return encrypt_with_rsa(rsa_payload, public_key)
+
+    return {
+        'generate_session_key': lambda: generate_session_key(32),
+        'encrypt_with_rsa': lambda: encrypt_with_rsa(rsa_payload, public_key),
+        'encrypt_with_rsa (uncached)': rsa_uncached,
+        'encrypt_with_aes': lambda: encrypt_with_aes('benchmark-password', key_info),
+    }
+
+
+def run(fn: Callable[[], object], threads: int, ops_per_thread: int) -> dict:
+    """threads개의 스레드가 동시에 ops_per_thread번씩 fn을 실행"""
+    latencies: List[List[float]] = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(samples: List[float]) -> None:
+        barrier.wait()
+        for _ in range(ops_per_thread):
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+
+    workers = [threading.Thread(target=worker, args=(samples,)) for samples in latencies]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    samples = sorted(s for per_thread in latencies for s in per_thread)
+    return {
+        'ops_per_sec': len(samples) / elapsed,
+        'p50': samples[len(samples) // 2],
+        'p99': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ops', type=int, default=500, help='스레드당 실행 횟수')
+    parser.add_argument('--threads', type=int, nargs='+', default=sorted({1, 4, cpus}), help='측정할 스레드 수')
+    parser.add_argument('--only', help='이 이름의 연산만 측정')
+    args = parser.parse_args()
+
+    public_key = make_public_key()
+    targets = primitives(public_key)
+    if args.only:
+        targets = {args.only: targets[args.only]}
+
+    print(f"cpus={cpus} ops/thread={args.ops} threads={args.threads}")
+    print(f"{'primitive':<30}{'threads':>8}{'ops/sec':>12}{'p50(us)':>10}{'p99(us)':>10}{'scaling':>9}")
+    for name, fn in targets.items():
+        run(fn, 1, min(args.ops, 50))  # 워밍업 (RSA 키 캐시 등)
+        single = None
+        for threads in args.threads:
+            r = run(fn, threads, args.ops)
+            single = single or r['ops_per_sec']
+            print(f"{name:<30}{threads:>8}{r['ops_per_sec']:>12.0f}{r['p50'] * 1e6:>10.1f}"
+                  f"{r['p99'] * 1e6:>10.1f}{r['ops_per_sec'] / single:>8.2f}x")
+        print()
+
+    if cpus == 1:
+        print("note: 1 CPU - thread scaling cannot show whether the GIL is released.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+대량 암호화 벤치마크
+==================
+같은 수의 비밀번호에 대해 로그인마다 하던 방식(generate_session_key + encrypt_with_rsa + encrypt_with_aes)과
+`encrypt_passwords()`(현재 스레드 / 프로세스 풀)의 처리량을 비교합니다.
+
+`--pregenerated`를 주면 세션키를 미리 만들어 넘겨, 세션키 생성(PBKDF2)을 뺀 암호화 자체만 비교합니다.
+네트워크 없이 실행됩니다.
+
+실행:
+- `python benchmarks/bench_crypto_batch.py`
+- `python benchmarks/bench_crypto_batch.py --count 20000 --processes 8`
+- `python benchmarks/bench_crypto_batch.py --pregenerated`
+"""
+
+import argparse
+import base64
+import os
+import sys
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.infrastructure.crypto import (  # noqa: E402
+    encrypt_passwords,
+    encrypt_with_aes,
+    encrypt_with_rsa,
+    generate_session_key,
+)
+
+
+def make_public_key() -> str:
+    """로그인 페이지의 public-key 값과 같은 형식 (PEM 헤더 없는 Base64 DER)"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    der = key.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return base64.b64encode(der).decode('ascii')
+
+
+def one_by_one(passwords, public_key, key_infos) -> None:
+    for i, password in enumerate(passwords):
+        key_info = key_infos[i] if key_infos is not None else generate_session_key(32)
+        encrypt_with_rsa(f"{key_info['keyStr']},{int(time.time() * 1000)}", public_key)
+        encrypt_with_aes(password, key_info)
+
+
+def measure(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=5000, help='암호화할 비밀번호 수')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help='프로세스 풀 크기')
+    parser.add_argument('--chunk-size', type=int, default=256, help='프로세스에 한 번에 넘길 비밀번호 수')
+    parser.add_argument('--pregenerated', action='store_true', help='세션키를 미리 만들어 넘김')
+    args = parser.parse_args()
+
+    public_key = make_public_key()
+    passwords = [f'password-{i:06d}' for i in range(args.count)]
+    key_infos = [generate_session_key(32) for _ in passwords] if args.pregenerated else None
+
+    modes = {
+        'one-by-one': lambda: one_by_one(passwords, public_key, key_infos),
+        'batch': lambda: encrypt_passwords(passwords, public_key, key_infos=key_infos),
+        f'batch x{args.processes} procs': lambda: encrypt_passwords(
+            passwords, public_key, key_infos=key_infos, processes=args.processes, chunk_size=args.chunk_size,
+        ),
+    }
+
+    print(f"count={args.count} processes={args.processes} pregenerated={args.pregenerated}")
+    print(f"{'mode':<22}{'elapsed(s)':>12}{'ops/sec':>12}{'speedup':>10}")
+    baseline = None
+    for name, fn in modes.items():
+        elapsed = measure(fn)
+        baseline = baseline or elapsed
+        print(f"{name:<22}{elapsed:>12.3f}{args.count / elapsed:>12.0f}{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
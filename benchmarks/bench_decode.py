@@ -0,0 +1,92 @@
+"""
+응답 본문 디코딩 벤치마크
+========================
+Content-Type에 charset이 없는 큰 MSI 페이지(사진 base64가 든 학생카드)를 두고,
+`response.text`(requests가 본문 전체로 인코딩을 추측)와 `response_text()`/`make_soup(bytes)`
+(헤더/`<meta>`에 선언된 인코딩만 사용)의 비용을 비교합니다.
+
+네트워크 없이 `requests.Response`를 직접 만들어 측정합니다.
+
+실행:
+- `python benchmarks/bench_decode.py`
+- `python benchmarks/bench_decode.py --photo-kb 300 --repeat 50`
+"""
+
+import argparse
+import base64
+import os
+import sys
+import time
+
+import requests
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.infrastructure.parser import make_soup, response_text  # noqa: E402
+
+CARD_PAGE = """<html><head><title>학생카드</title></head><body>
+<div class="card-item basic"><div id="pictureInclude">
+<img src="data:image/jpeg;base64,{photo}" />
+<div class="flex-table">
+<div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">60201234</div></div>
+<div class="flex-table-item"><div class="item-title">한글성명</div><div class="item-data">김명지</div></div>
+</div></div></div>
+<hr /><div class="flex-table">{inputs}</div>
+</body></html>"""
+
+
+def make_response(photo_kb: int, content_type) -> requests.Response:
+    inputs = ''.join(f'<input name="field{i}" value="서울특별시 서대문구 거북골로 {i}" />' for i in range(200))
+    photo = base64.b64encode(os.urandom(photo_kb * 1024 * 3 // 4)).decode('ascii')
+    response = requests.Response()
+    response._content = CARD_PAGE.format(photo=photo, inputs=inputs).encode('utf-8')
+    response.status_code = 200
+    if content_type:
+        response.headers['Content-Type'] = content_type
+    return response
+
+
+def measure(fn, repeat: int) -> float:
+    """1회 평균 (ms)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--photo-kb', type=int, default=150, help='사진 base64 크기 (KB)')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수')
+    args = parser.parse_args()
+
+    body = make_response(args.photo_kb, None).content
+
+    def fresh():
+        # 매번 새 응답으로 측정 (charset이 없는 Content-Type)
+        response = requests.Response()
+        response._content = body
+        response.status_code = 200
+        return response
+
+    rows = [
+        ('decode: response.text (charset detection)', lambda: fresh().text),
+        ('decode: response_text (declared/UTF-8)', lambda: response_text(fresh())),
+        ('parse: BeautifulSoup(response.text)', lambda: BeautifulSoup(fresh().text, 'lxml')),
+        ('parse: make_soup(response.content)', lambda: make_soup(fresh().content)),
+    ]
+
+    print(f"page={len(body) / 1024:.0f}KB (no charset in Content-Type) repeat={args.repeat}")
+    print(f"{'path':<46}{'ms/page':>10}")
+    timings = {}
+    for name, fn in rows:
+        timings[name] = measure(fn, args.repeat)
+        print(f"{name:<46}{timings[name]:>10.2f}")
+
+    removed = timings[rows[0][0]] - timings[rows[1][0]]
+    print(f"\ndecode cost removed per page: {removed:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
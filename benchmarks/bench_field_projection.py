@@ -0,0 +1,125 @@
+"""
+필드 프로젝션 벤치마크
+=====================
+`tests/golden`의 실제 크기 MSI 페이지(사진이 든 학생카드, 학적변동내역, MSI 홈)를 Fetcher `_parse_*`로 읽을 때
+전체 조회와 `fetch(fields=...)`로 일부 필드만 조회하는 경우의 처리량과 메모리를 파서 백엔드별로 비교합니다.
+
+열:
+- pages/sec, p50(ms): 반복 파싱의 처리량과 중앙값
+- peak(KB): 한 번 파싱하는 동안 tracemalloc으로 본 파이썬 할당 최대치
+- kept(KB): 파싱이 끝난 뒤 결과 모델이 붙잡고 있는 파이썬 할당 크기
+- same: 요청한 필드 값이 전체 조회 결과와 같은지
+
+libxml2가 C에서 할당하는 lxml 트리 노드는 tracemalloc에 잡히지 않습니다. 페이지 트리는 프로젝션과 관계없이 만들어지므로
+줄어드는 것은 요소 찾기, raw_html_data 직렬화, 사진(data URI) 복사와 모델 조립입니다.
+
+실행:
+- `python benchmarks/bench_field_projection.py`
+- `python benchmarks/bench_field_projection.py --repeat 50 --backends lxml`
+- `python benchmarks/bench_field_projection.py --pages student_card --no-memory`
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.fetcher import StudentBasicInfoFetcher, StudentCardFetcher, StudentChangeLogFetcher  # noqa: E402
+from tests.golden import LATEST_VERSION, load_corpus  # noqa: E402
+
+# 페이지 종류 -> (Fetcher, 파싱 메서드 이름, 프로젝션 이름 -> fields)
+PROJECTIONS = {
+    'student_card': (StudentCardFetcher, '_parse_student_card', {
+        'all': None,
+        'id+name': {'student_profile.student_id', 'student_profile.name_korean'},
+        'profile': {'student_profile'},
+        'contact': {'personal_contact'},
+        'raw_html_data': {'raw_html_data'},
+    }),
+    'student_changelog': (StudentChangeLogFetcher, '_parse_student_changelog', {
+        'all': None,
+        'status': {'academic_status.status'},
+        'change_log_list': {'change_log_list'},
+    }),
+    'home': (StudentBasicInfoFetcher, '_parse_basic_info', {
+        'all': None,
+        'department': {'department'},
+    }),
+}
+
+
+def parser_for(page, backend: str, fields):
+    """한 번 파싱하는 함수 (fetch(fields=...)가 네트워크 단계 뒤에 하는 것과 같음)"""
+    fetcher_class, method_name, _ = PROJECTIONS[page.kind]
+    fetcher = fetcher_class(session=None, parser_backend=backend, **(
+        {'user_pw': ''} if fetcher_class is StudentCardFetcher else {}
+    ))
+    fetcher._encoding = page.encoding
+    fetcher._parts = fetcher.page_parts(fields)
+    parse = getattr(fetcher, method_name)
+    return lambda: parse(page.body)
+
+
+def pick(model, path: str):
+    for name in path.split('.'):
+        model = getattr(model, name)
+    return model
+
+
+def measure(run, repeat: int):
+    """(pages/sec, p50 ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return repeat / sum(samples), statistics.median(samples) * 1000
+
+
+def memory(run):
+    """(peak KB, 남은 KB) - 지연 초기화가 빠지도록 한 번 실행한 뒤 측정"""
+    run()
+    tracemalloc.start()
+    try:
+        result = run()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+        return peak / 1024, current / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--version', default=LATEST_VERSION, help='코퍼스 버전 디렉터리')
+    parser.add_argument('--repeat', type=int, default=30, help='프로젝션별 반복 횟수')
+    parser.add_argument('--backends', nargs='+', default=['lxml', 'bs4'], help='비교할 백엔드 이름')
+    parser.add_argument('--pages', nargs='+', default=list(PROJECTIONS), help='측정할 페이지 종류')
+    parser.add_argument('--no-memory', action='store_true', help='메모리 측정 생략')
+    args = parser.parse_args()
+
+    corpus = [page for page in load_corpus(args.version) if page.kind in args.pages]
+
+    print(f"corpus={args.version} repeat={args.repeat}")
+    print(f"{'page':<19}{'parser':<8}{'fields':<16}{'pages/sec':>11}{'p50(ms)':>9}"
+          f"{'peak(KB)':>10}{'kept(KB)':>10}{'same':>7}")
+    for page in corpus:
+        for backend in args.backends:
+            full = parser_for(page, backend, None)()
+            for label, fields in PROJECTIONS[page.kind][2].items():
+                run = parser_for(page, backend, fields)
+                same = all(pick(run(), path) == pick(full, path) for path in fields or ())
+                throughput, p50 = measure(run, args.repeat)
+                peak, kept = ('-', '-') if args.no_memory else (f'{value:.0f}' for value in memory(run))
+                print(f"{page.name:<19}{backend:<8}{label:<16}{throughput:>11.1f}{p50:>9.2f}"
+                      f"{peak:>10}{kept:>10}{str(same):>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+골든 코퍼스 파서 벤치마크
+========================
+`tests/golden/<버전>`의 실제 크기 페이지(로그인, 리다이렉트, MSI 홈, 사진이 든 학생카드, 학적변동내역)를
+라이브러리가 로그인/조회 중에 쓰는 파서로 읽어 파서별 처리량과 메모리를 비교합니다.
+
+- HTMLParser: 로그인 페이지 값 추출, 리다이렉트/홈 페이지 상태 판정 (정규표현식 빠른 경로)
+- 파서 백엔드(lxml, bs4, regex ...): HTMLParser의 폴백과 Fetcher `_parse_*` (모델 생성까지)
+
+열:
+- pages/sec, p50(ms): 반복 파싱의 처리량과 중앙값
+- peak(KB): 한 번 파싱하는 동안 tracemalloc으로 본 파이썬 할당 최대치
+- kept(KB), blocks: 파싱이 끝난 뒤에도 결과가 붙잡고 있는 파이썬 할당 크기와 블록 수
+  (CPython은 누적 할당 횟수를 제공하지 않으므로 남은 블록 수로 할당량을 봅니다)
+
+libxml2가 C에서 할당하는 lxml 트리 노드는 tracemalloc에 잡히지 않습니다.
+결과가 manifest에 기록된 값과 다르면 `same` 열이 False가 됩니다. (regex 백엔드는 속성 값의 엔티티를 풀지 않음)
+
+실행:
+- `python benchmarks/bench_golden_corpus.py`
+- `python benchmarks/bench_golden_corpus.py --repeat 50 --backends lxml bs4`
+- `python benchmarks/bench_golden_corpus.py --version v1 --pages student_card --no-memory`
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.fetcher import StudentBasicInfoFetcher, StudentCardFetcher, StudentChangeLogFetcher  # noqa: E402
+from mju_univ_auth.infrastructure.parser import HTMLParser, get_parser_backend, parser_backend_names  # noqa: E402
+from tests.golden import LATEST_VERSION, load_corpus, observe  # noqa: E402
+
+# 페이지 종류 -> HTMLParser가 그 페이지에서 하는 일
+HTML_PARSER_TASKS = {
+    'login': lambda text: HTMLParser.extract_login_page_data(text),
+    'redirect': lambda text: (lambda state: (state.has_js_form_submit, state.form_action, state.form_data))(
+        HTMLParser.classify_page(text)
+    ),
+    'home': lambda text: (HTMLParser.classify_page(text).has_logout, HTMLParser.extract_csrf_token(text)),
+}
+# Fetcher 페이지 종류 -> (Fetcher, 파싱 메서드 이름)
+FETCHER_PARSERS = {
+    'home': (StudentBasicInfoFetcher, '_parse_basic_info'),
+    'student_card': (StudentCardFetcher, '_parse_student_card'),
+    'student_changelog': (StudentChangeLogFetcher, '_parse_student_changelog'),
+}
+# 페이지 종류 -> 파서 백엔드가 그 페이지에서 읽는 ParserBackend.pages 이름
+BACKEND_PAGES = {
+    'login': 'login_page',
+    'redirect': 'form_inputs',
+    'home': 'student_basicinfo',
+    'student_card': 'student_card',
+    'student_changelog': 'student_changelog',
+}
+
+
+def tasks(page, backends):
+    """(파서 이름, 한 번 파싱하는 함수, 결과가 manifest와 같은지 확인하는 함수) 목록"""
+    text = page.text
+    expected = page.expected
+    if page.kind in HTML_PARSER_TASKS:
+        task = HTML_PARSER_TASKS[page.kind]
+        yield 'HTMLParser', lambda: task(text), lambda: observe(page) == expected
+    backend_page = BACKEND_PAGES[page.kind]
+    for name in backends:
+        backend = get_parser_backend(name)
+        if backend_page not in backend.pages:
+            continue
+        if backend_page == 'login_page':
+            run = lambda backend=backend: backend.login_page_data(text)  # noqa: E731
+            check = lambda run=run: run() == (expected['public_key'], expected['csrf_token'], expected['form_action'])  # noqa: E731
+        elif backend_page == 'form_inputs':
+            run = lambda backend=backend: backend.form_inputs(text)  # noqa: E731
+            check = lambda run=run: run() == expected['form_data']  # noqa: E731
+        else:
+            # Fetcher `_parse_*` (페이지 데이터 -> pydantic 모델)
+            fetcher_class, method_name = FETCHER_PARSERS[page.kind]
+            fetcher = fetcher_class(session=None, parser_backend=name, **(
+                {'user_pw': ''} if fetcher_class is StudentCardFetcher else {}
+            ))
+            fetcher._encoding = page.encoding
+            run = lambda parse=getattr(fetcher, method_name): parse(page.body)  # noqa: E731
+            check = lambda name=name: observe(page, name) == expected  # noqa: E731
+        yield name, run, check
+
+
+def measure(run, repeat: int):
+    """(pages/sec, p50 ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return repeat / sum(samples), statistics.median(samples) * 1000
+
+
+def memory(run):
+    """(peak KB, 남은 KB, 남은 블록 수) - 지연 초기화(스레드 로컬 파서, 정규식 캐시)가 빠지도록 한 번 실행한 뒤 측정"""
+    run()
+    tracemalloc.start()
+    try:
+        result = run()
+        gc.collect()  # bs4 트리처럼 순환 참조로 남은 객체는 빼고 결과가 붙잡은 것만
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        del result
+        return peak / 1024, current / 1024, blocks
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--version', default=LATEST_VERSION, help='코퍼스 버전 디렉터리')
+    parser.add_argument('--repeat', type=int, default=30, help='파서/페이지별 반복 횟수')
+    parser.add_argument('--backends', nargs='+', default=parser_backend_names(), help='비교할 백엔드 이름')
+    parser.add_argument('--pages', nargs='+', help='측정할 페이지 이름 (기본 전부)')
+    parser.add_argument('--no-memory', action='store_true', help='메모리 측정 생략')
+    args = parser.parse_args()
+
+    corpus = [page for page in load_corpus(args.version) if not args.pages or page.name in args.pages]
+
+    print(f"corpus={args.version} repeat={args.repeat}")
+    print(f"{'page':<19}{'size(KB)':>9}  {'parser':<11}{'pages/sec':>11}{'p50(ms)':>9}"
+          f"{'peak(KB)':>10}{'kept(KB)':>10}{'blocks':>8}{'same':>7}")
+    for page in corpus:
+        for name, run, check in tasks(page, args.backends):
+            same = check()
+            throughput, p50 = measure(run, args.repeat)
+            if args.no_memory:
+                peak = kept = blocks = '-'
+            else:
+                peak, kept, blocks = (f'{value:.0f}' for value in memory(run))
+            print(f"{page.name:<19}{len(page.body) / 1024:>9.0f}  {name:<11}{throughput:>11.1f}{p50:>9.2f}"
+                  f"{peak:>10}{kept:>10}{blocks:>8}{str(same):>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+로그인 암호화 파이프라인 벤치마크
+================================
+세션키 파생(PBKDF2)과 비밀번호 AES 암호화를 로그인 페이지 요청과 겹쳐 수행할 때와
+페이지를 받은 뒤에 순서대로 수행할 때, 로그인 페이지 수신 후 로그인 POST 데이터가 준비될 때까지의
+시간(임계 경로)을 비교합니다.
+
+로그인 페이지 요청은 `--rtt-ms`만큼 잠드는 것으로 흉내 내며, 암호화는 실제 구현을 그대로 사용합니다.
+`--threads`로 여러 로그인을 동시에 돌려 암호화 스레드 풀이 붐빌 때도 확인할 수 있습니다.
+
+실행:
+- `python benchmarks/bench_login_pipeline.py`
+- `python benchmarks/bench_login_pipeline.py --logins 500 --threads 8 --rtt-ms 5`
+"""
+
+import argparse
+import base64
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.authenticator.standard_authenticator import StandardAuthenticator  # noqa: E402
+
+
+def make_public_key() -> str:
+    """로그인 페이지의 public-key 값과 같은 형식 (PEM 헤더 없는 Base64 DER)"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    der = key.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return base64.b64encode(der).decode('ascii')
+
+
+def one_login(public_key: str, rtt: float, overlap: bool) -> float:
+    """로그인 페이지 수신부터 POST 데이터 준비까지 걸린 시간 (초)"""
+    auth = StandardAuthenticator('60201234', 'benchmark-password')
+    if overlap:
+        auth._begin_password_material()
+    time.sleep(rtt)  # 1단계: 로그인 페이지 GET
+    auth._public_key = public_key
+    auth._csrf_token = 'csrf'
+
+    started = time.perf_counter()
+    auth._prepare_encrypted_data()
+    return time.perf_counter() - started
+
+
+def run(public_key: str, logins: int, threads: int, rtt: float, overlap: bool) -> list:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(lambda _: one_login(public_key, rtt, overlap), range(logins)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--logins', type=int, default=200, help='모드별 로그인 횟수')
+    parser.add_argument('--threads', type=int, default=1, help='동시 로그인 수')
+    parser.add_argument('--rtt-ms', type=float, default=10.0, help='로그인 페이지 요청에 흉내 낼 지연 (ms)')
+    args = parser.parse_args()
+
+    public_key = make_public_key()
+    rtt = args.rtt_ms / 1000
+    run(public_key, 10, 1, 0, True)  # 워밍업 (스레드 풀 생성)
+
+    print(f"logins={args.logins} threads={args.threads} rtt={args.rtt_ms}ms")
+    print(f"{'mode':<12}{'p50(ms)':>10}{'p99(ms)':>10}{'mean(ms)':>10}")
+    means = {}
+    for name, overlap in (('sequential', False), ('overlapped', True)):
+        samples = sorted(run(public_key, args.logins, args.threads, rtt, overlap))
+        p50 = samples[len(samples) // 2] * 1000
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+        means[name] = statistics.fmean(samples) * 1000
+        print(f"{name:<12}{p50:>10.3f}{p99:>10.3f}{means[name]:>10.3f}")
+
+    print(f"\ncritical path saved per login: {means['sequential'] - means['overlapped']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
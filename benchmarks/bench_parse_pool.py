@@ -0,0 +1,109 @@
+"""
+파싱 프로세스 풀 벤치마크
+=========================
+요청 스레드 여러 개가 `tests/golden`의 학생카드(사진 포함)를 Fetcher `_parse_student_card`로 계속 파싱하는 동안,
+가벼운 요청을 흉내 내는 스레드 하나가 작은 일(로그인 페이지 CSRF 토큰 추출)을 반복할 때의 지연을 잽니다.
+요청 스레드에서 파싱하는 경우(in-thread)와 `ParsePool`에 넘기는 경우(pool)를 워커 수/대기열 크기별로 비교합니다.
+
+열:
+- pages/sec, p50/p99(ms): 요청 스레드의 학생카드 파싱 처리량과 지연
+- light p99(ms): 가벼운 요청의 지연 (파싱이 GIL을 잡고 있으면 늘어남)
+- util, fallbacks, max_q: 풀의 워커 사용률, 요청 스레드에서 파싱한 수, 최대 대기열 깊이
+
+워커 프로세스는 CPU 코어를 나눠 쓰므로 코어가 워커 수 + 1보다 적으면 pool이 in-thread보다 느릴 수 있습니다.
+
+실행:
+- `python benchmarks/bench_parse_pool.py`
+- `python benchmarks/bench_parse_pool.py --threads 8 --workers 2 4 --seconds 5`
+- `python benchmarks/bench_parse_pool.py --backend bs4 --max-queue 0`
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth import ParsePool, use_parse_pool  # noqa: E402
+from mju_univ_auth.fetcher import StudentCardFetcher  # noqa: E402
+from mju_univ_auth.infrastructure.parser import HTMLParser  # noqa: E402
+from tests.golden import LATEST_VERSION, load_corpus  # noqa: E402
+
+
+def p99(samples):
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+
+
+def run(card, login, backend: str, threads: int, seconds: float):
+    """(요청 스레드 파싱 시간 목록, 가벼운 요청 시간 목록, 경과 시간)"""
+    stop = threading.Event()
+    parse_samples, light_samples = [], []
+
+    def request_thread():
+        fetcher = StudentCardFetcher(session=None, user_pw='', parser_backend=backend)
+        fetcher._encoding = card.encoding
+        while not stop.is_set():
+            started = time.perf_counter()
+            fetcher._parse_student_card(card.body)
+            parse_samples.append(time.perf_counter() - started)
+
+    def light_thread():
+        text = login.text
+        while not stop.is_set():
+            started = time.perf_counter()
+            HTMLParser.extract_csrf_token(text)
+            light_samples.append(time.perf_counter() - started)
+            time.sleep(0.001)
+
+    workers = [threading.Thread(target=request_thread) for _ in range(threads)] + [threading.Thread(target=light_thread)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return parse_samples, light_samples, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--version', default=LATEST_VERSION, help='코퍼스 버전 디렉터리')
+    parser.add_argument('--backend', default='lxml', choices=['lxml', 'bs4'], help='파서 백엔드')
+    parser.add_argument('--threads', type=int, default=4, help='학생카드를 파싱하는 요청 스레드 수')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2], help='비교할 워커 프로세스 수')
+    parser.add_argument('--max-queue', type=int, default=None, help='빈 워커를 기다리게 할 최대 파싱 수 (없으면 워커 수)')
+    parser.add_argument('--seconds', type=float, default=3.0, help='설정별 측정 시간')
+    args = parser.parse_args()
+
+    pages = {page.kind: page for page in load_corpus(args.version)}
+    card, login = pages['student_card'], pages['login']
+
+    print(f"corpus={args.version} backend={args.backend} threads={args.threads} cpus={os.cpu_count()}")
+    print(f"{'mode':<18}{'pages/sec':>11}{'p50(ms)':>9}{'p99(ms)':>9}{'light p99(ms)':>15}"
+          f"{'util':>7}{'fallbacks':>11}{'max_q':>7}")
+
+    def report(label, result, metrics=None):
+        parse_samples, light_samples, elapsed = result
+        pool_columns = (f"{metrics.utilization:>7.0%}{metrics.fallbacks:>11}{metrics.max_queue_depth:>7}"
+                        if metrics else f"{'-':>7}{'-':>11}{'-':>7}")
+        print(f"{label:<18}{len(parse_samples) / elapsed:>11.1f}{statistics.median(parse_samples) * 1000:>9.2f}"
+              f"{p99(parse_samples):>9.2f}{p99(light_samples):>15.3f}{pool_columns}")
+
+    report('in-thread', run(card, login, args.backend, args.threads, args.seconds))
+    for workers in args.workers:
+        with ParsePool(workers=workers, max_queue=args.max_queue) as pool:
+            previous = use_parse_pool(pool)
+            try:
+                result = run(card, login, args.backend, args.threads, args.seconds)
+            finally:
+                use_parse_pool(previous)
+            metrics = pool.metrics()
+        report(f'pool w={workers} q={metrics.max_queue}', result, metrics)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+파서 백엔드 비교 벤치마크
+========================
+등록된 모든 파서 백엔드(regex, bs4, lxml ...)를 같은 HTML 페이지로 실행해
+페이지 종류별 처리량(pages/sec), 파싱 1회의 최대 메모리, 결과가 bs4 백엔드(기존 동작)와 같은지 비교합니다.
+(raw_html_data는 `tests.golden.canonical_markup()`으로 표기 차이를 없애고 비교)
+
+- 로그인 페이지(login_page)와 자동 제출 폼(form_inputs): HTMLParser가 정규표현식 실패 시 쓰는 폴백
+- 학생카드/학적변동내역/학생 기본 정보: MSI Fetcher의 `_parse_*`가 쓰는 페이지 파싱
+  (사진 base64와 메뉴/스크립트가 든 실제 크기의 페이지를 bytes로 만들어 측정)
+
+최대 메모리는 한 번 파싱하는 동안 tracemalloc으로 본 파이썬 할당 최대치입니다.
+libxml2가 C에서 할당하는 lxml 트리 노드는 빠지므로, lxml 값은 파이썬 쪽 할당(결과 문자열, XPath 결과 ...)만입니다.
+
+실행:
+- `python benchmarks/bench_parser_backends.py`
+- `python benchmarks/bench_parser_backends.py --photo-kb 300 --menu-items 800 --repeat 50`
+- `python benchmarks/bench_parser_backends.py --backends lxml bs4 --no-memory`
+"""
+
+import argparse
+import base64
+import dataclasses
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.infrastructure.parser import get_parser_backend, parser_backend_names  # noqa: E402
+from tests.golden import canonical_markup  # noqa: E402
+
+REFERENCE_BACKEND = 'bs4'
+
+PAGE = """<!DOCTYPE html><html lang="ko"><head><meta charset="UTF-8"><title>MSI</title>
+<script>var menu = {{ "open": true }}; if (a < b && c > d) {{ init(); }}</script></head>
+<body><ul class="side-menu">{menu}</ul>
+{content}
+<script>document.querySelectorAll('.menu-item').forEach(function (e) {{ e.hidden = false; }});</script>
+</body></html>"""
+MENU_ITEM = '<li class="menu-item"><a href="/servlet/su/sud/Sud00Svl01?pgmid=W_SUD{i:03d}&amp;sysdiv=SCH">메뉴 {i}</a></li>\n'
+
+# 속성 순서가 정규표현식 빠른 경로와 반대인 로그인 페이지 (HTMLParser가 백엔드로 폴백하는 경우)
+LOGIN = """<form id="signin-form" method="post" action="/sso/process/login.do?tx=1&amp;lang=ko">
+  <input type="hidden" id="public-key" value="{public_key}">
+  <input type="hidden" id="c_r_t" value="6f1c2a9e-0b1d-4c7e-9a55-3f3b1f2c8d77">
+  <input type="text" id="input-userId" name="id"><input type="password" id="input-password" name="pw">
+</form>"""
+REDIRECT_FORM = """<form name="frm" method="post" action="https://msi.mju.ac.kr/index_Myiweb.jsp">
+{inputs}</form><script>document.frm.submit();</script>"""
+
+CARD = """<div class="card-item basic">
+  <!-- 학생 사진 -->
+  <div id="pictureInclude"><img src="data:image/jpg;base64,{photo}" alt="사진">
+    <div class="flex-table">
+      <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">60201234</div></div>
+      <div class="flex-table-item"><div class="item-title">한글성명</div><div class="item-data">김명지</div></div>
+      <div class="flex-table-item"><div class="item-title">학년</div><div class="item-data">3 학년</div></div>
+      <div class="flex-table-item"><div class="item-title">학적상태</div><div class="item-data">재학</div></div>
+      <div class="flex-table-item"><div class="item-title">학부(과)</div><div class="item-data">컴퓨터공학과</div></div>
+      <div class="flex-table-item"><div class="item-title">상담교수</div><div class="item-data">홍길동</div></div>
+      <div class="flex-table-item"><div class="item-title">학생설계전공지도교수</div><div class="item-data">()</div></div>
+    </div>
+  </div>
+  <hr>
+  <div class="flex-table">{inputs}</div>
+</div>"""
+CONTACT = {
+    'nm_eng': 'KIM', 'nm_eng2': 'MYONGJI', 'std_tel': '02-300-1234', 'htel': '010-1234-5678',
+    'email': 'student@mju.ac.kr', 'zip1': '037', 'zip2': '24', 'addr1': '서울특별시 서대문구 거북골로 34',
+    'addr2': '본관 101호', 'zip1_2': '170', 'zip2_2': '58', 'addr1_2': '경기도 용인시 처인구', 'addr2_2': '명지로 116',
+}
+
+CHANGELOG = """<div class="card-item basic"><div class="flex-table">
+  <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">60201234</div></div>
+  <div class="flex-table-item"><div class="item-title">성명</div><div class="item-data">김명지</div></div>
+  <div class="flex-table-item"><div class="item-title">학적상태</div><div class="item-data">재학</div></div>
+</div></div>
+<div class="card-item basic"><div class="data-title small">누적 휴학 : <span>총 2학기</span></div>
+<div class="read-table"><table><tbody>{rows}</tbody></table></div></div>"""
+CHANGELOG_ROW = '<tr><td>{year}</td><td>1학기</td><td>일반휴학</td><td>{year}-02-10</td><td>{year}-08-31</td><td>개인사정</td></tr>\n'
+
+BASIC_INFO = """<div class="main-user-info">
+  <div class="info-cell"><div class="title">소 속 :</div><div class="value">컴퓨터공학과</div></div>
+  <div class="info-cell"><div class="title">구 분 :</div><div class="value">학부생</div></div>
+  <div class="info-cell"><div class="title">학 년 :</div><div class="value">3학년</div></div>
+  <div class="info-cell"><div class="title">최근접속시간 :</div><div class="value">2025-03-02 09:10:11</div></div>
+  <div class="info-cell"><div class="title">최근접속IP :</div><div class="value">10.0.0.1</div></div>
+</div>"""
+
+
+def make_pages(photo_kb: int, menu_items: int) -> dict:
+    """페이지 종류 -> 본문 (login_page/form_inputs는 str, MSI 페이지는 bytes)"""
+    menu = ''.join(MENU_ITEM.format(i=i) for i in range(menu_items))
+    photo = base64.b64encode(os.urandom(photo_kb * 1024 * 3 // 4)).decode('ascii')
+    inputs = ''.join(f'<input type="text" name="{name}" value="{value}" readonly>\n' for name, value in CONTACT.items())
+    hidden = ''.join(f'<input type="hidden" name="ssoToken{i}" value="{photo[i * 64:(i + 1) * 64]}">\n' for i in range(20))
+    rows = ''.join(CHANGELOG_ROW.format(year=2010 + i) for i in range(12))
+    contents = {
+        'login_page': LOGIN.format(public_key=photo[:392]),
+        'form_inputs': REDIRECT_FORM.format(inputs=hidden),
+        'student_card': CARD.format(photo=photo, inputs=inputs),
+        'student_changelog': CHANGELOG.format(rows=rows),
+        'student_basicinfo': BASIC_INFO,
+    }
+    pages = {name: PAGE.format(menu=menu, content=content) for name, content in contents.items()}
+    return {name: html if name in ('login_page', 'form_inputs') else html.encode('utf-8') for name, html in pages.items()}
+
+
+def run(backend_name: str, page: str, html):
+    """백엔드로 페이지를 한 번 파싱 (ParserBackend의 페이지 종류 이름 = 메서드 이름, login_page만 다름)"""
+    backend = get_parser_backend(backend_name)
+    method = 'login_page_data' if page == 'login_page' else page
+    return getattr(backend, method)(html)
+
+
+def comparable(result):
+    """raw_html_data는 표기 차이(`<br>`/`<br/>` 등)를 없앤 형태로 비교"""
+    if dataclasses.is_dataclass(result) and hasattr(result, 'raw_html_data'):
+        return dataclasses.replace(result, raw_html_data=canonical_markup(result.raw_html_data))
+    return result
+
+
+def measure(backend_name: str, page: str, html, repeat: int) -> float:
+    """초당 처리 페이지 수"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run(backend_name, page, html)
+    return repeat / (time.perf_counter() - started)
+
+
+def peak_memory(backend_name: str, page: str, html) -> float:
+    """한 번 파싱하는 동안의 파이썬 할당 최대치 (KB)"""
+    tracemalloc.start()
+    try:
+        run(backend_name, page, html)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--photo-kb', type=int, default=150, help='학생카드 사진 base64 크기 (KB)')
+    parser.add_argument('--menu-items', type=int, default=400, help='페이지마다 들어가는 메뉴 항목 수')
+    parser.add_argument('--repeat', type=int, default=30, help='백엔드/페이지별 반복 횟수')
+    parser.add_argument('--backends', nargs='+', default=parser_backend_names(), help='비교할 백엔드 이름')
+    parser.add_argument('--no-memory', action='store_true', help='최대 메모리 측정 생략')
+    args = parser.parse_args()
+
+    pages = make_pages(args.photo_kb, args.menu_items)
+
+    print(f"photo={args.photo_kb}KB menu-items={args.menu_items} repeat={args.repeat} reference={REFERENCE_BACKEND}")
+    print(f"{'page':<19}{'size(KB)':>9}  {'backend':<8}{'pages/sec':>11}{'peak(KB)':>10}{'same result':>13}")
+    for page, html in pages.items():
+        expected = comparable(run(REFERENCE_BACKEND, page, html))
+        for backend_name in args.backends:
+            if page not in get_parser_backend(backend_name).pages:
+                print(f"{page:<19}{len(html) / 1024:>9.0f}  {backend_name:<8}{'-':>11}{'-':>10}{'-':>13}")
+                continue
+            same = comparable(run(backend_name, page, html)) == expected
+            throughput = measure(backend_name, page, html, args.repeat)
+            peak = '-' if args.no_memory else f'{peak_memory(backend_name, page, html):.0f}'
+            print(f"{page:<19}{len(html) / 1024:>9.0f}  {backend_name:<8}{throughput:>11.1f}{peak:>10}{str(same):>13}")
+
+
+if __name__ == '__main__':
+    main()
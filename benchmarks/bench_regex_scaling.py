@@ -0,0 +1,179 @@
+"""
+정규표현식 최악 시간 벤치마크 (크기 확장 + 퍼징)
+=============================================
+HTMLParser/PageState/LoginPageScanner와 학생카드 Fetcher가 문서 전체에 쓰는 정규표현식 경로를
+되돌아가기(backtracking)를 유발하는 입력과 무작위 퍼징 입력으로 크기를 두 배씩 늘려 가며 실행하고,
+log(시간)/log(크기)의 기울기(지수)로 시간이 입력 길이에 선형인지 확인합니다. (1.0 = 선형, 2.0 = 제곱)
+
+- 지수가 `--limit`(기본 1.3)을 넘는 항목은 SUPERLINEAR로 표시하고, `--check`면 종료 코드 1로 끝냅니다.
+- `--legacy`는 같은 입력을 이전 패턴(태그 안에서 `[^>]*`를 이어 쓰던 버전)으로도 실행해 비교합니다.
+  이전 패턴은 제곱 시간이라 `--legacy-max-kb`(기본 128)까지만 늘립니다.
+
+실행:
+- `python benchmarks/bench_regex_scaling.py`
+- `python benchmarks/bench_regex_scaling.py --max-kb 2048 --check`
+- `python benchmarks/bench_regex_scaling.py --legacy --inputs giant_tag alert_storm`
+"""
+
+import argparse
+import math
+import os
+import random
+import re
+import sys
+import time
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.fetcher.student_card_fetcher import StudentCardFetcher  # noqa: E402
+from mju_univ_auth.infrastructure.parser import HTMLParser, LoginPageScanner, PageState  # noqa: E402
+
+# 입력 이름 -> 반복할 조각 (조각을 원하는 크기까지 이어 붙임, 앞에 prefix)
+INPUTS = {
+    'unclosed_tags': ('', '<input name="a" value="b" '),            # '>' 없이 태그만 계속 열림
+    'giant_tag': ('<input ', 'name="x" '),                          # 닫히지 않는 태그 하나에 속성만 반복
+    'value_storm': ('<form id="signin-form" ', 'value="k" data-id="public-key " '),
+    'open_quotes': ('<form action="', "x='y "),                    # 닫히지 않는 따옴표
+    'alert_storm': ('<script>', "alert('\\u00"),                   # 한 줄에 닫히지 않는 alert(' 반복
+    'meta_storm': ('', '<meta _csrf name="_csrf" '),
+    'redirect_storm': ('<script>', 'location.href =  window.location  '),
+    'csrf_storm': ('', 'name="_csrf" value="t" name="_csrf" '),
+    'long_value': ('<input type="hidden" id="public-key" value="', 'QUJD'),  # 닫히지 않는 긴 base64 값
+}
+# 퍼징에 쓰는 조각 (태그/속성/따옴표/스크립트 문자열을 무작위로 섞음)
+FUZZ_TOKENS = (
+    '<input', '<form', '<meta', '<', '>', ' ', '\n', '"', "'", '=', 'name=', 'value=', 'id=', 'action=',
+    '"public-key"', "'c_r_t'", '"signin-form"', '_csrf', 'content=', 'alert(', "alert('", 'location.href=',
+    'X-CSRF-TOKEN:', 'var errorMsg = "', '\\', 'https://msi.mju.ac.kr/', 'abc', '한글', '/>',
+)
+
+
+def make_input(name: str, size: int, seed: int = 0) -> str:
+    if name == 'fuzz':
+        rng = random.Random(seed)
+        parts, length = [], 0
+        while length < size:
+            token = rng.choice(FUZZ_TOKENS)
+            parts.append(token)
+            length += len(token)
+        return ''.join(parts)[:size]
+    prefix, piece = INPUTS[name]
+    return (prefix + piece * (size // len(piece) + 1))[:size]
+
+
+def _card_fetcher() -> StudentCardFetcher:
+    fetcher = StudentCardFetcher(session=MagicMock(), user_pw='pw')
+    fetcher._csrf_token = 'token'
+    return fetcher
+
+
+def _scan(html: str) -> None:
+    scanner = LoginPageScanner()
+    data = html.encode('utf-8')
+    for start in range(0, len(data), 16 * 1024):
+        if scanner.feed(data[start:start + 16 * 1024]):
+            return
+    scanner.close()
+
+
+_FETCHER = _card_fetcher()
+
+# 대상 이름 -> 한 번 실행하는 함수
+TARGETS = {
+    'PageState.form_action': lambda html: PageState(html).form_action,
+    'PageState.form_data': lambda html: PageState(html).form_data,
+    'PageState.js_redirect': lambda html: PageState(html).js_redirect,
+    'PageState.error_message': lambda html: PageState(html).error_message,
+    'login_page_data': lambda html: HTMLParser.extract_login_page_data(html),
+    'LoginPageScanner': _scan,
+    'extract_csrf_token': lambda html: HTMLParser.extract_csrf_token(html),
+    'card._password_request': lambda html: _FETCHER._password_request(html),
+    'card._redirect_form': lambda html: _FETCHER._redirect_form_request(html),
+}
+
+# 이전 패턴 (비교용)
+_LEGACY = {
+    'form_action': r'<form[^>]*action=["\']([^"\']+)["\']',
+    'form_input': r'<input[^>]*name=["\']([^"\']+)["\'][^>]*value=["\']([^"\']*)["\']|'
+                  r'<input[^>]*value=["\']([^"\']*)["\'][^>]*name=["\']([^"\']+)["\']',
+    'alert': r"alert\(['\"](.+?)['\"]\)",
+    'public_key': r'value=["\']([^"\']+)["\'][^>]*id=["\']public-key["\']',
+    'public_key_reverse': r'id=["\']public-key["\'][^>]*value=["\']([^"\']+)["\']',
+    'signin_form': r'<form[^>]*id=["\']signin-form["\'][^>]*action=["\']([^"\']+)["\']',
+    'csrf_meta': r'meta[^>]*_csrf[^>]*content="([^"]+)"',
+    'csrf_input_reverse': r'value="([^"]+)"[^>]*name="_csrf"',
+    'card_csrf': r'name=["\"]_csrf["\"][^>]*value=["\"]([^"]+)["\"]',
+}
+LEGACY_TARGETS = {
+    f'legacy.{name}': (lambda pattern: lambda html: [match.group(0) for match in pattern.finditer(html)])(
+        re.compile(pattern)
+    )
+    for name, pattern in _LEGACY.items()
+}
+
+
+def timed(run, html: str, repeat: int) -> float:
+    """repeat번 중 가장 빠른 실행 시간 (초)"""
+    best = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(html)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def exponent(sizes, seconds) -> float:
+    """log(시간) ~ log(크기) 최소제곱 기울기"""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(second, 1e-7)) for second in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum((x - mean_x) ** 2 for x in xs)
+
+
+def run_table(targets: dict, inputs, sizes, repeat: int, limit: float) -> int:
+    print(f"{'target':<26}{'input':<16}" + ''.join(f'{size // 1024:>8}K' for size in sizes) + f"{'exp':>7}")
+    superlinear = 0
+    for target, run in targets.items():
+        for name in inputs:
+            seconds = [timed(run, make_input(name, size), repeat) for size in sizes]
+            slope = exponent(sizes, seconds)
+            flag = '  SUPERLINEAR' if slope > limit else ''
+            superlinear += bool(flag)
+            print(f"{target:<26}{name:<16}" + ''.join(f'{second * 1000:>8.2f}m' for second in seconds)
+                  + f"{slope:>7.2f}{flag}")
+    return superlinear
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--min-kb', type=int, default=32, help='가장 작은 입력 크기 (KB)')
+    parser.add_argument('--max-kb', type=int, default=512, help='가장 큰 입력 크기 (KB, 두 배씩 늘림)')
+    parser.add_argument('--repeat', type=int, default=3, help='크기별 반복 횟수 (가장 빠른 값 사용)')
+    parser.add_argument('--inputs', nargs='+', default=[*INPUTS, 'fuzz'], help='입력 종류')
+    parser.add_argument('--limit', type=float, default=1.3, help='SUPERLINEAR로 볼 지수')
+    parser.add_argument('--check', action='store_true', help='SUPERLINEAR 항목이 있으면 종료 코드 1')
+    parser.add_argument('--legacy', action='store_true', help='이전 패턴도 실행해 비교')
+    parser.add_argument('--legacy-max-kb', type=int, default=128, help='이전 패턴의 가장 큰 입력 크기 (KB)')
+    args = parser.parse_args()
+
+    def doubling(max_kb):
+        sizes, size = [], args.min_kb * 1024
+        while size <= max_kb * 1024:
+            sizes.append(size)
+            size *= 2
+        return sizes
+
+    print(f"repeat={args.repeat} limit={args.limit} (시간 단위 ms, exp = log-log 기울기)")
+    superlinear = run_table(TARGETS, args.inputs, doubling(args.max_kb), args.repeat, args.limit)
+    if args.legacy:
+        print()
+        run_table(LEGACY_TARGETS, args.inputs, doubling(args.legacy_max_kb), 1, args.limit)
+
+    print(f"\nsuperlinear: {superlinear}")
+    if args.check and superlinear:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+스트리밍 읽기 벤치마크
+====================
+로그인 페이지(공개키/CSRF 토큰/폼 액션)와 세션 유효성 검사 페이지를 본문 전체를 받아 판정할 때와
+`stream_pages`처럼 필요한 값이 나올 때까지만 읽을 때의 수신 바이트와 판정까지 걸린 시간을 비교합니다.
+
+로컬 HTTP 서버가 페이지를 `--chunk-kb` 단위로 `--delay-ms`씩 쉬며 보내 느린 회선을 흉내 냅니다.
+값을 찾은 뒤 남은 본문이 drain_limit 이하면 마저 읽고(커넥션 재사용), 초과하면 커넥션을 닫습니다.
+
+실행:
+- `python benchmarks/bench_streaming.py`
+- `python benchmarks/bench_streaming.py --page-kb 300 --delay-ms 5 --repeat 20`
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.infrastructure.parser import (  # noqa: E402
+    HTMLParser,
+    LoginPageScanner,
+    SessionPageScanner,
+    response_text,
+)
+from mju_univ_auth.infrastructure.transport import create_session, read_until  # noqa: E402
+
+LOGIN_HEAD = """<html><head><meta charset="utf-8"><title>명지대학교 통합로그인</title>{styles}</head><body>
+<form id="signin-form" action="/sso/process/login.do" method="post">
+<input type="hidden" value="{public_key}" id="public-key" />
+<input type="hidden" value="6f1c2a9e-0b1d-4c7e-9a55-3f3b1f2c8d77" id="c_r_t" />
+</form>"""
+SERVICE_HEAD = """<html><head><meta charset="utf-8"><title>MSI</title>{styles}</head><body>
+<div class="header"><a href="/servlet/security/MySecurityLogout">로그아웃</a></div>"""
+
+
+def make_pages(page_kb: int) -> dict:
+    styles = '<style>' + '.menu-item{padding:4px 8px;margin:0}' * 40 + '</style>'
+    filler = '<div class="notice">개인정보 처리방침 및 이용약관 안내문</div>\n'
+    public_key = 'MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA' * 8
+    pages = {}
+    for name, head in (('login', LOGIN_HEAD), ('service', SERVICE_HEAD)):
+        html = head.format(styles=styles, public_key=public_key)
+        repeat = max(0, (page_kb * 1024 - len(html.encode('utf-8'))) // len(filler.encode('utf-8')))
+        pages[name] = (html + filler * repeat + '</body></html>').encode('utf-8')
+    return pages
+
+
+def serve(pages: dict, chunk_size: int, delay: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True  # 조각마다 바로 보냄 (localhost의 지연 ACK 40ms 대기 제거)
+
+        def do_GET(self):
+            body = pages[self.path.strip('/')]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html;charset=UTF-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            try:
+                for start in range(0, len(body), chunk_size):
+                    self.wfile.write(body[start:start + chunk_size])
+                    self.wfile.flush()
+                    time.sleep(delay)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # 클라이언트가 필요한 값만 읽고 커넥션을 닫음
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+
+        def handle_error(self, request, client_address):
+            pass  # 닫힌 커넥션의 다음 요청 대기 중 reset
+
+    server = Server(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def decide_full(session, url: str, page: str):
+    response = session.get(url)
+    text = response_text(response)
+    if page == 'login':
+        return HTMLParser.extract_login_page_data(text), len(response.content)
+    return HTMLParser.classify_page(text).has_logout, len(response.content)
+
+
+def decide_streamed(session, url: str, page: str):
+    response = session.get(url, stream=True)
+    scanner = LoginPageScanner() if page == 'login' else SessionPageScanner(logout_decides=True)
+    received = read_until(response, scanner)
+    if page == 'login':
+        return HTMLParser.extract_login_page_data(scanner.text), received
+    return HTMLParser.classify_page(scanner.text).has_logout, received
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--page-kb', type=int, default=120, help='페이지 크기 (KB)')
+    parser.add_argument('--chunk-kb', type=int, default=16, help='서버가 한 번에 보내는 크기 (KB)')
+    parser.add_argument('--delay-ms', type=float, default=2.0, help='서버가 조각 사이에 쉬는 시간 (ms)')
+    parser.add_argument('--repeat', type=int, default=30, help='모드별 반복 횟수')
+    args = parser.parse_args()
+
+    pages = make_pages(args.page_kb)
+    server = serve(pages, args.chunk_kb * 1024, args.delay_ms / 1000)
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    session = create_session(pooled=False)
+
+    print(f"page={args.page_kb}KB chunk={args.chunk_kb}KB delay={args.delay_ms}ms repeat={args.repeat}")
+    print(f"{'page':<9}{'mode':<10}{'bytes read':>12}{'p50(ms)':>10}{'mean(ms)':>10}{'same result':>13}")
+    for page in ('login', 'service'):
+        url = f'{base}/{page}'
+        expected = None
+        for mode, decide in (('full', decide_full), ('streamed', decide_streamed)):
+            decide(session, url, page)  # 워밍업 (커넥션 생성)
+            samples, received = [], 0
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                result, received = decide(session, url, page)
+                samples.append(time.perf_counter() - started)
+            expected = expected if expected is not None else result
+            samples.sort()
+            print(f"{page:<9}{mode:<10}{received:>12}{samples[len(samples) // 2] * 1000:>10.2f}"
+                  f"{statistics.fmean(samples) * 1000:>10.2f}{str(result == expected):>13}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
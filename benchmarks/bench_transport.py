@@ -0,0 +1,93 @@
+"""
+공유 커넥션 풀 벤치마크
+======================
+로그인 1회와 같은 횟수(5회)의 요청을 보내는 "가짜 로그인"을 반복하며
+로그인마다 새 `requests.Session()`을 만드는 방식과
+`create_session()`(공유 커넥션 풀) 방식을 비교합니다.
+
+로컬 대역 서버를 사용하므로 네트워크 없이 실행됩니다.
+서버 측에서 새로 맺어진 TCP 커넥션 수를 세어 핸드셰이크 절감 효과를 보여줍니다.
+
+실행:
+- `python benchmarks/bench_transport.py`
+- `python benchmarks/bench_transport.py --tls --logins 200 --threads 8`
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.infrastructure.transport import configure_transport, create_session  # noqa: E402
+from _local_server import LocalServer  # noqa: E402
+
+REQUESTS_PER_LOGIN = 5  # 로그인 페이지 GET, 로그인 POST, 폼 제출 2회, 결과 페이지
+
+
+def fake_login(session: requests.Session, base_url: str) -> None:
+    """로그인 한 번과 같은 순서로 요청을 보냅니다."""
+    session.get(f"{base_url}/sso/auth", verify=False)
+    session.post(f"{base_url}/sso/process/login.do", data={'user_id': 'x'}, verify=False)
+    session.post(f"{base_url}/index_Myiweb.jsp", data={'token': 'x'}, verify=False)
+    session.post(f"{base_url}/servlet/security/MySecurityStart", data={'token': 'x'}, verify=False)
+    session.get(f"{base_url}/servlet/security/MySecurityStart", verify=False)
+
+
+def run(server: LocalServer, logins: int, threads: int, pooled: bool) -> dict:
+    server.reset_stats()
+
+    def one_login(_):
+        session = create_session() if pooled else requests.Session()
+        try:
+            fake_login(session, server.base_url)
+        finally:
+            session.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(one_login, range(logins)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'elapsed': elapsed,
+        'connections': server.connections,
+        'requests': server.requests,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--logins', type=int, default=100)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--tls', action='store_true', help='자체 서명 인증서로 HTTPS 서버 사용')
+    parser.add_argument('--pool-maxsize', type=int, default=None)
+    args = parser.parse_args()
+
+    warnings.filterwarnings('ignore', message='Unverified HTTPS request')
+    if args.pool_maxsize:
+        configure_transport(pool_maxsize=args.pool_maxsize)
+
+    with LocalServer(tls=args.tls) as server:
+        fresh = run(server, args.logins, args.threads, pooled=False)
+        pooled = run(server, args.logins, args.threads, pooled=True)
+
+    scheme = 'HTTPS' if args.tls else 'HTTP'
+    print(f"\n[{scheme}] 로그인 {args.logins}회 x 요청 {REQUESTS_PER_LOGIN}회, 스레드 {args.threads}개\n")
+    print(f"{'방식':<24}{'소요 시간':>12}{'새 커넥션':>12}{'요청':>10}{'로그인당 ms':>14}")
+    for label, stats in (('requests.Session()', fresh), ('create_session() (공유)', pooled)):
+        per_login = stats['elapsed'] / args.logins * 1000
+        print(f"{label:<24}{stats['elapsed']:>11.3f}s{stats['connections']:>12}{stats['requests']:>10}{per_login:>14.2f}")
+
+    saved = fresh['connections'] - pooled['connections']
+    print(f"\n절감된 핸드셰이크: {saved}회 ({saved / max(fresh['connections'], 1):.0%})")
+    print(f"속도 향상: x{fresh['elapsed'] / max(pooled['elapsed'], 1e-9):.2f}")
+
+
+if __name__ == '__main__':
+    main()
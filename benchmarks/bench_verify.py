@@ -0,0 +1,104 @@
+"""
+자격 증명 검증 벤치마크
+======================
+`verify_credentials()`(로그인 POST 응답에서 중단)와 전체 `login()`을 같은 계정으로 반복하며
+로그인 1회당 HTTP 왕복 수, 수신 바이트, 소요 시간을 비교합니다.
+
+테스트용 가짜 SSO 서버(tests/mock/mock_sso_server.py)를 httpx MockTransport로 연결하므로
+네트워크 없이 실행됩니다. `--rtt-ms`로 요청마다 지연을 주어 실제 왕복 비용을 흉내 내고,
+`--page-kb`로 서비스 첫 페이지 크기를 키워 실제 포털 페이지 크기를 흉내 냅니다.
+
+실행 (httpx 필요):
+- `python benchmarks/bench_verify.py`
+- `python benchmarks/bench_verify.py --logins 200 --concurrency 50 --rtt-ms 30 --page-kb 120`
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mju_univ_auth.authenticator import async_standard_authenticator  # noqa: E402
+from mju_univ_auth import AsyncStandardAuthenticator  # noqa: E402
+from tests.mock.mock_sso_server import MockSSOServer  # noqa: E402
+
+
+class DelayedTransport(httpx.AsyncBaseTransport):
+    """요청마다 rtt만큼 기다린 뒤 가짜 서버로 위임"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, rtt: float):
+        self._transport = transport
+        self._rtt = rtt
+
+    async def handle_async_request(self, request):
+        await asyncio.sleep(self._rtt)
+        return await self._transport.handle_async_request(request)
+
+
+async def run(accounts: dict, logins: int, concurrency: int, verify: bool) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    credentials = list(accounts.items())
+    totals = {'round_trips': 0, 'bytes': 0, 'failures': 0}
+
+    async def one(i: int) -> None:
+        user_id, user_pw = credentials[i % len(credentials)]
+        # 병합 없이 매번 실제로 수행
+        auth = AsyncStandardAuthenticator(user_id, user_pw, single_flight=False)
+        async with semaphore:
+            if verify:
+                result = await auth.verify_credentials('msi')
+                stats = result.data
+            else:
+                result = await auth.login('msi')
+                stats = auth.login_stats
+                await auth.aclose()
+        if not result.success:
+            totals['failures'] += 1
+            return
+        totals['round_trips'] += stats.round_trips
+        totals['bytes'] += stats.bytes_received
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(logins)))
+    elapsed = time.perf_counter() - started
+    return {'elapsed': elapsed, **totals}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--logins', type=int, default=100, help='모드별 로그인 횟수')
+    parser.add_argument('--concurrency', type=int, default=20, help='동시 로그인 수')
+    parser.add_argument('--rtt-ms', type=float, default=20.0, help='요청당 흉내 낼 왕복 지연 (ms)')
+    parser.add_argument('--page-kb', type=int, default=60, help='서비스 첫 페이지에 덧붙일 크기 (KB)')
+    args = parser.parse_args()
+
+    accounts = {f'6020{i:04d}': f'pw-{i}' for i in range(args.concurrency)}
+    server = MockSSOServer(accounts, home_padding=args.page_kb * 1024)
+    rtt = args.rtt_ms / 1000
+    async_standard_authenticator.create_async_client = lambda: httpx.AsyncClient(
+        transport=DelayedTransport(server.httpx_transport(), rtt), follow_redirects=True,
+    )
+
+    results = {}
+    for name, verify in (('login()', False), ('verify_credentials()', True)):
+        results[name] = asyncio.run(run(accounts, args.logins, args.concurrency, verify))
+
+    print(f"logins={args.logins} concurrency={args.concurrency} rtt={args.rtt_ms}ms page={args.page_kb}KB")
+    print(f"{'mode':<22}{'round trips/login':>18}{'KB/login':>12}{'elapsed(s)':>12}{'failures':>10}")
+    for name, r in results.items():
+        done = max(args.logins - r['failures'], 1)
+        print(f"{name:<22}{r['round_trips'] / done:>18.2f}{r['bytes'] / done / 1024:>12.1f}"
+              f"{r['elapsed']:>12.2f}{r['failures']:>10}")
+
+    full, fast = results['login()'], results['verify_credentials()']
+    print(f"\nsaved per login: {(full['round_trips'] - fast['round_trips']) / args.logins:.2f} round trips, "
+          f"{(full['bytes'] - fast['bytes']) / args.logins / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,8 @@ MSI(My iWeb) 서비스에 접속하여 학생 정보를 조회하는 모듈
     print(student_card.data.student_profile.name_korean)
 
 모듈 구성:
-- facade: MjuUnivAuth - 메인 API 클래스
+- facade: MjuUnivAuth - 메인 API 클래스 (async_facade: AsyncMjuUnivAuth - asyncio 버전)
+- bulk: login_many, alogin_many - 대량 로그인 (완료 순 스트리밍)
 - domain: StudentBasicInfo, StudentCard, StudentChangeLog - 데이터 모델
 - base: Authenticator, BaseFetcher - 기반 클래스
 - config: 서비스 설정
@@ -21,16 +22,28 @@ MSI(My iWeb) 서비스에 접속하여 학생 정보를 조회하는 모듈
 
 # 메인 Facade 클래스
 from .facade import MjuUnivAuth
+from .async_facade import AsyncMjuUnivAuth
+from .bulk import login_many, alogin_many
 
 # Authenticator 클래스
 from .authenticator.base_authenticator import BaseAuthenticator
 from .authenticator.standard_authenticator import StandardAuthenticator
+from .authenticator.async_standard_authenticator import AsyncStandardAuthenticator
+from .authenticator.login_context_pool import LoginContextPool, LoginContextPoolMetrics
+from .infrastructure.crypto import SessionKeyPool, SessionKeyPoolMetrics, use_session_key_pool
+from .infrastructure.parser import ParserBackend, register_parser_backend, use_parser_backend
+from .infrastructure.parse_cache import ParseCache, ParseCacheMetrics, use_parse_cache
+from .infrastructure.parse_pool import ParsePool, ParsePoolMetrics, use_parse_pool
 
 # Fetcher 클래스
 from .fetcher.base_fetcher import BaseFetcher
 from .fetcher.student_basicinfo_fetcher import StudentBasicInfoFetcher
 from .fetcher.student_card_fetcher import StudentCardFetcher
 from .fetcher.student_changelog_fetcher import StudentChangeLogFetcher
+from .fetcher.async_base_fetcher import AsyncBaseFetcher
+from .fetcher.async_student_basicinfo_fetcher import AsyncStudentBasicInfoFetcher
+from .fetcher.async_student_card_fetcher import AsyncStudentCardFetcher
+from .fetcher.async_student_changelog_fetcher import AsyncStudentChangeLogFetcher
 
 # 도메인 모델
 from .domain import (
@@ -46,6 +59,7 @@ from .domain import (
 
 # 결과 객체
 from .results import MjuUnivAuthResult, ErrorCode
+from .authenticator.sso_login_protocol import LoginStats
 
 # 예외 클래스
 from .exceptions import (
@@ -63,16 +77,38 @@ from .exceptions import (
 __all__ = [
     # 메인 API
     'MjuUnivAuth',
+    'AsyncMjuUnivAuth',
+    'login_many',
+    'alogin_many',
     
     # 기반 클래스
     'BaseAuthenticator',
     'StandardAuthenticator',
+    'AsyncStandardAuthenticator',
+    'LoginContextPool',
+    'LoginContextPoolMetrics',
+    'SessionKeyPool',
+    'SessionKeyPoolMetrics',
+    'use_session_key_pool',
+    'ParserBackend',
+    'register_parser_backend',
+    'use_parser_backend',
+    'ParseCache',
+    'ParseCacheMetrics',
+    'use_parse_cache',
+    'ParsePool',
+    'ParsePoolMetrics',
+    'use_parse_pool',
     'BaseFetcher',
+    'AsyncBaseFetcher',
     
     # Fetcher 클래스
     'StudentBasicInfoFetcher',
     'StudentCardFetcher',
     'StudentChangeLogFetcher',
+    'AsyncStudentBasicInfoFetcher',
+    'AsyncStudentCardFetcher',
+    'AsyncStudentChangeLogFetcher',
     
     # 데이터 클래스
     'StudentBasicInfo',
@@ -87,6 +123,7 @@ __all__ = [
     # 결과 객체
     'MjuUnivAuthResult',
     'ErrorCode',
+    'LoginStats',
 
     # 예외 클래스
     'MjuUnivAuthError',
@@ -0,0 +1,286 @@
+"""
+AsyncMjuUnivAuth Facade
+=======================
+MjuUnivAuth의 asyncio 버전입니다. (httpx 필요: pip install 'mju_univ_auth[async]')
+
+로그인/조회의 모든 네트워크 요청을 `httpx.AsyncClient`로 보내므로,
+ASGI 서버 등 이벤트 루프 안에서 워커 스레드를 점유하지 않고 MSI 정보를 조회할 수 있습니다.
+결과(MjuUnivAuthResult)와 에러 코드(ErrorCode)는 동기 Facade와 동일합니다.
+"""
+
+from typing import Callable, Iterable, Optional, TypeVar
+import logging
+
+from .authenticator.async_standard_authenticator import AsyncStandardAuthenticator
+from .authenticator.sso_login_protocol import LoginStats
+from .fetcher.async_base_fetcher import AsyncBaseFetcher
+from .fetcher.async_student_basicinfo_fetcher import AsyncStudentBasicInfoFetcher
+from .fetcher.async_student_card_fetcher import AsyncStudentCardFetcher
+from .fetcher.async_student_changelog_fetcher import AsyncStudentChangeLogFetcher
+from .domain.student_basicinfo import StudentBasicInfo
+from .domain.student_card import StudentCard
+from .domain.student_changelog import StudentChangeLog
+from .infrastructure.transport import httpx
+from .results import MjuUnivAuthResult, ErrorCode
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncMjuUnivAuth:
+    """
+    명지대학교 통합 인증/정보 조회 비동기 Facade
+
+    - MjuUnivAuth와 같이 "하나의 인스턴스는 하나의 성공적인 세션만 책임진다" 원칙을 따릅니다.
+    - 사용이 끝나면 `aclose()`를 호출하거나 `async with` 구문을 사용합니다.
+
+    사용 예시:
+    ```python
+    from mju_univ_auth import AsyncMjuUnivAuth
+
+    async with AsyncMjuUnivAuth(user_id="학번", user_pw="비밀번호") as auth:
+        await auth.login("msi")
+        card_result = await auth.get_student_card()
+        if card_result.success:
+            print(f"이름: {card_result.data.student_profile.name_korean}")
+    ```
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        user_pw: str,
+        verbose: bool = False,
+    ):
+        """
+        Args:
+            user_id: 학번/교번
+            user_pw: 비밀번호
+            verbose: 상세 로그 출력 여부
+        """
+        self._user_id = user_id
+        self._user_pw = user_pw
+        self._verbose = verbose
+
+        self._authenticator: Optional[AsyncStandardAuthenticator] = None
+        self._service: Optional[str] = None
+        self._login_result: Optional[MjuUnivAuthResult] = None
+
+    async def __aenter__(self) -> 'AsyncMjuUnivAuth':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def login(self, service: str = 'msi') -> 'AsyncMjuUnivAuth':
+        """
+        로그인을 수행합니다.
+        성공/실패와 관계없이 self를 반환하며, 결과는 `get_session()`으로 확인할 수 있습니다.
+
+        Args:
+            service: 로그인할 서비스 ('main', 'msi', 'lms', 'portal', 'myicap', 'intern', 'ipp', 'ucheck')
+
+        Returns:
+            AsyncMjuUnivAuth: self
+        """
+        await self.aclose()
+
+        self._authenticator = AsyncStandardAuthenticator(
+            user_id=self._user_id,
+            user_pw=self._user_pw,
+            verbose=self._verbose
+        )
+        self._login_result = await self._authenticator.login(service)
+
+        if self._login_result.success:
+            self._service = service
+        else:
+            self._service = None
+        return self
+
+    async def verify_credentials(self, service: str = 'msi') -> MjuUnivAuthResult[LoginStats]:
+        """
+        아이디/비밀번호가 맞는지만 확인합니다. (세션을 만들지 않으며 로그인 상태도 바뀌지 않습니다)
+
+        Args:
+            service: 검증에 사용할 서비스 (기본값: 'msi')
+
+        Returns:
+            MjuUnivAuthResult[LoginStats]: 검증 결과. `credentials_valid`로 유효성을 확인합니다.
+        """
+        authenticator = AsyncStandardAuthenticator(
+            user_id=self._user_id,
+            user_pw=self._user_pw,
+            verbose=self._verbose
+        )
+        return await authenticator.verify_credentials(service)
+
+    async def is_logged_in(self, service: str = 'msi') -> bool:
+        """
+        현재 세션이 유효한지 서버에 요청하여 확인합니다.
+
+        Args:
+            service: 유효성을 확인할 서비스.
+
+        Returns:
+            bool: 세션 유효 여부
+        """
+        if self._login_result is None or not self._login_result.success:
+            return False
+        return await self._authenticator.is_session_valid(service)
+
+    async def aclose(self) -> None:
+        """로그인 세션(httpx.AsyncClient)을 닫습니다. (공유 커넥션 풀은 유지됩니다)"""
+        if self._authenticator is not None:
+            await self._authenticator.aclose()
+        self._authenticator = None
+        self._service = None
+        self._login_result = None
+
+    @property
+    def session(self) -> Optional['httpx.AsyncClient']:
+        """
+        현재 로그인된 `httpx.AsyncClient` 객체를 반환합니다.
+        로그인되지 않은 경우 `None`을 반환합니다.
+        """
+        return self._login_result.data if self._login_result and self._login_result.success else None
+
+    @property
+    def service(self) -> Optional[str]:
+        """
+        로그인에 성공한 서비스의 이름을 반환합니다.
+        로그인되지 않은 경우 `None`을 반환합니다.
+        """
+        return self._service
+
+    def get_session(self) -> MjuUnivAuthResult['httpx.AsyncClient']:
+        """
+        현재 로그인된 세션을 반환합니다.
+
+        Returns:
+            MjuUnivAuthResult[httpx.AsyncClient]: 세션 객체
+        """
+        if self._login_result is None:
+            return MjuUnivAuthResult(
+                request_succeeded=False,
+                error_code=ErrorCode.SESSION_NOT_EXIST_ERROR,
+                error_message="세션이 없습니다."
+            )
+        return self._login_result
+
+    def _check_msi_session(self, data_name: str) -> Optional[MjuUnivAuthResult]:
+        """MSI 조회 전 세션 상태 확인. 조회할 수 없으면 실패 결과를, 가능하면 None을 반환"""
+        if self._login_result is None:
+            return MjuUnivAuthResult(
+                request_succeeded=False,
+                error_code=ErrorCode.SESSION_NOT_EXIST_ERROR,
+                error_message="세션이 없습니다."
+            )
+
+        if not self._login_result.success:
+            return self._login_result
+
+        if self._service != 'msi':
+            return MjuUnivAuthResult(
+                request_succeeded=False,
+                error_code=ErrorCode.INVALID_SERVICE_USAGE_ERROR,
+                error_message=f"MSI 서비스로 로그인된 세션이 아닙니다. {data_name}는 MSI 서비스 로그인이 필요합니다."
+            )
+        return None
+
+    async def _fetch_with_reauth(
+        self, create_fetcher: Callable[[], AsyncBaseFetcher[T]], fields: Optional[Iterable[str]] = None
+    ) -> MjuUnivAuthResult[T]:
+        """
+        조회 중 서비스 세션이 만료되었으면 SSO 세션 쿠키로 조용히 재인증한 뒤 한 번 더 조회합니다.
+        SSO 세션까지 만료되었으면 첫 조회 결과(SESSION_EXPIRED_ERROR)를 그대로 반환합니다.
+        fields는 Fetcher.fetch()의 필드 프로젝션입니다.
+        """
+        result = await create_fetcher().fetch(fields)
+        if result.error_code != ErrorCode.SESSION_EXPIRED_ERROR:
+            return result
+
+        if self._verbose:
+            logger.info("서비스 세션 만료: SSO 세션으로 재인증 시도")
+        reauth_result = await self._authenticator.reauthenticate(service=self._service, login_fallback=False)
+        if not reauth_result.success:
+            return result
+        return await create_fetcher().fetch(fields)
+
+    # =================================================================
+    # 데이터 조회 메서드 (고수준 API)
+    # =================================================================
+
+    async def get_student_basicinfo(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[StudentBasicInfo]:
+        """
+        학생 기본 정보(대시보드 요약)를 조회합니다.
+        MSI 서비스 로그인이 필요합니다.
+
+        Args:
+            fields: 조회할 모델 필드 경로 (예: {'department'}). 주면 나머지 값은 페이지에서 찾지 않고 기본값으로 둡니다.
+                    (없으면 전부 조회, 모델에 없는 경로면 ValueError)
+
+        Returns:
+            MjuUnivAuthResult[StudentBasicInfo]: 학생 기본 정보 조회 결과
+        """
+        if self._verbose:
+            logger.info("===== mju-univ-auth: 학생 기본 정보 비동기 조회 =====")
+
+        error_result = self._check_msi_session("학생 기본 정보")
+        if error_result is not None:
+            return error_result
+
+        return await self._fetch_with_reauth(lambda: AsyncStudentBasicInfoFetcher(
+            session=self._login_result.data,
+            verbose=self._verbose,
+        ), fields)
+
+    async def get_student_card(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[StudentCard]:
+        """
+        학생카드 정보를 조회합니다.
+        MSI 서비스 로그인이 필요하며, 내부적으로 2차 인증을 수행합니다.
+
+        Args:
+            fields: 조회할 모델 필드 경로 (예: {'student_profile.name_korean'}). 주면 나머지 값은 페이지에서 찾지 않고 기본값으로 둡니다.
+                    (없으면 전부 조회, 모델에 없는 경로면 ValueError)
+
+        Returns:
+            MjuUnivAuthResult[StudentCard]: 학생카드 정보 조회 결과
+        """
+        if self._verbose:
+            logger.info("===== mju-univ-auth: 학생카드 비동기 조회 =====")
+
+        error_result = self._check_msi_session("학생카드 정보")
+        if error_result is not None:
+            return error_result
+
+        return await self._fetch_with_reauth(lambda: AsyncStudentCardFetcher(
+            session=self._login_result.data,
+            user_pw=self._user_pw,
+            verbose=self._verbose,
+        ), fields)
+
+    async def get_student_changelog(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[StudentChangeLog]:
+        """
+        학적변동내역을 조회합니다.
+        MSI 서비스 로그인이 필요합니다.
+
+        Args:
+            fields: 조회할 모델 필드 경로 (예: {'academic_status.status'}). 주면 나머지 값은 페이지에서 찾지 않고 기본값으로 둡니다.
+                    (없으면 전부 조회, 모델에 없는 경로면 ValueError)
+
+        Returns:
+            MjuUnivAuthResult[StudentChangeLog]: 학적변동내역 정보 조회 결과
+        """
+        if self._verbose:
+            logger.info("===== mju-univ-auth: 학적변동내역 비동기 조회 =====")
+
+        error_result = self._check_msi_session("학적변동내역 정보")
+        if error_result is not None:
+            return error_result
+
+        return await self._fetch_with_reauth(lambda: AsyncStudentChangeLogFetcher(
+            session=self._login_result.data,
+            verbose=self._verbose,
+        ), fields)
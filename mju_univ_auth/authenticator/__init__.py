@@ -1,7 +1,18 @@
 from .base_authenticator import BaseAuthenticator
+from .sso_login_protocol import SSOLoginProtocol, HttpRequest, HttpResponse, LoginState, LoginStats
+from .login_context_pool import LoginContextPool, LoginContextPoolMetrics
 from .standard_authenticator import StandardAuthenticator
+from .async_standard_authenticator import AsyncStandardAuthenticator
 
 __all__ = [
     "BaseAuthenticator",
+    "SSOLoginProtocol",
+    "HttpRequest",
+    "HttpResponse",
+    "LoginState",
+    "LoginStats",
+    "LoginContextPool",
+    "LoginContextPoolMetrics",
     "StandardAuthenticator",
-]
\ No newline at end of file
+    "AsyncStandardAuthenticator",
+]
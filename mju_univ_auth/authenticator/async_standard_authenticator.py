@@ -0,0 +1,463 @@
+"""
+비동기 표준 인증 모듈
+=====================
+asyncio 기반 AsyncStandardAuthenticator 클래스를 정의합니다.
+
+StandardAuthenticator와 같은 로그인 절차(SSOLoginProtocol)/결과(MjuUnivAuthResult)/에러 매핑을 따르지만,
+HTTP 요청을 `httpx.AsyncClient`로 보내므로 하나의 이벤트 루프에서 수천 건의 로그인을
+스레드 없이 동시에 처리할 수 있습니다.
+
+사용법 (httpx 필요: pip install 'mju_univ_auth[async]'):
+    auth = AsyncStandardAuthenticator(user_id="학번", user_pw="비밀번호")
+    result = await auth.login('msi')
+    if result.success:
+        client = result.data  # httpx.AsyncClient
+"""
+import asyncio
+import time
+import weakref
+from typing import Dict, Optional, Sequence, Tuple
+import logging
+
+from .base_authenticator import _login_error_result, _split_services
+from .sso_login_protocol import (
+    SSOLoginProtocol,
+    HttpRequest,
+    HttpResponse,
+    LoginStats,
+    is_final_url_reached,
+    is_sso_cookie_domain,
+    is_sso_url,
+)
+from ..config import SERVICES, TIMEOUT_CONFIG, DEFAULT_HEADERS
+from ..infrastructure.parser import HTMLParser, SessionPageScanner, response_text
+from ..infrastructure.crypto import generate_session_key, encrypt_with_rsa, encrypt_with_aes, take_pooled_session_key
+from ..infrastructure.transport import httpx, require_httpx, create_async_client, aread_until
+from ..infrastructure.single_flight import AsyncSingleFlight, login_flight_key
+from ..results import MjuUnivAuthResult, ErrorCode
+from ..exceptions import NetworkError
+from ..utils import mask_sensitive
+
+logger = logging.getLogger(__name__)
+
+# 같은 (user_id, service, 비밀번호) 로그인이 동시에 오면 한 번만 수행 (이벤트 루프별)
+_login_flights = AsyncSingleFlight()
+# 병합된 로그인으로 여러 Authenticator가 공유하는 클라이언트 -> 아직 aclose()하지 않은 Authenticator 수
+_client_refs: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _share_client(result: MjuUnivAuthResult, callers: int) -> None:
+    """병합된 로그인 결과의 클라이언트 참조 수 기록"""
+    if result.success:
+        _client_refs[result.data] = callers
+
+
+class AsyncStandardAuthenticator:
+    """명지대학교 표준 SSO 인증을 asyncio로 처리하는 클래스"""
+
+    def __init__(
+        self,
+        user_id: str,
+        user_pw: str,
+        verbose: bool = False,
+        single_flight: bool = True,
+        stream_pages: bool = False,
+    ):
+        """
+        Args:
+            user_id: 학번/교번
+            user_pw: 비밀번호
+            verbose: 상세 로그 출력 여부
+            single_flight: 같은 계정의 동시 로그인을 하나로 합칠지 여부
+            stream_pages: 로그인 페이지와 세션 유효성 검사 페이지를 필요한 값이 나올 때까지만 읽을지 여부
+        """
+        require_httpx()
+        self._user_id = user_id
+        self._user_pw = user_pw
+        self._verbose = verbose
+        self._single_flight = single_flight
+        self._stream_pages = stream_pages
+        self._client: Optional['httpx.AsyncClient'] = None
+        self._service: Optional[str] = None
+        self._login_stats: Optional[LoginStats] = None
+        # 로그인 과정에서 획득한 데이터
+        self._public_key: Optional[str] = None
+        self._csrf_token: Optional[str] = None
+        # 1단계 요청과 겹쳐 미리 계산한 (세션키, AES 암호화된 비밀번호)
+        self._password_material: Optional[Tuple[dict, str]] = None
+
+    async def login(self, service: str = 'msi') -> MjuUnivAuthResult['httpx.AsyncClient']:
+        """
+        SSO 로그인 수행
+
+        같은 (user_id, service, 비밀번호)의 로그인이 이미 진행 중이면 새로 로그인하지 않고
+        그 결과를 함께 받습니다. 공유된 클라이언트는 마지막 Authenticator가 aclose()할 때 닫힙니다.
+
+        Args:
+            service: 로그인할 서비스 (기본값: 'msi')
+
+        Returns:
+            MjuUnivAuthResult[httpx.AsyncClient]: 로그인 결과
+        """
+        if not self._single_flight:
+            return await self._login(service)
+
+        key = login_flight_key(self._user_id, service, self._user_pw)
+        result = await _login_flights.do(key, lambda: self._login(service), on_done=_share_client)
+        if result.success:
+            self._client = result.data
+            self._service = service
+        else:
+            self._client = None
+            self._service = None
+        return result
+
+    async def _login(self, service: str) -> MjuUnivAuthResult['httpx.AsyncClient']:
+        """병합 없이 로그인 1회 수행"""
+        client = create_async_client()
+        try:
+            await self._execute_login(client, service)
+            self._service = service
+
+            return MjuUnivAuthResult(
+                request_succeeded=True,
+                credentials_valid=True,
+                data=client
+            )
+
+        except Exception as e:
+            self._client = None
+            self._service = None
+            await client.aclose()
+            return _login_error_result(e)
+
+    async def _execute_login(self, client: 'httpx.AsyncClient', service: str):
+        """
+        실제 SSO 로그인 로직 (StandardAuthenticator와 같은 SSOLoginProtocol을 비동기로 구동)
+
+        Raises:
+            ServiceNotFoundError: 알 수 없는 서비스
+            InvalidCredentialsError: 로그인 정보가 틀렸을 때
+            ParsingError: 로그인 페이지 파싱에 실패했을 때
+            NetworkError: 네트워크 요청에 실패했을 때
+        """
+        self._client = client
+        self._client.headers.update(DEFAULT_HEADERS)
+
+        protocol = self._create_protocol(service)
+
+        if self._verbose:
+            logger.info(f"===== MJU SSO 비동기 로그인: {protocol.service_config.name} =====")
+            logger.info(f"User ID: {mask_sensitive(self._user_id)}")
+
+        await self._drive(client, protocol, overlap_crypto=True)
+        self._login_stats = protocol.stats
+
+    async def verify_credentials(self, service: str = 'msi') -> MjuUnivAuthResult[LoginStats]:
+        """
+        자격 증명(아이디/비밀번호)의 유효성만 확인합니다. (StandardAuthenticator.verify_credentials 참고)
+
+        로그인 POST 응답에서 승인/거부가 결정되면 멈추며, 서비스 세션은 만들지 않습니다.
+
+        Args:
+            service: 검증에 사용할 서비스 (기본값: 'msi')
+
+        Returns:
+            MjuUnivAuthResult[LoginStats]: 검증 결과 (data: 왕복 수/수신 바이트/소요 시간)
+        """
+        if not self._single_flight:
+            return await self._verify_credentials(service)
+
+        key = login_flight_key(self._user_id, f'verify:{service}', self._user_pw)
+        return await _login_flights.do(key, lambda: self._verify_credentials(service))
+
+    async def _verify_credentials(self, service: str) -> MjuUnivAuthResult[LoginStats]:
+        """병합 없이 자격 증명 검증 1회 수행"""
+        client = create_async_client()
+        try:
+            client.headers.update(DEFAULT_HEADERS)
+            protocol = self._create_protocol(service, verify_only=True)
+            await self._drive(client, protocol, overlap_crypto=True)
+            return MjuUnivAuthResult(
+                request_succeeded=True,
+                credentials_valid=True,
+                data=protocol.stats
+            )
+        except Exception as e:
+            return _login_error_result(e)
+        finally:
+            await client.aclose()
+
+    async def login_services(self, services: Sequence[str]) -> Dict[str, MjuUnivAuthResult['httpx.AsyncClient']]:
+        """
+        한 번의 SSO 로그인으로 여러 서비스에 로그인합니다. (StandardAuthenticator.login_services 참고)
+
+        첫 번째 서비스의 클라이언트는 이 인스턴스가 관리(aclose())하고,
+        나머지 서비스의 클라이언트는 호출자가 직접 `await client.aclose()` 해야 합니다.
+
+        Args:
+            services: 로그인할 서비스 목록 (예: ['msi', 'lms', 'portal'])
+
+        Returns:
+            Dict[str, MjuUnivAuthResult[httpx.AsyncClient]]: 서비스별 로그인 결과 (입력 순서 유지)
+        """
+        known, results = _split_services(services)
+        if not known:
+            return {service: results[service] for service in dict.fromkeys(services)}
+
+        first, rest = known[0], known[1:]
+        results[first] = await self.login(first)
+        if results[first].success:
+            sso_cookies = [c for c in results[first].data.cookies.jar if is_sso_cookie_domain(c.domain)]
+            handoffs = await asyncio.gather(*(self._handoff(service, sso_cookies) for service in rest))
+            results.update(zip(rest, handoffs))
+        else:
+            # 자격 증명/네트워크 실패는 나머지 서비스에도 그대로 적용
+            for service in rest:
+                results[service] = results[first]
+
+        return {service: results[service] for service in dict.fromkeys(services)}
+
+    async def _handoff(self, service: str, sso_cookies: list) -> MjuUnivAuthResult['httpx.AsyncClient']:
+        """SSO 세션 쿠키를 복사한 새 클라이언트로 서비스 진입 (SSO 세션이 만료되었으면 자격 증명 로그인)"""
+        client = create_async_client()
+        for cookie in sso_cookies:
+            client.cookies.jar.set_cookie(cookie)
+        try:
+            client.headers.update(DEFAULT_HEADERS)
+            await self._drive(client, self._create_protocol(service, sso_handoff=True))
+            return MjuUnivAuthResult(
+                request_succeeded=True,
+                credentials_valid=True,
+                data=client
+            )
+        except Exception as e:
+            await client.aclose()
+            return _login_error_result(e)
+
+    async def reauthenticate(
+        self,
+        client: Optional['httpx.AsyncClient'] = None,
+        service: str = 'msi',
+        login_fallback: bool = True,
+    ) -> MjuUnivAuthResult['httpx.AsyncClient']:
+        """
+        서비스 세션이 만료된 클라이언트를 조용히 복구합니다. (StandardAuthenticator.reauthenticate 참고)
+
+        Args:
+            client: 서비스 세션이 만료된 httpx.AsyncClient (기본값: 이 인스턴스가 로그인한 클라이언트)
+            service: 복구할 서비스 (기본값: 'msi')
+            login_fallback: SSO 세션도 만료되었을 때 자격 증명 로그인으로 진행할지 여부
+
+        Returns:
+            MjuUnivAuthResult[httpx.AsyncClient]: 복구 결과 (성공 시 data는 전달한 클라이언트)
+        """
+        client = client if client is not None else self._client
+        if client is None:
+            return MjuUnivAuthResult(
+                request_succeeded=False,
+                error_code=ErrorCode.SESSION_NOT_EXIST_ERROR,
+                error_message="세션이 없습니다."
+            )
+        try:
+            protocol = self._create_protocol(service, sso_handoff=True, login_fallback=login_fallback)
+            await self._drive(client, protocol)
+        except Exception as e:
+            return _login_error_result(e)
+
+        if client is self._client:
+            self._service = service
+        return MjuUnivAuthResult(
+            request_succeeded=True,
+            credentials_valid=True,
+            data=client
+        )
+
+    def _create_protocol(
+        self,
+        service: str,
+        verify_only: bool = False,
+        sso_handoff: bool = False,
+        login_fallback: bool = True,
+    ) -> SSOLoginProtocol:
+        return SSOLoginProtocol(
+            self._user_id,
+            self._user_pw,
+            service,
+            payload_builder=self._build_login_payload,
+            verify_only=verify_only,
+            sso_handoff=sso_handoff,
+            login_fallback=login_fallback,
+            verbose=self._verbose,
+        )
+
+    async def _drive(
+        self,
+        client: 'httpx.AsyncClient',
+        protocol: SSOLoginProtocol,
+        overlap_crypto: bool = False,
+    ) -> None:
+        """
+        프로토콜이 끝날 때까지 요청을 보내고 응답을 돌려줌
+
+        overlap_crypto=True면 세션키 파생/비밀번호 암호화를 1단계 요청과 동시에 기본 실행기(스레드)에서 수행합니다.
+        (이벤트 루프에서 PBKDF2를 돌리지 않음)
+        """
+        self._password_material = None
+        request = protocol.start()
+        material = None
+        if overlap_crypto:
+            material = asyncio.get_running_loop().run_in_executor(None, self._derive_password_material)
+        try:
+            response = await self._send(client, request)
+        except BaseException:
+            if material is not None:
+                material.cancel()
+            raise
+        if material is not None:
+            self._password_material = await material
+        request = protocol.receive(response)
+        while request is not None:
+            request = protocol.receive(await self._send(client, request))
+
+    async def _send(self, client: 'httpx.AsyncClient', request: HttpRequest) -> HttpResponse:
+        """
+        프로토콜이 요청한 HTTP 요청을 전송 (follow_redirects면 HTTP 3xx 리다이렉트는 httpx가 따라감)
+
+        stream_pages 모드에서 요청에 scanner가 있으면 본문을 필요한 값이 나올 때까지만 읽습니다.
+        """
+        scanner = request.scanner() if self._stream_pages and request.scanner is not None else None
+        try:
+            http_request = client.build_request(
+                request.method,
+                request.url,
+                data=request.data,
+                headers=request.headers,
+                timeout=request.timeout,
+            )
+            response = await client.send(
+                http_request, stream=scanner is not None, follow_redirects=request.follow_redirects,
+            )
+            if scanner is not None:
+                size = await aread_until(response, scanner)
+        except httpx.HTTPError as e:
+            raise NetworkError(request.description, url=request.url, original_error=e)
+
+        if scanner is None:
+            text, size = response_text(response), len(response.content)
+        else:
+            text = scanner.text
+        return HttpResponse(
+            url=str(response.url),
+            status_code=response.status_code,
+            text=text,
+            location=response.headers.get('Location'),
+            round_trips=len(response.history) + 1,
+            size=sum(len(r.content) for r in response.history) + size,
+        )
+
+    def _build_login_payload(self, public_key: str, csrf_token: str) -> dict:
+        """SSOLoginProtocol의 payload_builder: 로그인 페이지에서 얻은 값으로 암호화 데이터 준비"""
+        self._public_key = public_key
+        self._csrf_token = csrf_token
+        return self._prepare_encrypted_data()
+
+    def _derive_password_material(self) -> Tuple[dict, str]:
+        """(세션키 정보, AES 암호화된 비밀번호) - 로그인 페이지와 무관하므로 1단계 요청과 겹쳐 계산"""
+        key_info = take_pooled_session_key(32) or generate_session_key(32)
+        return key_info, encrypt_with_aes(self._user_pw, key_info)
+
+    def _prepare_encrypted_data(self) -> dict:
+        """암호화된 로그인 데이터 준비 (미리 계산한 값이 없으면 여기서 계산, RSA는 공개키가 필요하므로 항상 여기서)"""
+        material, self._password_material = self._password_material, None
+        key_info, pw_enc = material if material is not None else self._derive_password_material()
+        timestamp = str(int(time.time() * 1000))
+        encsymka = encrypt_with_rsa(f"{key_info['keyStr']},{timestamp}", self._public_key)
+
+        return {
+            'user_id': self._user_id,
+            'pw': '',
+            'pw_enc': pw_enc,
+            'encsymka': encsymka,
+            'c_r_t': self._csrf_token,
+            'user_id_enc': '',
+        }
+
+    async def is_session_valid(self, service: str = 'msi') -> bool:
+        """
+        현재 세션이 유효한지 가볍게 체크합니다.
+
+        Args:
+            service: 확인할 서비스 (기본값: 'msi')
+
+        Returns:
+            bool: 세션이 유효하면 True, 아니면 False
+        """
+        if self._client is None or service not in SERVICES:
+            return False
+
+        service_config = SERVICES[service]
+        try:
+            request = self._client.build_request('GET', service_config.final_url, timeout=TIMEOUT_CONFIG.default)
+            response = await self._client.send(request, stream=self._stream_pages)
+            if self._stream_pages:
+                # 로그인 폼은 SSO 페이지에만 있으므로, 서비스 페이지면 로그아웃 표시만으로도 판정이 끝남
+                scanner = SessionPageScanner(logout_decides=not is_sso_url(str(response.url)))
+                await aread_until(response, scanner)
+                text = scanner.text
+            else:
+                text = response_text(response)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            if self._verbose:
+                logger.error(f"세션 유효성 검사 중 네트워크 오류 발생: {e}")
+            return False
+
+        page = HTMLParser.classify_page(text)
+        if page.has_signin_form:
+            return False
+        if page.has_logout:
+            return True
+        return is_final_url_reached(str(response.url), service_config.final_url)
+
+    async def aclose(self) -> None:
+        """
+        로그인에 사용한 클라이언트를 닫습니다. (공유 커넥션 풀은 유지됩니다)
+        병합된 로그인으로 다른 Authenticator와 공유 중인 클라이언트는 마지막 aclose()에서 닫힙니다.
+        """
+        if self._client is None:
+            return
+        client = self._client
+        self._client = None
+        self._service = None
+
+        remaining = _client_refs.get(client, 1) - 1
+        if remaining > 0:
+            _client_refs[client] = remaining
+            return
+        _client_refs.pop(client, None)
+        await client.aclose()
+
+    @property
+    def session(self) -> Optional['httpx.AsyncClient']:
+        """
+        현재 로그인된 `httpx.AsyncClient` 객체를 반환합니다.
+        로그인되지 않은 경우 `None`을 반환합니다.
+        """
+        return self._client
+
+    @property
+    def service(self) -> Optional[str]:
+        """
+        로그인에 성공한 서비스의 이름을 반환합니다.
+        로그인되지 않은 경우 `None`을 반환합니다.
+        """
+        return self._service
+
+    @property
+    def login_stats(self) -> Optional[LoginStats]:
+        """
+        이 인스턴스가 직접 수행한 마지막 로그인의 비용(왕복 수/수신 바이트/소요 시간)을 반환합니다.
+        병합된 로그인의 결과만 받은 경우에는 `None`입니다.
+        """
+        return self._login_stats
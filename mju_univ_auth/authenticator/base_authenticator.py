@@ -3,10 +3,16 @@
 =============================
 인증을 위한 BaseAuthenticator 기반 클래스를 정의합니다.
 """
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 import requests
 
 from ..results import MjuUnivAuthResult, ErrorCode
+from ..infrastructure.transport import create_session
+from ..infrastructure.single_flight import SingleFlight, login_flight_key
+from .sso_login_protocol import LoginStats, is_sso_cookie_domain
+from .login_context_pool import LoginContext, LoginContextPool
+from ..config import SERVICES
 from ..exceptions import (
     MjuUnivAuthError,
     InvalidCredentialsError,
@@ -19,6 +25,52 @@ from ..exceptions import (
 )
 
 
+# 로그인 중 발생한 예외 -> (request_succeeded, credentials_valid, error_code)
+_LOGIN_ERROR_MAPPING = (
+    (InvalidCredentialsError, True, False, ErrorCode.INVALID_CREDENTIALS_ERROR),
+    (NetworkError, False, False, ErrorCode.NETWORK_ERROR),
+    (ServiceNotFoundError, False, False, ErrorCode.SERVICE_NOT_FOUND_ERROR),
+    (ParsingError, False, True, ErrorCode.PARSING_ERROR),
+    (SessionExpiredError, False, True, ErrorCode.SESSION_EXPIRED_ERROR),
+    (AlreadyLoggedInError, False, True, ErrorCode.ALREADY_LOGGED_IN_ERROR),
+    (InvalidServiceUsageError, False, False, ErrorCode.SERVICE_UNKNOWN_ERROR),
+)
+
+
+def _split_services(services: Sequence[str]) -> Tuple[List[str], Dict[str, MjuUnivAuthResult]]:
+    """중복 제거한 서비스 목록을 (알려진 서비스, 알 수 없는 서비스의 실패 결과)로 나눔 (동기/비동기 공용)"""
+    known: List[str] = []
+    unknown: Dict[str, MjuUnivAuthResult] = {}
+    for service in dict.fromkeys(services):
+        if service in SERVICES:
+            known.append(service)
+        else:
+            unknown[service] = _login_error_result(ServiceNotFoundError(service, list(SERVICES.keys())))
+    return known, unknown
+
+
+def _login_error_result(error: Exception) -> MjuUnivAuthResult:
+    """로그인 중 발생한 예외를 MjuUnivAuthResult로 변환 (동기/비동기 Authenticator 공용)"""
+    for error_type, request_succeeded, credentials_valid, error_code in _LOGIN_ERROR_MAPPING:
+        if isinstance(error, error_type):
+            return MjuUnivAuthResult(
+                request_succeeded=request_succeeded,
+                credentials_valid=credentials_valid,
+                error_code=error_code,
+                error_message=str(error)
+            )
+    return MjuUnivAuthResult(
+        request_succeeded=False,
+        credentials_valid=False,
+        error_code=ErrorCode.UNKNOWN_ERROR,
+        error_message=str(error)
+    )
+
+
+# 프로세스 전역 로그인 병합: 같은 (user_id, service, 비밀번호) 로그인이 동시에 오면 한 번만 수행
+_login_flights = SingleFlight()
+
+
 class BaseAuthenticator:
     """인증을 위한 기반 클래스"""
 
@@ -27,30 +79,62 @@ class BaseAuthenticator:
         user_id: str,
         user_pw: str,
         verbose: bool = False,
+        single_flight: bool = True,
+        context_pool: Optional[LoginContextPool] = None,
+        stream_pages: bool = False,
     ):
         """
         Args:
             user_id: 학번/교번
             user_pw: 비밀번호
             verbose: 상세 로그 출력 여부
+            single_flight: 같은 계정의 동시 로그인을 하나로 합칠지 여부
+            context_pool: 미리 받아 둔 로그인 페이지를 꺼내 쓸 풀 (없으면 매번 로그인 페이지부터 요청)
+            stream_pages: 로그인 페이지와 세션 유효성 검사 페이지를 필요한 값이 나올 때까지만 읽을지 여부
         """
         self._user_id = user_id
         self._user_pw = user_pw
         self._verbose = verbose
+        self._single_flight = single_flight
+        self._context_pool = context_pool
+        self._stream_pages = stream_pages
+        # 이번 로그인에 사용할 미리 받아 둔 로그인 컨텍스트 (_execute_login이 소비)
+        self._login_context: Optional[LoginContext] = None
         self._session: Optional[requests.Session] = None
         self._service: Optional[str] = None
+        self._login_stats: Optional[LoginStats] = None
 
     def login(self, service: str = 'msi') -> MjuUnivAuthResult[requests.Session]:
         """
         SSO 로그인 수행
 
+        같은 (user_id, service, 비밀번호)의 로그인이 이미 진행 중이면 새로 로그인하지 않고
+        그 결과를 함께 받습니다. (모든 호출자가 같은 requests.Session을 공유)
+
         Args:
             service: 로그인할 서비스 (기본값: 'msi')
 
         Returns:
             MjuUnivAuthResult[requests.Session]: 로그인 결과
         """
-        session = requests.Session()
+        if not self._single_flight:
+            return self._login(service)
+
+        key = login_flight_key(self._user_id, service, self._user_pw)
+        result = _login_flights.do(key, lambda: self._login(service))
+        if result.success:
+            self._session = result.data
+            self._service = service
+        else:
+            self._session = None
+            self._service = None
+        return result
+
+    def _login(self, service: str) -> MjuUnivAuthResult[requests.Session]:
+        """병합 없이 로그인 1회 수행"""
+        context = self._context_pool.acquire(service) if self._context_pool is not None else None
+        session = context.session if context is not None else create_session()
+        self._login_context = context
         try:
             self._execute_login(session, service)
             self._service = service
@@ -61,81 +145,167 @@ class BaseAuthenticator:
                 data=session
             )
 
-        except InvalidCredentialsError as e:
+        except Exception as e:
             self._session = None
             self._service = None
+            return _login_error_result(e)
+
+    def _execute_login(self, session: requests.Session, service: str):
+        """자식 클래스 구현부: 실패 시 반드시 커스텀 예외를 raise 해야 함"""
+        raise NotImplementedError
+
+    def login_services(
+        self,
+        services: Sequence[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, MjuUnivAuthResult[requests.Session]]:
+        """
+        한 번의 SSO 로그인으로 여러 서비스에 로그인합니다.
+
+        첫 번째 서비스만 자격 증명으로 로그인하고, 나머지 서비스는 그 SSO 세션 쿠키를 복사한
+        새 세션으로 각 서비스의 auth_url 리다이렉트 체인만 따라갑니다. (스레드로 병렬 수행)
+        계정당 하나의 SSO 세션만 쓰므로 서비스마다 로그인할 때처럼 서로의 세션을 무효화하지 않습니다.
+        병렬 진입 중 SSO 세션이 만료된 서비스는 그 뒤에 입력 순서대로 하나씩 자격 증명 로그인합니다.
+        (로그인 POST 준비는 인스턴스의 공개키/CSRF 토큰을 쓰므로 병렬로 수행하지 않음)
+
+        이 인스턴스의 `session`/`service`는 첫 번째 서비스의 세션을 가리킵니다.
+
+        Args:
+            services: 로그인할 서비스 목록 (예: ['msi', 'lms', 'portal'])
+            max_workers: 병렬로 진입할 최대 서비스 수 (기본값: 나머지 서비스 수)
+
+        Returns:
+            Dict[str, MjuUnivAuthResult[requests.Session]]: 서비스별 로그인 결과 (입력 순서 유지)
+        """
+        known, results = _split_services(services)
+        if not known:
+            return {service: results[service] for service in dict.fromkeys(services)}
+
+        first, rest = known[0], known[1:]
+        results[first] = self.login(first)
+        if results[first].success:
+            sso_cookies = [c for c in results[first].data.cookies if is_sso_cookie_domain(c.domain)]
+            if rest:
+                with ThreadPoolExecutor(max_workers=max_workers or len(rest), thread_name_prefix='mju-handoff') as pool:
+                    handoffs = pool.map(lambda s: self._handoff(s, sso_cookies, login_fallback=False), rest)
+                    for service, result in zip(rest, handoffs):
+                        results[service] = result
+                for service in rest:
+                    if results[service].error_code == ErrorCode.SESSION_EXPIRED_ERROR:
+                        results[service] = self._handoff(service, sso_cookies)
+        else:
+            # 자격 증명/네트워크 실패는 나머지 서비스에도 그대로 적용
+            for service in rest:
+                results[service] = results[first]
+
+        return {service: results[service] for service in dict.fromkeys(services)}
+
+    def _handoff(
+        self,
+        service: str,
+        sso_cookies: list,
+        login_fallback: bool = True,
+    ) -> MjuUnivAuthResult[requests.Session]:
+        """SSO 세션 쿠키를 복사한 새 세션으로 서비스 진입 (login_fallback=False면 SSO 세션 만료 시 SESSION_EXPIRED_ERROR)"""
+        session = create_session()
+        for cookie in sso_cookies:
+            session.cookies.set_cookie(cookie)
+        try:
+            self._execute_handoff(session, service, login_fallback=login_fallback)
             return MjuUnivAuthResult(
                 request_succeeded=True,
-                credentials_valid=False,
-                error_code=ErrorCode.INVALID_CREDENTIALS_ERROR,
-                error_message=str(e)
-            )
-        except NetworkError as e:
-            self._session = None
-            self._service = None
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=False,
-                error_code=ErrorCode.NETWORK_ERROR,
-                error_message=str(e)
-            )
-        except ServiceNotFoundError as e:
-            self._session = None
-            self._service = None
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=False,
-                error_code=ErrorCode.SERVICE_NOT_FOUND_ERROR,
-                error_message=str(e)
-            )
-        except ParsingError as e:
-            self._session = None
-            self._service = None
-            return MjuUnivAuthResult(
-                request_succeeded=False,
                 credentials_valid=True,
-                error_code=ErrorCode.PARSING_ERROR,
-                error_message=str(e)
+                data=session
             )
-        except SessionExpiredError as e:
-            self._session = None
-            self._service = None
+        except Exception as e:
+            session.close()
+            return _login_error_result(e)
+
+    def reauthenticate(
+        self,
+        session: Optional[requests.Session] = None,
+        service: str = 'msi',
+        login_fallback: bool = True,
+    ) -> MjuUnivAuthResult[requests.Session]:
+        """
+        서비스 세션이 만료된 세션을 조용히 복구합니다.
+
+        세션에 남아 있는 SSO 세션 쿠키로 서비스의 auth_url 리다이렉트 체인만 다시 따라가
+        새 서비스 세션을 받습니다. (비밀번호 암호화/로그인 POST 생략)
+        SSO 세션까지 만료되었으면 login_fallback=True일 때 같은 세션으로 자격 증명 로그인을 하고,
+        False이면 SESSION_EXPIRED_ERROR를 반환합니다.
+
+        Args:
+            session: 서비스 세션이 만료된 requests.Session (기본값: 이 인스턴스가 로그인한 세션)
+            service: 복구할 서비스 (기본값: 'msi')
+            login_fallback: SSO 세션도 만료되었을 때 자격 증명 로그인으로 진행할지 여부
+
+        Returns:
+            MjuUnivAuthResult[requests.Session]: 복구 결과 (성공 시 data는 전달한 세션)
+        """
+        session = session if session is not None else self._session
+        if session is None:
             return MjuUnivAuthResult(
                 request_succeeded=False,
-                credentials_valid=True,
-                error_code=ErrorCode.SESSION_EXPIRED_ERROR,
-                error_message=str(e)
+                error_code=ErrorCode.SESSION_NOT_EXIST_ERROR,
+                error_message="세션이 없습니다."
             )
-        except AlreadyLoggedInError as e:
-            self._session = None
-            self._service = None
+        try:
+            self._execute_handoff(session, service, login_fallback=login_fallback)
+        except Exception as e:
+            return _login_error_result(e)
+
+        self._session = session
+        self._service = service
+        return MjuUnivAuthResult(
+            request_succeeded=True,
+            credentials_valid=True,
+            data=session
+        )
+
+    def _execute_handoff(self, session: requests.Session, service: str, login_fallback: bool = True):
+        """자식 클래스 구현부: SSO 세션 쿠키가 있는 세션으로 서비스에 진입, 실패 시 커스텀 예외를 raise"""
+        raise NotImplementedError
+
+    def verify_credentials(self, service: str = 'msi') -> MjuUnivAuthResult[LoginStats]:
+        """
+        자격 증명(아이디/비밀번호)의 유효성만 확인합니다.
+
+        SSO 로그인 POST 응답에서 승인/거부가 결정되면 바로 멈추고, 서비스 측 리다이렉트와
+        폼 제출(세션 생성)은 생략합니다. 따라서 서비스 세션은 만들어지지 않으며
+        `session`/`service`도 바뀌지 않습니다.
+
+        같은 (user_id, service, 비밀번호)의 검증이 이미 진행 중이면 그 결과를 함께 받습니다.
+
+        Args:
+            service: 검증에 사용할 서비스 (기본값: 'msi')
+
+        Returns:
+            MjuUnivAuthResult[LoginStats]: 검증 결과 (data: 왕복 수/수신 바이트/소요 시간)
+        """
+        if not self._single_flight:
+            return self._verify_credentials(service)
+
+        key = login_flight_key(self._user_id, f'verify:{service}', self._user_pw)
+        return _login_flights.do(key, lambda: self._verify_credentials(service))
+
+    def _verify_credentials(self, service: str) -> MjuUnivAuthResult[LoginStats]:
+        """병합 없이 자격 증명 검증 1회 수행"""
+        session = create_session()
+        try:
+            stats = self._execute_verify(session, service)
             return MjuUnivAuthResult(
-                request_succeeded=False,
+                request_succeeded=True,
                 credentials_valid=True,
-                error_code=ErrorCode.ALREADY_LOGGED_IN_ERROR,
-                error_message=str(e)
-            )
-        except InvalidServiceUsageError as e:
-            self._session = None
-            self._service = None
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=False,
-                error_code=ErrorCode.SERVICE_UNKNOWN_ERROR,
-                error_message=str(e)
+                data=stats
             )
         except Exception as e:
-            self._session = None
-            self._service = None
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=False,
-                error_code=ErrorCode.UNKNOWN_ERROR,
-                error_message=str(e)
-            )
+            return _login_error_result(e)
+        finally:
+            session.close()
 
-    def _execute_login(self, session: requests.Session, service: str):
-        """자식 클래스 구현부: 실패 시 반드시 커스텀 예외를 raise 해야 함"""
+    def _execute_verify(self, session: requests.Session, service: str) -> LoginStats:
+        """자식 클래스 구현부: 자격 증명만 확인하고 비용(LoginStats)을 반환, 실패 시 커스텀 예외를 raise"""
         raise NotImplementedError
 
     def is_session_valid(self, service: str = 'msi') -> bool:
@@ -166,3 +336,11 @@ class BaseAuthenticator:
         로그인되지 않은 경우 `None`을 반환합니다.
         """
         return self._service
+
+    @property
+    def login_stats(self) -> Optional[LoginStats]:
+        """
+        이 인스턴스가 직접 수행한 마지막 로그인의 비용(왕복 수/수신 바이트/소요 시간)을 반환합니다.
+        병합된 로그인의 결과만 받은 경우에는 `None`입니다.
+        """
+        return self._login_stats
@@ -0,0 +1,299 @@
+"""
+로그인 컨텍스트 풀
+=================
+로그인 1단계(로그인 페이지 GET)를 미리 수행해 둔 "로그인 컨텍스트"를 백그라운드 스레드로 채워 두는 풀입니다.
+
+로그인 페이지는 사용자 입력과 무관하게 공개키, CSRF 토큰(c_r_t), 폼 액션과 사전 로그인 쿠키만 내려주므로,
+API 서버처럼 로그인이 계속 들어오는 환경에서는 미리 받아 둘 수 있습니다.
+로그인 요청이 오면 준비된 컨텍스트(세션 + 로그인 페이지)를 하나 꺼내 암호화/로그인 POST부터 시작합니다.
+
+- 컨텍스트마다 TTL이 있으며, 오래된 컨텍스트는 버리고 다시 채웁니다.
+  (TTL은 SSO 서버의 사전 로그인 세션/CSRF 토큰 수명보다 짧게 설정해야 합니다)
+- 풀이 비어 있으면 평소처럼 로그인 페이지부터 요청합니다. (miss)
+- `metrics()`로 적중률과 사용 시점의 컨텍스트 나이(staleness)를 확인할 수 있습니다.
+- requests 기반 StandardAuthenticator 전용입니다.
+
+사용법:
+    pool = LoginContextPool(services=('msi',), size=8, ttl=60)
+    pool.start()
+    auth = StandardAuthenticator(user_id, user_pw, context_pool=pool)
+    auth.login('msi')
+    print(pool.metrics().hit_rate)
+    pool.close()
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Sequence
+
+import requests
+
+from .sso_login_protocol import SSOLoginProtocol, HttpResponse
+from ..config import SERVICES, DEFAULT_HEADERS
+from ..infrastructure.parser import HTMLParser, response_text
+from ..infrastructure.transport import create_session, read_until
+from ..exceptions import NetworkError, ParsingError, ServiceNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoginContext:
+    """로그인 1단계까지 마친 컨텍스트"""
+    service: str
+    session: requests.Session   # 사전 로그인 쿠키가 들어 있는 세션
+    response: HttpResponse      # 미리 받아 둔 로그인 페이지 (요청 시점 비용이 아니므로 round_trips=0)
+    created_at: float           # time.monotonic()
+
+    @property
+    def age(self) -> float:
+        """생성 후 경과 시간 (초)"""
+        return time.monotonic() - self.created_at
+
+
+@dataclass
+class LoginContextPoolMetrics:
+    """LoginContextPool 지표 (metrics() 호출 시점의 스냅샷)"""
+    hits: int = 0                 # 준비된 컨텍스트로 시작한 로그인 수
+    misses: int = 0               # 풀이 비어 로그인 페이지부터 요청한 로그인 수
+    expired: int = 0              # TTL이 지나 사용되지 못하고 버려진 컨텍스트 수
+    prefetched: int = 0           # 미리 받아 둔 컨텍스트 수
+    prefetch_failures: int = 0    # 로그인 페이지 미리 받기 실패 수
+    ready: int = 0                # 현재 준비된 컨텍스트 수
+    total_age_at_use: float = 0.0  # 사용된 컨텍스트 나이의 합 (초)
+    max_age_at_use: float = 0.0    # 사용된 컨텍스트 나이의 최댓값 (초)
+
+    @property
+    def hit_rate(self) -> float:
+        requests_total = self.hits + self.misses
+        return self.hits / requests_total if requests_total else 0.0
+
+    @property
+    def mean_age_at_use(self) -> float:
+        return self.total_age_at_use / self.hits if self.hits else 0.0
+
+
+class LoginContextPool:
+    """서비스별로 미리 받아 둔 로그인 컨텍스트를 관리하는 스레드 안전한 풀"""
+
+    def __init__(
+        self,
+        services: Sequence[str] = ('msi',),
+        size: int = 4,
+        ttl: float = 60.0,
+        retry_interval: float = 5.0,
+        verbose: bool = False,
+        stream_pages: bool = False,
+    ):
+        """
+        Args:
+            services: 컨텍스트를 준비할 서비스 목록
+            size: 서비스별로 준비해 둘 컨텍스트 수
+            ttl: 컨텍스트 수명 (초). 이보다 오래된 컨텍스트는 사용하지 않습니다.
+            retry_interval: 로그인 페이지 미리 받기에 실패했을 때 다시 시도할 때까지 기다릴 시간 (초)
+            verbose: 상세 로그 출력 여부
+            stream_pages: 로그인 페이지를 공개키, CSRF 토큰, 폼 액션이 나올 때까지만 읽을지 여부
+
+        Raises:
+            ServiceNotFoundError: 알 수 없는 서비스
+        """
+        for service in services:
+            if service not in SERVICES:
+                raise ServiceNotFoundError(service, list(SERVICES.keys()))
+        if size < 1:
+            raise ValueError("size는 1 이상이어야 합니다.")
+
+        self._services = tuple(dict.fromkeys(services))
+        self._size = size
+        self._ttl = ttl
+        self._retry_interval = retry_interval
+        self._verbose = verbose
+        self._stream_pages = stream_pages
+
+        self._cond = threading.Condition()
+        self._ready: Dict[str, Deque[LoginContext]] = {service: deque() for service in self._services}
+        self._metrics = LoginContextPoolMetrics()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __enter__(self) -> 'LoginContextPool':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def services(self) -> Sequence[str]:
+        return self._services
+
+    def start(self) -> None:
+        """백그라운드 스레드로 풀을 채우기 시작합니다."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("닫힌 LoginContextPool입니다.")
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='mju-login-context-pool', daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 준비된 컨텍스트의 세션을 닫습니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._cond:
+            for contexts in self._ready.values():
+                while contexts:
+                    contexts.popleft().session.close()
+
+    def acquire(self, service: str) -> Optional[LoginContext]:
+        """
+        준비된 컨텍스트 중 가장 최근 것을 꺼냅니다. 없으면 None (miss)
+
+        Args:
+            service: 로그인할 서비스
+
+        Returns:
+            Optional[LoginContext]: 로그인 컨텍스트 (호출자가 세션을 소유)
+        """
+        with self._cond:
+            contexts = self._ready.get(service)
+            if contexts is None:
+                return None
+            self._evict_expired(contexts)
+            if not contexts:
+                self._metrics.misses += 1
+                self._cond.notify_all()
+                return None
+
+            context = contexts.pop()
+            age = context.age
+            self._metrics.hits += 1
+            self._metrics.total_age_at_use += age
+            self._metrics.max_age_at_use = max(self._metrics.max_age_at_use, age)
+            self._cond.notify_all()  # 빈자리 채우기
+            return context
+
+    def fill(self) -> None:
+        """
+        모든 서비스의 컨텍스트를 size개까지 지금 바로 채웁니다. (백그라운드 스레드 없이 워밍업할 때 사용)
+        미리 받기에 실패하면 그 자리에서 멈춥니다.
+        """
+        while True:
+            with self._cond:
+                service = self._next_service_to_fill()
+            if service is None or not self._prefetch_and_store(service):
+                return
+
+    def prefetch(self, service: str) -> LoginContext:
+        """
+        로그인 페이지를 받아 컨텍스트를 하나 만듭니다. (풀에 넣지 않음)
+
+        Raises:
+            NetworkError: 로그인 페이지 요청에 실패했을 때
+            ParsingError: 로그인 페이지가 아닌 응답을 받았을 때
+        """
+        # 1단계 요청은 프로토콜이 만든 것과 같아야 하므로 프로토콜에게 받아 씁니다.
+        request = SSOLoginProtocol('', '', service).start()
+
+        session = create_session()
+        session.headers.update(DEFAULT_HEADERS)
+        try:
+            response = session.request(
+                request.method, request.url, headers=request.headers, timeout=request.timeout,
+                stream=self._stream_pages,
+            )
+            if self._stream_pages:
+                scanner = request.scanner()
+                read_until(response, scanner)
+                text = scanner.text
+            else:
+                text = response_text(response)
+        except requests.RequestException as e:
+            session.close()
+            raise NetworkError(request.description, url=request.url, original_error=e)
+
+        public_key, csrf_token, form_action = HTMLParser.extract_login_page_data(text)
+        if not (public_key and csrf_token and form_action):
+            session.close()
+            raise ParsingError("미리 받은 페이지가 로그인 페이지가 아닙니다.", field="signin-form")
+
+        return LoginContext(
+            service=service,
+            session=session,
+            response=HttpResponse(url=response.url, status_code=response.status_code, text=text, round_trips=0),
+            created_at=time.monotonic(),
+        )
+
+    def metrics(self) -> LoginContextPoolMetrics:
+        """현재 지표의 스냅샷을 반환합니다."""
+        with self._cond:
+            for contexts in self._ready.values():
+                self._evict_expired(contexts)
+            snapshot = LoginContextPoolMetrics(**vars(self._metrics))
+            snapshot.ready = sum(len(contexts) for contexts in self._ready.values())
+            return snapshot
+
+    # ------------------------------------------------------------------ 내부 구현
+    def _evict_expired(self, contexts: Deque[LoginContext]) -> None:
+        """TTL이 지난 컨텍스트를 버림 (락을 잡은 상태에서 호출)"""
+        while contexts and contexts[0].age > self._ttl:
+            contexts.popleft().session.close()
+            self._metrics.expired += 1
+
+    def _next_service_to_fill(self) -> Optional[str]:
+        """준비된 컨텍스트가 가장 적은 서비스 (모두 가득 찼으면 None, 락을 잡은 상태에서 호출)"""
+        if self._closed:
+            return None
+        for contexts in self._ready.values():
+            self._evict_expired(contexts)
+        service = min(self._services, key=lambda s: len(self._ready[s]))
+        return service if len(self._ready[service]) < self._size else None
+
+    def _next_expiry(self) -> Optional[float]:
+        """가장 먼저 만료될 컨텍스트까지 남은 시간 (락을 잡은 상태에서 호출)"""
+        oldest = [contexts[0] for contexts in self._ready.values() if contexts]
+        if not oldest:
+            return None
+        return max(0.0, self._ttl - max(context.age for context in oldest))
+
+    def _prefetch_and_store(self, service: str) -> bool:
+        try:
+            context = self.prefetch(service)
+        except Exception as e:
+            with self._cond:
+                self._metrics.prefetch_failures += 1
+            if self._verbose:
+                logger.warning(f"로그인 페이지 미리 받기 실패 ({service}): {e}")
+            return False
+
+        with self._cond:
+            if self._closed:
+                context.session.close()
+                return False
+            self._ready[service].append(context)
+            self._metrics.prefetched += 1
+        return True
+
+    def _run(self) -> None:
+        """백그라운드 스레드: 빈자리가 생기거나 컨텍스트가 만료되면 다시 채움"""
+        while True:
+            with self._cond:
+                service = self._next_service_to_fill()
+                while service is None and not self._closed:
+                    self._cond.wait(self._next_expiry())
+                    service = self._next_service_to_fill()
+                if self._closed:
+                    return
+
+            if not self._prefetch_and_store(service):
+                with self._cond:
+                    if not self._closed:
+                        self._cond.wait(self._retry_interval)
@@ -3,28 +3,29 @@
 ===============
 StandardAuthenticator 클래스를 정의합니다.
 """
+import os
 import time
-from typing import Optional
-from urllib.parse import urlparse, urljoin
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
 import requests
 import logging
 
 from .base_authenticator import BaseAuthenticator
+from .login_context_pool import LoginContextPool
+from .sso_login_protocol import SSOLoginProtocol, HttpRequest, HttpResponse, LoginStats, is_final_url_reached, is_sso_url
 from ..config import SERVICES, TIMEOUT_CONFIG, DEFAULT_HEADERS
-from ..infrastructure.parser import HTMLParser
-from ..infrastructure.crypto import generate_session_key, encrypt_with_rsa, encrypt_with_aes
-from ..exceptions import (
-    MjuUnivAuthError,
-    InvalidCredentialsError,
-    NetworkError,
-    ServiceNotFoundError,
-    ParsingError,
-    AlreadyLoggedInError,
-)
+from ..infrastructure.parser import HTMLParser, SessionPageScanner, response_text
+from ..infrastructure.crypto import generate_session_key, encrypt_with_rsa, encrypt_with_aes, take_pooled_session_key
+from ..infrastructure.transport import read_until
+from ..exceptions import NetworkError
 from ..utils import mask_sensitive
 
 logger = logging.getLogger(__name__)
 
+# 로그인 페이지 요청과 겹쳐 세션키 파생/비밀번호 암호화를 수행하는 프로세스 전역 스레드 풀
+# (스레드는 첫 로그인 때 생성됩니다)
+_crypto_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix='mju-crypto')
+
 
 class StandardAuthenticator(BaseAuthenticator):
     """명지대학교 표준 SSO 인증을 처리하는 클래스"""
@@ -34,17 +35,24 @@ class StandardAuthenticator(BaseAuthenticator):
         user_id: str,
         user_pw: str,
         verbose: bool = False,
+        single_flight: bool = True,
+        context_pool: Optional[LoginContextPool] = None,
+        stream_pages: bool = False,
     ):
-        super().__init__(user_id, user_pw, verbose)
+        super().__init__(user_id, user_pw, verbose, single_flight, context_pool, stream_pages)
         # 로그인 과정에서 획득한 데이터
         self._public_key: Optional[str] = None
         self._csrf_token: Optional[str] = None
-        self._form_action: Optional[str] = None
+        # 1단계 요청과 겹쳐 미리 계산 중인 (세션키, AES 암호화된 비밀번호)
+        self._password_material: Optional[Future] = None
 
     def _execute_login(self, session: requests.Session, service: str):
         """
         실제 SSO 로그인 로직
 
+        로그인 절차는 SSOLoginProtocol(sans-IO)이 결정하고, 이 메서드는 요청을 보내고
+        응답을 돌려주는 동기 드라이버 역할만 합니다.
+
         Args:
             session: 사용할 requests.Session 객체
             service: 로그인할 서비스
@@ -60,89 +68,171 @@ class StandardAuthenticator(BaseAuthenticator):
         self._session = session
         self._session.headers.update(DEFAULT_HEADERS)
 
-        if service not in SERVICES:
-            raise ServiceNotFoundError(service, list(SERVICES.keys()))
-
-        service_config = SERVICES[service]
+        protocol = self._create_protocol(service)
 
         if self._verbose:
-            logger.info(f"===== MJU SSO 로그인: {service_config.name} =====")
+            logger.info(f"===== MJU SSO 로그인: {protocol.service_config.name} =====")
             logger.info(f"User ID: {mask_sensitive(self._user_id)}")
 
-        # Step 1: 로그인 페이지 접속 및 파싱
-        self._fetch_login_page(service_config.auth_url)
+        # 미리 받아 둔 로그인 페이지가 있으면 1단계 요청 없이 그 응답으로 시작
+        context, self._login_context = self._login_context, None
+        prefetched = context.response if context is not None and context.session is session else None
+        if self._verbose and prefetched is not None:
+            logger.info(f"[Step 1] 미리 받아 둔 로그인 페이지 사용 ({context.age:.1f}s 전)")
+        if prefetched is None:
+            self._begin_password_material()
 
-        # Step 2: 암호화 데이터 준비
-        encrypted_data = self._prepare_encrypted_data()
+        self._drive(session, protocol, prefetched)
+        self._login_stats = protocol.stats
 
-        # Step 3: 로그인 요청 전송
-        response = self._submit_login(service_config.auth_url, encrypted_data)
-
-        # Step 4: JS 리다이렉트/폼 처리 (최종 URL에 도달할 때까지)
-        response = self._handle_redirects(response, service_config.final_url)
+    def _execute_verify(self, session: requests.Session, service: str) -> LoginStats:
+        """
+        자격 증명만 확인하는 SSO 로그인 (로그인 POST 응답에서 중단)
 
-        # Step 5: 결과 확인
-        self._validate_login_result(response, service_config)
+        Raises:
+            ServiceNotFoundError: 알 수 없는 서비스
+            InvalidCredentialsError: 로그인 정보가 틀렸을 때
+            ParsingError: 로그인 페이지 파싱에 실패했을 때
+            NetworkError: 네트워크 요청에 실패했을 때
+        """
+        session.headers.update(DEFAULT_HEADERS)
+        protocol = self._create_protocol(service, verify_only=True)
 
         if self._verbose:
-            logger.info(f"✓ 로그인 성공! ({service_config.name})")
+            logger.info(f"===== MJU SSO 자격 증명 확인: {protocol.service_config.name} =====")
+            logger.info(f"User ID: {mask_sensitive(self._user_id)}")
 
-    
-    def _fetch_login_page(self, login_url: str) -> None:
-        """로그인 페이지 접속 및 필요 정보 파싱"""
-        if self._verbose:
-            logger.info("[Step 1] 로그인 페이지 접속")
-            logger.debug(f"GET {login_url}")
+        self._begin_password_material()
+        self._drive(session, protocol)
+        return protocol.stats
+
+    def _execute_handoff(self, session: requests.Session, service: str, login_fallback: bool = True):
+        """
+        SSO 세션 쿠키가 있는 세션으로 서비스에 진입 (로그인 POST 생략)
+        SSO 세션이 만료되었으면 login_fallback에 따라 자격 증명 로그인으로 진행합니다.
+
+        Raises:
+            SessionExpiredError: SSO 세션이 만료되었고 login_fallback=False일 때
+            InvalidCredentialsError: (SSO 세션 만료 후) 로그인 정보가 틀렸을 때
+            ParsingError: 로그인 페이지 파싱에 실패했을 때
+            NetworkError: 네트워크 요청에 실패했을 때
+        """
+        session.headers.update(DEFAULT_HEADERS)
+        protocol = self._create_protocol(service, sso_handoff=True, login_fallback=login_fallback)
 
-        try:
-            response = self._session.get(login_url, timeout=TIMEOUT_CONFIG.default)
-        except requests.RequestException as e:
-            raise NetworkError("로그인 페이지 접속 실패", url=login_url, original_error=e)
-        
         if self._verbose:
-            logger.debug(f"Response: {response.status_code} - {response.url}")
-            logger.info("[Step 1-2] 로그인 페이지 파싱")
+            logger.info(f"===== MJU SSO 세션으로 서비스 진입: {protocol.service_config.name} =====")
 
-        # 페이지 파싱
-        public_key, csrf_token, form_action = HTMLParser.extract_login_page_data(response.text)
+        self._drive(session, protocol)
 
-        if not public_key:
-            raise ParsingError("공개키(public-key)를 찾을 수 없습니다.", field="public-key")
-        if not csrf_token:
-            raise ParsingError("CSRF 토큰(c_r_t)을 찾을 수 없습니다.", field="c_r_t")
-        if not form_action:
-            raise ParsingError("로그인 폼(signin-form)을 찾을 수 없습니다.", field="signin-form")
+    def _create_protocol(
+        self,
+        service: str,
+        verify_only: bool = False,
+        sso_handoff: bool = False,
+        login_fallback: bool = True,
+    ) -> SSOLoginProtocol:
+        return SSOLoginProtocol(
+            self._user_id,
+            self._user_pw,
+            service,
+            payload_builder=self._build_login_payload,
+            verify_only=verify_only,
+            sso_handoff=sso_handoff,
+            login_fallback=login_fallback,
+            verbose=self._verbose,
+        )
+
+    def _drive(
+        self,
+        session: requests.Session,
+        protocol: SSOLoginProtocol,
+        prefetched: Optional[HttpResponse] = None,
+    ) -> None:
+        """프로토콜이 끝날 때까지 요청을 보내고 응답을 돌려줌 (prefetched: 첫 요청 대신 사용할 응답)"""
+        request = protocol.start()
+        if prefetched is not None:
+            request = protocol.receive(prefetched)
+        while request is not None:
+            request = protocol.receive(self._send(session, request))
+
+    def _send(self, session: requests.Session, request: HttpRequest) -> HttpResponse:
+        """
+        프로토콜이 요청한 HTTP 요청을 전송 (follow_redirects면 HTTP 3xx 리다이렉트는 requests가 따라감)
+
+        stream_pages 모드에서 요청에 scanner가 있으면 본문을 필요한 값이 나올 때까지만 읽습니다.
+        """
+        scanner = request.scanner() if self._stream_pages and request.scanner is not None else None
+        try:
+            response = session.request(
+                request.method,
+                request.url,
+                data=request.data,
+                headers=request.headers,
+                timeout=request.timeout,
+                allow_redirects=request.follow_redirects,
+                stream=scanner is not None,
+            )
+            if scanner is not None:
+                size = read_until(response, scanner)
+        except requests.RequestException as e:
+            raise NetworkError(request.description, url=request.url, original_error=e)
 
+        if scanner is None:
+            text, size = response_text(response), len(response.content)
+        else:
+            text = scanner.text
+        return HttpResponse(
+            url=response.url,
+            status_code=response.status_code,
+            text=text,
+            location=response.headers.get('Location'),
+            round_trips=len(response.history) + 1,
+            size=sum(len(r.content) for r in response.history) + size,
+        )
+
+    def _build_login_payload(self, public_key: str, csrf_token: str) -> dict:
+        """SSOLoginProtocol의 payload_builder: 로그인 페이지에서 얻은 값으로 암호화 데이터 준비"""
         self._public_key = public_key
         self._csrf_token = csrf_token
-        self._form_action = form_action
+        return self._prepare_encrypted_data()
 
-        if self._verbose:
-            logger.debug(f"Public Key: {public_key[:50]}..." if len(public_key) > 50 else f"Public Key: {public_key}")
-            logger.debug(f"CSRF Token: {csrf_token}")
-            logger.debug(f"Form Action: {form_action}")
-            logger.info("✓ 페이지 파싱 완료")
+    def _begin_password_material(self) -> None:
+        """
+        세션키 파생(PBKDF2)과 비밀번호 AES 암호화는 로그인 페이지와 무관하므로
+        1단계 요청이 오가는 동안 다른 스레드에서 미리 시작합니다. (공개키가 필요한 RSA만 페이지 수신 후 수행)
+        """
+        self._password_material = _crypto_executor.submit(self._derive_password_material)
+
+    def _derive_password_material(self) -> Tuple[dict, str]:
+        """(세션키 정보, AES 암호화된 비밀번호)"""
+        key_info = take_pooled_session_key(32) or generate_session_key(32)
+        return key_info, encrypt_with_aes(self._user_pw, key_info)
+
+    def _take_password_material(self) -> Tuple[dict, str]:
+        """미리 시작한 계산 결과를 받거나, 없으면 지금 계산 (한 번 쓰면 비움)"""
+        future, self._password_material = self._password_material, None
+        if future is not None:
+            return future.result()
+        return self._derive_password_material()
 
     def _prepare_encrypted_data(self) -> dict:
         """암호화된 로그인 데이터 준비"""
         if self._verbose:
             logger.info("[Step 2] 암호화 데이터 준비")
 
-        # 1. 세션키 생성
-        key_info = generate_session_key(32)
+        # 1. 세션키 생성 + 2. AES 암호화 (비밀번호) - 1단계 요청과 겹쳐 미리 계산됨
+        key_info, pw_enc = self._take_password_material()
         if self._verbose:
             logger.debug(f"Session Key: {key_info['keyStr'][:16]}...({len(key_info['keyStr'])} chars)")
 
-        # 2. 타임스탬프 생성
+        # 3. 타임스탬프 생성
         timestamp = str(int(time.time() * 1000))
 
-        # 3. RSA 암호화 (keyStr + 타임스탬프)
+        # 4. RSA 암호화 (keyStr + 타임스탬프)
         rsa_payload = f"{key_info['keyStr']},{timestamp}"
         encsymka = encrypt_with_rsa(rsa_payload, self._public_key)
 
-        # 4. AES 암호화 (비밀번호)
-        pw_enc = encrypt_with_aes(self._user_pw, key_info)
-
         if self._verbose:
             logger.info("✓ 암호화 완료")
 
@@ -155,161 +245,9 @@ class StandardAuthenticator(BaseAuthenticator):
             'user_id_enc': '',
         }
 
-    def _submit_login(self, login_url: str, encrypted_data: dict):
-        """로그인 요청 전송"""
-        if self._verbose:
-            logger.info("[Step 3] 로그인 요청 전송")
-
-        # Form Action URL 구성
-        if self._form_action.startswith('/'):
-            action_url = f"https://sso.mju.ac.kr{self._form_action}"
-        else:
-            action_url = self._form_action
-
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Origin': 'https://sso.mju.ac.kr',
-            'Referer': login_url,
-            'Upgrade-Insecure-Requests': '1',
-        }
-
-        if self._verbose:
-            logger.debug(f"POST {action_url}")
-
-        try:
-            response = self._session.post(
-                action_url,
-                data=encrypted_data,
-                headers=headers,
-                timeout=TIMEOUT_CONFIG.login,
-            )
-        except requests.RequestException as e:
-            raise NetworkError("로그인 요청 실패", url=action_url, original_error=e)
-        
-        if self._verbose:
-            logger.debug(f"Response: {response.status_code} - {response.url}")
-
-        return response
-
     def _is_final_url_reached(self, current_url: str, final_url: str) -> bool:
         """최종 URL에 도달했는지 확인"""
-        current_parsed = urlparse(current_url)
-        final_parsed = urlparse(final_url)
-        
-        return (current_parsed.netloc == final_parsed.netloc and 
-                current_parsed.path.rstrip('/') == final_parsed.path.rstrip('/'))
-
-    def _handle_redirects(self, response, final_url: str, max_redirects: int = 3):
-        """JavaScript 폼 제출 및 리다이렉트 처리 (최종 URL에 도달할 때까지)"""
-        for i in range(max_redirects):
-            # 최종 URL에 도달했으면 중단
-            if self._is_final_url_reached(response.url, final_url):
-                if self._verbose:
-                    logger.debug(f"Final URL: {response.url}")
-                break
-                
-            # 1. JavaScript 폼 자동 제출 처리
-            if HTMLParser.has_js_form_submit(response.text):
-                action, form_data = HTMLParser.extract_form_data(response.text)
-                if action and form_data:
-                    if self._verbose:
-                        logger.info(f"[Step 3-{i+2}] JS 폼 자동 제출 처리")
-
-                    action_url = self._build_absolute_url(response.url, action)
-                    if self._verbose:
-                        logger.debug(f"Form Action: {action_url}")
-
-                    headers = {
-                        'Content-Type': 'application/x-www-form-urlencoded',
-                        'Origin': f"https://{urlparse(response.url).netloc}",
-                        'Referer': response.url,
-                    }
-
-                    try:
-                        response = self._session.post(
-                            action_url,
-                            data=form_data,
-                            headers=headers,
-                            timeout=TIMEOUT_CONFIG.login,
-                        )
-                    except requests.RequestException as e:
-                        raise NetworkError("폼 제출 실패", url=action_url, original_error=e)
-                    
-                    if self._verbose:
-                        logger.debug(f"Response: {response.status_code} - {response.url}")
-                    continue
-
-            # 2. location.href 리다이렉트 처리
-            redirect_url = HTMLParser.extract_js_redirect(response.text)
-            if redirect_url:
-                if self._verbose:
-                    logger.info(f"[Step 3-{i+2}] JS 리다이렉트 따라가기")
-                    logger.debug(f"JS Redirect URL: {redirect_url}")
-
-                # 응답 URL을 사용하여 상대 리다이렉트를 절대 URL로 변환
-                action_url = self._build_absolute_url(response.url, redirect_url)
-                if self._verbose:
-                    logger.debug(f"Resolved JS Redirect URL: {action_url}")
-
-                try:
-                    response = self._session.get(action_url, timeout=TIMEOUT_CONFIG.login)
-                except requests.RequestException as e:
-                    raise NetworkError("리다이렉트 실패", url=action_url, original_error=e)
-                    
-                if self._verbose:
-                    logger.debug(f"Response: {response.status_code} - {response.url}")
-                continue
-
-            # 더 이상 처리할 JS 동작이 없음
-            break
-
-        return response
-
-    def _build_absolute_url(self, base_url: str, path: str) -> str:
-        """상대 경로를 절대 URL로 변환"""
-        if path.startswith('http'):
-            return path
-        return urljoin(base_url, path)
-
-    def _validate_login_result(self, response, service_config) -> None:
-        """로그인 결과 검증"""
-        if self._verbose:
-            logger.info("[Step 4] 로그인 결과 확인")
-
-        html = response.text
-        current_url = response.url
-
-        # 최종 URL에 도달했는지 확인
-        final_url_reached = self._is_final_url_reached(current_url, service_config.final_url)
-
-        # 로그인 폼이 다시 나타났는지 확인
-        has_signin_form = HTMLParser.has_signin_form(html)
-
-        # 로그아웃 버튼이 있는지 확인
-        has_logout = HTMLParser.has_logout_button(html)
-
-        # 성공 판정: 최종 URL에 도착했고 로그인 폼이 없으면 성공
-        if (final_url_reached and not has_signin_form) or (has_logout and not has_signin_form):
-            return
-
-        # 실패 판정: 로그인 폼이 다시 나타났으면 실패
-        if has_signin_form:
-            error_msg = HTMLParser.extract_error_message(html)
-            if error_msg:
-                if self._verbose:
-                    logger.error("로그인 실패")
-                    logger.error(f"Server Error: {error_msg}")
-                raise InvalidCredentialsError(error_msg, service=service_config.name)
-
-            if self._verbose:
-                logger.error("로그인 실패")
-                logger.error("원인: 로그인 폼이 다시 표시됨 (인증 실패)")
-            raise InvalidCredentialsError("인증 실패 (로그인 정보를 확인해주세요)", service=service_config.name)
-
-        # 알 수 없는 상태
-        if self._verbose:
-            logger.warning("로그인 결과 불확실")
-        raise MjuUnivAuthError("알 수 없는 오류가 발생했습니다.")
+        return is_final_url_reached(current_url, final_url)
 
     def is_session_valid(self, service: str = 'msi') -> bool:
         """
@@ -340,7 +278,17 @@ class StandardAuthenticator(BaseAuthenticator):
             logger.debug(f"GET {check_url}")
 
         try:
-            response = self._session.get(check_url, timeout=TIMEOUT_CONFIG.default, allow_redirects=True)
+            response = self._session.get(
+                check_url, timeout=TIMEOUT_CONFIG.default, allow_redirects=True, stream=self._stream_pages,
+            )
+            if self._stream_pages:
+                # 로그인 폼은 SSO 페이지에만 있으므로, 서비스 페이지면 로그아웃 표시만으로도 판정이 끝남
+                # (상태 코드 확인 전에 읽어 에러 응답의 커넥션도 정리)
+                scanner = SessionPageScanner(logout_decides=not is_sso_url(response.url))
+                read_until(response, scanner)
+                text = scanner.text
+            else:
+                text = response_text(response)
             response.raise_for_status()
         except requests.RequestException as e:
             if self._verbose:
@@ -350,18 +298,16 @@ class StandardAuthenticator(BaseAuthenticator):
         if self._verbose:
             logger.debug(f"Response: {response.status_code} - {response.url}")
 
-        html = response.text
+        page = HTMLParser.classify_page(text)
 
         # 로그인 폼이 있으면 세션 무효
-        has_signin_form = HTMLParser.has_signin_form(html)
-        if has_signin_form:
+        if page.has_signin_form:
             if self._verbose:
                 logger.warning("세션이 만료되었거나 유효하지 않습니다. (로그인 폼 확인)")
             return False
 
         # 로그아웃 버튼이 있으면 세션 유효
-        has_logout = HTMLParser.has_logout_button(html)
-        if has_logout:
+        if page.has_logout:
             if self._verbose:
                 logger.info("✓ 세션이 유효합니다. (로그아웃 버튼 확인)")
             return True
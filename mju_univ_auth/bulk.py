@@ -0,0 +1,150 @@
+"""
+대량 로그인
+==========
+많은 계정의 로그인(자격 증명 검증)을 동시 실행 수를 제한하여 처리하고,
+끝나는 순서대로 결과를 스트리밍합니다.
+
+- 자격 증명은 필요한 만큼만 꺼내 씁니다. (제너레이터를 넘기면 수만 건도 메모리가 일정)
+- 동시에 진행 중인 로그인은 최대 `concurrency`개이며, 소비자가 결과를 꺼내가지 않으면
+  새 로그인을 시작하지 않습니다. (backpressure)
+- 모든 로그인은 프로세스 전역 공유 커넥션 풀을 사용합니다.
+
+사용법:
+    from mju_univ_auth import login_many
+
+    for user_id, result in login_many(read_credentials(), service='msi', concurrency=32):
+        print(user_id, result.success)
+
+    # asyncio
+    async for user_id, result in alogin_many(credentials, concurrency=200):
+        ...
+"""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Set, Tuple, Union
+
+from .authenticator.standard_authenticator import StandardAuthenticator
+from .authenticator.async_standard_authenticator import AsyncStandardAuthenticator
+from .results import MjuUnivAuthResult
+
+Credential = Tuple[str, str]
+
+
+def login_many(
+    credentials: Iterable[Credential],
+    service: str = 'msi',
+    concurrency: int = 8,
+    verbose: bool = False,
+) -> Iterator[Tuple[str, MjuUnivAuthResult]]:
+    """
+    여러 계정을 스레드 풀로 동시에 로그인하고, 끝나는 순서대로 결과를 반환하는 제너레이터
+
+    `concurrency`가 공유 커넥션 풀의 호스트당 크기(기본 32)보다 크면
+    `configure_transport(pool_maxsize=concurrency)`로 함께 늘리는 것을 권장합니다.
+
+    Args:
+        credentials: (user_id, user_pw) 쌍의 iterable
+        service: 로그인할 서비스 (기본값: 'msi')
+        concurrency: 동시에 진행할 최대 로그인 수
+        verbose: 상세 로그 출력 여부
+
+    Yields:
+        Tuple[str, MjuUnivAuthResult]: (user_id, 로그인 결과)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency는 1 이상이어야 합니다.")
+
+    credential_iter = iter(credentials)
+    pending: Dict[Future, str] = {}
+    exhausted = False
+
+    def login(user_id: str, user_pw: str) -> MjuUnivAuthResult:
+        return StandardAuthenticator(user_id, user_pw, verbose=verbose).login(service)
+
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='mju-login')
+    try:
+        while True:
+            # 빈 슬롯만큼만 자격 증명을 꺼내 제출
+            while not exhausted and len(pending) < concurrency:
+                credential = next(credential_iter, None)
+                if credential is None:
+                    exhausted = True
+                    break
+                user_id, user_pw = credential
+                pending[pool.submit(login, user_id, user_pw)] = user_id
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        # 소비자가 중간에 멈추면 아직 시작하지 않은 작업은 취소하고, 진행 중인 로그인만 기다립니다.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def alogin_many(
+    credentials: Union[Iterable[Credential], AsyncIterable[Credential]],
+    service: str = 'msi',
+    concurrency: int = 64,
+    verbose: bool = False,
+) -> AsyncIterator[Tuple[str, MjuUnivAuthResult]]:
+    """
+    여러 계정을 하나의 이벤트 루프에서 동시에 로그인하고, 끝나는 순서대로 결과를 반환하는 비동기 제너레이터
+
+    결과의 `data`(httpx.AsyncClient)가 필요 없으면 `await client.aclose()` 없이 버려도
+    공유 커넥션 풀은 유지되므로 소켓이 새지 않습니다.
+
+    Args:
+        credentials: (user_id, user_pw) 쌍의 iterable 또는 async iterable
+        service: 로그인할 서비스 (기본값: 'msi')
+        concurrency: 동시에 진행할 최대 로그인 수
+        verbose: 상세 로그 출력 여부
+
+    Yields:
+        Tuple[str, MjuUnivAuthResult]: (user_id, 로그인 결과)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency는 1 이상이어야 합니다.")
+
+    if isinstance(credentials, AsyncIterable):
+        credential_iter = credentials.__aiter__()
+    else:
+        credential_iter = _as_async_iterator(credentials)
+
+    async def login(user_id: str, user_pw: str) -> Tuple[str, MjuUnivAuthResult]:
+        result = await AsyncStandardAuthenticator(user_id, user_pw, verbose=verbose).login(service)
+        return user_id, result
+
+    pending: Set[asyncio.Task] = set()
+    exhausted = False
+    try:
+        while True:
+            # 빈 슬롯만큼만 자격 증명을 꺼내 시작
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    user_id, user_pw = await credential_iter.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(login(user_id, user_pw)))
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # 소비자가 중간에 멈추면 진행 중인 로그인을 취소합니다.
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _as_async_iterator(iterable: Iterable[Credential]) -> AsyncIterator[Credential]:
+    for item in iterable:
+        yield item
@@ -110,3 +110,27 @@ class TimeoutConfig:
 
 TIMEOUT_CONFIG = TimeoutConfig()
 
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """공유 커넥션 풀 설정"""
+    pool_connections: int = 16      # 캐시할 호스트별 커넥션 풀 개수 (sso, msi, lms ...)
+    pool_maxsize: int = 32          # 호스트 하나당 유지할 최대 커넥션 수
+    pool_block: bool = False        # 풀이 가득 찼을 때 대기 여부 (False면 임시 커넥션 생성)
+    keep_alive: bool = True         # TCP keep-alive 사용 여부
+    keep_alive_idle: int = 60       # keep-alive 프로브 시작까지의 유휴 시간(초)
+    keep_alive_interval: int = 15   # keep-alive 프로브 간격(초)
+    keep_alive_count: int = 4       # 연결 종료 전 실패 허용 프로브 횟수
+
+
+POOL_CONFIG = PoolConfig()
+
+
+@dataclass(frozen=True)
+class StreamConfig:
+    """스트리밍 읽기(stream_pages) 설정"""
+    chunk_size: int = 8192          # 한 번에 읽을 본문 크기 (바이트)
+    drain_limit: int = 16384        # 필요한 값을 찾은 뒤 남은 본문이 이 이하면 마저 읽어 커넥션을 풀에 반환 (초과하면 커넥션을 닫음)
+
+
+STREAM_CONFIG = StreamConfig()
@@ -4,11 +4,13 @@ MjuUnivAuth Facade
 사용자 친화적 고수준 API를 제공하는 메인 클래스입니다.
 """
 
-from typing import Optional
+from typing import Callable, Iterable, Optional, TypeVar
 import logging
 import requests
 
 from .authenticator.standard_authenticator import StandardAuthenticator
+from .authenticator.sso_login_protocol import LoginStats
+from .fetcher.base_fetcher import BaseFetcher
 from .fetcher.student_basicinfo_fetcher import StudentBasicInfoFetcher
 from .fetcher.student_card_fetcher import StudentCardFetcher
 from .fetcher.student_changelog_fetcher import StudentChangeLogFetcher
@@ -19,6 +21,8 @@ from .results import MjuUnivAuthResult, ErrorCode
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class MjuUnivAuth:
     """
@@ -104,6 +108,24 @@ class MjuUnivAuth:
             self._service = None
         return self
 
+    def verify_credentials(self, service: str = 'msi') -> MjuUnivAuthResult[LoginStats]:
+        """
+        아이디/비밀번호가 맞는지만 확인합니다. (세션을 만들지 않으며 로그인 상태도 바뀌지 않습니다)
+        SSO 로그인 응답에서 바로 멈추므로 login()보다 왕복 수와 수신 바이트가 적습니다.
+
+        Args:
+            service: 검증에 사용할 서비스 (기본값: 'msi')
+
+        Returns:
+            MjuUnivAuthResult[LoginStats]: 검증 결과. `credentials_valid`로 유효성을 확인합니다.
+        """
+        authenticator = StandardAuthenticator(
+            user_id=self._user_id,
+            user_pw=self._user_pw,
+            verbose=self._verbose
+        )
+        return authenticator.verify_credentials(service)
+
     def is_logged_in(self, service: str = 'msi') -> bool:
         """
         현재 세션이 유효한지 확인합니다.
@@ -159,15 +181,43 @@ class MjuUnivAuth:
             )
         return self._login_result
 
+    def _fetch_with_reauth(
+        self, create_fetcher: Callable[[], BaseFetcher[T]], fields: Optional[Iterable[str]] = None
+    ) -> MjuUnivAuthResult[T]:
+        """
+        조회 중 서비스 세션이 만료되었으면 SSO 세션 쿠키로 조용히 재인증한 뒤 한 번 더 조회합니다.
+        SSO 세션까지 만료되었으면 첫 조회 결과(SESSION_EXPIRED_ERROR)를 그대로 반환합니다.
+        fields는 Fetcher.fetch()의 필드 프로젝션입니다.
+        """
+        result = create_fetcher().fetch(fields)
+        if result.error_code != ErrorCode.SESSION_EXPIRED_ERROR:
+            return result
+
+        if self._verbose:
+            logger.info("서비스 세션 만료: SSO 세션으로 재인증 시도")
+        authenticator = StandardAuthenticator(
+            user_id=self._user_id,
+            user_pw=self._user_pw,
+            verbose=self._verbose
+        )
+        reauth_result = authenticator.reauthenticate(self._login_result.data, self._service, login_fallback=False)
+        if not reauth_result.success:
+            return result
+        return create_fetcher().fetch(fields)
+
     # =================================================================
     # 데이터 조회 메서드 (고수준 API)
     # =================================================================
 
-    def get_student_basicinfo(self) -> MjuUnivAuthResult[StudentBasicInfo]:
+    def get_student_basicinfo(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[StudentBasicInfo]:
         """
         학생 기본 정보(대시보드 요약)를 조회합니다.
         MSI 서비스 로그인이 필요합니다.
 
+        Args:
+            fields: 조회할 모델 필드 경로 (예: {'department'}). 주면 나머지 값은 페이지에서 찾지 않고 기본값으로 둡니다.
+                    (없으면 전부 조회, 모델에 없는 경로면 ValueError)
+
         Returns:
             MjuUnivAuthResult[StudentBasicInfo]: 학생 기본 정보 조회 결과
         """
@@ -191,18 +241,21 @@ class MjuUnivAuth:
                 error_message="MSI 서비스로 로그인된 세션이 아닙니다. 학생 기본 정보는 MSI 서비스 로그인이 필요합니다."
             )
 
-        fetcher = StudentBasicInfoFetcher(
+        return self._fetch_with_reauth(lambda: StudentBasicInfoFetcher(
             session=self._login_result.data,
             verbose=self._verbose,
-        )
-        return fetcher.fetch()
+        ), fields)
 
-    def get_student_card(self) -> MjuUnivAuthResult[StudentCard]:
+    def get_student_card(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[StudentCard]:
         """
         학생카드 정보를 조회합니다.
         MSI 서비스 로그인이 필요하며, 내부적으로 2차 인증을 수행합니다.
         이 메서드를 호출하기 전에 반드시 세션이 msi 서비스로 로그인되어 있어야 합니다.
 
+        Args:
+            fields: 조회할 모델 필드 경로 (예: {'student_profile.name_korean'}). 주면 나머지 값은 페이지에서 찾지 않고 기본값으로 둡니다.
+                    (없으면 전부 조회, 모델에 없는 경로면 ValueError)
+
         Returns:
             MjuUnivAuthResult[StudentCard]: 학생카드 정보 조회 결과
         """
@@ -226,19 +279,22 @@ class MjuUnivAuth:
                 error_message="MSI 서비스로 로그인된 세션이 아닙니다. 학생카드 정보는 MSI 서비스 로그인이 필요합니다."
             )
 
-        fetcher = StudentCardFetcher(
+        return self._fetch_with_reauth(lambda: StudentCardFetcher(
             session=self._login_result.data,
             user_pw=self._user_pw,
             verbose=self._verbose,
-        )
-        return fetcher.fetch()
+        ), fields)
 
-    def get_student_changelog(self) -> MjuUnivAuthResult[StudentChangeLog]:
+    def get_student_changelog(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[StudentChangeLog]:
         """
         학적변동내역을 조회합니다.
         MSI 서비스 로그인이 필요합니다.
         이 메서드를 호출하기 전에 반드시 세션이 msi 서비스로 로그인되어 있어야 합니다.
-    
+
+        Args:
+            fields: 조회할 모델 필드 경로 (예: {'academic_status.status'}). 주면 나머지 값은 페이지에서 찾지 않고 기본값으로 둡니다.
+                    (없으면 전부 조회, 모델에 없는 경로면 ValueError)
+
         Returns:
             MjuUnivAuthResult[StudentChangeLog]: 학적변동내역 정보 조회 결과
         """
@@ -262,8 +318,7 @@ class MjuUnivAuth:
                 error_message="MSI 서비스로 로그인된 세션이 아닙니다. 학적변동내역 정보는 MSI 서비스 로그인이 필요합니다."
             )
     
-        fetcher = StudentChangeLogFetcher(
+        return self._fetch_with_reauth(lambda: StudentChangeLogFetcher(
             session=self._login_result.data,
             verbose=self._verbose,
-        )
-        return fetcher.fetch()
+        ), fields)
@@ -2,10 +2,18 @@ from .base_fetcher import BaseFetcher
 from .student_basicinfo_fetcher import StudentBasicInfoFetcher
 from .student_card_fetcher import StudentCardFetcher
 from .student_changelog_fetcher import StudentChangeLogFetcher
+from .async_base_fetcher import AsyncBaseFetcher
+from .async_student_basicinfo_fetcher import AsyncStudentBasicInfoFetcher
+from .async_student_card_fetcher import AsyncStudentCardFetcher
+from .async_student_changelog_fetcher import AsyncStudentChangeLogFetcher
 
 __all__ = [
     "BaseFetcher",
     "StudentBasicInfoFetcher",
     "StudentCardFetcher",
     "StudentChangeLogFetcher",
+    "AsyncBaseFetcher",
+    "AsyncStudentBasicInfoFetcher",
+    "AsyncStudentCardFetcher",
+    "AsyncStudentChangeLogFetcher",
 ]
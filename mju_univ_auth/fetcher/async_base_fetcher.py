@@ -0,0 +1,44 @@
+"""
+비동기 조회 기반 클래스
+======================
+`httpx.AsyncClient` 세션으로 데이터를 조회하는 Fetcher의 기반 클래스입니다.
+
+비동기 Fetcher는 동기 Fetcher를 함께 상속하여 요청 구성/파싱 로직을 그대로 재사용하고,
+네트워크 I/O 메서드만 코루틴으로 재정의합니다.
+"""
+
+from typing import Iterable, Optional, TypeVar
+
+from .base_fetcher import BaseFetcher, _fetch_error_result, _session_not_exist_result
+from ..results import MjuUnivAuthResult
+
+T = TypeVar('T')
+
+
+class AsyncBaseFetcher(BaseFetcher[T]):
+    """
+    비동기 데이터 조회를 위한 기반 클래스
+
+    `session`에는 로그인된 `httpx.AsyncClient`를 전달합니다.
+    """
+
+    async def fetch(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[T]:
+        """데이터를 조회합니다. (fields는 BaseFetcher.fetch()와 같은 필드 프로젝션)"""
+        self._parts = self.page_parts(fields)
+        if self.session is None:
+            return _session_not_exist_result()
+
+        try:
+            data = await self._execute()
+            return MjuUnivAuthResult(
+                request_succeeded=True,
+                credentials_valid=True,
+                data=data
+            )
+
+        except Exception as e:
+            return _fetch_error_result(e)
+
+    async def _execute(self) -> T:
+        """자식 클래스 구현부: 실패 시 반드시 커스텀 예외를 raise 해야 함"""
+        raise NotImplementedError
@@ -0,0 +1,52 @@
+"""
+학생 기본 정보 비동기 조회 서비스
+================================
+`httpx.AsyncClient` 세션으로 MSI 대시보드 요약 정보를 조회합니다.
+"""
+
+import logging
+
+from .async_base_fetcher import AsyncBaseFetcher
+from .student_basicinfo_fetcher import StudentBasicInfoFetcher
+from ..config import SERVICES, TIMEOUT_CONFIG
+from ..domain.student_basicinfo import StudentBasicInfo
+from ..infrastructure.transport import httpx
+from ..exceptions import NetworkError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncStudentBasicInfoFetcher(AsyncBaseFetcher[StudentBasicInfo], StudentBasicInfoFetcher):
+    """학생 기본 정보 비동기 조회 서비스 (파싱은 StudentBasicInfoFetcher와 공유)"""
+
+    async def _execute(self) -> StudentBasicInfo:
+        """
+        학생 기본 정보를 조회합니다.
+
+        Returns:
+            StudentBasicInfo: 조회된 학생 기본 정보
+        """
+        if self._verbose:
+            logger.info("[Step C] 학생 기본 정보 비동기 조회 시작")
+
+        # 1. MSI 메인 페이지 접근
+        html = await self._access_main_page()
+
+        # 2. 정보 파싱
+        basic_info = self._parse_basic_info(html)
+
+        if self._verbose:
+            logger.info("✓ 학생 기본 정보 조회 완료")
+        return basic_info
+
+    async def _access_main_page(self) -> bytes:
+        """MSI 메인 페이지(MySecurityStart) 접근"""
+        if self._verbose:
+            logger.info("[Step C-1] MSI 메인 페이지 접근")
+
+        try:
+            response = await self.session.get(SERVICES['msi'].endpoints.HOME, timeout=TIMEOUT_CONFIG.default)
+        except httpx.HTTPError as e:
+            raise NetworkError("MSI 홈페이지 접속 실패", url=SERVICES['msi'].endpoints.HOME, original_error=e)
+
+        return self._handle_main_page_response(str(response.url), self._read_body(response), response.status_code)
@@ -0,0 +1,121 @@
+"""
+학생카드 비동기 조회 서비스
+==========================
+`httpx.AsyncClient` 세션으로 MSI 학생카드 정보를 조회합니다.
+"""
+
+import logging
+
+from .async_base_fetcher import AsyncBaseFetcher
+from .student_card_fetcher import StudentCardFetcher
+from ..config import SERVICES, TIMEOUT_CONFIG
+from ..domain.student_card import StudentCard
+from ..infrastructure.parser import Html, response_text
+from ..infrastructure.transport import httpx
+from ..exceptions import NetworkError, InvalidCredentialsError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncStudentCardFetcher(AsyncBaseFetcher[StudentCard], StudentCardFetcher):
+    """학생카드 정보 비동기 조회 서비스 (요청 구성/파싱은 StudentCardFetcher와 공유)"""
+
+    async def _execute(self) -> StudentCard:
+        """
+        학생카드 정보를 조회합니다.
+
+        Returns:
+            StudentCard: 조회된 학생카드 정보
+        """
+        if self._verbose:
+            logger.info("[Step A] 학생카드 정보 비동기 조회 시작")
+
+        # 1. CSRF 토큰 획득
+        await self._get_csrf_token()
+
+        # 2. 학생카드 페이지 접근
+        html = await self._access_student_card_page()
+
+        # 3. 비밀번호 인증 필요 여부 확인 및 처리
+        if self._is_password_required(html):
+            if self._verbose:
+                logger.warning("2차 비밀번호 인증이 필요합니다.")
+            html = await self._submit_password(html)
+            html = await self._handle_redirect_form(html)
+
+            if self._is_password_required(html):
+                raise InvalidCredentialsError("2차 비밀번호 인증에 실패했습니다.")
+
+        # 4. 학생 정보 파싱
+        student_card = self._parse_student_card(html)
+
+        if self._verbose:
+            logger.info("✓ 학생카드 정보 조회 완료")
+        return student_card
+
+    async def _get_csrf_token(self) -> None:
+        """MSI 홈페이지에서 CSRF 토큰 추출"""
+        if self._verbose:
+            logger.info("[Step A-1] CSRF 토큰 추출")
+
+        try:
+            response = await self.session.get(SERVICES['msi'].endpoints.HOME, timeout=TIMEOUT_CONFIG.default)
+        except httpx.HTTPError as e:
+            raise NetworkError("MSI 홈페이지 접속 실패", url=SERVICES['msi'].endpoints.HOME, original_error=e)
+
+        self._handle_home_response(str(response.url), response_text(response), response.status_code)
+
+    async def _access_student_card_page(self) -> bytes:
+        """학생카드 페이지 접근"""
+        if self._verbose:
+            logger.info("[Step A-2] 학생카드 페이지 접근")
+
+        form_data, headers = self._student_card_request()
+        try:
+            response = await self.session.post(
+                SERVICES['msi'].endpoints.STUDENT_CARD,
+                data=form_data,
+                headers=headers,
+                timeout=TIMEOUT_CONFIG.page_access,
+            )
+        except httpx.HTTPError as e:
+            raise NetworkError("학생카드 페이지 접근 실패", url=SERVICES['msi'].endpoints.STUDENT_CARD, original_error=e)
+
+        self._last_url = str(response.url)
+        return self._read_body(response)
+
+    async def _submit_password(self, html: Html) -> bytes:
+        """2차 비밀번호 인증"""
+        if self._verbose:
+            logger.info("[Step A-3] 2차 비밀번호 인증")
+
+        form_data, headers = self._password_request(html)
+        try:
+            response = await self.session.post(
+                SERVICES['msi'].endpoints.PASSWORD_VERIFY,
+                data=form_data,
+                headers=headers,
+                timeout=TIMEOUT_CONFIG.page_access,
+            )
+        except httpx.HTTPError as e:
+            raise NetworkError("비밀번호 인증 요청 실패", url=SERVICES['msi'].endpoints.PASSWORD_VERIFY, original_error=e)
+
+        self._last_url = str(response.url)
+        return self._read_body(response)
+
+    async def _handle_redirect_form(self, html: Html) -> Html:
+        """2차 인증 후 리다이렉트 폼 처리"""
+        if self._verbose:
+            logger.info("[Step A-4] 리다이렉트 폼 처리")
+
+        redirect_request = self._redirect_form_request(html)
+        if redirect_request is None:
+            return html
+        action, form_data, headers = redirect_request
+
+        try:
+            response = await self.session.post(action, data=form_data, headers=headers, timeout=TIMEOUT_CONFIG.page_access)
+        except httpx.HTTPError as e:
+            raise NetworkError("리다렉트 폼 제출 실패", url=action, original_error=e)
+
+        return self._read_body(response)
@@ -0,0 +1,74 @@
+"""
+학적변동내역 비동기 조회 서비스
+==============================
+`httpx.AsyncClient` 세션으로 MSI 학적변동내역을 조회합니다.
+"""
+
+import logging
+
+from .async_base_fetcher import AsyncBaseFetcher
+from .student_changelog_fetcher import StudentChangeLogFetcher
+from ..config import SERVICES, TIMEOUT_CONFIG
+from ..domain.student_changelog import StudentChangeLog
+from ..infrastructure.parser import response_text
+from ..infrastructure.transport import httpx
+from ..exceptions import NetworkError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncStudentChangeLogFetcher(AsyncBaseFetcher[StudentChangeLog], StudentChangeLogFetcher):
+    """학적변동내역 비동기 조회 서비스 (요청 구성/파싱은 StudentChangeLogFetcher와 공유)"""
+
+    async def _execute(self) -> StudentChangeLog:
+        """
+        학적변동내역을 조회합니다.
+
+        Returns:
+            StudentChangeLog: 조회된 학적변동내역 정보
+        """
+        if self._verbose:
+            logger.info("[Step B] 학적변동내역 정보 비동기 조회 시작")
+
+        # 1. CSRF 토큰 획득
+        await self._get_csrf_token()
+
+        # 2. 학적변동내역 페이지 접근
+        html = await self._access_changelog_page()
+
+        # 3. 정보 파싱
+        changelog = self._parse_student_changelog(html)
+
+        if self._verbose:
+            logger.info("✓ 학적변동내역 정보 조회 완료")
+        return changelog
+
+    async def _get_csrf_token(self) -> None:
+        """MSI 홈페이지에서 CSRF 토큰 추출"""
+        if self._verbose:
+            logger.info("[Step B-1] CSRF 토큰 추출")
+
+        try:
+            response = await self.session.get(SERVICES['msi'].endpoints.HOME, timeout=TIMEOUT_CONFIG.default)
+        except httpx.HTTPError as e:
+            raise NetworkError("MSI 홈페이지 접속 실패", url=SERVICES['msi'].endpoints.HOME, original_error=e)
+
+        self._handle_home_response(str(response.url), response_text(response), response.status_code)
+
+    async def _access_changelog_page(self) -> bytes:
+        """학적변동내역 페이지 접근"""
+        if self._verbose:
+            logger.info("[Step B-2] 학적변동내역 페이지 접근")
+
+        form_data, headers = self._changelog_request()
+        try:
+            response = await self.session.post(
+                SERVICES['msi'].endpoints.CHANGE_LOG,
+                data=form_data,
+                headers=headers,
+                timeout=TIMEOUT_CONFIG.page_access,
+            )
+        except httpx.HTTPError as e:
+            raise NetworkError("학적변동내역 페이지 접근 실패", url=SERVICES['msi'].endpoints.CHANGE_LOG, original_error=e)
+
+        return self._read_body(response)
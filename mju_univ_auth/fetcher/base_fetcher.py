@@ -4,10 +4,15 @@
 데이터 조회를 위한 BaseFetcher 기반 클래스를 정의합니다.
 """
 
-from typing import Generic, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Generic, Iterable, Optional, Type, TypeVar
 import requests
+from pydantic import BaseModel
 
 from ..results import MjuUnivAuthResult, ErrorCode
+from ..infrastructure.parse_cache import cached_parse
+from ..infrastructure.parse_pool import pooled_parse
+from ..infrastructure.parser import Html, PageParts, get_parser_backend, response_body, wants
 from ..exceptions import (
     NetworkError,
     ParsingError,
@@ -19,23 +24,146 @@ from ..exceptions import (
 T = TypeVar('T')
 
 
+# 조회 중 발생한 예외 -> (request_succeeded, credentials_valid, error_code)
+_FETCH_ERROR_MAPPING = (
+    (ParsingError, False, True, ErrorCode.PARSING_ERROR),
+    (NetworkError, False, None, ErrorCode.NETWORK_ERROR),
+    (SessionExpiredError, False, False, ErrorCode.SESSION_EXPIRED_ERROR),
+    (InvalidCredentialsError, True, False, ErrorCode.INVALID_CREDENTIALS_ERROR),
+)
+
+
+def _fetch_error_result(error: Exception) -> MjuUnivAuthResult:
+    """조회 중 발생한 예외를 MjuUnivAuthResult로 변환 (동기/비동기 Fetcher 공용)"""
+    for error_type, request_succeeded, credentials_valid, error_code in _FETCH_ERROR_MAPPING:
+        if isinstance(error, error_type):
+            return MjuUnivAuthResult(
+                request_succeeded=request_succeeded,
+                credentials_valid=credentials_valid,
+                error_code=error_code,
+                error_message=str(error)
+            )
+    return MjuUnivAuthResult(
+        request_succeeded=False,
+        credentials_valid=None,
+        error_code=ErrorCode.UNKNOWN_ERROR,
+        error_message=str(error)
+    )
+
+
+def _session_not_exist_result() -> MjuUnivAuthResult:
+    """세션 없이 조회를 시도했을 때의 결과"""
+    return MjuUnivAuthResult(
+        request_succeeded=False,
+        credentials_valid=False,
+        error_code=ErrorCode.SESSION_NOT_EXIST_ERROR,
+        error_message=str(SessionNotExistError())
+    )
+
+
+@lru_cache(maxsize=None)
+def _field_paths(model: Type[BaseModel]) -> FrozenSet[str]:
+    """모델의 필드 경로 ('student_profile', 'student_profile.name_korean' ...)"""
+    paths = set()
+    for name, info in model.model_fields.items():
+        paths.add(name)
+        if isinstance(info.annotation, type) and issubclass(info.annotation, BaseModel):
+            paths.update(f'{name}.{path}' for path in _field_paths(info.annotation))
+    return frozenset(paths)
+
+
 class BaseFetcher(Generic[T]):
     """데이터 조회를 위한 기반 클래스"""
-    
-    def __init__(self, session: requests.Session):
+
+    # 파싱할 페이지 종류 (ParserBackend.pages). 페이지를 파싱하지 않는 Fetcher는 None
+    PAGE: Optional[str] = None
+    # 조회 결과 모델과, 모델 필드 경로 -> 그 값을 채우는 페이지 데이터 필드 (필드 프로젝션에 사용)
+    # 더 긴(구체적인) 경로가 우선합니다. ('student_profile.photo_base64' -> 'photo_src', 'student_profile' -> 'fields')
+    MODEL: Optional[Type[BaseModel]] = None
+    PAGE_PARTS: Dict[str, str] = {}
+
+    def __init__(self, session: requests.Session, parser_backend: Optional[str] = None):
+        """
+        Args:
+            session: 로그인된 세션
+            parser_backend: 파서 백엔드 이름 ('lxml', 'bs4' ..., 없으면 use_parser_backend()로 고른 전역 백엔드)
+        """
         self.session = session
+        self._parser = get_parser_backend(parser_backend, page=self.PAGE)
+        self._encoding: Optional[str] = None  # 마지막으로 읽은 페이지 본문의 인코딩
+        self._parts: PageParts = None          # 이번 조회에서 채울 페이지 데이터 필드 (None이면 전부)
+
+    def _read_body(self, response) -> bytes:
+        """파싱할 페이지 본문(bytes)을 꺼내고 인코딩을 기록 (response.text의 charset 감지를 거치지 않음)"""
+        body, self._encoding = response_body(response)
+        return body
+
+    @classmethod
+    def page_parts(cls, fields: Optional[Iterable[str]]) -> PageParts:
+        """
+        조회할 모델 필드 경로를 채워야 하는 페이지 데이터 필드로 바꿉니다. (fields가 None이면 None = 전부)
+
+        'student_profile'처럼 중간 경로를 주면 그 아래 필드를 모두 조회합니다.
+
+        Raises:
+            ValueError: 모델에 없는 필드 경로
+        """
+        if fields is None:
+            return None
+        if isinstance(fields, str):
+            fields = (fields,)
+
+        known = _field_paths(cls.MODEL)
+        parts = set()
+        for path in fields:
+            if path not in known:
+                raise ValueError(f"{cls.MODEL.__name__}에 없는 필드입니다: {path!r}")
+            # path 자신과 그 아래 경로
+            parts.update(
+                part for prefix, part in cls.PAGE_PARTS.items() if prefix == path or prefix.startswith(f'{path}.')
+            )
+            # path를 포함하는 가장 구체적인 경로
+            if path not in cls.PAGE_PARTS:
+                covering = [prefix for prefix in cls.PAGE_PARTS if path.startswith(f'{prefix}.')]
+                if covering:
+                    parts.add(cls.PAGE_PARTS[max(covering, key=len)])
+        return frozenset(parts)
+
+    def _wants(self, part: str) -> bool:
+        """이번 조회에서 페이지 데이터의 part 값을 쓰는지"""
+        return wants(self._parts, part)
 
-    def fetch(self) -> MjuUnivAuthResult[T]:
+    def _parse_page(self, html: Html) -> Any:
+        """
+        PAGE 종류의 페이지를 파서 백엔드로 읽어 페이지 데이터(StudentCardPage ...)를 반환
+
+        필드 프로젝션이 있으면 요청한 값만 찾습니다. 파싱 결과 메모 캐시가 설치되어 있으면
+        같은 본문(백엔드/인코딩/프로젝션도 같음)은 다시 파싱하지 않습니다.
+        파싱 프로세스 풀이 설치되어 있으면 워커 프로세스에서 파싱합니다. (포화면 이 스레드에서)
+        """
+        page, backend, encoding, parts = self.PAGE, self._parser.name, self._encoding, self._parts
+        parse = getattr(self._parser, page)
+
+        def parse_page():
+            return pooled_parse(page, backend, html, encoding, parts, lambda: parse(html, encoding, parts))
+
+        return cached_parse(page, html, parse_page, backend, encoding, parts)
+
+    def fetch(self, fields: Optional[Iterable[str]] = None) -> MjuUnivAuthResult[T]:
+        """
+        데이터를 조회합니다.
+
+        Args:
+            fields: 조회할 모델 필드 경로 (예: {'student_profile.student_id', 'student_profile.name_korean'}).
+                    주면 나머지 값은 페이지에서 찾지도, 복사하지도, 검증하지도 않고 모델 기본값('' 등)으로 둡니다.
+                    없으면 전부 조회합니다.
+
+        Raises:
+            ValueError: fields에 모델에 없는 필드 경로가 있는 경우
+        """
+        self._parts = self.page_parts(fields)
         if self.session is None:
-            try:
-                raise SessionNotExistError()
-            except SessionNotExistError as e:
-                return MjuUnivAuthResult(
-                    request_succeeded=False,
-                    credentials_valid=False,
-                    error_code=ErrorCode.SESSION_NOT_EXIST_ERROR,
-                    error_message=str(e)
-                )
+            return _session_not_exist_result()
 
         try:
             data = self._execute()
@@ -44,46 +172,9 @@ class BaseFetcher(Generic[T]):
                 credentials_valid=True,
                 data=data
             )
-            
-        except ParsingError as e:
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=True,
-                error_code=ErrorCode.PARSING_ERROR,
-                error_message=str(e)
-            )
-            
-        except NetworkError as e:
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=None,
-                error_code=ErrorCode.NETWORK_ERROR,
-                error_message=str(e)
-            )
-            
-        except SessionExpiredError as e:
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=False,
-                error_code=ErrorCode.SESSION_EXPIRED_ERROR,
-                error_message=str(e)
-            )
-
-        except InvalidCredentialsError as e:
-            return MjuUnivAuthResult(
-                request_succeeded=True,
-                credentials_valid=False,
-                error_code=ErrorCode.INVALID_CREDENTIALS_ERROR,
-                error_message=str(e),
-            )
 
         except Exception as e:
-            return MjuUnivAuthResult(
-                request_succeeded=False,
-                credentials_valid=None,
-                error_code=ErrorCode.UNKNOWN_ERROR,
-                error_message=str(e)
-            )
+            return _fetch_error_result(e)
 
     def _execute(self) -> T:
         """자식 클래스 구현부: 실패 시 반드시 커스텀 예외를 raise 해야 함"""
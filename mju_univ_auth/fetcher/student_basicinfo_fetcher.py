@@ -5,11 +5,12 @@ MSI 메인 페이지에서 대시보드 요약 정보를 조회합니다.
 """
 
 import logging
+from typing import Optional
 import requests
-from bs4 import BeautifulSoup
 
 from ..fetcher.base_fetcher import BaseFetcher
 from ..config import SERVICES, TIMEOUT_CONFIG
+from ..infrastructure.parser import Html
 from ..domain.student_basicinfo import StudentBasicInfo
 from ..exceptions import (
     NetworkError,
@@ -23,17 +24,30 @@ logger = logging.getLogger(__name__)
 class StudentBasicInfoFetcher(BaseFetcher[StudentBasicInfo]):
     """학생 기본 정보(대시보드 요약) 조회 서비스"""
 
+    PAGE = 'student_basicinfo'
+    MODEL = StudentBasicInfo
+    PAGE_PARTS = {
+        'department': 'fields',
+        'category': 'fields',
+        'grade': 'fields',
+        'last_access_time': 'fields',
+        'last_access_ip': 'fields',
+        'raw_html_data': 'raw_html_data',
+    }
+
     def __init__(
         self,
         session: requests.Session,
         verbose: bool = False,
+        parser_backend: Optional[str] = None,
     ):
         """
         Args:
             session: 로그인된 세션
             verbose: 상세 로그 출력 여부
+            parser_backend: 파서 백엔드 이름 (없으면 전역 백엔드, 기본 'lxml')
         """
-        super().__init__(session)
+        super().__init__(session, parser_backend)
         self._verbose = verbose
 
     def _execute(self) -> StudentBasicInfo:
@@ -56,7 +70,7 @@ class StudentBasicInfoFetcher(BaseFetcher[StudentBasicInfo]):
             logger.info("✓ 학생 기본 정보 조회 완료")
         return basic_info
 
-    def _access_main_page(self) -> str:
+    def _access_main_page(self) -> bytes:
         """MSI 메인 페이지(MySecurityStart) 접근"""
         if self._verbose:
             logger.info("[Step C-1] MSI 메인 페이지 접근")
@@ -67,43 +81,36 @@ class StudentBasicInfoFetcher(BaseFetcher[StudentBasicInfo]):
         except requests.RequestException as e:
             raise NetworkError("MSI 홈페이지 접속 실패", url=SERVICES['msi'].endpoints.HOME, original_error=e)
         
+        return self._handle_main_page_response(response.url, self._read_body(response), response.status_code)
+
+    def _handle_main_page_response(self, url: str, html: Html, status_code: int) -> Html:
+        """MSI 메인 페이지 응답의 세션 만료 여부 확인 (동기/비동기 공용)"""
         if self._verbose:
-            logger.debug(f"Response: {response.status_code} - {response.url}")
+            logger.debug(f"Response: {status_code} - {url}")
 
         # 세션 만료 확인
-        if 'sso.mju.ac.kr' in response.url:
-            raise SessionExpiredError("세션이 만료되었습니다. 다시 로그인해주세요.", redirect_url=response.url)
+        if 'sso.mju.ac.kr' in url:
+            raise SessionExpiredError("세션이 만료되었습니다. 다시 로그인해주세요.", redirect_url=url)
 
-        return response.text
+        return html
 
-    def _parse_basic_info(self, html: str) -> StudentBasicInfo:
-        """학생 기본 정보 HTML 파싱"""
+    def _parse_basic_info(self, html: Html) -> StudentBasicInfo:
+        """학생 기본 정보 HTML 파싱 (bytes면 마지막으로 읽은 응답의 인코딩으로 lxml이 직접 디코딩)"""
         if self._verbose:
             logger.info("[Step C-2] 학생 기본 정보 파싱")
 
-        soup = BeautifulSoup(html, 'lxml')
-        info_card = soup.find('div', class_='main-user-info')
-
-        if not info_card:
-            raise ParsingError("기본 정보 카드('main-user-info')를 찾을 수 없습니다.")
+        page = self._parse_page(html)
+        data = page.fields
 
         info = StudentBasicInfo()
-        info.raw_html_data = str(info_card) if info_card else ''
-
-        info_cells = info_card.find_all('div', class_='info-cell')
-        data = {}
-        for cell in info_cells:
-            title = cell.find('div', class_='title').get_text(strip=True).replace(':', '').strip()
-            value = cell.find('div', class_='value').get_text(strip=True)
-            data[title] = value
-
+        info.raw_html_data = page.raw_html_data
         info.department = data.get('소 속', '')
         info.category = data.get('구 분', '')
         info.grade = data.get('학 년', '')
         info.last_access_time = data.get('최근접속시간', '')
         info.last_access_ip = data.get('최근접속IP', '')
         
-        if not info.department:
+        if self._wants('fields') and not info.department:
             raise ParsingError("기본 정보 필드('소속')를 파싱할 수 없습니다.")
 
         if self._verbose:
@@ -4,14 +4,13 @@
 MSI 서비스에서 학생카드 정보를 조회합니다.
 """
 
-import re
 import logging
+from typing import Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
 
 from ..fetcher.base_fetcher import BaseFetcher
 from ..config import SERVICES, TIMEOUT_CONFIG
-from ..infrastructure.parser import HTMLParser
+from ..infrastructure.parser import HTMLParser, Html, decode_html, iter_tags, response_text
 from ..domain.student_card import StudentCard, StudentProfile, PersonalContact, Address
 from ..exceptions import (
     NetworkError,
@@ -26,19 +25,30 @@ logger = logging.getLogger(__name__)
 class StudentCardFetcher(BaseFetcher[StudentCard]):
     """학생카드 정보 조회 서비스"""
 
+    PAGE = 'student_card'
+    MODEL = StudentCard
+    PAGE_PARTS = {
+        'student_profile.photo_base64': 'photo_src',
+        'student_profile': 'fields',
+        'personal_contact': 'inputs',
+        'raw_html_data': 'raw_html_data',
+    }
+
     def __init__(
         self,
         session: requests.Session,
         user_pw: str,
         verbose: bool = False,
+        parser_backend: Optional[str] = None,
     ):
         """
         Args:
             session: 로그인된 세션
             user_pw: 비밀번호 (2차 인증에 사용)
             verbose: 상세 로그 출력 여부
+            parser_backend: 파서 백엔드 이름 (없으면 전역 백엔드, 기본 'lxml')
         """
-        super().__init__(session)
+        super().__init__(session, parser_backend)
         self.user_pw = user_pw
         self._verbose = verbose
 
@@ -89,14 +99,18 @@ class StudentCardFetcher(BaseFetcher[StudentCard]):
         except requests.RequestException as e:
             raise NetworkError("MSI 홈페이지 접속 실패", url=SERVICES['msi'].endpoints.HOME, original_error=e)
         
+        self._handle_home_response(response.url, response_text(response), response.status_code)
+
+    def _handle_home_response(self, url: str, html: str, status_code: int) -> None:
+        """MSI 홈페이지 응답에서 세션 만료 여부 확인 후 CSRF 토큰 추출 (동기/비동기 공용)"""
         if self._verbose:
-            logger.debug(f"Response: {response.status_code} - {response.url}")
+            logger.debug(f"Response: {status_code} - {url}")
 
         # 세션 만료 확인
-        if 'sso.mju.ac.kr' in response.url:
-            raise SessionExpiredError("세션이 만료되었습니다. 다시 로그인해주세요.", redirect_url=response.url)
+        if 'sso.mju.ac.kr' in url:
+            raise SessionExpiredError("세션이 만료되었습니다. 다시 로그인해주세요.", redirect_url=url)
 
-        self._csrf_token = HTMLParser.extract_csrf_token(response.text)
+        self._csrf_token = HTMLParser.extract_csrf_token(html)
 
         if not self._csrf_token:
             raise ParsingError("CSRF 토큰을 찾을 수 없습니다.", field="csrf")
@@ -105,11 +119,34 @@ class StudentCardFetcher(BaseFetcher[StudentCard]):
             logger.debug(f"CSRF Token: {self._csrf_token}")
             logger.info("✓ CSRF 토큰 추출 완료")
 
-    def _access_student_card_page(self) -> str:
+    def _access_student_card_page(self) -> bytes:
         """학생카드 페이지 접근"""
         if self._verbose:
             logger.info("[Step A-2] 학생카드 페이지 접근")
 
+        form_data, headers = self._student_card_request()
+
+        if self._verbose:
+            logger.debug(f"POST {SERVICES['msi'].endpoints.STUDENT_CARD}")
+
+        try:
+            response = self.session.post(
+                SERVICES['msi'].endpoints.STUDENT_CARD,
+                data=form_data,
+                headers=headers,
+                timeout=TIMEOUT_CONFIG.page_access,
+            )
+        except requests.RequestException as e:
+            raise NetworkError("학생카드 페이지 접근 실패", url=SERVICES['msi'].endpoints.STUDENT_CARD, original_error=e)
+        
+        if self._verbose:
+            logger.debug(f"Response: {response.status_code} - {response.url}")
+
+        self._last_url = response.url
+        return self._read_body(response)
+
+    def _student_card_request(self) -> Tuple[dict, dict]:
+        """학생카드 페이지 요청의 (form_data, headers)"""
         form_data = {
             'sysdiv': 'SCH',
             'subsysdiv': 'SCH',
@@ -125,38 +162,45 @@ class StudentCardFetcher(BaseFetcher[StudentCard]):
             'Referer': SERVICES['msi'].endpoints.HOME,
             'X-CSRF-TOKEN': self._csrf_token,
         }
+        return form_data, headers
+
+    def _is_password_required(self, html: Html) -> bool:
+        """비밀번호 입력이 필요한지 확인"""
+        if isinstance(html, bytes):
+            return b'tfpassword' in html or b'verifyPW' in html
+        return 'tfpassword' in html or 'verifyPW' in html
+
+    def _submit_password(self, html: Html) -> bytes:
+        """2차 비밀번호 인증"""
+        if self._verbose:
+            logger.info("[Step A-3] 2차 비밀번호 인증")
+
+        form_data, headers = self._password_request(html)
 
         if self._verbose:
-            logger.debug(f"POST {SERVICES['msi'].endpoints.STUDENT_CARD}")
+            logger.debug(f"POST {SERVICES['msi'].endpoints.PASSWORD_VERIFY}")
 
         try:
             response = self.session.post(
-                SERVICES['msi'].endpoints.STUDENT_CARD,
+                SERVICES['msi'].endpoints.PASSWORD_VERIFY,
                 data=form_data,
                 headers=headers,
                 timeout=TIMEOUT_CONFIG.page_access,
             )
         except requests.RequestException as e:
-            raise NetworkError("학생카드 페이지 접근 실패", url=SERVICES['msi'].endpoints.STUDENT_CARD, original_error=e)
+            raise NetworkError("비밀번호 인증 요청 실패", url=SERVICES['msi'].endpoints.PASSWORD_VERIFY, original_error=e)
         
         if self._verbose:
             logger.debug(f"Response: {response.status_code} - {response.url}")
 
         self._last_url = response.url
-        return response.text
-
-    def _is_password_required(self, html: str) -> bool:
-        """비밀번호 입력이 필요한지 확인"""
-        return 'tfpassword' in html or 'verifyPW' in html
-
-    def _submit_password(self, html: str) -> str:
-        """2차 비밀번호 인증"""
-        if self._verbose:
-            logger.info("[Step A-3] 2차 비밀번호 인증")
+        return self._read_body(response)
 
+    def _password_request(self, html: Html) -> Tuple[dict, dict]:
+        """2차 비밀번호 인증 요청의 (form_data, headers)"""
+        html = decode_html(html, self._encoding)
         # originalurl 추출
-        original_match = re.search(r'name="originalurl"\s+value="([^"]+)"', html)
-        original_url = original_match.group(1) if original_match else SERVICES['msi'].endpoints.STUDENT_CARD
+        original_url = HTMLParser.extract_input_value(html, 'originalurl') or SERVICES['msi'].endpoints.STUDENT_CARD
 
         form_data = {
             'originalurl': original_url,
@@ -170,41 +214,38 @@ class StudentCardFetcher(BaseFetcher[StudentCard]):
             'Referer': self._last_url or SERVICES['msi'].endpoints.STUDENT_CARD,
             'X-CSRF-TOKEN': self._csrf_token,
         }
+        return form_data, headers
 
+    def _handle_redirect_form(self, html: Html) -> Html:
+        """2차 인증 후 리다이렉트 폼 처리"""
         if self._verbose:
-            logger.debug(f"POST {SERVICES['msi'].endpoints.PASSWORD_VERIFY}")
+            logger.info("[Step A-4] 리다이렉트 폼 처리")
+
+        redirect_request = self._redirect_form_request(html)
+        if redirect_request is None:
+            return html
+        action, form_data, headers = redirect_request
 
         try:
-            response = self.session.post(
-                SERVICES['msi'].endpoints.PASSWORD_VERIFY,
-                data=form_data,
-                headers=headers,
-                timeout=TIMEOUT_CONFIG.page_access,
-            )
+            response = self.session.post(action, data=form_data, headers=headers, timeout=TIMEOUT_CONFIG.page_access)
         except requests.RequestException as e:
-            raise NetworkError("비밀번호 인증 요청 실패", url=SERVICES['msi'].endpoints.PASSWORD_VERIFY, original_error=e)
+            raise NetworkError("리다렉트 폼 제출 실패", url=action, original_error=e)
         
         if self._verbose:
             logger.debug(f"Response: {response.status_code} - {response.url}")
 
-        self._last_url = response.url
-        return response.text
-
-    def _handle_redirect_form(self, html: str) -> str:
-        """2차 인증 후 리다이렉트 폼 처리"""
-        if self._verbose:
-            logger.info("[Step A-4] 리다이렉트 폼 처리")
-
-        action_match = re.search(r'action\s*=\s*["\"](https[^"]+)["\"]', html)
-        csrf_match = re.search(r'name=["\"]_csrf["\"][^>]*value=["\"]([^"]+)["\"]', html)
+        return self._read_body(response)
 
-        action = action_match.group(1) if action_match else ''
+    def _redirect_form_request(self, html: Html) -> Optional[Tuple[str, dict, dict]]:
+        """리다이렉트 폼 요청의 (action, form_data, headers), 폼이 없으면 None"""
+        html = decode_html(html, self._encoding)
+        action = next((form['action'] for form in iter_tags(html, 'form') if form.get('action', '').startswith('https')), '')
         if not action or 'Sum00Svl01getStdCard' not in action:
             if self._verbose:
                 logger.warning("리다이렉트 폼을 찾지 못했습니다.")
-            return html
+            return None
 
-        csrf = csrf_match.group(1) if csrf_match else self._csrf_token
+        csrf = HTMLParser.extract_input_value(html, '_csrf') or self._csrf_token
 
         if self._verbose:
             logger.debug(f"Redirect URL: {action}")
@@ -216,47 +257,24 @@ class StudentCardFetcher(BaseFetcher[StudentCard]):
             'Referer': self._last_url,
             'X-CSRF-TOKEN': csrf,
         }
+        return action, form_data, headers
 
-        try:
-            response = self.session.post(action, data=form_data, headers=headers, timeout=TIMEOUT_CONFIG.page_access)
-        except requests.RequestException as e:
-            raise NetworkError("리다렉트 폼 제출 실패", url=action, original_error=e)
-        
-        if self._verbose:
-            logger.debug(f"Response: {response.status_code} - {response.url}")
-
-        return response.text
-
-    def _parse_student_card(self, html: str) -> StudentCard:
-        """학생카드 HTML 파싱"""
+    def _parse_student_card(self, html: Html) -> StudentCard:
+        """학생카드 HTML 파싱 (bytes면 마지막으로 읽은 응답의 인코딩으로 lxml이 직접 디코딩)"""
         if self._verbose:
             logger.info("[Step A-5] 학생 정보 파싱")
 
-        soup = BeautifulSoup(html, 'lxml')
-        card_item = soup.find('div', class_='card-item basic')
+        page = self._parse_page(html)
+        fields, inputs = page.fields, page.inputs
         card = StudentCard()
-        card.raw_html_data = str(card_item) if card_item else ''
+        card.raw_html_data = page.raw_html_data
 
-        # 1. 학생 프로필 정보 파싱
+        # 1. 학생 프로필 정보
         profile = StudentProfile()
-        
-        # 사진
-        img_tag = soup.select_one('#pictureInclude img')
-        if img_tag and 'base64,' in img_tag.get('src', ''):
-            profile.photo_base64 = img_tag['src']
-            # profile.photo_base64 = img_tag['src'].split('base64,')[1]
-
-        # 기본 정보 테이블
-        profile_table = soup.select_one('#pictureInclude .flex-table')
-        if not profile_table:
-            raise ParsingError("학생 프로필 테이블을 찾을 수 없습니다.")
-
-        fields = {}
-        for item in profile_table.find_all('div', class_='flex-table-item'):
-            title = item.find('div', class_='item-title').get_text(strip=True)
-            value = item.find('div', class_='item-data').get_text(strip=True)
-            fields[title] = value
-        
+        if 'base64,' in page.photo_src:
+            profile.photo_base64 = page.photo_src
+            # profile.photo_base64 = page.photo_src.split('base64,')[1]
+
         profile.student_id = fields.get('학번', '')
         profile.name_korean = fields.get('한글성명', '')
         profile.grade = fields.get('학년', '').replace('학년', '').strip()
@@ -268,43 +286,32 @@ class StudentCardFetcher(BaseFetcher[StudentCard]):
 
         card.student_profile = profile
 
-        # 2. 개인 연락처 정보 파싱
-        contact = PersonalContact()
-        contact_table = soup.select_one('hr + .flex-table')
-        if not contact_table:
-            raise ParsingError("개인 연락처 테이블을 찾을 수 없습니다.")
-
-        contact.english_surname = contact_table.find('input', {'name': 'nm_eng'}).get('value', '')
-        contact.english_givenname = contact_table.find('input', {'name': 'nm_eng2'}).get('value', '')
-        contact.phone_number = contact_table.find('input', {'name': 'std_tel'}).get('value', '')
-        contact.mobile_number = contact_table.find('input', {'name': 'htel'}).get('value', '')
-        contact.email = contact_table.find('input', {'name': 'email'}).get('value', '')
-
-        # 현거주지 주소
-        zip1 = contact_table.find('input', {'name': 'zip1'}).get('value', '')
-        zip2 = contact_table.find('input', {'name': 'zip2'}).get('value', '')
-        addr1 = contact_table.find('input', {'name': 'addr1'}).get('value', '')
-        addr2 = contact_table.find('input', {'name': 'addr2'}).get('value', '')
-        contact.current_residence_address = Address(
-            postal_code=f"{zip1}-{zip2}",
-            address=f"{addr1} {addr2}".strip()
-        )
-
-        # 주민등록 주소
-        zip1_2 = contact_table.find('input', {'name': 'zip1_2'}).get('value', '')
-        zip2_2 = contact_table.find('input', {'name': 'zip2_2'}).get('value', '')
-        addr1_2 = contact_table.find('input', {'name': 'addr1_2'}).get('value', '')
-        addr2_2 = contact_table.find('input', {'name': 'addr2_2'}).get('value', '')
-        contact.resident_registration_address = Address(
-            postal_code=f"{zip1_2}-{zip2_2}",
-            address=f"{addr1_2} {addr2_2}".strip()
-        )
-        
-        card.personal_contact = contact
+        # 2. 개인 연락처 정보 (필드 프로젝션에서 빠졌으면 기본값)
+        if self._wants('inputs'):
+            contact = PersonalContact()
+            contact.english_surname = inputs['nm_eng']
+            contact.english_givenname = inputs['nm_eng2']
+            contact.phone_number = inputs['std_tel']
+            contact.mobile_number = inputs['htel']
+            contact.email = inputs['email']
+
+            # 현거주지 주소
+            contact.current_residence_address = Address(
+                postal_code=f"{inputs['zip1']}-{inputs['zip2']}",
+                address=f"{inputs['addr1']} {inputs['addr2']}".strip()
+            )
+
+            # 주민등록 주소
+            contact.resident_registration_address = Address(
+                postal_code=f"{inputs['zip1_2']}-{inputs['zip2_2']}",
+                address=f"{inputs['addr1_2']} {inputs['addr2_2']}".strip()
+            )
+
+            card.personal_contact = contact
 
-        if not card.student_profile.student_id:
+        if self._wants('fields') and not card.student_profile.student_id:
             raise ParsingError("학생 정보를 찾을 수 없습니다 (학번 필드 누락).", field="student_id")
 
         if self._verbose:
             logger.info("✓ 학생 정보 파싱 완료")
-        return card
\ No newline at end of file
+        return card
@@ -5,12 +5,12 @@ MSI 서비스에서 학적변동내역을 조회합니다.
 """
 
 import logging
+from typing import Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
 
 from .base_fetcher import BaseFetcher
 from ..config import SERVICES, TIMEOUT_CONFIG
-from ..infrastructure.parser import HTMLParser
+from ..infrastructure.parser import HTMLParser, Html, response_text
 from ..domain.student_changelog import StudentChangeLog, AcademicStatus, ChangeLogEntry
 from ..exceptions import (
     NetworkError,
@@ -24,17 +24,28 @@ logger = logging.getLogger(__name__)
 class StudentChangeLogFetcher(BaseFetcher[StudentChangeLog]):
     """학적변동내역 조회 서비스"""
 
+    PAGE = 'student_changelog'
+    MODEL = StudentChangeLog
+    PAGE_PARTS = {
+        'academic_status': 'fields',
+        'cumulative_leave_semesters': 'leave_semesters',
+        'change_log_list': 'rows',
+        'raw_html_data': 'raw_html_data',
+    }
+
     def __init__(
         self,
         session: requests.Session,
         verbose: bool = False,
+        parser_backend: Optional[str] = None,
     ):
         """
         Args:
             session: 로그인된 세션
             verbose: 상세 로그 출력 여부
+            parser_backend: 파서 백엔드 이름 (없으면 전역 백엔드, 기본 'lxml')
         """
-        super().__init__(session)
+        super().__init__(session, parser_backend)
         self._verbose = verbose
 
         self._csrf_token: str | None = None
@@ -73,14 +84,18 @@ class StudentChangeLogFetcher(BaseFetcher[StudentChangeLog]):
         except requests.RequestException as e:
             raise NetworkError("MSI 홈페이지 접속 실패", url=SERVICES['msi'].endpoints.HOME, original_error=e)
         
+        self._handle_home_response(response.url, response_text(response), response.status_code)
+
+    def _handle_home_response(self, url: str, html: str, status_code: int) -> None:
+        """MSI 홈페이지 응답에서 세션 만료 여부 확인 후 CSRF 토큰 추출 (동기/비동기 공용)"""
         if self._verbose:
-            logger.debug(f"Response: {response.status_code} - {response.url}")
+            logger.debug(f"Response: {status_code} - {url}")
 
         # 세션 만료 확인
-        if 'sso.mju.ac.kr' in response.url:
-            raise SessionExpiredError("세션이 만료되었습니다. 다시 로그인해주세요.", redirect_url=response.url)
+        if 'sso.mju.ac.kr' in url:
+            raise SessionExpiredError("세션이 만료되었습니다. 다시 로그인해주세요.", redirect_url=url)
 
-        self._csrf_token = HTMLParser.extract_csrf_token(response.text)
+        self._csrf_token = HTMLParser.extract_csrf_token(html)
 
         if not self._csrf_token:
             raise ParsingError("CSRF 토큰을 찾을 수 없습니다.", field="csrf")
@@ -89,25 +104,12 @@ class StudentChangeLogFetcher(BaseFetcher[StudentChangeLog]):
             logger.debug(f"CSRF Token: {self._csrf_token}")
             logger.info("✓ CSRF 토큰 추출 완료")
 
-    def _access_changelog_page(self) -> str:
+    def _access_changelog_page(self) -> bytes:
         """학적변동내역 페이지 접근"""
         if self._verbose:
             logger.info("[Step B-2] 학적변동내역 페이지 접근")
 
-        form_data = {
-            'sysdiv': 'SCH',
-            'subsysdiv': 'SCH',
-            'folderdiv': '101',
-            'pgmid': 'W_SUD020',
-            '_csrf': self._csrf_token,
-        }
-
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Origin': 'https://msi.mju.ac.kr',
-            'Referer': SERVICES['msi'].endpoints.HOME,
-            'X-CSRF-TOKEN': self._csrf_token,
-        }
+        form_data, headers = self._changelog_request()
 
         if self._verbose:
             logger.debug(f"POST {SERVICES['msi'].endpoints.CHANGE_LOG}")
@@ -125,30 +127,38 @@ class StudentChangeLogFetcher(BaseFetcher[StudentChangeLog]):
         if self._verbose:
             logger.debug(f"Response: {response.status_code} - {response.url}")
 
-        return response.text
+        return self._read_body(response)
+
+    def _changelog_request(self) -> Tuple[dict, dict]:
+        """학적변동내역 페이지 요청의 (form_data, headers)"""
+        form_data = {
+            'sysdiv': 'SCH',
+            'subsysdiv': 'SCH',
+            'folderdiv': '101',
+            'pgmid': 'W_SUD020',
+            '_csrf': self._csrf_token,
+        }
+
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Origin': 'https://msi.mju.ac.kr',
+            'Referer': SERVICES['msi'].endpoints.HOME,
+            'X-CSRF-TOKEN': self._csrf_token,
+        }
+        return form_data, headers
 
-    def _parse_student_changelog(self, html: str) -> StudentChangeLog:
-        """학적변동내역 HTML 파싱"""
+    def _parse_student_changelog(self, html: Html) -> StudentChangeLog:
+        """학적변동내역 HTML 파싱 (bytes면 마지막으로 읽은 응답의 인코딩으로 lxml이 직접 디코딩)"""
         if self._verbose:
             logger.info("[Step B-3] 학적변동내역 정보 파싱")
 
-        soup = BeautifulSoup(html, 'lxml')
-        card_items = soup.find_all('div', class_='card-item basic')
+        page = self._parse_page(html)
+        fields = page.fields
         changelog = StudentChangeLog()
-        changelog.raw_html_data = "\n".join(map(str, card_items)) if card_items else ''
+        changelog.raw_html_data = page.raw_html_data
 
-        # 1. 학적 기본 정보 파싱
+        # 1. 학적 기본 정보
         status = AcademicStatus()
-        status_table = soup.select_one('.card-item.basic .flex-table')
-        if not status_table:
-            raise ParsingError("학적 기본 정보 테이블을 찾을 수 없습니다.")
-
-        fields = {}
-        for item in status_table.find_all('div', class_='flex-table-item'):
-            title = item.find('div', class_='item-title').get_text(strip=True)
-            value = item.find('div', class_='item-data').get_text(strip=True)
-            fields[title] = value
-        
         status.student_id = fields.get('학번', '')
         status.name = fields.get('성명', '')
         status.status = fields.get('학적상태', '')
@@ -157,32 +167,26 @@ class StudentChangeLogFetcher(BaseFetcher[StudentChangeLog]):
         status.department = fields.get('학부(과)', '')
         changelog.academic_status = status
 
-        # 2. 휴학 누적 현황 파싱
-        leave_span = soup.select_one('.data-title.small span')
-        if leave_span:
-            changelog.cumulative_leave_semesters = leave_span.get_text(strip=True)
-
-        # 3. 변동 내역 리스트 파싱
-        log_list = []
-        log_table = soup.select_one('.read-table table')
-        if log_table and log_table.tbody:
-            for row in log_table.tbody.find_all('tr'):
-                cols = row.find_all('td')
-                if len(cols) == 6:
-                    entry = ChangeLogEntry(
-                        year=cols[0].get_text(strip=True),
-                        semester=cols[1].get_text(strip=True),
-                        change_type=cols[2].get_text(strip=True),
-                        change_date=cols[3].get_text(strip=True),
-                        expiry_date=cols[4].get_text(strip=True),
-                        reason=cols[5].get_text(strip=True),
-                    )
-                    log_list.append(entry)
-        changelog.change_log_list = log_list
-
-        if not changelog.academic_status.student_id:
+        # 2. 휴학 누적 현황
+        if page.leave_semesters is not None:
+            changelog.cumulative_leave_semesters = page.leave_semesters
+
+        # 3. 변동 내역 리스트 (열이 6개인 행만)
+        changelog.change_log_list = [
+            ChangeLogEntry(
+                year=cols[0],
+                semester=cols[1],
+                change_type=cols[2],
+                change_date=cols[3],
+                expiry_date=cols[4],
+                reason=cols[5],
+            )
+            for cols in page.rows if len(cols) == 6
+        ]
+
+        if self._wants('fields') and not changelog.academic_status.student_id:
             raise ParsingError("학적변동내역 정보를 찾을 수 없습니다 (학번 필드 누락).", field="student_id")
 
         if self._verbose:
             logger.info("✓ 학적변동내역 정보 파싱 완료")
-        return changelog
\ No newline at end of file
+        return changelog
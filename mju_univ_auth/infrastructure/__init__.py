@@ -1,11 +1,56 @@
 """인프라스트럭처 모듈 - 파서, 암호화 등"""
 
-from .parser import HTMLParser
-from .crypto import generate_session_key, encrypt_with_rsa, encrypt_with_aes
+from .parser import (
+    HTMLParser,
+    ParserBackend,
+    get_parser_backend,
+    parser_backend_names,
+    register_parser_backend,
+    use_parser_backend,
+)
+from .lxml_html import LxmlBackend  # 'lxml' 파서 백엔드 등록
+from .parse_cache import ParseCache, ParseCacheMetrics, use_parse_cache
+from .parse_pool import ParsePool, ParsePoolMetrics, use_parse_pool
+from .crypto import (
+    generate_session_key,
+    encrypt_with_rsa,
+    encrypt_with_aes,
+    encrypt_passwords,
+    EncryptedPassword,
+    rsa_key_cache_info,
+    clear_rsa_key_cache,
+    SessionKeyPool,
+    SessionKeyPoolMetrics,
+    use_session_key_pool,
+)
+from .transport import SharedHTTPAdapter, configure_transport, create_session, get_shared_adapter
 
 __all__ = [
     'HTMLParser',
+    'ParserBackend',
+    'LxmlBackend',
+    'get_parser_backend',
+    'parser_backend_names',
+    'register_parser_backend',
+    'use_parser_backend',
+    'ParseCache',
+    'ParseCacheMetrics',
+    'use_parse_cache',
+    'ParsePool',
+    'ParsePoolMetrics',
+    'use_parse_pool',
     'generate_session_key',
     'encrypt_with_rsa',
     'encrypt_with_aes',
+    'encrypt_passwords',
+    'EncryptedPassword',
+    'rsa_key_cache_info',
+    'clear_rsa_key_cache',
+    'SessionKeyPool',
+    'SessionKeyPoolMetrics',
+    'use_session_key_pool',
+    'SharedHTTPAdapter',
+    'configure_transport',
+    'create_session',
+    'get_shared_adapter',
 ]
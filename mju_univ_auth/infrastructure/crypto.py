@@ -7,11 +7,31 @@ JavaScript 원본 (bandiJS):
 - genKey(length): 세션키 생성 + PBKDF2로 AES 키 파생
 - encryptJavaPKI(data): RSA로 암호화
 - encryptBase64AES(data, keyInfo): AES로 암호화
+
+대량 암호화:
+    encrypt_passwords(passwords, public_key)로 여러 비밀번호의 pw_enc/encsymka를 한 번에 만들 수 있습니다.
+    (processes=N이면 프로세스 풀로 분산)
+
+세션키 풀 (선택):
+    로그인이 많은 환경에서는 세션키 생성(PBKDF2)을 백그라운드 스레드가 미리 해 두도록 할 수 있습니다.
+    설치된 풀이 있으면 로그인은 준비된 세션키를 하나 꺼내 쓰고, 비어 있으면 평소처럼 직접 생성합니다.
+
+    pool = SessionKeyPool(size=128)
+    pool.start()
+    use_session_key_pool(pool)     # 프로세스 전역 설치 (해제: use_session_key_pool(None))
+    print(pool.metrics().exhausted)
 """
 
 import base64
+import multiprocessing
 import os
-from typing import Dict
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding
@@ -54,6 +74,31 @@ def generate_session_key(length: int = 32) -> Dict[str, any]:
     }
 
 
+# 로드한 RSA 공개키 객체 캐시 크기. SSO 공개키는 거의 바뀌지 않으므로 키 교체 중에 겹치는 몇 개면 충분합니다.
+RSA_KEY_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=RSA_KEY_CACHE_SIZE)
+def _load_public_key(public_key_str: str):
+    """Base64 공개키 문자열 -> RSA 공개키 객체 (PEM/ASN.1 디코딩은 키마다 한 번만)"""
+    # PEM 형식으로 변환
+    pem_key = f"-----BEGIN PUBLIC KEY-----\n{public_key_str}\n-----END PUBLIC KEY-----"
+    return serialization.load_pem_public_key(
+        pem_key.encode('utf-8'),
+        backend=default_backend()
+    )
+
+
+def rsa_key_cache_info():
+    """RSA 공개키 캐시 통계 (hits, misses, maxsize, currsize)"""
+    return _load_public_key.cache_info()
+
+
+def clear_rsa_key_cache() -> None:
+    """RSA 공개키 캐시와 통계를 비웁니다."""
+    _load_public_key.cache_clear()
+
+
 def encrypt_with_rsa(data: str, public_key_str: str) -> str:
     """
     RSA-PKCS1-v1.5로 데이터 암호화 (JavaScript bandiJS.encryptJavaPKI 대응)
@@ -65,14 +110,8 @@ def encrypt_with_rsa(data: str, public_key_str: str) -> str:
     Returns:
         Base64로 인코딩된 암호문
     """
-    # PEM 형식으로 변환
-    pem_key = f"-----BEGIN PUBLIC KEY-----\n{public_key_str}\n-----END PUBLIC KEY-----"
-    
-    # RSA 키 로드
-    rsa_key = serialization.load_pem_public_key(
-        pem_key.encode('utf-8'),
-        backend=default_backend()
-    )
+    # RSA 키 로드 (캐시)
+    rsa_key = _load_public_key(public_key_str)
     
     # PKCS1_v1_5 암호화 (Java 호환)
     encrypted = rsa_key.encrypt(
@@ -115,3 +154,254 @@ def encrypt_with_aes(plain_text: str, key_info: Dict[str, any]) -> str:
     encrypted = encryptor.update(padded) + encryptor.finalize()
     
     return base64.b64encode(encrypted).decode('utf-8')
+
+
+@dataclass(frozen=True)
+class EncryptedPassword:
+    """로그인 POST에 들어가는 암호화 필드 쌍"""
+    pw_enc: str      # AES 암호화된 비밀번호
+    encsymka: str    # RSA 암호화된 "keyStr,타임스탬프"
+
+
+def encrypt_passwords(
+    passwords: Sequence[str],
+    public_key_str: str,
+    key_infos: Optional[Sequence[Dict[str, any]]] = None,
+    timestamps: Optional[Sequence[str]] = None,
+    processes: int = 0,
+    chunk_size: int = 256,
+) -> List[EncryptedPassword]:
+    """
+    여러 비밀번호를 한 번에 암호화 (대량 로그인용)
+
+    공개키 로드, RSA 패딩 객체, AES 알고리즘/백엔드 준비를 청크당 한 번만 하며, 결과는 입력 순서와 같습니다.
+    같은 세션키(key_infos)를 주면 pw_enc는 encrypt_with_aes()와 바이트 단위로 같습니다.
+    encsymka는 RSA-PKCS1-v1.5 패딩이 무작위라 호출마다 달라지지만, 복호화하면 encrypt_with_rsa()와 같은 평문입니다.
+
+    Args:
+        passwords: 암호화할 비밀번호 목록
+        public_key_str: 로그인 페이지의 RSA 공개키 (Base64)
+        key_infos: 비밀번호별 세션키 (없으면 비밀번호마다 새로 생성, 세션키 생성이 대부분의 CPU 시간)
+        timestamps: 비밀번호별 encsymka 타임스탬프 (없으면 비밀번호마다 암호화하는 시점의 ms 타임스탬프)
+        processes: 0이면 현재 스레드에서, 1 이상이면 그 수만큼의 프로세스로 청크를 나눠 처리
+        chunk_size: 프로세스 하나에 한 번에 넘길 비밀번호 수
+
+    Returns:
+        List[EncryptedPassword]: 비밀번호별 (pw_enc, encsymka)
+
+    Raises:
+        ValueError: key_infos/timestamps의 길이가 passwords와 다를 때
+    """
+    if key_infos is not None and len(key_infos) != len(passwords):
+        raise ValueError("key_infos는 passwords와 길이가 같아야 합니다.")
+    if timestamps is not None and len(timestamps) != len(passwords):
+        raise ValueError("timestamps는 passwords와 길이가 같아야 합니다.")
+
+    missing = [None] * len(passwords)
+    items = list(zip(passwords, key_infos if key_infos is not None else missing,
+                     timestamps if timestamps is not None else missing))
+    if processes < 1 or len(items) <= chunk_size:
+        return _encrypt_chunk(public_key_str, items)
+
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    # 로그인/풀 스레드가 도는 프로세스에서 fork하면 자식이 교착될 수 있으므로 spawn을 사용합니다.
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn')) as pool:
+        results = pool.map(_encrypt_chunk, [public_key_str] * len(chunks), chunks)
+        return [encrypted for chunk in results for encrypted in chunk]
+
+
+def _encrypt_chunk(
+    public_key_str: str,
+    items: Sequence[Tuple[str, Optional[Dict[str, any]], Optional[str]]],
+) -> List[EncryptedPassword]:
+    """
+    encrypt_passwords()의 작업 단위 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+
+    encrypt_with_rsa()/encrypt_with_aes()와 같은 계산을 하되, 공개키/패딩/AES 알고리즘/백엔드는 청크에서 한 번만 준비합니다.
+    (Cipher 객체는 키/IV에 묶이므로 세션키마다 만들어야 함)
+    """
+    rsa_key = _load_public_key(public_key_str)
+    pkcs1 = padding.PKCS1v15()
+    aes, cbc, backend = algorithms.AES, modes.CBC, default_backend()
+    b64encode = base64.b64encode
+
+    results = []
+    for plain_text, key_info, timestamp in items:
+        key_info = key_info or take_pooled_session_key(32) or generate_session_key(32)
+        timestamp = timestamp or str(int(time.time() * 1000))
+
+        # encrypt_with_aes()와 같음: Base64 평문 + PKCS7 패딩 + AES-CBC
+        input_data = b64encode(plain_text.encode('utf-8'))
+        padding_len = 16 - (len(input_data) % 16)
+        encryptor = Cipher(aes(key_info['key']), cbc(key_info['iv']), backend=backend).encryptor()
+        pw_enc = encryptor.update(input_data + bytes([padding_len] * padding_len)) + encryptor.finalize()
+
+        encsymka = rsa_key.encrypt(f"{key_info['keyStr']},{timestamp}".encode('utf-8'), pkcs1)
+        results.append(EncryptedPassword(
+            pw_enc=b64encode(pw_enc).decode('utf-8'),
+            encsymka=b64encode(encsymka).decode('utf-8'),
+        ))
+    return results
+
+
+@dataclass
+class SessionKeyPoolMetrics:
+    """SessionKeyPool 지표 (metrics() 호출 시점의 스냅샷)"""
+    size: int = 0            # 목표 크기
+    ready: int = 0           # 현재 준비된 세션키 수
+    produced: int = 0        # 미리 생성한 세션키 수
+    taken: int = 0           # 풀에서 꺼내 쓴 세션키 수
+    exhausted: int = 0       # 풀이 비어 있어 직접 생성하게 된 횟수
+    min_ready: int = 0       # start() 이후 꺼내 쓴 직후 남은 세션키 수의 최솟값 (0이 자주 보이면 size를 늘리세요)
+
+    @property
+    def hit_rate(self) -> float:
+        requests_total = self.taken + self.exhausted
+        return self.taken / requests_total if requests_total else 0.0
+
+
+class SessionKeyPool:
+    """
+    미리 생성한 일회용 세션키 풀 (스레드 안전)
+
+    - 세션키는 꺼내는 순간 풀에서 제거되며, 같은 세션키가 두 번 나가지 않습니다.
+    - 백그라운드 스레드가 준비된 세션키를 size개로 유지합니다.
+    - `resize()`로 실행 중에 크기를 조정할 수 있습니다. (`metrics()`의 exhausted/min_ready 참고)
+    """
+
+    def __init__(self, size: int = 64, key_length: int = 32):
+        """
+        Args:
+            size: 준비해 둘 세션키 수
+            key_length: 파생할 AES 키 길이 (바이트, 로그인은 32 사용)
+        """
+        if size < 1:
+            raise ValueError("size는 1 이상이어야 합니다.")
+
+        self._size = size
+        self._key_length = key_length
+        self._cond = threading.Condition()
+        self._ready: Deque[Dict[str, any]] = deque()
+        self._metrics = SessionKeyPoolMetrics(size=size, min_ready=size)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __enter__(self) -> 'SessionKeyPool':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def key_length(self) -> int:
+        return self._key_length
+
+    def start(self) -> None:
+        """백그라운드 스레드로 풀을 채우기 시작합니다."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("닫힌 SessionKeyPool입니다.")
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='mju-session-key-pool', daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 준비된 세션키를 버립니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._cond:
+            self._ready.clear()
+
+    def resize(self, size: int) -> None:
+        """목표 크기를 바꿉니다. (줄이면 남는 세션키는 버립니다)"""
+        if size < 1:
+            raise ValueError("size는 1 이상이어야 합니다.")
+        with self._cond:
+            self._size = self._metrics.size = size
+            while len(self._ready) > size:
+                self._ready.popleft()
+            self._cond.notify_all()
+
+    def take(self) -> Optional[Dict[str, any]]:
+        """
+        준비된 세션키를 하나 꺼냅니다. 비어 있으면 None (호출자가 직접 생성)
+
+        Returns:
+            Optional[dict]: { 'keyStr': str, 'key': bytes, 'iv': bytes } (한 번만 사용)
+        """
+        with self._cond:
+            if not self._ready:
+                self._metrics.exhausted += 1
+                self._metrics.min_ready = 0
+                self._cond.notify_all()
+                return None
+            key_info = self._ready.popleft()
+            self._metrics.taken += 1
+            self._metrics.min_ready = min(self._metrics.min_ready, len(self._ready))
+            self._cond.notify_all()  # 빈자리 채우기
+            return key_info
+
+    def fill(self) -> None:
+        """풀을 size개까지 지금 바로 채웁니다. (백그라운드 스레드 없이 워밍업할 때 사용)"""
+        while self._produce_one():
+            pass
+
+    def metrics(self) -> SessionKeyPoolMetrics:
+        """현재 지표의 스냅샷을 반환합니다."""
+        with self._cond:
+            snapshot = SessionKeyPoolMetrics(**vars(self._metrics))
+            snapshot.ready = len(self._ready)
+            return snapshot
+
+    # ------------------------------------------------------------------ 내부 구현
+    def _produce_one(self) -> bool:
+        """세션키를 하나 만들어 넣음 (가득 찼거나 닫혔으면 False)"""
+        with self._cond:
+            if self._closed or len(self._ready) >= self._size:
+                return False
+        key_info = generate_session_key(self._key_length)  # 락 밖에서 생성
+        with self._cond:
+            if self._closed or len(self._ready) >= self._size:
+                return False
+            self._ready.append(key_info)
+            self._metrics.produced += 1
+        return True
+
+    def _run(self) -> None:
+        """백그라운드 스레드: 꺼내 간 만큼 다시 채움"""
+        while True:
+            with self._cond:
+                while not self._closed and len(self._ready) >= self._size:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            self._produce_one()
+
+
+_session_key_pool: Optional[SessionKeyPool] = None
+
+
+def use_session_key_pool(pool: Optional[SessionKeyPool]) -> Optional[SessionKeyPool]:
+    """
+    로그인에 사용할 세션키 풀을 프로세스 전역으로 설치합니다. (None이면 해제)
+
+    Returns:
+        Optional[SessionKeyPool]: 이전에 설치되어 있던 풀
+    """
+    global _session_key_pool
+    previous, _session_key_pool = _session_key_pool, pool
+    return previous
+
+
+def take_pooled_session_key(length: int = 32) -> Optional[Dict[str, any]]:
+    """설치된 풀에서 세션키를 하나 꺼냅니다. 풀이 없거나, 비었거나, 키 길이가 다르면 None"""
+    pool = _session_key_pool
+    if pool is None or pool.key_length != length:
+        return None
+    return pool.take()
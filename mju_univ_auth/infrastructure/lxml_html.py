@@ -0,0 +1,264 @@
+"""
+lxml 파서 백엔드
+===============
+MSI 페이지를 BeautifulSoup 트리 없이 lxml 트리와 미리 컴파일된 XPath로 파싱하는 파서 백엔드(`LxmlBackend`,
+이름 'lxml')와 도우미 함수들입니다.
+
+BeautifulSoup(lxml 빌더)과 같은 libxml2 파서로 트리를 만들고, `text_of()`는 `tag.get_text(strip=True)`와 같은 문자열을
+만듭니다. raw_html_data는 같은 lxml 트리의 요소를 `markup_of()`(`etree.tostring(method='html')`)로 직렬화합니다.
+BeautifulSoup `str(tag)`에 맞춰 정리하므로 bs4 백엔드와 같은 요소/속성/텍스트이며, 빈 요소(`<br>`)와 값 없는 속성의
+표기만 다릅니다.
+
+사용법:
+    root = parse_html(body, encoding)
+    items = _ITEMS(root)                 # etree.XPath(f"//div[{has_class('flex-table-item')}]")
+    title = text_of(first(_TITLE(items[0])))
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from ..exceptions import ParsingError
+from .parser import (
+    DEFAULT_ENCODING,
+    PAGES,
+    Html,
+    PageParts,
+    ParserBackend,
+    StudentBasicInfoPage,
+    StudentCardPage,
+    StudentChangeLogPage,
+    declared_encoding,
+    register_parser_backend,
+    wants,
+)
+
+
+def has_class(name: str) -> str:
+    """BeautifulSoup `class_=name`과 같은 XPath 조건 (공백 포함 시 class 전체, 아니면 class 토큰 하나)"""
+    if ' ' in name:
+        return f"normalize-space(@class)='{name}'"
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# get_text()가 건너뛰는 요소 (BeautifulSoup의 Script/Stylesheet/TemplateString)
+TEXT = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+# BeautifulSoup이 공백 하나/줄바꿈 하나로 줄이는 공백뿐인 텍스트 (pre/textarea 밖)
+_BLANK_TEXT = etree.XPath(".//text()[normalize-space()='' and not(ancestor::pre or ancestor::textarea)]")
+
+_parsers = threading.local()   # lxml 파서는 스레드 간 공유하지 않음
+
+
+def _parser(encoding: str) -> Optional[etree.HTMLParser]:
+    """인코딩별 파서 (libxml2가 모르는 인코딩 이름이면 None)"""
+    cache: Dict[str, Optional[etree.HTMLParser]] = getattr(_parsers, 'by_encoding', None)
+    if cache is None:
+        cache = _parsers.by_encoding = {}
+    if encoding not in cache:
+        parser = None
+        # 파이썬 코덱 이름(euc_kr)과 iconv 이름(euc-kr) 순으로 시도
+        for name in dict.fromkeys((encoding, encoding.replace('_', '-'))):
+            try:
+                parser = etree.HTMLParser(encoding=name)
+                break
+            except LookupError:
+                continue
+        cache[encoding] = parser
+    return cache[encoding]
+
+
+def parse_html(html: Html, encoding: Optional[str] = None) -> etree._Element:
+    """HTML(bytes면 주어진/선언된 인코딩으로 libxml2가 직접 디코딩)을 lxml 트리로 파싱. 빈 문서면 빈 <html>"""
+    if isinstance(html, bytes):
+        encoding = encoding or declared_encoding(None, html)
+        parser = _parser(encoding)
+        if parser is None:  # libxml2가 모르는 인코딩은 파이썬에서 디코딩
+            html = html.decode(encoding, errors='replace')
+    if isinstance(html, str):
+        html, parser = html.encode(DEFAULT_ENCODING), _parser(DEFAULT_ENCODING)
+    root = etree.fromstring(html, parser) if html.strip() else None
+    return root if root is not None else etree.Element('html')
+
+
+def first(nodes: List[etree._Element]) -> Optional[etree._Element]:
+    """XPath 결과의 첫 요소 (없으면 None)"""
+    return nodes[0] if nodes else None
+
+
+def text_of(node: etree._Element) -> str:
+    """BeautifulSoup `tag.get_text(strip=True)`와 같은 값 (주석, script/style/template 제외)"""
+    return ''.join(text.strip() for text in TEXT(node))
+
+
+def markup_of(node: etree._Element) -> str:
+    """
+    요소의 HTML 문자열 (raw_html_data용, `etree.tostring(method='html')`)
+
+    BeautifulSoup `str(tag)`처럼 속성을 이름순으로 두고 class 값의 공백을 정리하며, 공백뿐인 텍스트는 줄바꿈이 있으면
+    줄바꿈 하나, 없으면 공백 하나로 줄입니다. (pre/textarea 안은 그대로) 빈 요소(`<br>`)와 값 없는 속성은 HTML 표기를 따르므로 문자열이 bs4 백엔드와 똑같지는
+    않지만 같은 요소/속성/텍스트입니다. 요소의 트리를 고치므로 다른 값을 모두 읽은 뒤에 부릅니다.
+    """
+    for text in _BLANK_TEXT(node):
+        blank = '\n' if '\n' in text else ' '
+        if text != blank:
+            owner = text.getparent()
+            if text.is_tail:
+                owner.tail = blank
+            else:
+                owner.text = blank
+    for element in node.iter(etree.Element):
+        css_class = element.get('class')
+        if css_class is not None:
+            element.set('class', ' '.join(css_class.split()))
+        if len(element.attrib) > 1:
+            attributes = sorted(element.attrib.items())
+            element.attrib.clear()
+            element.attrib.update(attributes)
+    return etree.tostring(node, encoding='unicode', method='html', with_tail=False)
+
+
+# ------------------------------------------------------------------ 파서 백엔드
+# SoupBackend의 find/select_one과 같은 요소를 선택하는 XPath
+_PUBLIC_KEY_INPUT = etree.XPath("//input[@id='public-key']")
+_CSRF_INPUT = etree.XPath("//input[@id='c_r_t']")
+_SIGNIN_FORM = etree.XPath("//form[@id='signin-form']")
+_FIRST_FORM = etree.XPath("//form")
+_INPUTS = etree.XPath(".//input")
+
+_CARD_ITEMS = etree.XPath(f"//div[{has_class('card-item basic')}]")
+_PHOTO = etree.XPath("//*[@id='pictureInclude']//img")
+_PROFILE_TABLE = etree.XPath(f"//*[@id='pictureInclude']//*[{has_class('flex-table')}]")
+_CONTACT_TABLE = etree.XPath(f"//*[{has_class('flex-table')}][preceding-sibling::*[1][self::hr]]")
+_TABLE_ITEMS = etree.XPath(f".//div[{has_class('flex-table-item')}]")
+_ITEM_TITLE = etree.XPath(f".//div[{has_class('item-title')}]")
+_ITEM_DATA = etree.XPath(f".//div[{has_class('item-data')}]")
+_NAMED_INPUTS = etree.XPath(".//input[@name]")
+
+_STATUS_TABLE = etree.XPath(
+    f"//*[{has_class('card-item')} and {has_class('basic')}]//*[{has_class('flex-table')}]"
+)
+_LEAVE_SPAN = etree.XPath(f"//*[{has_class('data-title')} and {has_class('small')}]//span")
+_LOG_TABLE = etree.XPath(f"//*[{has_class('read-table')}]//table")
+_TBODY = etree.XPath(".//tbody")
+_ROWS = etree.XPath(".//tr")
+_CELLS = etree.XPath(".//td")
+
+_INFO_CARD = etree.XPath(f"//div[{has_class('main-user-info')}]")
+_INFO_CELLS = etree.XPath(f".//div[{has_class('info-cell')}]")
+_CELL_TITLE = etree.XPath(f".//div[{has_class('title')}]")
+_CELL_VALUE = etree.XPath(f".//div[{has_class('value')}]")
+
+
+class LxmlBackend(ParserBackend):
+    """lxml 트리와 미리 컴파일된 XPath 사용 (raw_html_data도 lxml 트리에서 직렬화, `markup_of()`)"""
+
+    name = 'lxml'
+    pages = PAGES
+
+    def login_page_data(self, html: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        root = parse_html(html)
+        public_key_input = first(_PUBLIC_KEY_INPUT(root))
+        csrf_input = first(_CSRF_INPUT(root))
+        form = first(_SIGNIN_FORM(root))
+        return (
+            public_key_input.get('value') if public_key_input is not None else None,
+            csrf_input.get('value') if csrf_input is not None else None,
+            form.get('action') if form is not None else None,
+        )
+
+    def form_inputs(self, html: str) -> Dict[str, str]:
+        form_data = {}
+        form = first(_FIRST_FORM(parse_html(html)))
+        if form is not None:
+            for input_tag in _INPUTS(form):
+                name = input_tag.get('name')
+                if name:
+                    form_data[name] = input_tag.get('value', '')
+        return form_data
+
+    def student_card(self, html: Html, encoding: Optional[str] = None, parts: PageParts = None) -> StudentCardPage:
+        root = parse_html(html, encoding)
+        img_tag = first(_PHOTO(root)) if wants(parts, 'photo_src') else None
+
+        fields = {}
+        if wants(parts, 'fields'):
+            profile_table = first(_PROFILE_TABLE(root))
+            if profile_table is None:
+                raise ParsingError("학생 프로필 테이블을 찾을 수 없습니다.")
+            fields = self._flex_table_fields(profile_table)
+
+        inputs = {}
+        if wants(parts, 'inputs'):
+            contact_table = first(_CONTACT_TABLE(root))
+            if contact_table is None:
+                raise ParsingError("개인 연락처 테이블을 찾을 수 없습니다.")
+
+            for input_tag in _NAMED_INPUTS(contact_table):
+                inputs.setdefault(input_tag.get('name'), input_tag.get('value', ''))
+
+        card_item = first(_CARD_ITEMS(root)) if wants(parts, 'raw_html_data') else None
+        return StudentCardPage(
+            raw_html_data=markup_of(card_item) if card_item is not None else '',
+            photo_src=img_tag.get('src', '') if img_tag is not None else '',
+            fields=fields,
+            inputs=inputs,
+        )
+
+    def student_changelog(
+        self, html: Html, encoding: Optional[str] = None, parts: PageParts = None
+    ) -> StudentChangeLogPage:
+        root = parse_html(html, encoding)
+
+        fields = {}
+        if wants(parts, 'fields'):
+            status_table = first(_STATUS_TABLE(root))
+            if status_table is None:
+                raise ParsingError("학적 기본 정보 테이블을 찾을 수 없습니다.")
+            fields = self._flex_table_fields(status_table)
+
+        leave_span = first(_LEAVE_SPAN(root)) if wants(parts, 'leave_semesters') else None
+
+        rows = []
+        log_table = first(_LOG_TABLE(root)) if wants(parts, 'rows') else None
+        tbody = first(_TBODY(log_table)) if log_table is not None else None
+        if tbody is not None:
+            for row in _ROWS(tbody):
+                rows.append([text_of(col) for col in _CELLS(row)])
+
+        card_items = _CARD_ITEMS(root) if wants(parts, 'raw_html_data') else []
+        return StudentChangeLogPage(
+            raw_html_data="\n".join(map(markup_of, card_items)),
+            fields=fields,
+            leave_semesters=text_of(leave_span) if leave_span is not None else None,
+            rows=rows,
+        )
+
+    def student_basicinfo(
+        self, html: Html, encoding: Optional[str] = None, parts: PageParts = None
+    ) -> StudentBasicInfoPage:
+        root = parse_html(html, encoding)
+        info_card = first(_INFO_CARD(root))
+        if info_card is None:
+            raise ParsingError("기본 정보 카드('main-user-info')를 찾을 수 없습니다.")
+
+        fields = {}
+        if wants(parts, 'fields'):
+            for cell in _INFO_CELLS(info_card):
+                title = text_of(_CELL_TITLE(cell)[0]).replace(':', '').strip()
+                fields[title] = text_of(_CELL_VALUE(cell)[0])
+        return StudentBasicInfoPage(
+            raw_html_data=markup_of(info_card) if wants(parts, 'raw_html_data') else '',
+            fields=fields,
+        )
+
+    @staticmethod
+    def _flex_table_fields(table: etree._Element) -> Dict[str, str]:
+        fields = {}
+        for item in _TABLE_ITEMS(table):
+            fields[text_of(_ITEM_TITLE(item)[0])] = text_of(_ITEM_DATA(item)[0])
+        return fields
+
+
+register_parser_backend(LxmlBackend())
@@ -0,0 +1,180 @@
+"""
+파싱 결과 메모 캐시
+==================
+바이트 단위로 같은 본문을 다시 파싱하지 않도록 본문 해시 -> 파싱 결과를 기억하는 선택 기능입니다.
+
+- 키는 (파싱 종류, 변형, 본문의 BLAKE2b 128비트 해시)입니다. 변형에는 결과를 바꾸는 값(파서 백엔드 이름,
+  본문 인코딩 ...)을 넣습니다. 본문 자체는 키로 보관하지 않습니다.
+- 항목 수(max_entries)와 결과 크기 합(max_bytes)을 넘으면 가장 오래 쓰지 않은 항목부터 버립니다. (LRU)
+- 파싱 중 예외가 나면 기억하지 않습니다.
+- 캐시된 결과는 여러 호출이 함께 쓰므로 호출자가 수정하면 안 됩니다. (HTMLParser/Fetcher는 읽기만 함)
+
+본문마다 달라지는 값(CSRF 토큰, 세션 토큰 ...)이 들어 있는 페이지는 같은 구조라도 해시가 달라 적중하지 않습니다.
+`metrics()`의 종류별 적중률로 효과를 확인한 뒤 켜세요.
+
+사용법:
+    from mju_univ_auth import ParseCache, use_parse_cache
+
+    use_parse_cache(ParseCache(max_entries=512, max_bytes=64 * 1024 * 1024))
+    ...
+    print(cache.metrics().hit_rate)
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class ParseCacheMetrics:
+    """ParseCache 지표 (metrics() 호출 시점의 스냅샷)"""
+    max_entries: int = 0
+    max_bytes: int = 0
+    entries: int = 0         # 현재 항목 수
+    bytes: int = 0           # 현재 결과 크기 합 (추정치)
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0       # 한도를 넘어 버린 항목 수
+    oversized: int = 0       # 결과 하나가 max_bytes보다 커서 기억하지 않은 횟수
+    hits_by_kind: Dict[str, int] = field(default_factory=dict)
+    misses_by_kind: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def hit_rate_of(self, kind: str) -> float:
+        """파싱 종류별 적중률"""
+        hits, misses = self.hits_by_kind.get(kind, 0), self.misses_by_kind.get(kind, 0)
+        return hits / (hits + misses) if hits + misses else 0.0
+
+
+def _digest(html) -> bytes:
+    if isinstance(html, str):
+        html = html.encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(html, digest_size=16).digest()
+
+
+def _approx_size(value: Any) -> int:
+    """파싱 결과가 차지하는 메모리 추정치 (문자열/컨테이너/데이터클래스/일반 객체 속성을 따라감)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(_approx_size(key) + _approx_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_approx_size(item) for item in value)
+    if is_dataclass(value):
+        return size + sum(_approx_size(getattr(value, f.name)) for f in fields(value))
+    attributes = getattr(value, '__dict__', None)
+    if attributes is not None:
+        return size + _approx_size(attributes)
+    return size
+
+
+class ParseCache:
+    """
+    본문 해시 -> 파싱 결과 LRU 캐시 (스레드 안전)
+
+    같은 키를 동시에 처음 파싱하면 각자 파싱하고 마지막 결과를 기억합니다. (결과는 같음)
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Args:
+            max_entries: 기억할 최대 항목 수
+            max_bytes: 기억할 결과 크기 합의 상한 (추정치, 바이트)
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries와 max_bytes는 1 이상이어야 합니다.")
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple, Tuple[Any, int]]' = OrderedDict()
+        self._metrics = ParseCacheMetrics(max_entries=max_entries, max_bytes=max_bytes)
+
+    def get_or_parse(self, kind: str, html, parse: Callable[[], T], *variant) -> T:
+        """
+        기억한 결과가 있으면 돌려주고, 없으면 parse()를 호출해 결과를 기억합니다.
+
+        Args:
+            kind: 파싱 종류 (지표를 나누는 이름, 예: 'student_card')
+            html: 파싱할 본문 (str 또는 bytes)
+            parse: 실제 파싱 함수
+            *variant: 같은 본문이라도 결과를 바꾸는 값 (백엔드 이름, 인코딩 ...)
+        """
+        key = (kind, variant, _digest(html))
+        metrics = self._metrics
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                metrics.hits += 1
+                metrics.hits_by_kind[kind] = metrics.hits_by_kind.get(kind, 0) + 1
+                return entry[0]
+            metrics.misses += 1
+            metrics.misses_by_kind[kind] = metrics.misses_by_kind.get(kind, 0) + 1
+
+        value = parse()  # 락 밖에서 파싱
+        size = _approx_size(value)
+        with self._lock:
+            if size > metrics.max_bytes:
+                metrics.oversized += 1
+                return value
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                metrics.bytes -= previous[1]
+            self._entries[key] = (value, size)
+            metrics.bytes += size
+            while len(self._entries) > metrics.max_entries or metrics.bytes > metrics.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                metrics.bytes -= evicted_size
+                metrics.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """기억한 결과를 모두 버립니다. (지표는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._metrics.bytes = 0
+
+    def metrics(self) -> ParseCacheMetrics:
+        """현재 지표의 스냅샷을 반환합니다."""
+        with self._lock:
+            snapshot = ParseCacheMetrics(**vars(self._metrics))
+            snapshot.hits_by_kind = dict(snapshot.hits_by_kind)
+            snapshot.misses_by_kind = dict(snapshot.misses_by_kind)
+            snapshot.entries = len(self._entries)
+            return snapshot
+
+
+_parse_cache: Optional[ParseCache] = None
+
+
+def use_parse_cache(cache: Optional[ParseCache]) -> Optional[ParseCache]:
+    """
+    HTMLParser와 Fetcher 파싱에 사용할 메모 캐시를 프로세스 전역으로 설치합니다. (None이면 해제)
+
+    Returns:
+        Optional[ParseCache]: 이전에 설치되어 있던 캐시
+    """
+    global _parse_cache
+    previous, _parse_cache = _parse_cache, cache
+    return previous
+
+
+def cached_parse(kind: str, html, parse: Callable[[], T], *variant, uncached: Optional[Callable[[], T]] = None) -> T:
+    """
+    설치된 캐시가 있으면 `ParseCache.get_or_parse()`, 없으면 parse()를 그대로 호출
+
+    uncached를 주면 캐시가 없을 때 parse() 대신 호출합니다. (기억하지 않을 때는 필요한 값만 계산하는 결과 등)
+    """
+    cache = _parse_cache
+    if cache is None:
+        return (uncached or parse)()
+    return cache.get_or_parse(kind, html, parse, *variant)
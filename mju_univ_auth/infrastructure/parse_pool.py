@@ -0,0 +1,239 @@
+"""
+파싱 프로세스 풀
+===============
+Fetcher의 MSI 페이지 파싱(트리 생성과 값 추출)을 워커 프로세스에서 실행하는 선택 기능입니다.
+
+스레드가 많은 서버에서는 요청 스레드의 파싱이 GIL을 잡고 있어 다른 요청 처리와 경쟁합니다.
+풀을 설치하면(`use_parse_pool()`) Fetcher는 응답 본문을 워커에 넘기고 페이지 데이터(StudentCardPage ...)를 돌려받아
+요청 스레드에서 모델만 조립합니다. 결과를 기다리는 동안 요청 스레드는 GIL을 놓습니다.
+
+- 워커에 넘겼지만 끝나지 않은 파싱이 `workers + max_queue`개면(포화) 워커를 기다리지 않고 요청 스레드에서 바로 파싱합니다.
+- 풀이 닫혔거나 워커 프로세스가 죽어 풀이 깨졌을 때도 요청 스레드에서 파싱합니다.
+- 워커에는 임포트할 때 등록되는 백엔드(`OFFLOADED_BACKENDS`)만 있으므로, 그 밖의 백엔드는 항상 요청 스레드에서 파싱합니다.
+- 파싱 중 난 예외(ParsingError 등)는 요청 스레드에서 다시 발생합니다.
+
+본문과 결과를 프로세스 사이에 복사(pickle)하는 비용이 있으므로, 효과는 `metrics()`의 utilization과 요청 지연으로 확인하세요.
+
+사용법:
+    from mju_univ_auth import ParsePool, use_parse_pool
+
+    pool = ParsePool(workers=4, max_queue=8)
+    pool.start()
+    use_parse_pool(pool)
+    ...
+    print(pool.metrics().queue_depth, pool.metrics().utilization)
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from .parser import Html, PageParts, get_parser_backend
+
+T = TypeVar('T')
+
+# 워커 프로세스에서도 패키지 임포트만으로 등록되는 파서 백엔드
+OFFLOADED_BACKENDS = frozenset({'lxml', 'bs4'})
+
+
+@dataclass
+class ParsePoolMetrics:
+    """ParsePool 지표 (metrics() 호출 시점의 스냅샷)"""
+    workers: int = 0
+    max_queue: int = 0
+    in_flight: int = 0           # 워커에 넘겼고 아직 끝나지 않은 파싱 수 (실행 중 + 대기)
+    queue_depth: int = 0         # 그중 빈 워커를 기다리는 수
+    max_queue_depth: int = 0     # start() 이후 queue_depth의 최댓값
+    offloaded: int = 0           # 워커에서 끝난 파싱 수 (예외로 끝난 것 포함)
+    failed: int = 0              # 그중 예외(ParsingError 등)로 끝난 수
+    fallbacks: int = 0           # 포화/풀 오류로 요청 스레드에서 파싱한 수
+    busy_seconds: float = 0.0    # 워커가 파싱에 쓴 시간의 합
+    uptime_seconds: float = 0.0  # start() 이후 경과 시간
+
+    @property
+    def utilization(self) -> float:
+        """워커 사용률 (파싱에 쓴 시간 / (워커 수 x 경과 시간))"""
+        capacity = self.workers * self.uptime_seconds
+        return min(self.busy_seconds / capacity, 1.0) if capacity else 0.0
+
+    @property
+    def offload_rate(self) -> float:
+        """워커에서 파싱한 비율"""
+        total = self.offloaded + self.fallbacks
+        return self.offloaded / total if total else 0.0
+
+
+def _parse_in_worker(
+    page: str, backend: str, html: Html, encoding: Optional[str], parts: PageParts
+) -> Tuple[Any, float]:
+    """ParsePool의 작업 단위 (프로세스 풀에서 실행되므로 모듈 최상위 함수). (페이지 데이터, 파싱에 걸린 시간)"""
+    started = time.perf_counter()
+    result = getattr(get_parser_backend(backend, page=page), page)(html, encoding, parts)
+    return result, time.perf_counter() - started
+
+
+def _warm_up(_: int) -> None:
+    """워커 프로세스의 패키지 임포트와 백엔드 등록을 미리 끝냄"""
+    get_parser_backend('lxml')
+
+
+class ParsePool:
+    """
+    MSI 페이지 파싱 프로세스 풀 (스레드 안전)
+
+    `start()` 전이나 `close()` 뒤에는 모든 파싱을 요청 스레드에서 합니다. (fallbacks에 세지 않음)
+    """
+
+    def __init__(self, workers: int = 2, max_queue: Optional[int] = None):
+        """
+        Args:
+            workers: 워커 프로세스 수
+            max_queue: 빈 워커를 기다리게 할 최대 파싱 수 (넘으면 요청 스레드에서 파싱, 없으면 workers와 같음)
+        """
+        max_queue = workers if max_queue is None else max_queue
+        if workers < 1 or max_queue < 0:
+            raise ValueError("workers는 1 이상, max_queue는 0 이상이어야 합니다.")
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._started_at: Optional[float] = None
+        self._closed = False
+        self._metrics = ParsePoolMetrics(workers=workers, max_queue=max_queue)
+
+    def __enter__(self) -> 'ParsePool':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """워커 프로세스를 띄우고 패키지 임포트가 끝날 때까지 기다립니다."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("닫힌 ParsePool입니다.")
+            if self._executor is not None:
+                return
+            workers = self._metrics.workers
+            # 요청/풀 스레드가 도는 프로세스에서 fork하면 자식이 교착될 수 있으므로 spawn을 사용합니다.
+            self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            executor = self._executor
+        list(executor.map(_warm_up, range(workers)))
+        with self._lock:
+            self._started_at = time.monotonic()
+
+    def close(self) -> None:
+        """워커 프로세스를 멈춥니다. (기다리는 파싱은 취소되고 요청 스레드에서 파싱)"""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def parse(
+        self,
+        page: str,
+        backend: str,
+        html: Html,
+        encoding: Optional[str],
+        parts: PageParts,
+        parse_locally: Callable[[], T],
+    ) -> T:
+        """
+        워커 프로세스에서 페이지를 파싱합니다. 포화/풀 오류면 parse_locally()로 요청 스레드에서 파싱합니다.
+
+        Args:
+            page: ParserBackend 페이지 종류 ('student_card' ...)
+            backend: 파서 백엔드 이름
+            html, encoding, parts: ParserBackend 페이지 메서드 인자
+            parse_locally: 같은 결과를 요청 스레드에서 만드는 함수
+        """
+        if backend not in OFFLOADED_BACKENDS:
+            return parse_locally()
+        executor = self._reserve()
+        if executor is None:
+            return parse_locally()
+
+        try:
+            future = executor.submit(_parse_in_worker, page, backend, html, encoding, parts)
+        except RuntimeError:  # 닫히는 중이거나 깨진 풀
+            self._release(fallback=True)
+            return parse_locally()
+        try:
+            result, elapsed = future.result()
+        except (BrokenProcessPool, CancelledError):  # 워커가 죽었거나 close()로 취소됨
+            self._release(fallback=True)
+            return parse_locally()
+        except BaseException:
+            self._release(failed=True)
+            raise
+        self._release(elapsed)
+        return result
+
+    def metrics(self) -> ParsePoolMetrics:
+        """현재 지표의 스냅샷을 반환합니다."""
+        with self._lock:
+            snapshot = ParsePoolMetrics(**vars(self._metrics))
+            snapshot.queue_depth = max(snapshot.in_flight - snapshot.workers, 0)
+            if self._started_at is not None:
+                snapshot.uptime_seconds = time.monotonic() - self._started_at
+            return snapshot
+
+    # ------------------------------------------------------------------ 내부 구현
+    def _reserve(self) -> Optional[ProcessPoolExecutor]:
+        """워커에 넘길 자리를 잡음 (시작 전/닫힘/포화면 None)"""
+        metrics = self._metrics
+        with self._lock:
+            if self._executor is None or self._started_at is None:
+                return None
+            if metrics.in_flight >= metrics.workers + metrics.max_queue:
+                metrics.fallbacks += 1
+                return None
+            metrics.in_flight += 1
+            metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.in_flight - metrics.workers)
+            return self._executor
+
+    def _release(self, elapsed: float = 0.0, failed: bool = False, fallback: bool = False) -> None:
+        metrics = self._metrics
+        with self._lock:
+            metrics.in_flight -= 1
+            metrics.busy_seconds += elapsed
+            if fallback:
+                metrics.fallbacks += 1
+            else:
+                metrics.offloaded += 1
+                metrics.failed += failed
+
+
+_parse_pool: Optional[ParsePool] = None
+
+
+def use_parse_pool(pool: Optional[ParsePool]) -> Optional[ParsePool]:
+    """
+    Fetcher 페이지 파싱에 사용할 프로세스 풀을 프로세스 전역으로 설치합니다. (None이면 해제)
+
+    Returns:
+        Optional[ParsePool]: 이전에 설치되어 있던 풀
+    """
+    global _parse_pool
+    previous, _parse_pool = _parse_pool, pool
+    return previous
+
+
+def pooled_parse(
+    page: str,
+    backend: str,
+    html: Html,
+    encoding: Optional[str],
+    parts: PageParts,
+    parse_locally: Callable[[], T],
+) -> T:
+    """설치된 풀이 있으면 `ParsePool.parse()`, 없으면 parse_locally()를 그대로 호출"""
+    pool = _parse_pool
+    if pool is None:
+        return parse_locally()
+    return pool.parse(page, backend, html, encoding, parts, parse_locally)
@@ -2,36 +2,414 @@
 HTML 파서 모듈
 =============
 HTML 파싱 로직을 통합하여 일관된 방식으로 데이터를 추출합니다.
+
+응답 본문 인코딩:
+    `response.text`는 Content-Type에 charset이 없으면 본문 전체로 인코딩을 추측(charset 감지)하므로
+    큰 MSI 페이지(사진 base64가 든 학생카드 등)에서 느립니다. 파싱 경로는 `response.content`(bytes)와
+    `declared_encoding()`(헤더 charset -> <meta charset> -> UTF-8)을 사용하며, BeautifulSoup에는
+    bytes를 그대로 넘겨 lxml이 직접 디코딩하게 합니다. (`make_soup`)
+
+스트리밍 읽기:
+    로그인 페이지(공개키, CSRF 토큰, 폼 action)와 세션 유효성 검사(로그인 폼/로그아웃 표시)는 문서 일부만
+    필요합니다. `PageScanner`에 본문 조각을 넣다가 값이 모두 나오면 나머지는 받지 않습니다.
+    (`transport.read_until`)
+
+파서 백엔드:
+    HTML에서 값을 꺼내는 방식(regex, bs4, lxml ...)은 `ParserBackend`로 등록해 이름으로 고릅니다.
+    `use_parser_backend()`는 프로세스 전역, Fetcher의 `parser_backend` 인자는 Fetcher별 선택입니다.
+    HTMLParser는 로그인 페이지/폼을 정규표현식으로 먼저 읽고, 실패하면 선택된 백엔드로 폴백합니다.
+
+파싱 결과 메모:
+    `use_parse_cache()`로 `ParseCache`를 설치하면 HTMLParser와 Fetcher의 파싱 결과를 본문 해시로 기억해
+    같은 본문은 다시 파싱하지 않습니다. (`parse_cache` 모듈)
 """
 
+import codecs
 import re
-from typing import Optional, Dict, Tuple
+from dataclasses import dataclass, fields as dataclass_fields
+from functools import cached_property
+from typing import Optional, Dict, FrozenSet, Iterator, List, Tuple, Union
 
 from bs4 import BeautifulSoup, SoupStrainer
 
+from ..exceptions import ParsingError
+from .parse_cache import cached_parse
+
+# 파서 입력: 디코딩된 문자열 또는 응답 본문 bytes
+Html = Union[str, bytes]
+
+DEFAULT_ENCODING = 'utf-8'   # 명지대 SSO/MSI 페이지 인코딩
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET = re.compile(rb'<meta[^>]{0,200}?charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_SCAN_BYTES = 2048     # <meta charset>을 찾을 본문 앞부분 크기
+
+
+def _known_codec(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def declared_encoding(content_type: Optional[str], body: bytes = b'') -> str:
+    """
+    응답 본문 인코딩 결정 (본문 전체를 훑는 인코딩 추측 없음)
+
+    Content-Type 헤더의 charset -> 본문 앞부분의 <meta charset> -> UTF-8 순서입니다.
+    """
+    if content_type:
+        match = _HEADER_CHARSET.search(content_type)
+        encoding = _known_codec(match.group(1)) if match else None
+        if encoding:
+            return encoding
+    match = _META_CHARSET.search(body, 0, _META_SCAN_BYTES)
+    return (_known_codec(match.group(1).decode('ascii')) if match else None) or DEFAULT_ENCODING
+
+
+def response_body(response) -> Tuple[bytes, str]:
+    """requests/httpx 응답의 (본문 bytes, 인코딩)"""
+    body = response.content
+    return body, declared_encoding(response.headers.get('Content-Type'), body)
+
+
+def decode_html(html: Html, encoding: Optional[str] = None) -> str:
+    """bytes면 주어진 인코딩(없으면 선언된 인코딩)으로 디코딩, 문자열이면 그대로"""
+    if isinstance(html, str):
+        return html
+    return html.decode(encoding or declared_encoding(None, html), errors='replace')
+
+
+def response_text(response) -> str:
+    """`response.text` 대신 사용: 선언된 인코딩으로만 디코딩"""
+    return decode_html(*response_body(response))
+
+
+def make_soup(html: Html, encoding: Optional[str] = None, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """BeautifulSoup(lxml) 생성. bytes는 문자열로 바꾸지 않고 lxml이 직접 디코딩합니다."""
+    if isinstance(html, bytes):
+        return BeautifulSoup(html, 'lxml', from_encoding=encoding or declared_encoding(None, html), parse_only=parse_only)
+    return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+# 로그인/리다이렉트 페이지 판정용 미리 컴파일된 패턴
+#
+# 문서 전체에 쓰는 패턴은 모두 입력 길이에 선형 시간이어야 합니다. (크거나 악의적인 페이지 하나가 워커 스레드를
+# 붙잡지 않도록) 파이썬 re는 되돌아가며(backtracking) 찾으므로 다음을 지킵니다.
+# - 태그 안의 값은 `<input[^>]*name=..[^>]*value=..`처럼 겹치는 반복을 이어 쓰지 않고, 태그를 찾은 뒤(_TAGS)
+#   그 본문의 속성을 한 번 훑어(_ATTRIBUTE) 꺼냅니다. (iter_tags)
+# - _TAGS: 태그 본문이 '<' 또는 '>'에서 끝나므로 시작 위치마다 보는 구간이 서로 겹치지 않음
+# - _ATTRIBUTE: 이름 앞 lookbehind로 이름 중간에서 다시 시작하지 않고, 닫히지 않은 따옴표 값은
+#   따옴표 종류마다 한 번만 끝까지 찾음
+# - 나머지: 고정 문자열로 시작하고, 반복 다음에 그 반복이 먹지 않는 문자가 오거나(`[^"]+"`) 길이가 제한됨
+_TAGS = {tag: re.compile(rf'<{tag}\b([^<>]*)>') for tag in ('form', 'input', 'meta')}
+_ATTRIBUTE = re.compile(r'(?<![^\s"\'/])([^\s"\'<>/=]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'<>=`]+))')
+_JS_REDIRECTS = (
+    re.compile(r"(?:location|window\.location)\.href\s*=\s*['\"](?P<url>[^'\"]+)['\"]"),
+    re.compile(r"(?:location|window\.location)\s*=\s*['\"](?P<url>[^'\"]+)['\"]"),
+)
+_ERROR_VAR = re.compile(r'var errorMsg = "([^"]+)"')
+# 메시지는 같은 따옴표가 나올 때까지 (역슬래시 이스케이프 허용, 줄바꿈 없음)
+_ALERT = re.compile(r"""alert\(\s*(?:'((?:[^'\\\n]|\\.)+)'|"((?:[^"\\\n]|\\.)+)")\s*\)""")
+_CSRF_HEADER = re.compile(r"X-CSRF-TOKEN[\"']?\s*:\s*[\"']([^\"']+)[\"']")
+
+# 대소문자 무시 검색 시 한 번에 소문자로 바꿀 구간 크기 (문서 전체를 복사하지 않음)
+_CASEFOLD_WINDOW = 64 * 1024
+# PageScanner가 새 조각을 검사할 때 직전 조각 끝에서 겹쳐 볼 최소 문자 수 ('signin-form' 등 표시 문자열용)
+_SCAN_OVERLAP = 16
+
+
+def _contains_ignore_case(html: str, needle: str) -> bool:
+    """html.lower()로 문서 전체를 복사하지 않고 대소문자 무시 포함 여부 확인 (needle은 소문자)"""
+    if needle in html or needle.capitalize() in html or needle.upper() in html:
+        return True
+    overlap = len(needle) - 1
+    for start in range(0, len(html), _CASEFOLD_WINDOW):
+        if needle in html[start:start + _CASEFOLD_WINDOW + overlap].lower():
+            return True
+    return False
+
+
+def _unescape(message: str) -> str:
+    """JavaScript 문자열의 \\uXXXX 등 이스케이프 해제 (이스케이프되지 않은 한글은 그대로, 잘못된 이스케이프면 원문)"""
+    try:
+        return message.encode('latin-1', 'backslashreplace').decode('unicode_escape')
+    except UnicodeDecodeError:
+        return message
+
+
+def _attributes(body: str) -> Dict[str, str]:
+    """태그 본문의 속성 이름(소문자) -> 값. 같은 이름은 처음 값, HTML 엔티티는 풀지 않음"""
+    attributes = {}
+    for match in _ATTRIBUTE.finditer(body):
+        name, double, single, bare = match.groups()
+        attributes.setdefault(name.lower(), double if double is not None else single if single is not None else bare)
+    return attributes
+
+
+def iter_tags(html: str, tag: str, start: int = 0, end: Optional[int] = None) -> Iterator[Dict[str, str]]:
+    """
+    html[start:end]의 `<tag ...>`마다 속성 dict를 문서 순서대로 반환 (tag: 'form', 'input', 'meta')
+
+    문서 길이에 선형 시간입니다. 속성 값 안의 '<', '>'는 태그의 끝으로 봅니다.
+    """
+    for match in _TAGS[tag].finditer(html, start, len(html) if end is None else end):
+        yield _attributes(match.group(1))
+
+
+def _input_values(html: str) -> Dict[str, str]:
+    """name과 value가 모두 있는 <input>의 name -> value (같은 name은 마지막 값)"""
+    values = {}
+    for attributes in iter_tags(html, 'input'):
+        name = attributes.get('name')
+        if name and 'value' in attributes:
+            values[name] = attributes['value']
+    return values
+
+
+def _login_page_values(
+    html: str, start: int = 0, end: Optional[int] = None
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """html[start:end]에서 처음 나온 (public-key value, c_r_t value, signin-form action), 속성 순서 무관"""
+    public_key = csrf_token = form_action = None
+    for attributes in iter_tags(html, 'input', start, end):
+        element_id, value = attributes.get('id'), attributes.get('value')
+        if value and element_id == 'public-key' and public_key is None:
+            public_key = value
+        elif value and element_id == 'c_r_t' and csrf_token is None:
+            csrf_token = value
+        if public_key and csrf_token:
+            break
+    for attributes in iter_tags(html, 'form', start, end):
+        if attributes.get('id') == 'signin-form' and attributes.get('action'):
+            form_action = attributes['action']
+            break
+    return public_key, csrf_token, form_action
+
+
+class PageState:
+    """
+    로그인 과정에서 받은 페이지의 상태 (HTMLParser.classify_page 결과)
+
+    각 속성은 같은 의미의 HTMLParser 메서드(has_signin_form, extract_form_data ...)와 같은 값이며,
+    처음 읽을 때 한 번만 계산됩니다. 응답마다 PageState를 하나 만들어 돌려 쓰면
+    같은 문서를 판정 단계마다 다시 검색하지 않습니다.
+    """
+
+    def __init__(self, html: str):
+        self._html = html
+
+    @cached_property
+    def has_signin_form(self) -> bool:
+        """로그인 폼(signin-form) 존재"""
+        return 'signin-form' in self._html
+
+    @cached_property
+    def has_logout(self) -> bool:
+        """로그아웃 표시 존재"""
+        return '로그아웃' in self._html or _contains_ignore_case(self._html, 'logout')
+
+    @cached_property
+    def has_js_form_submit(self) -> bool:
+        """onLoad 자동 폼 제출 페이지"""
+        html = self._html
+        return 'onLoad=' in html and ('submit()' in html or 'doLogin()' in html)
+
+    @cached_property
+    def form_action(self) -> Optional[str]:
+        """action이 있는 첫 번째 폼의 action"""
+        for attributes in iter_tags(self._html, 'form'):
+            if attributes.get('action'):
+                return attributes['action']
+        return None
+
+    @cached_property
+    def form_data(self) -> Dict[str, str]:
+        """폼 input name -> value (폼이 없으면 빈 dict)"""
+        if self.form_action is None:
+            return {}
+        form_data = _input_values(self._html)
+        if not form_data:
+            # 정규표현식 실패 시 선택된 파서 백엔드로 폴백 (기본 lxml)
+            form_data = get_parser_backend(page='form_inputs').form_inputs(self._html)
+        return form_data
+
+    @cached_property
+    def js_redirect(self) -> Optional[str]:
+        """location.href / window.location 리다이렉트 대상 URL"""
+        for pattern in _JS_REDIRECTS:
+            match = pattern.search(self._html)
+            if match:
+                return match.group('url')
+        return None
+
+    @cached_property
+    def error_message(self) -> Optional[str]:
+        """errorMsg 변수 또는 alert() 메시지 (unicode escape 해제)"""
+        match = _ERROR_VAR.search(self._html) or _ALERT.search(self._html)
+        return _unescape(match.group(match.lastindex)) if match else None
+
+    def snapshot(self) -> 'PageSnapshot':
+        """모든 값을 계산해 본문 없이 담은 PageSnapshot"""
+        return PageSnapshot(**{f.name: getattr(self, f.name) for f in dataclass_fields(PageSnapshot)})
+
+
+@dataclass(frozen=True)
+class PageSnapshot:
+    """
+    PageState의 값을 모두 미리 계산해 둔 것 (파싱 결과 메모 캐시가 기억하는 형태)
+
+    본문을 붙잡지 않으며, 기억할 때 크기 추정(max_bytes)에 모든 값이 들어갑니다.
+    """
+    has_signin_form: bool
+    has_logout: bool
+    has_js_form_submit: bool
+    form_action: Optional[str]
+    form_data: Dict[str, str]
+    js_redirect: Optional[str]
+    error_message: Optional[str]
+
+
+class PageScanner:
+    """
+    응답 본문을 조각(chunk) 단위로 받아 필요한 값이 모두 나왔는지 판단하는 증분 스캐너 (스트리밍 읽기용)
+
+    feed()가 True를 반환하면 남은 본문은 읽지 않아도 됩니다. 새 조각이 오면 직전까지 검사한 위치의
+    마지막 태그 시작('<')부터 다시 검사하므로, 조각 경계에 걸친 태그도 놓치지 않고 같은 문서를 처음부터
+    다시 훑지 않습니다. `text`는 지금까지 받은 본문이며, 스캐너가 끝났다면 필요한 값이 모두 들어 있습니다.
+    """
+
+    def __init__(self):
+        self._content_type: Optional[str] = None
+        self._pending = b''     # 인코딩을 정하기 전까지 모아 둔 앞부분 (<meta charset> 확인용)
+        self._decoder = None
+        self._text = ''
+        self._scanned = 0       # 검사를 마친 text 길이
+        self.bytes_read = 0
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def begin(self, content_type: Optional[str]) -> None:
+        """응답의 Content-Type (charset) 지정. 첫 feed() 전에 호출합니다."""
+        self._content_type = content_type
+
+    def feed(self, chunk: bytes) -> bool:
+        """본문 조각 추가. 필요한 값을 모두 찾았으면 True"""
+        if self.done or not chunk:
+            return self.done
+        self.bytes_read += len(chunk)
+        if self._decoder is None:
+            self._pending += chunk
+            if len(self._pending) < _META_SCAN_BYTES:
+                return False
+            chunk, self._pending = self._pending, b''
+            self._start_decoder(chunk)
+        return self._append(self._decoder.decode(chunk))
+
+    def close(self) -> bool:
+        """본문 끝. 남은 바이트를 마저 디코딩해 검사합니다."""
+        if self.done:
+            return True
+        if self._decoder is None:
+            head, self._pending = self._pending, b''
+            self._start_decoder(head)
+            tail = self._decoder.decode(head, final=True)
+        else:
+            tail = self._decoder.decode(b'', final=True)
+        return self._append(tail, final=True)
+
+    def _start_decoder(self, head: bytes) -> None:
+        encoding = declared_encoding(self._content_type, head)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+    def _append(self, text: str, final: bool = False) -> bool:
+        if not text and not final:
+            return self.done
+        tag_start = self._text.rfind('<', 0, self._scanned)
+        start = max(0, min(tag_start if tag_start >= 0 else self._scanned, self._scanned - _SCAN_OVERLAP))
+        self._text += text
+        # 끝난 태그까지만 검사: 멈췄을 때 text만 다시 파싱해도 같은 값이 나오도록
+        end = len(self._text) if final else self._text.rfind('>') + 1
+        if end > start:
+            self.done = self._scan(start, end)
+            self._scanned = end
+        return self.done
+
+    def _scan(self, start: int, end: int) -> bool:
+        """text[start:end]를 검사하고, 필요한 값을 모두 찾았으면 True"""
+        raise NotImplementedError
+
+
+class LoginPageScanner(PageScanner):
+    """로그인 페이지의 public-key, c_r_t, signin-form action이 모두 나오면 멈춤 (extract_login_page_data와 같은 값)"""
+
+    def __init__(self):
+        super().__init__()
+        self.public_key: Optional[str] = None
+        self.csrf_token: Optional[str] = None
+        self.form_action: Optional[str] = None
+
+    def _scan(self, start: int, end: int) -> bool:
+        public_key, csrf_token, form_action = _login_page_values(self._text, start, end)
+        self.public_key = self.public_key or public_key
+        self.csrf_token = self.csrf_token or csrf_token
+        self.form_action = self.form_action or form_action
+        return bool(self.public_key and self.csrf_token and self.form_action)
+
+
+class SessionPageScanner(PageScanner):
+    """
+    세션 유효성 판정용: 로그인 폼(signin-form)이 나오면 멈춤
+
+    logout_decides=True면 로그아웃 표시가 나와도 멈춥니다. 로그인 폼은 SSO 페이지에만 있으므로
+    SSO가 아닌 서비스 페이지를 검사할 때만 켜야 전체 문서를 본 판정(로그인 폼 우선)과 같습니다.
+    """
+
+    def __init__(self, logout_decides: bool = False):
+        super().__init__()
+        self._logout_decides = logout_decides
+        self.has_signin_form = False
+        self.has_logout = False
+
+    def _scan(self, start: int, end: int) -> bool:
+        window = self._text[start:end]
+        if not self.has_signin_form:
+            self.has_signin_form = 'signin-form' in window
+        if not self.has_logout:
+            self.has_logout = '로그아웃' in window or _contains_ignore_case(window, 'logout')
+        return self.has_signin_form or (self._logout_decides and self.has_logout)
+
 
 class HTMLParser:
     """HTML 파싱 유틸리티"""
     
-    # CSRF 토큰 추출 패턴들
-    CSRF_PATTERNS = [
-        # meta 태그
-        (r'meta[^>]*_csrf[^>]*content="([^"]+)"', 'meta'),
-        # X-CSRF-TOKEN 헤더 설정 (JavaScript 내)
-        (r"X-CSRF-TOKEN[\"']?\s*:\s*[\"']([^\"']+)[\"']", 'header'),
-        # input hidden 태그
-        (r'name="_csrf"\s+value="([^"]+)"', 'input'),
-        # value가 먼저 오는 패턴
-        (r'value="([^"]+)"[^>]*name="_csrf"', 'input_reverse'),
-    ]
-    
     @classmethod
     def extract_csrf_token(cls, html: str) -> Optional[str]:
         """HTML에서 CSRF 토큰 추출 (여러 패턴 시도)"""
-        for pattern, _ in cls.CSRF_PATTERNS:
-            match = re.search(pattern, html)
-            if match:
-                return match.group(1)
+        return cached_parse('csrf_token', html, lambda: cls._extract_csrf_token(html))
+
+    @classmethod
+    def _extract_csrf_token(cls, html: str) -> Optional[str]:
+        # 1. <meta name="_csrf" content="...">
+        for attributes in iter_tags(html, 'meta'):
+            if attributes.get('name') == '_csrf' and attributes.get('content'):
+                return attributes['content']
+        # 2. JavaScript의 X-CSRF-TOKEN 헤더 설정
+        match = _CSRF_HEADER.search(html)
+        if match:
+            return match.group(1)
+        # 3. <input name="_csrf" value="...">
+        return cls.extract_input_value(html, '_csrf')
+
+    @classmethod
+    def extract_input_value(cls, html: str, name: str) -> Optional[str]:
+        """name이 같은 첫 번째 <input>의 value (없거나 비어 있으면 None)"""
+        for attributes in iter_tags(html, 'input'):
+            if attributes.get('name') == name:
+                return attributes.get('value') or None
         return None
     
     @classmethod
@@ -42,45 +420,17 @@ class HTMLParser:
         Returns:
             Tuple[public_key, csrf_token, form_action]
         """
+        return cached_parse('login_page', html, lambda: cls._extract_login_page_data(html), _default_backend)
+
+    @classmethod
+    def _extract_login_page_data(cls, html: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         # 정규표현식으로 빠른 추출 시도
-        public_key_match = re.search(
-            r'value=["\']([^"\']+)["\'][^>]*id=["\']public-key["\']', html
-        )
-        csrf_match = re.search(
-            r'value=["\']([^"\']+)["\'][^>]*id=["\']c_r_t["\']', html
-        )
-        form_action_match = re.search(
-            r'<form[^>]*id=["\']signin-form["\'][^>]*action=["\']([^"\']+)["\']', html
-        )
-        
-        if public_key_match and csrf_match and form_action_match:
-            return (
-                public_key_match.group(1),
-                csrf_match.group(1),
-                form_action_match.group(1)
-            )
-        
-        # 정규표현식 실패 시 BeautifulSoup으로 폴백
-        parse_only = SoupStrainer(['input', 'form'])
-        soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
-        
-        public_key = None
-        csrf_token = None
-        form_action = None
-        
-        public_key_input = soup.find('input', {'id': 'public-key'})
-        if public_key_input:
-            public_key = public_key_input.get('value')
-        
-        csrf_input = soup.find('input', {'id': 'c_r_t'})
-        if csrf_input:
-            csrf_token = csrf_input.get('value')
-        
-        form = soup.find('form', {'id': 'signin-form'})
-        if form:
-            form_action = form.get('action')
-        
-        return public_key, csrf_token, form_action
+        public_key, csrf_token, form_action = _login_page_values(html)
+        if public_key and csrf_token and form_action:
+            return public_key, csrf_token, form_action
+
+        # 정규표현식 실패 시 선택된 파서 백엔드로 폴백 (기본 lxml)
+        return get_parser_backend(page='login_page').login_page_data(html)
     
     @classmethod
     def extract_form_data(cls, html: str, form_selector: Optional[str] = None) -> Tuple[Optional[str], Dict[str, str]]:
@@ -94,56 +444,15 @@ class HTMLParser:
         Returns:
             Tuple[action_url, form_data_dict]
         """
-        # 정규표현식으로 빠른 추출 시도
-        form_action_match = re.search(r'<form[^>]*action=["\']([^"\']+)["\']', html)
-        if not form_action_match:
+        state = cls.classify_page(html)
+        if state.form_action is None:
             return None, {}
-        
-        action = form_action_match.group(1)
-        
-        # hidden input들 추출
-        input_pattern = re.compile(
-            r'<input[^>]*name=["\']([^"\']+)["\'][^>]*value=["\']([^"\']*)["\']|'
-            r'<input[^>]*value=["\']([^"\']*)["\'][^>]*name=["\']([^"\']+)["\']'
-        )
-        
-        form_data = {}
-        for match in input_pattern.finditer(html):
-            if match.group(1):
-                form_data[match.group(1)] = match.group(2)
-            elif match.group(4):
-                form_data[match.group(4)] = match.group(3)
-        
-        if not form_data:
-            # 정규표현식 실패 시 BeautifulSoup으로 폴백
-            parse_only = SoupStrainer('form')
-            soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
-            form = soup.find('form')
-            if form:
-                for input_tag in form.find_all('input'):
-                    name = input_tag.get('name')
-                    value = input_tag.get('value', '')
-                    if name:
-                        form_data[name] = value
-        
-        return action, form_data
-    
+        return state.form_action, state.form_data
+
     @classmethod
     def extract_error_message(cls, html: str) -> Optional[str]:
         """HTML에서 에러 메시지 추출"""
-        # var errorMsg = "..." 패턴
-        var_error_match = re.search(r'var errorMsg = "([^"]+)"', html)
-        if var_error_match:
-            message = var_error_match.group(1)
-            return message.encode('latin-1').decode('unicode_escape')
-
-        # alert() 패턴
-        alert_match = re.search(r"alert\(['\"](.+?)['\"]\)", html)
-        if alert_match:
-            message = alert_match.group(1)
-            return message.encode('latin-1').decode('unicode_escape')
-
-        return None
+        return cls.classify_page(html).error_message
     
     @classmethod
     def extract_js_redirect(cls, html: str) -> Optional[str]:
@@ -156,25 +465,12 @@ class HTMLParser:
         반환된 값은 절대 또는 상대 URL일 수 있습니다; 필요한 경우 호출자가
         응답 URL로 이를 해결해야 합니다.
         """
-        # location.replace('/path') 또는 location.assign('/path') 또는 location.href = '...'
-        patterns = [
-            r"(?:location|window\.location)\.href\s*=\s*['\"](?P<url>[^'\"]+)['\"]",
-            r"(?:location|window\.location)\s*=\s*['\"](?P<url>[^'\"]+)['\"]",
-            # r"(?:location\.replace|location\.assign)\s*\(\s*['\"](?P<url>[^'\"]+)['\"]\s*\)",
-            # r"window\.location\.replace\(\s*['\"](?P<url>[^'\"]+)['\"]\s*\)",
-        ]
-
-        for pat in patterns:
-            match = re.search(pat, html)
-            if match:
-                return match.group('url')
-
-        return None
+        return cls.classify_page(html).js_redirect
     
     @classmethod
     def has_js_form_submit(cls, html: str) -> bool:
         """JavaScript 자동 폼 제출 패턴 감지"""
-        return 'onLoad=' in html and ('submit()' in html or 'doLogin()' in html)
+        return cls.classify_page(html).has_js_form_submit
     
     @classmethod
     def has_signin_form(cls, html: str) -> bool:
@@ -184,4 +480,289 @@ class HTMLParser:
     @classmethod
     def has_logout_button(cls, html: str) -> bool:
         """로그아웃 버튼 존재 여부 확인"""
-        return '로그아웃' in html or 'logout' in html.lower()
+        return cls.classify_page(html).has_logout
+
+    @classmethod
+    def classify_page(cls, html: str) -> Union[PageState, PageSnapshot]:
+        """
+        로그인/리다이렉트 과정의 페이지 상태 판정
+
+        로그인 폼, 로그아웃 표시, 자동 제출 폼(action, 필드), JS 리다이렉트 URL, 에러 메시지를
+        미리 컴파일된 패턴으로 필요한 것만 한 번씩 계산합니다. (문서 전체 복사 없음)
+        파싱 결과 메모 캐시가 설치되어 있으면 값을 모두 계산한 PageSnapshot을 기억해 같은 본문에 돌려줍니다.
+        """
+        return cached_parse('page_state', html, lambda: PageState(html).snapshot(), uncached=lambda: PageState(html))
+
+
+# =================================================================
+# 파서 백엔드
+# =================================================================
+
+# 페이지 데이터에서 채울 값(필드 이름)의 집합. None이면 전부
+PageParts = Optional[FrozenSet[str]]
+
+
+def wants(parts: PageParts, part: str) -> bool:
+    """페이지 데이터의 part 값을 찾아야 하는지 (필드 프로젝션으로 빠진 값은 찾지도, 복사하지도 않음)"""
+    return parts is None or part in parts
+
+
+@dataclass(frozen=True)
+class StudentCardPage:
+    """학생카드 페이지에서 읽은 값 (StudentCardFetcher가 모델로 조립, 요청하지 않은 값은 비어 있음)"""
+    raw_html_data: str
+    photo_src: str                  # #pictureInclude img의 src ('' 이면 없음)
+    fields: Dict[str, str]          # 프로필 표 항목 제목 -> 값
+    inputs: Dict[str, str]          # 개인 연락처 표 input name -> value (같은 이름은 처음 것)
+
+
+@dataclass(frozen=True)
+class StudentChangeLogPage:
+    """학적변동내역 페이지에서 읽은 값 (StudentChangeLogFetcher가 모델로 조립, 요청하지 않은 값은 비어 있음)"""
+    raw_html_data: str
+    fields: Dict[str, str]          # 학적 기본 정보 표 항목 제목 -> 값
+    leave_semesters: Optional[str]  # 휴학 누적 현황 (표시가 없으면 None)
+    rows: List[List[str]]           # 변동 내역 표의 행별 셀 텍스트
+
+
+@dataclass(frozen=True)
+class StudentBasicInfoPage:
+    """MSI 메인 페이지의 학생 기본 정보 카드에서 읽은 값 (요청하지 않은 값은 비어 있음)"""
+    raw_html_data: str
+    fields: Dict[str, str]          # 항목 제목(':' 제외) -> 값
+
+
+# 파서 백엔드가 처리하는 페이지 종류 전체 (전역 백엔드는 전부 지원해야 함)
+PAGES = frozenset({'login_page', 'form_inputs', 'student_card', 'student_changelog', 'student_basicinfo'})
+
+
+class ParserBackend:
+    """
+    HTML에서 값을 꺼내는 파서 백엔드
+
+    `pages`에 적힌 페이지 종류의 메서드만 구현합니다. 새 백엔드는 이 클래스를 상속해
+    `register_parser_backend()`로 등록하면 `use_parser_backend()`나 Fetcher의 `parser_backend`로 고를 수 있습니다.
+
+    페이지 종류:
+    - login_page: 로그인 페이지의 (공개키, CSRF 토큰, 폼 action)  — HTMLParser 정규표현식 실패 시 폴백
+    - form_inputs: 첫 번째 폼의 input name -> value              — HTMLParser 정규표현식 실패 시 폴백
+    - student_card / student_changelog / student_basicinfo: MSI Fetcher 페이지
+
+    MSI 페이지 메서드의 parts는 채울 페이지 데이터 필드 이름입니다. (None이면 전부, `wants()`로 확인)
+    빠진 값은 요소를 찾지도 않고 빈 값('', {}, [], None)으로 두며, 그 값에 필요한 표가 없어도 ParsingError를 내지 않습니다.
+    """
+
+    name = ''
+    pages: FrozenSet[str] = frozenset()
+
+    def login_page_data(self, html: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        raise NotImplementedError
+
+    def form_inputs(self, html: str) -> Dict[str, str]:
+        raise NotImplementedError
+
+    def student_card(self, html: Html, encoding: Optional[str] = None, parts: PageParts = None) -> StudentCardPage:
+        raise NotImplementedError
+
+    def student_changelog(
+        self, html: Html, encoding: Optional[str] = None, parts: PageParts = None
+    ) -> StudentChangeLogPage:
+        raise NotImplementedError
+
+    def student_basicinfo(
+        self, html: Html, encoding: Optional[str] = None, parts: PageParts = None
+    ) -> StudentBasicInfoPage:
+        raise NotImplementedError
+
+
+class RegexBackend(ParserBackend):
+    """정규표현식만 사용 (트리를 만들지 않음). 로그인 페이지/폼 값만 지원하며 속성 값의 HTML 엔티티는 풀지 않음"""
+
+    name = 'regex'
+    pages = frozenset({'login_page', 'form_inputs'})
+
+    def login_page_data(self, html: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        return _login_page_values(html)
+
+    def form_inputs(self, html: str) -> Dict[str, str]:
+        return _input_values(html)
+
+
+class SoupBackend(ParserBackend):
+    """BeautifulSoup(lxml 빌더) 트리와 find/select_one 사용"""
+
+    name = 'bs4'
+    pages = PAGES
+
+    def login_page_data(self, html: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer(['input', 'form']))
+
+        public_key = None
+        csrf_token = None
+        form_action = None
+
+        public_key_input = soup.find('input', {'id': 'public-key'})
+        if public_key_input:
+            public_key = public_key_input.get('value')
+
+        csrf_input = soup.find('input', {'id': 'c_r_t'})
+        if csrf_input:
+            csrf_token = csrf_input.get('value')
+
+        form = soup.find('form', {'id': 'signin-form'})
+        if form:
+            form_action = form.get('action')
+
+        return public_key, csrf_token, form_action
+
+    def form_inputs(self, html: str) -> Dict[str, str]:
+        form_data = {}
+        soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer('form'))
+        form = soup.find('form')
+        if form:
+            for input_tag in form.find_all('input'):
+                name = input_tag.get('name')
+                value = input_tag.get('value', '')
+                if name:
+                    form_data[name] = value
+        return form_data
+
+    def student_card(self, html: Html, encoding: Optional[str] = None, parts: PageParts = None) -> StudentCardPage:
+        soup = make_soup(html, encoding)
+        card_item = soup.find('div', class_='card-item basic') if wants(parts, 'raw_html_data') else None
+
+        # 사진
+        img_tag = soup.select_one('#pictureInclude img') if wants(parts, 'photo_src') else None
+
+        # 기본 정보 테이블
+        fields = {}
+        if wants(parts, 'fields'):
+            profile_table = soup.select_one('#pictureInclude .flex-table')
+            if not profile_table:
+                raise ParsingError("학생 프로필 테이블을 찾을 수 없습니다.")
+            fields = self._flex_table_fields(profile_table)
+
+        # 개인 연락처 테이블
+        inputs = {}
+        if wants(parts, 'inputs'):
+            contact_table = soup.select_one('hr + .flex-table')
+            if not contact_table:
+                raise ParsingError("개인 연락처 테이블을 찾을 수 없습니다.")
+
+            for input_tag in contact_table.find_all('input', attrs={'name': True}):
+                inputs.setdefault(input_tag['name'], input_tag.get('value', ''))
+
+        return StudentCardPage(
+            raw_html_data=str(card_item) if card_item else '',
+            photo_src=img_tag.get('src', '') if img_tag else '',
+            fields=fields,
+            inputs=inputs,
+        )
+
+    def student_changelog(
+        self, html: Html, encoding: Optional[str] = None, parts: PageParts = None
+    ) -> StudentChangeLogPage:
+        soup = make_soup(html, encoding)
+        card_items = soup.find_all('div', class_='card-item basic') if wants(parts, 'raw_html_data') else []
+
+        fields = {}
+        if wants(parts, 'fields'):
+            status_table = soup.select_one('.card-item.basic .flex-table')
+            if not status_table:
+                raise ParsingError("학적 기본 정보 테이블을 찾을 수 없습니다.")
+            fields = self._flex_table_fields(status_table)
+
+        leave_span = soup.select_one('.data-title.small span') if wants(parts, 'leave_semesters') else None
+
+        rows = []
+        log_table = soup.select_one('.read-table table') if wants(parts, 'rows') else None
+        if log_table and log_table.tbody:
+            for row in log_table.tbody.find_all('tr'):
+                rows.append([col.get_text(strip=True) for col in row.find_all('td')])
+
+        return StudentChangeLogPage(
+            raw_html_data="\n".join(map(str, card_items)),
+            fields=fields,
+            leave_semesters=leave_span.get_text(strip=True) if leave_span else None,
+            rows=rows,
+        )
+
+    def student_basicinfo(
+        self, html: Html, encoding: Optional[str] = None, parts: PageParts = None
+    ) -> StudentBasicInfoPage:
+        soup = make_soup(html, encoding)
+        info_card = soup.find('div', class_='main-user-info')
+        if not info_card:
+            raise ParsingError("기본 정보 카드('main-user-info')를 찾을 수 없습니다.")
+
+        fields = {}
+        if wants(parts, 'fields'):
+            for cell in info_card.find_all('div', class_='info-cell'):
+                title = cell.find('div', class_='title').get_text(strip=True).replace(':', '').strip()
+                fields[title] = cell.find('div', class_='value').get_text(strip=True)
+        return StudentBasicInfoPage(
+            raw_html_data=str(info_card) if wants(parts, 'raw_html_data') else '',
+            fields=fields,
+        )
+
+    @staticmethod
+    def _flex_table_fields(table) -> Dict[str, str]:
+        fields = {}
+        for item in table.find_all('div', class_='flex-table-item'):
+            title = item.find('div', class_='item-title').get_text(strip=True)
+            fields[title] = item.find('div', class_='item-data').get_text(strip=True)
+        return fields
+
+
+_backends: Dict[str, ParserBackend] = {}
+_default_backend = 'lxml'   # lxml 백엔드는 lxml_html 모듈이 등록
+
+
+def register_parser_backend(backend: ParserBackend) -> None:
+    """파서 백엔드 등록 (같은 이름이 있으면 교체)"""
+    _backends[backend.name] = backend
+
+
+def parser_backend_names() -> List[str]:
+    """등록된 파서 백엔드 이름 목록"""
+    return list(_backends)
+
+
+def get_parser_backend(name: Optional[str] = None, page: Optional[str] = None) -> ParserBackend:
+    """
+    이름으로 파서 백엔드를 찾습니다. (없으면 `use_parser_backend()`로 고른 전역 백엔드)
+
+    Raises:
+        ValueError: 등록되지 않은 이름이거나, page가 주어졌는데 그 페이지를 지원하지 않는 백엔드
+    """
+    name = name or _default_backend
+    backend = _backends.get(name)
+    if backend is None:
+        raise ValueError(f"등록되지 않은 파서 백엔드입니다: {name!r} (사용 가능: {', '.join(_backends)})")
+    if page is not None and page not in backend.pages:
+        raise ValueError(f"파서 백엔드 {name!r}는 {page} 페이지를 지원하지 않습니다.")
+    return backend
+
+
+def use_parser_backend(name: str) -> str:
+    """
+    프로세스 전역 파서 백엔드를 고릅니다. (HTMLParser 폴백, parser_backend를 지정하지 않은 Fetcher)
+
+    Returns:
+        str: 이전에 선택되어 있던 백엔드 이름
+
+    Raises:
+        ValueError: 등록되지 않은 이름이거나, 모든 페이지(`PAGES`)를 지원하지 않는 백엔드 (예: 'regex')
+    """
+    global _default_backend
+    missing = PAGES - get_parser_backend(name).pages
+    if missing:
+        raise ValueError(
+            f"파서 백엔드 {name!r}는 {', '.join(sorted(missing))} 페이지를 지원하지 않아 전역 백엔드로 쓸 수 없습니다."
+        )
+    previous, _default_backend = _default_backend, name
+    return previous
+
+
+register_parser_backend(RegexBackend())
+register_parser_backend(SoupBackend())
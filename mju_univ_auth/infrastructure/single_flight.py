@@ -0,0 +1,162 @@
+"""
+Single-flight 호출 병합
+======================
+같은 키로 동시에 들어온 호출을 하나의 실행으로 합칩니다.
+
+명지대 SSO는 계정당 하나의 활성 세션만 허용하므로, 같은 사용자가 동시에 로그인하면
+서로의 세션을 무효화합니다. 진행 중인 로그인이 있으면 새로 로그인하지 않고
+그 결과(같은 세션)를 함께 받도록 하여 불필요한 SSO 왕복과 연쇄 실패를 막습니다.
+
+- 결과를 캐시하지 않습니다. 실행이 끝나면 키가 제거되어 다음 호출은 새로 실행됩니다.
+- SingleFlight는 스레드용, AsyncSingleFlight는 asyncio용입니다.
+
+사용법:
+    flights = SingleFlight()
+    result = flights.do(login_flight_key(user_id, service, user_pw), lambda: do_login())
+"""
+
+import asyncio
+import hashlib
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# (결과, 결과를 함께 받은 호출 수) -> None. 대기 중인 호출이 결과를 보기 전에 한 번 호출됩니다.
+OnDone = Callable[[Any, int], None]
+
+
+def login_flight_key(user_id: str, service: str, user_pw: str) -> Tuple[str, str, str]:
+    """로그인 병합 키: (user_id, service, 비밀번호 SHA-256). 비밀번호가 다르면 병합하지 않습니다."""
+    return user_id, service, hashlib.sha256(user_pw.encode('utf-8')).hexdigest()
+
+
+class _Call:
+    """진행 중인 동기 호출"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.callers = 1
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """스레드 간 동일 키 호출 병합"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T], on_done: Optional[OnDone] = None) -> T:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 fn()을 실행합니다.
+
+        Args:
+            key: 병합 키
+            fn: 실제로 실행할 함수
+            on_done: (결과, 호출 수) 콜백. fn이 성공했을 때 대기 중인 호출이 깨어나기 전에 실행됩니다.
+
+        Returns:
+            fn()의 결과 (fn이 예외를 발생시키면 모든 호출에서 같은 예외가 발생합니다)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.callers += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # 키를 먼저 제거해 이후 호출은 합류하지 않게 한 뒤(호출 수 확정) 대기 중인 호출을 깨웁니다.
+            with self._lock:
+                self._calls.pop(key, None)
+            if call.error is None and on_done is not None:
+                on_done(call.result, call.callers)
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """진행 중인 키 개수"""
+        with self._lock:
+            return len(self._calls)
+
+
+class _AsyncCall:
+    """진행 중인 비동기 호출"""
+
+    def __init__(self):
+        self.task: Optional['asyncio.Task'] = None
+        self.callers = 1
+
+
+class AsyncSingleFlight:
+    """asyncio 코루틴 간 동일 키 호출 병합 (이벤트 루프별로 독립)"""
+
+    def __init__(self):
+        self._calls: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, _AsyncCall]]' = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _loop_calls(self) -> Dict[Hashable, _AsyncCall]:
+        loop = asyncio.get_running_loop()
+        calls = self._calls.get(loop)
+        if calls is None:
+            calls = self._calls[loop] = {}
+        return calls
+
+    async def do(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        on_done: Optional[OnDone] = None,
+    ) -> T:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 factory()를 실행합니다.
+
+        실제 실행은 별도 Task에서 이루어지므로, 한 호출자가 취소되어도 다른 호출자는 결과를 받습니다.
+
+        Args:
+            key: 병합 키
+            factory: 실행할 코루틴을 만드는 함수
+            on_done: (결과, 호출 수) 콜백. 성공했을 때 대기 중인 호출이 결과를 보기 전에 실행됩니다.
+        """
+        calls = self._loop_calls()
+        call = calls.get(key)
+        if call is not None:
+            call.callers += 1
+        else:
+            call = _AsyncCall()
+            calls[key] = call
+
+            async def run():
+                try:
+                    result = await factory()
+                finally:
+                    # 완료 전에 키를 제거해야 호출 수가 확정됩니다.
+                    calls.pop(key, None)
+                if on_done is not None:
+                    on_done(result, call.callers)
+                return result
+
+            call.task = asyncio.ensure_future(run())
+
+        return await asyncio.shield(call.task)
+
+    def in_flight(self) -> int:
+        """현재 이벤트 루프에서 진행 중인 키 개수"""
+        return len(self._loop_calls())
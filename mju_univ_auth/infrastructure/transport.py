@@ -0,0 +1,273 @@
+"""
+HTTP 전송 계층
+=============
+여러 Authenticator/Fetcher가 공유하는 프로세스 전역 커넥션 풀을 관리합니다.
+
+- 커넥션 풀(urllib3 PoolManager)은 프로세스 전체에서 하나를 공유합니다.
+  PoolManager는 업스트림 호스트(sso.mju.ac.kr, msi.mju.ac.kr ...)마다 별도의 풀을 유지합니다.
+- 쿠키(로그인 세션)는 `requests.Session`마다 독립적으로 유지되므로 사용자 간 섞이지 않습니다.
+- 매 로그인마다 TCP/TLS 핸드셰이크를 새로 하지 않고, 유휴 커넥션을 재사용합니다.
+
+사용법:
+    from mju_univ_auth.infrastructure.transport import configure_transport, create_session
+
+    configure_transport(pool_maxsize=64, keep_alive_idle=30)  # 선택: 풀 크기/keep-alive 조정
+    session = create_session()                                # 공유 풀을 사용하는 새 세션
+"""
+
+import asyncio
+import socket
+import threading
+import weakref
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    import httpx
+except ImportError:  # 비동기 기능은 선택 의존성(httpx)이 있을 때만 사용 가능
+    httpx = None
+
+from ..config import POOL_CONFIG, PoolConfig, STREAM_CONFIG, StreamConfig, TIMEOUT_CONFIG
+from .parser import PageScanner
+
+
+def _keep_alive_socket_options(pool_config: PoolConfig) -> List[Tuple[int, int, int]]:
+    """TCP keep-alive 소켓 옵션 구성 (플랫폼에서 지원하는 옵션만 사용)"""
+    options = list(HTTPConnection.default_socket_options)
+    if not pool_config.keep_alive:
+        return options
+
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE은 Linux, TCP_KEEPALIVE는 macOS 에서 사용하는 이름입니다.
+    idle_option = getattr(socket, 'TCP_KEEPIDLE', None) or getattr(socket, 'TCP_KEEPALIVE', None)
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, pool_config.keep_alive_idle))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, pool_config.keep_alive_interval))
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, pool_config.keep_alive_count))
+    return options
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    여러 `requests.Session`이 공유하는 HTTPAdapter
+
+    `Session.close()`는 마운트된 어댑터의 `close()`를 호출하므로,
+    한 세션을 닫을 때 다른 세션이 사용 중인 풀까지 닫히지 않도록 `close()`를 무시합니다.
+    풀을 실제로 정리하려면 `shutdown()`을 호출합니다.
+    """
+
+    def __init__(self, pool_config: PoolConfig = POOL_CONFIG):
+        self.pool_config = pool_config
+        super().__init__(
+            pool_connections=pool_config.pool_connections,
+            pool_maxsize=pool_config.pool_maxsize,
+            pool_block=pool_config.pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault('socket_options', _keep_alive_socket_options(self.pool_config))
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def close(self) -> None:
+        """공유 풀은 개별 세션 종료 시 닫지 않습니다."""
+
+    def shutdown(self) -> None:
+        """풀에 남아있는 모든 커넥션을 닫습니다."""
+        super().close()
+
+
+_adapter_lock = threading.Lock()
+_shared_adapter: Optional[SharedHTTPAdapter] = None
+
+
+def configure_transport(pool_config: Optional[PoolConfig] = None, **overrides) -> SharedHTTPAdapter:
+    """
+    공유 커넥션 풀 설정을 변경합니다.
+
+    이후 `create_session()`으로 만들어지는 세션부터 새 풀을 사용합니다.
+    이미 만들어진 세션은 기존 풀을 계속 사용합니다.
+
+    Args:
+        pool_config: 사용할 PoolConfig (없으면 기본값 POOL_CONFIG)
+        **overrides: PoolConfig 필드 개별 지정 (예: pool_maxsize=64, keep_alive=False)
+
+    Returns:
+        SharedHTTPAdapter: 새로 구성된 공유 어댑터
+    """
+    global _shared_adapter
+    config = replace(pool_config or POOL_CONFIG, **overrides)
+    with _adapter_lock:
+        _shared_adapter = SharedHTTPAdapter(config)
+        return _shared_adapter
+
+
+def get_shared_adapter() -> SharedHTTPAdapter:
+    """프로세스 전역 공유 어댑터를 반환합니다. (최초 호출 시 기본 설정으로 생성)"""
+    global _shared_adapter
+    adapter = _shared_adapter
+    if adapter is not None:
+        return adapter
+    with _adapter_lock:
+        if _shared_adapter is None:
+            _shared_adapter = SharedHTTPAdapter(POOL_CONFIG)
+        return _shared_adapter
+
+
+def create_session(pooled: bool = True) -> requests.Session:
+    """
+    새 `requests.Session`을 생성합니다.
+
+    Args:
+        pooled: True면 프로세스 전역 커넥션 풀을 공유하고, False면 세션 전용 풀을 사용합니다.
+
+    Returns:
+        requests.Session: 독립된 쿠키 저장소를 가진 세션
+    """
+    session = requests.Session()
+    if pooled:
+        adapter = get_shared_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    return session
+
+
+def _should_drain(content_length: Optional[str], downloaded: int, drain_limit: int) -> bool:
+    """남은 본문이 drain_limit 이하면 마저 읽어 커넥션을 재사용 (길이를 모르면 닫음)"""
+    try:
+        return int(content_length) - downloaded <= drain_limit
+    except (TypeError, ValueError):
+        return False
+
+
+def read_until(response: requests.Response, scanner: PageScanner, stream_config: Optional[StreamConfig] = None) -> int:
+    """
+    `stream=True`로 받은 응답 본문을 scanner가 필요한 값을 찾을 때까지만 읽습니다.
+
+    값을 찾은 뒤 남은 본문이 `drain_limit` 이하면 마저 읽어 커넥션을 풀에 돌려주고,
+    그보다 많으면 나머지를 받지 않고 커넥션을 닫습니다. (keep-alive 재사용 대신 수신량을 줄임)
+
+    Returns:
+        int: 수신한 본문 바이트 수 (디코딩 후, 마저 읽은 부분 포함)
+    """
+    config = stream_config or STREAM_CONFIG
+    scanner.begin(response.headers.get('Content-Type'))
+    received = 0
+    try:
+        chunks = response.iter_content(config.chunk_size)
+        for chunk in chunks:
+            if scanner.feed(chunk):
+                break
+        else:
+            scanner.close()
+            return scanner.bytes_read
+        # Content-Length와 raw.tell()은 모두 압축된(전송) 바이트 기준
+        if _should_drain(response.headers.get('Content-Length'), response.raw.tell(), config.drain_limit):
+            received = sum(len(chunk) for chunk in chunks)
+        return scanner.bytes_read + received
+    finally:
+        response.close()
+
+
+# =================================================================
+# 비동기(httpx) 전송 계층
+# =================================================================
+
+def require_httpx() -> None:
+    """httpx가 설치되어 있지 않으면 설치 방법과 함께 ImportError를 발생시킵니다."""
+    if httpx is None:
+        raise ImportError(
+            "비동기 API를 사용하려면 httpx가 필요합니다: pip install 'mju_univ_auth[async]'"
+        )
+
+
+if httpx is not None:
+    class SharedAsyncTransport(httpx.AsyncBaseTransport):
+        """
+        여러 `httpx.AsyncClient`가 공유하는 전송 계층
+
+        `AsyncClient.aclose()`가 공유 커넥션 풀을 닫지 않도록 요청만 위임합니다.
+        """
+
+        def __init__(self, transport: 'httpx.AsyncHTTPTransport'):
+            self._transport = transport
+
+        async def handle_async_request(self, request):
+            return await self._transport.handle_async_request(request)
+
+        async def aclose(self) -> None:
+            """공유 풀은 개별 클라이언트 종료 시 닫지 않습니다."""
+
+        async def shutdown(self) -> None:
+            """풀에 남아있는 모든 커넥션을 닫습니다."""
+            await self._transport.aclose()
+
+
+# 커넥션은 이벤트 루프에 묶이므로 이벤트 루프마다 풀을 하나씩 둡니다.
+_async_transports: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def get_shared_async_transport() -> 'SharedAsyncTransport':
+    """현재 이벤트 루프의 공유 비동기 전송 계층을 반환합니다. (최초 호출 시 생성)"""
+    require_httpx()
+    loop = asyncio.get_running_loop()
+    shared = _async_transports.get(loop)
+    if shared is None:
+        pool_config = get_shared_adapter().pool_config
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=pool_config.pool_connections * pool_config.pool_maxsize,
+                keepalive_expiry=pool_config.keep_alive_idle,
+            ),
+            socket_options=_keep_alive_socket_options(pool_config),
+        )
+        shared = SharedAsyncTransport(transport)
+        _async_transports[loop] = shared
+    return shared
+
+
+def create_async_client(pooled: bool = True) -> 'httpx.AsyncClient':
+    """
+    새 `httpx.AsyncClient`를 생성합니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+    Args:
+        pooled: True면 이벤트 루프 전역 커넥션 풀을 공유하고, False면 클라이언트 전용 풀을 사용합니다.
+
+    Returns:
+        httpx.AsyncClient: 독립된 쿠키 저장소를 가진 클라이언트 (HTTP 리다이렉트 자동 추적)
+    """
+    require_httpx()
+    return httpx.AsyncClient(
+        transport=get_shared_async_transport() if pooled else None,
+        follow_redirects=True,
+        timeout=TIMEOUT_CONFIG.default,
+    )
+
+
+async def aread_until(
+    response: 'httpx.Response', scanner: PageScanner, stream_config: Optional[StreamConfig] = None,
+) -> int:
+    """`read_until`의 비동기(httpx) 버전. `client.send(..., stream=True)`로 받은 응답에 사용합니다."""
+    config = stream_config or STREAM_CONFIG
+    scanner.begin(response.headers.get('Content-Type'))
+    received = 0
+    try:
+        chunks = response.aiter_bytes(config.chunk_size)
+        async for chunk in chunks:
+            if scanner.feed(chunk):
+                break
+        else:
+            scanner.close()
+            return scanner.bytes_read
+        if _should_drain(response.headers.get('Content-Length'), response.num_bytes_downloaded, config.drain_limit):
+            async for chunk in chunks:
+                received += len(chunk)
+        return scanner.bytes_read + received
+    finally:
+        await response.aclose()
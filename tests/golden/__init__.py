@@ -0,0 +1,139 @@
+"""
+Versioned golden HTML corpus of full-size, anonymized SSO/MSI pages.
+
+Each version lives in its own directory (``v1``, ``v2`` ...) with the page files
+and a ``manifest.json`` that records, per page, its kind, encoding, SHA-256 and
+the parse results the library produced when the version was cut. Versions are
+never edited in place: a markup change means a new version built with
+``python -m tests.golden.build <version>``.
+
+Used by ``tests/unit/test_golden_corpus.py`` (parse results must not drift) and
+``benchmarks/bench_golden_corpus.py`` (pages/sec, allocations, peak memory).
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+CORPUS_DIR = os.path.dirname(os.path.abspath(__file__))
+LATEST_VERSION = 'v1'
+
+
+@dataclass(frozen=True)
+class GoldenPage:
+    """One page of the corpus"""
+    name: str
+    kind: str                       # login / redirect / home / student_card / student_changelog
+    url: str                        # URL the page was served from
+    encoding: str
+    body: bytes = field(repr=False)
+    sha256: str = ''
+    expected: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding)
+
+
+def load_corpus(version: str = LATEST_VERSION) -> List[GoldenPage]:
+    """Loads a corpus version in manifest order, checking every file against its recorded SHA-256."""
+    directory = os.path.join(CORPUS_DIR, version)
+    with open(os.path.join(directory, 'manifest.json'), encoding='utf-8') as manifest_file:
+        manifest = json.load(manifest_file)
+
+    pages = []
+    for entry in manifest['pages']:
+        with open(os.path.join(directory, entry['file']), 'rb') as page_file:
+            body = page_file.read()
+        digest = hashlib.sha256(body).hexdigest()
+        if digest != entry['sha256']:
+            raise ValueError(f"{version}/{entry['file']} does not match its manifest SHA-256")
+        pages.append(GoldenPage(
+            name=entry['name'],
+            kind=entry['kind'],
+            url=entry['url'],
+            encoding=entry['encoding'],
+            body=body,
+            sha256=digest,
+            expected=entry['expected'],
+        ))
+    return pages
+
+
+def _digest_text(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def canonical_markup(markup: str) -> str:
+    """
+    raw_html_data re-serialized so that equivalent markup compares equal across parser backends.
+
+    The bs4 backend writes ``<br/>`` and ``readonly=""`` where the lxml backend writes ``<br>`` and ``readonly``;
+    both are parsed again by lxml, attribute whitespace is collapsed and the result goes through markup_of().
+    """
+    from lxml import etree, html
+    from mju_univ_auth.infrastructure.lxml_html import markup_of
+
+    if not markup:
+        return ''
+    root = html.fragment_fromstring(markup, create_parent='div')
+    for element in root.iter(etree.Element):
+        for name, value in element.attrib.items():
+            element.set(name, ' '.join(value.split()))
+    return markup_of(root)
+
+
+def observe(page: GoldenPage, parser_backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Parses a page the way the library does during login/fetch and returns the results as JSON-ready data.
+
+    Large values (raw_html_data, the photo) are reduced to their SHA-256 so the manifest stays small;
+    raw_html_data is hashed in its canonical_markup() form so every backend can match it.
+    """
+    from mju_univ_auth.fetcher.student_basicinfo_fetcher import StudentBasicInfoFetcher
+    from mju_univ_auth.fetcher.student_card_fetcher import StudentCardFetcher
+    from mju_univ_auth.fetcher.student_changelog_fetcher import StudentChangeLogFetcher
+    from mju_univ_auth.infrastructure.parser import HTMLParser
+
+    state = HTMLParser.classify_page(page.text)
+    if page.kind == 'login':
+        public_key, csrf_token, form_action = HTMLParser.extract_login_page_data(page.text)
+        return {
+            'public_key': public_key,
+            'csrf_token': csrf_token,
+            'form_action': form_action,
+            'has_signin_form': state.has_signin_form,
+        }
+    if page.kind == 'redirect':
+        return {
+            'has_js_form_submit': state.has_js_form_submit,
+            'form_action': state.form_action,
+            'form_data': state.form_data,
+            'js_redirect': state.js_redirect,
+        }
+    if page.kind == 'home':
+        fetcher = StudentBasicInfoFetcher(session=None, parser_backend=parser_backend)
+        fetcher._encoding = page.encoding
+        info = fetcher._parse_basic_info(page.body).model_dump()
+        info['raw_html_data'] = _digest_text(canonical_markup(info['raw_html_data']))
+        return {
+            'has_logout': state.has_logout,
+            'csrf_token': HTMLParser.extract_csrf_token(page.text),
+            'basic_info': info,
+        }
+    if page.kind == 'student_card':
+        fetcher = StudentCardFetcher(session=None, user_pw='', parser_backend=parser_backend)
+        fetcher._encoding = page.encoding
+        card = fetcher._parse_student_card(page.body).model_dump()
+        card['raw_html_data'] = _digest_text(canonical_markup(card['raw_html_data']))
+        card['student_profile']['photo_base64'] = _digest_text(card['student_profile']['photo_base64'])
+        return card
+    if page.kind == 'student_changelog':
+        fetcher = StudentChangeLogFetcher(session=None, parser_backend=parser_backend)
+        fetcher._encoding = page.encoding
+        changelog = fetcher._parse_student_changelog(page.body).model_dump()
+        changelog['raw_html_data'] = _digest_text(canonical_markup(changelog['raw_html_data']))
+        return changelog
+    raise ValueError(f"unknown page kind: {page.kind}")
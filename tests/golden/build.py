@@ -0,0 +1,377 @@
+"""
+Builds a version of the golden corpus.
+
+    python -m tests.golden.build v2
+
+The pages reproduce the structure and size of what sso.mju.ac.kr and
+msi.mju.ac.kr serve (page chrome, side menu, inline scripts and styles, the
+base64 photo), but every personal value is synthetic: the student is 김명지
+(60200001), phone numbers use the 010-0000 block, IP addresses come from
+192.0.2.0/24 (TEST-NET-1), addresses are the university's own, and tokens,
+keys and the photo are drawn from a seeded RNG so a rebuild is byte-identical.
+
+The expected parse results in the manifest are recorded with the reference
+'bs4' parser backend. An existing version is never overwritten unless
+``--force`` is given; bump the version instead when the markup changes.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import random
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from tests.golden import CORPUS_DIR, GoldenPage, observe  # noqa: E402
+
+SEED = 20250302
+REFERENCE_BACKEND = 'bs4'
+SSO_LOGIN_URL = 'https://sso.mju.ac.kr/sso/auth?client_id=msi&response_type=code&state=1764563066913'
+MSI_HOME_URL = 'https://msi.mju.ac.kr/servlet/security/MySecurityStart'
+
+STUDENT = {
+    'student_id': '60200001',
+    'name': '김명지',
+    'name_eng': ('KIM', 'MYONGJI'),
+    'department': 'ICT융합대학 컴퓨터공학과',
+    'phone': '02-0000-1234',
+    'mobile': '010-0000-5678',
+    'email': 'student60200001@example.com',
+    'address': ('037', '24', '서울특별시 서대문구 거북골로 34', '명지대학교 인문캠퍼스'),
+    'registered_address': ('170', '58', '경기도 용인시 처인구 명지로 116', '명지대학교 자연캠퍼스'),
+    'advisor': '홍길동',
+    'last_access': '2025-03-02 09:10:11',
+    'last_ip': '192.0.2.15',
+}
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>명지대학교 통합로그인</title>
+<link rel="stylesheet" href="/sso/resources/css/common.css?v=20250301">
+<style>
+{styles}
+</style>
+<script>
+{library}
+</script>
+</head>
+<body>
+<div id="wrap" class="login-wrap">
+  <header class="login-header"><h1><a href="https://www.mju.ac.kr"><img src="/sso/resources/img/logo.png" alt="명지대학교"></a></h1></header>
+  <div class="login-box">
+    <ul class="login-tab"><li class="on"><a href="#">통합로그인</a></li><li><a href="#">인증서 로그인</a></li></ul>
+    <form id="signin-form" action="/sso/process/login.do" method="post" autocomplete="off">
+      <input type="hidden" value="{public_key}" id="public-key" />
+      <input type="hidden" value="{csrf}" id="c_r_t" />
+      <input type="hidden" name="user_id" id="user_id" value="" />
+      <input type="hidden" name="pw" id="pw" value="" />
+      <div class="input-row"><label for="input-userId">아이디</label><input type="text" id="input-userId" placeholder="아이디(학번/교번)" maxlength="20"></div>
+      <div class="input-row"><label for="input-password">비밀번호</label><input type="password" id="input-password" placeholder="비밀번호" maxlength="64"></div>
+      <div class="save-id"><input type="checkbox" id="save-id"><label for="save-id">아이디 저장</label></div>
+      <button type="button" class="btn-login" onclick="doLogin();">로그인</button>
+    </form>
+    <ul class="login-links"><li><a href="/sso/find/id.do">아이디 찾기</a></li><li><a href="/sso/find/pw.do">비밀번호 찾기</a></li></ul>
+  </div>
+  <div class="notice-box">
+{notices}
+  </div>
+  <footer class="login-footer"><p>(03674) 서울특별시 서대문구 거북골로 34 명지대학교 &nbsp;|&nbsp; Copyright &copy; MYONGJI UNIVERSITY.</p></footer>
+</div>
+<script>
+{login_script}
+</script>
+</body>
+</html>
+"""
+
+REDIRECT_PAGE = """<html>
+<head><meta charset="UTF-8"><title>Redirect</title></head>
+<body onLoad="document.login.submit();">
+<form name="login" action="https://msi.mju.ac.kr/index_Myiweb.jsp" method="post">
+{inputs}</form>
+<noscript><p>자바스크립트가 꺼져 있습니다. 아래 버튼을 눌러 계속하세요.</p><input type="submit" value="계속"></noscript>
+</body>
+</html>
+"""
+
+MSI_PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<meta http-equiv="X-UA-Compatible" content="IE=edge">
+<meta name="_csrf" content="{csrf}" />
+<meta name="_csrf_header" content="X-CSRF-TOKEN" />
+<title>{title} - MSI 명지대학교 학사정보시스템</title>
+<link rel="stylesheet" href="/resources/css/msi.css?v=20250301">
+<style>
+{styles}
+</style>
+<script>
+var ctx = '';
+$.ajaxSetup({{ headers: {{ 'X-CSRF-TOKEN': '{csrf}' }} }});
+{library}
+</script>
+</head>
+<body>
+<div id="header">
+  <h1 class="logo"><a href="/servlet/security/MySecurityStart"><img src="/resources/img/msi_logo.png" alt="MSI"></a></h1>
+  <div class="user-area"><span class="user-name">{name}님</span> <a href="/servlet/security/MySecurityLogout" class="btn-logout">로그아웃</a></div>
+</div>
+<div id="container">
+  <nav id="lnb"><ul class="side-menu">
+{menu}
+  </ul></nav>
+  <div id="content">
+    <h2 class="page-title">{title}</h2>
+{content}
+  </div>
+</div>
+<div id="footer"><p>Copyright &copy; MYONGJI UNIVERSITY. All rights reserved.</p></div>
+<script>
+document.querySelectorAll('.side-menu a').forEach(function (item) {{
+  item.addEventListener('click', function () {{ if (window.sessionTimer && sessionTimer.remaining() < 0) {{ location.reload(); }} }});
+}});
+</script>
+</body>
+</html>
+"""
+
+HOME_CONTENT = """    <div class="main-user-info">
+      <div class="info-cell"><div class="title">소 속 :</div><div class="value">{department}</div></div>
+      <div class="info-cell"><div class="title">구 분 :</div><div class="value">학부생</div></div>
+      <div class="info-cell"><div class="title">학 년 :</div><div class="value">3학년</div></div>
+      <div class="info-cell"><div class="title">최근접속시간 :</div><div class="value">{last_access}</div></div>
+      <div class="info-cell"><div class="title">최근접속IP :</div><div class="value">{last_ip}</div></div>
+    </div>
+    <div class="board-list notice">
+      <h3>학사 공지</h3>
+      <ul>
+{notices}
+      </ul>
+    </div>"""
+
+CARD_CONTENT = """    <div class="card-item basic">
+      <div class="data-title">학생카드</div>
+      <!-- 학생 사진 -->
+      <div id="pictureInclude" class="photo-area">
+        <img src="data:image/jpg;base64,{photo}" alt="학생사진" width="120" height="160">
+        <div class="flex-table profile">
+          <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">{student_id}</div></div>
+          <div class="flex-table-item"><div class="item-title">한글성명</div><div class="item-data">{name}</div></div>
+          <div class="flex-table-item"><div class="item-title">학년</div><div class="item-data">3 학년</div></div>
+          <div class="flex-table-item"><div class="item-title">학적상태</div><div class="item-data">재학</div></div>
+          <div class="flex-table-item"><div class="item-title">학부(과)</div><div class="item-data">{department}</div></div>
+          <div class="flex-table-item"><div class="item-title">상담교수</div><div class="item-data">{advisor}</div></div>
+          <div class="flex-table-item"><div class="item-title">학생설계전공지도교수</div><div class="item-data">()</div></div>
+        </div>
+      </div>
+      <hr>
+      <div class="flex-table">
+{inputs}
+      </div>
+      <div class="btn-area"><button type="button" class="btn" onclick="saveStdCard();">저장</button></div>
+    </div>"""
+
+CHANGELOG_CONTENT = """    <div class="card-item basic">
+      <div class="flex-table">
+        <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">{student_id}</div></div>
+        <div class="flex-table-item"><div class="item-title">성명</div><div class="item-data">{name}</div></div>
+        <div class="flex-table-item"><div class="item-title">학적상태</div><div class="item-data">재학</div></div>
+        <div class="flex-table-item"><div class="item-title">학년</div><div class="item-data">3</div></div>
+        <div class="flex-table-item"><div class="item-title">이수학기</div><div class="item-data">6</div></div>
+        <div class="flex-table-item"><div class="item-title">학부(과)</div><div class="item-data">{department}</div></div>
+      </div>
+    </div>
+    <div class="card-item basic">
+      <div class="data-title small">누적 휴학 : <span style="color:red"> 총 4학기 </span></div>
+      <div class="read-table"><table>
+        <thead><tr><th>년도</th><th>학기</th><th>변동</th><th>일자</th><th>만료</th><th>사유</th></tr></thead>
+        <tbody>
+{rows}
+          <tr><td colspan="6">총 {count}건</td></tr>
+        </tbody>
+      </table></div>
+    </div>"""
+
+CHANGES = (
+    ('2021', '1학기', '일반휴학', '2021-02-15', '2021-08-31', '개인사정'),
+    ('2021', '2학기', '복학', '2021-08-20', '', ''),
+    ('2022', '1학기', '군입대휴학', '2022-01-10', '2023-08-31', '병역의무'),
+    ('2023', '2학기', '복학', '2023-08-21', '', '전역'),
+    ('2024', '2학기', '일반휴학', '2024-08-12', '2025-02-28', '어학연수'),
+    ('2025', '1학기', '복학', '2025-02-17', '', ''),
+)
+
+
+def _styles(rng: random.Random, rules: int) -> str:
+    properties = ('margin', 'padding', 'border-width', 'font-size', 'line-height', 'letter-spacing')
+    return '\n'.join(
+        f'.c{index:04d} {{ {rng.choice(properties)}: {rng.randint(0, 24)}px; color: #{rng.getrandbits(24):06x}; }}'
+        for index in range(rules)
+    )
+
+
+def _library(rng: random.Random, functions: int) -> str:
+    """Minified-looking inline script (the RSA/AES helpers and UI code the real pages inline)."""
+    return '\n'.join(
+        f'function f{index}(a,b){{var c=a<b&&b>0?a:{rng.randint(0, 9999)};'
+        f'return c^0x{rng.getrandbits(32):08x}|(b>>>{rng.randint(1, 31)});}}'
+        for index in range(functions)
+    )
+
+
+def _menu(items: int) -> str:
+    return '\n'.join(
+        f'    <li class="menu-item depth{2 + index % 2}"><a href="/servlet/su/sud/Sud00Svl01?pgmid=W_SUD{index:03d}'
+        f'&amp;sysdiv=SCH&amp;subsysdiv=SCH" title="메뉴 {index}">학사 메뉴 {index}</a></li>'
+        for index in range(items)
+    )
+
+
+def _token(rng: random.Random, length: int) -> str:
+    return base64.b64encode(rng.randbytes(length)).decode('ascii')
+
+
+def _uuid(rng: random.Random) -> str:
+    value = f'{rng.getrandbits(128):032x}'
+    return f'{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}'
+
+
+def _msi_page(rng: random.Random, csrf: str, title: str, content: str) -> str:
+    return MSI_PAGE.format(
+        csrf=csrf,
+        title=title,
+        name=STUDENT['name'],
+        styles=_styles(rng, 300),
+        library=_library(rng, 250),
+        menu=_menu(420),
+        content=content,
+    )
+
+
+def build_pages(seed: int = SEED):
+    """name -> (kind, url, html)"""
+    rng = random.Random(seed)
+    csrf = _uuid(rng)
+    notices = '\n'.join(
+        f'    <p class="notice">[공지] 통합로그인 시스템 점검 안내 ({index + 1}차) - 점검 시간에는 로그인이 제한됩니다.</p>'
+        for index in range(40)
+    )
+    login = LOGIN_PAGE.format(
+        styles=_styles(rng, 240),
+        library=_library(rng, 180),
+        public_key='MIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQEA' + _token(rng, 250),
+        csrf=_uuid(rng),
+        notices=notices,
+        login_script='function doLogin(){var f=document.getElementById("signin-form");f.submit();}',
+    )
+    redirect = REDIRECT_PAGE.format(inputs=''.join(
+        f'<input type="hidden" name="{name}" value="{value}">\n'
+        for name, value in (
+            ('code', _token(rng, 48)),
+            ('state', '1764563066913'),
+            ('tkn_type', 'normal'),
+            ('id_token', _token(rng, 900)),
+        )
+    ))
+    home = _msi_page(rng, csrf, '메인', HOME_CONTENT.format(
+        department=STUDENT['department'],
+        last_access=STUDENT['last_access'],
+        last_ip=STUDENT['last_ip'],
+        notices='\n'.join(
+            f'        <li><a href="/servlet/board/notice?seq={1000 + index}">[학사] 2025학년도 1학기 수강신청 안내 {index + 1}</a>'
+            f'<span class="date">2025-02-{1 + index % 28:02d}</span></li>'
+            for index in range(60)
+        ),
+    ))
+    # fake JPEG (SOI/APP0 ... EOI), about 110KB -> about 150KB of base64
+    photo = base64.b64encode(b'\xff\xd8\xff\xe0\x00\x10JFIF\x00' + rng.randbytes(110 * 1024) + b'\xff\xd9').decode('ascii')
+    zip1, zip2, addr1, addr2 = STUDENT['address']
+    zip1_2, zip2_2, addr1_2, addr2_2 = STUDENT['registered_address']
+    contact = {
+        'nm_eng': STUDENT['name_eng'][0], 'nm_eng2': STUDENT['name_eng'][1],
+        'std_tel': STUDENT['phone'], 'htel': STUDENT['mobile'], 'email': STUDENT['email'],
+        'zip1': zip1, 'zip2': zip2, 'addr1': addr1, 'addr2': addr2,
+        'zip1_2': zip1_2, 'zip2_2': zip2_2, 'addr1_2': addr1_2, 'addr2_2': addr2_2,
+    }
+    card = _msi_page(rng, csrf, '학생카드', CARD_CONTENT.format(
+        photo=photo,
+        student_id=STUDENT['student_id'],
+        name=STUDENT['name'],
+        department=STUDENT['department'],
+        advisor=STUDENT['advisor'],
+        inputs='\n'.join(
+            f'        <div class="flex-table-item"><label for="{name}">{name}</label>'
+            f'<input type="text" id="{name}" name="{name}" value="{value}" class="form-control"></div>'
+            for name, value in contact.items()
+        ),
+    ))
+    changelog = _msi_page(rng, csrf, '학적변동내역', CHANGELOG_CONTENT.format(
+        student_id=STUDENT['student_id'],
+        name=STUDENT['name'],
+        department=STUDENT['department'],
+        rows='\n'.join(
+            '          <tr>' + ''.join(f'<td>{value}</td>' for value in change) + '</tr>' for change in CHANGES
+        ),
+        count=len(CHANGES),
+    ))
+    return {
+        'login': ('login', SSO_LOGIN_URL, login),
+        'redirect': ('redirect', 'https://sso.mju.ac.kr/sso/process/login.do', redirect),
+        'home': ('home', MSI_HOME_URL, home),
+        'student_card': ('student_card', 'https://msi.mju.ac.kr/servlet/su/sum/Sum00Svl01getStdCard', card),
+        'student_changelog': (
+            'student_changelog', 'https://msi.mju.ac.kr/servlet/su/sud/Sud00Svl03viewChangeLog', changelog,
+        ),
+    }
+
+
+def build(version: str, force: bool = False) -> str:
+    directory = os.path.join(CORPUS_DIR, version)
+    if os.path.exists(os.path.join(directory, 'manifest.json')) and not force:
+        raise SystemExit(f"{version} already exists; build a new version or pass --force")
+    os.makedirs(directory, exist_ok=True)
+
+    entries = []
+    for name, (kind, url, html) in build_pages().items():
+        body = html.encode('utf-8')
+        file_name = f'{name}.html'
+        with open(os.path.join(directory, file_name), 'wb') as page_file:
+            page_file.write(body)
+        page = GoldenPage(name=name, kind=kind, url=url, encoding='utf-8', body=body)
+        entries.append({
+            'name': name,
+            'kind': kind,
+            'file': file_name,
+            'url': url,
+            'encoding': 'utf-8',
+            'bytes': len(body),
+            'sha256': hashlib.sha256(body).hexdigest(),
+            'expected': observe(page, REFERENCE_BACKEND),
+        })
+
+    manifest = {'version': version, 'seed': SEED, 'reference_backend': REFERENCE_BACKEND, 'pages': entries}
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file, ensure_ascii=False, indent=2)
+        manifest_file.write('\n')
+    return directory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('version', help="corpus version directory to create, e.g. 'v2'")
+    parser.add_argument('--force', action='store_true', help='overwrite an existing version')
+    args = parser.parse_args()
+    print(build(args.version, args.force))
+
+
+if __name__ == '__main__':
+    main()
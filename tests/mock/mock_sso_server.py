@@ -0,0 +1,293 @@
+"""
+In-process stand-in for sso.mju.ac.kr and the service hosts.
+
+The server hands out a real RSA public key, decrypts the RSA/AES login
+payload exactly like the real SSO would, and tracks sessions with cookies.
+It can be mounted on an ``httpx.AsyncClient`` via :meth:`httpx_transport`.
+
+The MSI host additionally serves the dashboard, the student card page (behind
+the second password prompt) and the change log page, so fetchers can be
+exercised end to end.
+"""
+
+import base64
+import secrets
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from mju_univ_auth.config import SERVICES, MSIEndpoints
+
+SSO_HOST = 'sso.mju.ac.kr'
+LOGIN_ACTION = '/sso/process/login.do'
+INVALID_CREDENTIALS_MESSAGE = '아이디 또는 비밀번호가 일치하지 않습니다.'
+
+LOGIN_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>명지대학교 통합로그인</title></head>
+<body>
+<form id="signin-form" action="{action}" method="post">
+    <input type="hidden" id="public-key" value="{public_key}" />
+    <input type="hidden" id="c_r_t" value="{csrf}" />
+    <input type="text" id="input-userId" name="user_id" />
+    <input type="password" id="input-password" name="pw" />
+</form>
+{script}
+</body></html>
+"""
+
+AUTO_SUBMIT_TEMPLATE = """<html><body onLoad="document.login.submit();">
+<form name="login" action="{action}" method="post">
+    <input type="hidden" name="token" value="{token}">
+</form>
+</body></html>
+"""
+
+SERVICE_HOME_TEMPLATE = """<html><body>
+<div class="header"><a href="/logout">로그아웃</a></div>
+<p>{name}</p>
+</body></html>
+"""
+
+MSI_HOME_TEMPLATE = """<html><head><meta name="_csrf" content="{csrf}" /></head><body>
+<div class="header"><a href="/logout">로그아웃</a></div>
+<div class="main-user-info">
+    <div class="info-cell"><div class="title">소 속 :</div><div class="value">컴퓨터공학과</div></div>
+    <div class="info-cell"><div class="title">구 분 :</div><div class="value">학부생</div></div>
+    <div class="info-cell"><div class="title">학 년 :</div><div class="value">3학년</div></div>
+</div>
+</body></html>
+"""
+
+MSI_PASSWORD_TEMPLATE = """<html><body>
+<form action="/servlet/sys/sys15/Sys15Svl01verifyPW" method="post">
+    <input type="hidden" name="originalurl" value="{original_url}">
+    <input type="password" name="tfpassword">
+</form>
+</body></html>
+"""
+
+MSI_REDIRECT_TEMPLATE = """<html><body onLoad="document.f.submit();">
+<form name="f" action="{action}" method="post">
+    <input type="hidden" name="_csrf" value="{csrf}">
+</form>
+</body></html>
+"""
+
+MSI_STUDENT_CARD_TEMPLATE = """<html><body>
+<div class="card-item basic">
+<div id="pictureInclude">
+    <img src="data:image/jpg;base64,FAKEDATA" />
+    <div class="flex-table">
+        <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">{user_id}</div></div>
+        <div class="flex-table-item"><div class="item-title">한글성명</div><div class="item-data">김명지</div></div>
+        <div class="flex-table-item"><div class="item-title">학년</div><div class="item-data">3학년</div></div>
+    </div>
+</div>
+<hr />
+<div class="flex-table">
+    <input name="nm_eng" value="KIM" /><input name="nm_eng2" value="MYONGJI" />
+    <input name="std_tel" value="02-123-4567" /><input name="htel" value="010-1234-5678" />
+    <input name="email" value="{user_id}@mju.ac.kr" />
+    <input name="zip1" value="123" /><input name="zip2" value="456" />
+    <input name="addr1" value="서울특별시" /><input name="addr2" value="서대문구" />
+    <input name="zip1_2" value="111" /><input name="zip2_2" value="222" />
+    <input name="addr1_2" value="경기도" /><input name="addr2_2" value="용인시" />
+</div>
+</div>
+</body></html>
+"""
+
+MSI_CHANGELOG_TEMPLATE = """<html><body>
+<div class="card-item basic">
+    <div class="flex-table">
+        <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">{user_id}</div></div>
+        <div class="flex-table-item"><div class="item-title">학적상태</div><div class="item-data">재학</div></div>
+    </div>
+</div>
+<div class="card-item basic">
+    <div class="data-title small">누적학기 : <span>총 2학기</span></div>
+    <div class="read-table"><table><tbody>
+        <tr><td>2023</td><td>1학기</td><td>군입대휴학</td><td>2023-01-10</td><td>2025-02-28</td><td></td></tr>
+    </tbody></table></div>
+</div>
+</body></html>
+"""
+
+
+@dataclass
+class MockResponse:
+    status: int
+    body: str
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class MockSSOServer:
+    """Cookie based SSO + service hosts, keyed by user_id -> password."""
+
+    def __init__(self, accounts: Dict[str, str], rsa_key_size: int = 2048, home_padding: int = 0):
+        self.accounts = dict(accounts)
+        self.home_padding = home_padding   # extra bytes appended to service home pages (benchmarks)
+        self._private_key = rsa.generate_private_key(public_exponent=65537, key_size=rsa_key_size)
+        der = self._private_key.public_key().public_bytes(
+            serialization.Encoding.DER,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        self.public_key = base64.b64encode(der).decode('ascii')
+        self._pending: Dict[str, str] = {}        # sso pre-login cookie -> client_id
+        self._sso_sessions: Dict[str, str] = {}   # sso cookie -> user_id
+        self._tokens: Dict[str, Tuple[str, str]] = {}   # one-time token -> (user_id, client_id)
+        self._service_sessions: Dict[str, str] = {}     # service cookie -> user_id
+        self._msi_csrf: Dict[str, str] = {}             # msi service cookie -> csrf token
+        self._msi_verified: Set[str] = set()            # msi service cookies past the 2nd password
+        self.requests: List[Tuple[str, str]] = []
+        self.login_posts = 0
+
+    # ------------------------------------------------------------------ helpers
+    @staticmethod
+    def _client_for_host(host: str) -> Optional[str]:
+        for client_id, config in SERVICES.items():
+            if urlparse(config.final_url).netloc == host:
+                return client_id
+        return None
+
+    def expire_service_sessions(self) -> None:
+        """Forget every service-side session (the SSO sessions stay valid)."""
+        self._service_sessions.clear()
+        self._msi_csrf.clear()
+        self._msi_verified.clear()
+
+    def expire_sso_sessions(self) -> None:
+        self._sso_sessions.clear()
+
+    def _decrypt_password(self, form: Dict[str, str]) -> Optional[str]:
+        try:
+            payload = self._private_key.decrypt(base64.b64decode(form['encsymka']), padding.PKCS1v15())
+            key_str = payload.decode('utf-8').split(',')[0]
+            kdf = PBKDF2HMAC(algorithm=hashes.SHA1(), length=32, salt=key_str[-16:].encode('utf-8'), iterations=1024)
+            key = kdf.derive(key_str.encode('utf-8'))
+            decryptor = Cipher(algorithms.AES(key), modes.CBC(key[-16:])).decryptor()
+            padded = decryptor.update(base64.b64decode(form['pw_enc'])) + decryptor.finalize()
+            return base64.b64decode(padded[:-padded[-1]]).decode('utf-8')
+        except Exception:
+            return None
+
+    def _login_page(self, client_id: str, error: Optional[str] = None) -> MockResponse:
+        pending = secrets.token_hex(8)
+        self._pending[pending] = client_id
+        script = ''
+        if error:
+            escaped = error.encode('unicode_escape').decode('latin-1')
+            script = f"<script>alert('{escaped}');</script>"
+        body = LOGIN_PAGE_TEMPLATE.format(
+            action=LOGIN_ACTION, public_key=self.public_key, csrf=secrets.token_hex(8), script=script,
+        )
+        return MockResponse(200, body, [('Set-Cookie', f'SSO_PENDING={pending}; Domain={SSO_HOST}; Path=/')])
+
+    def _auto_submit(self, user_id: str, client_id: str) -> str:
+        token = secrets.token_hex(8)
+        self._tokens[token] = (user_id, client_id)
+        return AUTO_SUBMIT_TEMPLATE.format(action=SERVICES[client_id].final_url, token=token)
+
+    def _service_home(self, client_id: str, service_cookie: str) -> MockResponse:
+        padding = f"<!-- {'x' * self.home_padding} -->" if self.home_padding else ''
+        if client_id != 'msi':
+            return MockResponse(200, SERVICE_HOME_TEMPLATE.format(name=SERVICES[client_id].name) + padding)
+        csrf = self._msi_csrf.setdefault(service_cookie, secrets.token_hex(8))
+        return MockResponse(200, MSI_HOME_TEMPLATE.format(csrf=csrf) + padding)
+
+    def _msi_page(self, url: str, method: str, service_cookie: str, form: Dict[str, str]) -> MockResponse:
+        user_id = self._service_sessions[service_cookie]
+        csrf = self._msi_csrf.get(service_cookie)
+        if method != 'POST' or csrf is None or form.get('_csrf') != csrf:
+            return MockResponse(403, 'invalid csrf')
+
+        if url == MSIEndpoints.STUDENT_CARD:
+            if service_cookie not in self._msi_verified:
+                return MockResponse(200, MSI_PASSWORD_TEMPLATE.format(original_url=MSIEndpoints.STUDENT_CARD))
+            return MockResponse(200, MSI_STUDENT_CARD_TEMPLATE.format(user_id=user_id))
+
+        if url == MSIEndpoints.PASSWORD_VERIFY:
+            if self.accounts.get(user_id) != form.get('tfpassword'):
+                return MockResponse(200, MSI_PASSWORD_TEMPLATE.format(original_url=MSIEndpoints.STUDENT_CARD))
+            self._msi_verified.add(service_cookie)
+            return MockResponse(200, MSI_REDIRECT_TEMPLATE.format(action=MSIEndpoints.STUDENT_CARD, csrf=csrf))
+
+        if url == MSIEndpoints.CHANGE_LOG:
+            return MockResponse(200, MSI_CHANGELOG_TEMPLATE.format(user_id=user_id))
+
+        return MockResponse(404, 'not found')
+
+    # ------------------------------------------------------------------ routing
+    def handle(self, method: str, url: str, cookies: Dict[str, str], form: Dict[str, str]) -> MockResponse:
+        parsed = urlparse(url)
+        self.requests.append((method, url))
+
+        if parsed.netloc == SSO_HOST and parsed.path == '/sso/auth':
+            client_id = parse_qs(parsed.query).get('client_id', ['www'])[0]
+            client_id = 'main' if client_id == 'www' else client_id
+            user_id = self._sso_sessions.get(cookies.get('SSO_SESSION', ''))
+            if user_id:
+                return MockResponse(200, self._auto_submit(user_id, client_id))
+            return self._login_page(client_id)
+
+        if parsed.netloc == SSO_HOST and parsed.path == LOGIN_ACTION and method == 'POST':
+            self.login_posts += 1
+            client_id = self._pending.pop(cookies.get('SSO_PENDING', ''), None)
+            user_id = form.get('user_id', '')
+            password = self._decrypt_password(form)
+            if client_id is None or password is None or self.accounts.get(user_id) != password:
+                return self._login_page(client_id or 'msi', error=INVALID_CREDENTIALS_MESSAGE)
+            sso_cookie = secrets.token_hex(8)
+            self._sso_sessions[sso_cookie] = user_id
+            return MockResponse(
+                200,
+                self._auto_submit(user_id, client_id),
+                [('Set-Cookie', f'SSO_SESSION={sso_cookie}; Domain={SSO_HOST}; Path=/')],
+            )
+
+        client_id = self._client_for_host(parsed.netloc)
+        if client_id is not None:
+            config = SERVICES[client_id]
+            if method == 'POST' and 'token' in form:
+                user_id, token_client = self._tokens.pop(form['token'], (None, None))
+                if user_id is None or token_client != client_id:
+                    return MockResponse(403, 'invalid token')
+                service_cookie = secrets.token_hex(8)
+                self._service_sessions[service_cookie] = user_id
+                response = self._service_home(client_id, service_cookie)
+                response.headers.append(
+                    ('Set-Cookie', f'SERVICE_SESSION={service_cookie}; Domain={parsed.netloc}; Path=/')
+                )
+                return response
+            service_cookie = cookies.get('SERVICE_SESSION', '')
+            if service_cookie in self._service_sessions:
+                if client_id == 'msi' and parsed.path != urlparse(config.final_url).path:
+                    return self._msi_page(url, method, service_cookie, form)
+                return self._service_home(client_id, service_cookie)
+            return MockResponse(302, '', [('Location', config.auth_url)])
+
+        return MockResponse(404, 'not found')
+
+    # ------------------------------------------------------------------ adapters
+    def httpx_transport(self):
+        import httpx
+
+        def handler(request: 'httpx.Request') -> 'httpx.Response':
+            cookie = SimpleCookie()
+            cookie.load(request.headers.get('cookie', ''))
+            cookies = {name: morsel.value for name, morsel in cookie.items()}
+            form = {k: v[0] for k, v in parse_qs(request.content.decode('utf-8')).items()} if request.content else {}
+            response = self.handle(request.method, str(request.url), cookies, form)
+            return httpx.Response(
+                response.status,
+                headers=[('Content-Type', 'text/html; charset=utf-8')] + response.headers,
+                content=response.body.encode('utf-8'),
+            )
+
+        return httpx.MockTransport(handler)
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from mju_univ_auth import (
+    AsyncMjuUnivAuth,
+    AsyncStudentCardFetcher,
+    ErrorCode,
+    StudentCard,
+    StudentChangeLog,
+    StudentBasicInfo,
+)
+from mju_univ_auth.authenticator import async_standard_authenticator
+from tests.mock.mock_sso_server import MockSSOServer
+
+ACCOUNTS = {f'6020{i:04d}': f'pw-{i}' for i in range(20)}
+
+
+@pytest.fixture
+def server():
+    return MockSSOServer(ACCOUNTS)
+
+
+@pytest.fixture(autouse=True)
+def mock_sso(server, monkeypatch):
+    """Routes every client created by the authenticator to the mock SSO server."""
+    monkeypatch.setattr(
+        async_standard_authenticator,
+        'create_async_client',
+        lambda: httpx.AsyncClient(transport=server.httpx_transport(), follow_redirects=True),
+    )
+
+
+def test_async_facade_fetches_all_msi_data():
+    async def scenario():
+        async with AsyncMjuUnivAuth(user_id='60200001', user_pw='pw-1') as auth:
+            await auth.login('msi')
+            return (
+                await auth.get_student_basicinfo(),
+                await auth.get_student_card(),
+                await auth.get_student_changelog(),
+            )
+
+    basicinfo, card, changelog = asyncio.run(scenario())
+
+    assert basicinfo.success and isinstance(basicinfo.data, StudentBasicInfo)
+    assert basicinfo.data.department == '컴퓨터공학과'
+    assert card.success and isinstance(card.data, StudentCard)
+    assert card.data.student_profile.student_id == '60200001'
+    assert card.data.personal_contact.email == '60200001@mju.ac.kr'
+    assert changelog.success and isinstance(changelog.data, StudentChangeLog)
+    assert changelog.data.change_log_list[0].change_type == '군입대휴학'
+
+
+def test_async_facade_without_login_returns_session_not_exist():
+    result = asyncio.run(AsyncMjuUnivAuth(user_id='60200001', user_pw='pw-1').get_student_card())
+
+    assert result.error_code == ErrorCode.SESSION_NOT_EXIST_ERROR
+
+
+def test_async_facade_propagates_login_failure():
+    async def scenario():
+        auth = await AsyncMjuUnivAuth(user_id='60200001', user_pw='wrong').login('msi')
+        return await auth.get_student_card()
+
+    result = asyncio.run(scenario())
+
+    assert result.error_code == ErrorCode.INVALID_CREDENTIALS_ERROR
+    assert result.credentials_valid is False
+
+
+def test_async_facade_rejects_non_msi_session():
+    async def scenario():
+        async with AsyncMjuUnivAuth(user_id='60200001', user_pw='pw-1') as auth:
+            await auth.login('lms')
+            return await auth.get_student_changelog()
+
+    result = asyncio.run(scenario())
+
+    assert result.error_code == ErrorCode.INVALID_SERVICE_USAGE_ERROR
+
+
+def test_async_facade_reports_expired_session(server):
+    async def scenario():
+        async with AsyncMjuUnivAuth(user_id='60200001', user_pw='pw-1') as auth:
+            await auth.login('msi')
+            server.expire_service_sessions()
+            server.expire_sso_sessions()
+            return await auth.get_student_card()
+
+    result = asyncio.run(scenario())
+
+    assert result.error_code == ErrorCode.SESSION_EXPIRED_ERROR
+
+
+def test_async_facade_silently_reauthenticates_expired_service_session(server):
+    async def scenario():
+        async with AsyncMjuUnivAuth(user_id='60200001', user_pw='pw-1') as auth:
+            await auth.login('msi')
+            posts = server.login_posts
+            server.expire_service_sessions()
+            result = await auth.get_student_card()
+            return result, server.login_posts - posts
+
+    result, extra_posts = asyncio.run(scenario())
+
+    assert result.success
+    assert isinstance(result.data, StudentCard)
+    assert extra_posts == 0
+
+
+def test_async_fetcher_wrong_second_password():
+    async def scenario():
+        async with AsyncMjuUnivAuth(user_id='60200001', user_pw='pw-1') as auth:
+            await auth.login('msi')
+            fetcher = AsyncStudentCardFetcher(session=auth.session, user_pw='wrong')
+            return await fetcher.fetch()
+
+    result = asyncio.run(scenario())
+
+    assert result.error_code == ErrorCode.INVALID_CREDENTIALS_ERROR
+    assert result.request_succeeded is True
+
+
+def test_async_fetcher_network_error():
+    def failing(request):
+        raise httpx.ReadTimeout('timeout', request=request)
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(failing)) as client:
+            return await AsyncStudentCardFetcher(session=client, user_pw='pw-1').fetch()
+
+    result = asyncio.run(scenario())
+
+    assert result.error_code == ErrorCode.NETWORK_ERROR
+
+
+def test_concurrent_card_fetches_on_one_event_loop():
+    async def fetch_card(user_id, user_pw):
+        async with AsyncMjuUnivAuth(user_id=user_id, user_pw=user_pw) as auth:
+            await auth.login('msi')
+            return await auth.get_student_card()
+
+    async def scenario():
+        return await asyncio.gather(*(fetch_card(uid, pw) for uid, pw in ACCOUNTS.items()))
+
+    results = asyncio.run(scenario())
+
+    assert all(result.success for result in results)
+    assert [r.data.student_profile.student_id for r in results] == list(ACCOUNTS)
@@ -0,0 +1,169 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from mju_univ_auth import AsyncStandardAuthenticator, ErrorCode
+from mju_univ_auth.authenticator import async_standard_authenticator
+from mju_univ_auth.config import SERVICES
+from tests.mock.mock_sso_server import MockSSOServer, INVALID_CREDENTIALS_MESSAGE
+
+ACCOUNTS = {f'6020{i:04d}': f'pw-{i}' for i in range(50)}
+
+
+@pytest.fixture(scope='module')
+def server():
+    return MockSSOServer(ACCOUNTS)
+
+
+@pytest.fixture(autouse=True)
+def mock_sso(server, monkeypatch):
+    """Routes every client created by the authenticator to the mock SSO server."""
+    monkeypatch.setattr(
+        async_standard_authenticator,
+        'create_async_client',
+        lambda: httpx.AsyncClient(transport=server.httpx_transport(), follow_redirects=True),
+    )
+
+
+def test_async_login_success():
+    async def scenario():
+        auth = AsyncStandardAuthenticator(user_id='60200001', user_pw='pw-1')
+        result = await auth.login('msi')
+        valid = await auth.is_session_valid('msi')
+        await auth.aclose()
+        return result, valid
+
+    result, valid = asyncio.run(scenario())
+
+    assert result.success
+    assert isinstance(result.data, httpx.AsyncClient)
+    assert valid is True
+
+
+def test_async_login_invalid_credentials():
+    auth = AsyncStandardAuthenticator(user_id='60200001', user_pw='wrong')
+    result = asyncio.run(auth.login('msi'))
+
+    assert not result.success
+    assert result.request_succeeded is True
+    assert result.credentials_valid is False
+    assert result.error_code == ErrorCode.INVALID_CREDENTIALS_ERROR
+    assert INVALID_CREDENTIALS_MESSAGE in result.error_message
+    assert auth.session is None
+
+
+def test_async_login_unknown_service():
+    auth = AsyncStandardAuthenticator(user_id='60200001', user_pw='pw-1')
+    result = asyncio.run(auth.login('unknown'))
+
+    assert result.error_code == ErrorCode.SERVICE_NOT_FOUND_ERROR
+
+
+def test_async_login_network_error(monkeypatch):
+    def failing(request):
+        raise httpx.ConnectTimeout('timeout', request=request)
+
+    monkeypatch.setattr(
+        async_standard_authenticator,
+        'create_async_client',
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(failing)),
+    )
+    auth = AsyncStandardAuthenticator(user_id='60200001', user_pw='pw-1')
+    result = asyncio.run(auth.login('msi'))
+
+    assert result.error_code == ErrorCode.NETWORK_ERROR
+    assert '로그인 페이지 접속 실패' in result.error_message
+
+
+def test_many_concurrent_logins_on_one_event_loop():
+    async def scenario():
+        auths = [AsyncStandardAuthenticator(user_id=uid, user_pw=pw) for uid, pw in ACCOUNTS.items()]
+        results = await asyncio.gather(*(auth.login('msi') for auth in auths))
+        for auth in auths:
+            await auth.aclose()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == len(ACCOUNTS)
+    assert all(result.success for result in results)
+
+
+def test_same_user_concurrent_logins_share_one_sso_round_trip(server):
+    async def scenario():
+        posts_before = server.login_posts
+        auths = [AsyncStandardAuthenticator(user_id='60200002', user_pw='pw-2') for _ in range(10)]
+        results = await asyncio.gather(*(auth.login('msi') for auth in auths))
+        posts = server.login_posts - posts_before
+
+        client = results[0].data
+        for auth in auths[:-1]:
+            await auth.aclose()
+        closed_early = client.is_closed
+        await auths[-1].aclose()
+        return results, posts, closed_early, client.is_closed
+
+    results, posts, closed_early, closed_last = asyncio.run(scenario())
+
+    assert posts == 1
+    assert all(result.success and result.data is results[0].data for result in results)
+    assert closed_early is False
+    assert closed_last is True
+
+
+def test_async_verify_credentials_does_not_create_service_session(server):
+    async def scenario():
+        auth = AsyncStandardAuthenticator(user_id='60200002', user_pw='pw-2')
+        login = await auth.login('msi')
+        await auth.aclose()
+
+        server.requests.clear()
+        verified = await AsyncStandardAuthenticator(user_id='60200002', user_pw='pw-2').verify_credentials('msi')
+        service_requests = [url for _, url in server.requests if 'sso.mju.ac.kr' not in url]
+        rejected = await AsyncStandardAuthenticator(user_id='60200002', user_pw='wrong').verify_credentials('msi')
+        return login, auth.login_stats, verified, service_requests, rejected
+
+    login, login_stats, verified, service_requests, rejected = asyncio.run(scenario())
+
+    assert login.success and verified.success
+    assert service_requests == []
+    assert verified.data.round_trips < login_stats.round_trips
+    assert verified.data.bytes_received < login_stats.bytes_received
+    assert rejected.error_code == ErrorCode.INVALID_CREDENTIALS_ERROR
+
+
+def test_async_login_services_single_sso_login(server):
+    async def scenario():
+        posts_before = server.login_posts
+        auth = AsyncStandardAuthenticator(user_id='60200003', user_pw='pw-3')
+        results = await auth.login_services(['msi', 'lms', 'portal'])
+        homes = {}
+        for service, result in results.items():
+            response = await result.data.get(SERVICES[service].final_url)
+            homes[service] = response.text
+        for service in ('lms', 'portal'):
+            await results[service].data.aclose()
+        await auth.aclose()
+        return results, homes, server.login_posts - posts_before
+
+    results, homes, posts = asyncio.run(scenario())
+
+    assert all(result.success for result in results.values())
+    assert posts == 1
+    assert all('로그아웃' in html for html in homes.values())
+
+
+def test_async_stream_pages_login_and_session_check():
+    async def scenario():
+        auth = AsyncStandardAuthenticator(user_id='60200002', user_pw='pw-2', stream_pages=True)
+        result = await auth.login('msi')
+        valid = await auth.is_session_valid('msi')
+        await auth.aclose()
+        return result, valid
+
+    result, valid = asyncio.run(scenario())
+
+    assert result.success
+    assert valid is True
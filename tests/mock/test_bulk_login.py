@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mju_univ_auth import ErrorCode, login_many
+from mju_univ_auth.authenticator.standard_authenticator import StandardAuthenticator
+from mju_univ_auth.exceptions import InvalidCredentialsError
+
+
+@pytest.fixture
+def fake_login(monkeypatch):
+    """Replaces the SSO round trips with a short sleep and tracks concurrency."""
+    state = {'active': 0, 'peak': 0, 'calls': 0}
+    lock = threading.Lock()
+
+    def fake_execute_login(self, session, service):
+        with lock:
+            state['active'] += 1
+            state['calls'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        try:
+            time.sleep(0.01)
+            if self._user_pw != 'ok':
+                raise InvalidCredentialsError('invalid')
+        finally:
+            with lock:
+                state['active'] -= 1
+
+    monkeypatch.setattr(StandardAuthenticator, '_execute_login', fake_execute_login)
+    return state
+
+
+def test_login_many_yields_every_result_with_bounded_concurrency(fake_login):
+    credentials = [(f'6020{i:04d}', 'ok' if i % 3 else 'bad') for i in range(40)]
+
+    results = dict(login_many(credentials, concurrency=4))
+
+    assert set(results) == {user_id for user_id, _ in credentials}
+    assert fake_login['peak'] <= 4
+    assert results['60200001'].success
+    assert results['60200000'].error_code == ErrorCode.INVALID_CREDENTIALS_ERROR
+
+
+def test_login_many_pulls_credentials_lazily(fake_login):
+    pulled = []
+
+    def credentials():
+        for i in range(1000):
+            pulled.append(i)
+            yield f'6020{i:04d}', 'ok'
+
+    stream = login_many(credentials(), concurrency=5)
+    first = [next(stream) for _ in range(3)]
+    stream.close()
+
+    assert len(first) == 3
+    assert len(pulled) <= 3 + 5
+    assert fake_login['calls'] <= 3 + 5
+
+
+def test_login_many_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        next(login_many([('60200001', 'ok')], concurrency=0))
+
+
+def test_alogin_many_against_mock_sso(monkeypatch):
+    httpx = pytest.importorskip('httpx')
+    from mju_univ_auth import alogin_many
+    from mju_univ_auth.authenticator import async_standard_authenticator
+    from tests.mock.mock_sso_server import MockSSOServer
+
+    accounts = {f'6020{i:04d}': f'pw-{i}' for i in range(30)}
+    server = MockSSOServer(accounts)
+    monkeypatch.setattr(
+        async_standard_authenticator,
+        'create_async_client',
+        lambda: httpx.AsyncClient(transport=server.httpx_transport(), follow_redirects=True),
+    )
+
+    async def credentials():
+        for user_id, user_pw in accounts.items():
+            yield user_id, user_pw if user_id != '60200007' else 'wrong'
+
+    async def scenario():
+        return {user_id: result async for user_id, result in alogin_many(credentials(), concurrency=8)}
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == len(accounts)
+    assert results['60200007'].error_code == ErrorCode.INVALID_CREDENTIALS_ERROR
+    assert sum(result.success for result in results.values()) == len(accounts) - 1
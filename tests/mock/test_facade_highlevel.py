@@ -23,7 +23,7 @@ def test_get_student_card_success(monkeypatch):
     # Mock the fetcher's fetch method
     expected_card = StudentCard(student_profile=StudentProfile(student_id='20200001', name_korean='홍길동'))
     mock_result = MjuUnivAuthResult(request_succeeded=True, credentials_valid=True, data=expected_card)
-    monkeypatch.setattr(StudentCardFetcher, 'fetch', lambda self: mock_result)
+    monkeypatch.setattr(StudentCardFetcher, 'fetch', lambda self, fields=None: mock_result)
 
     # Call the method
     result = auth.get_student_card()
@@ -65,7 +65,7 @@ def test_get_student_changelog_success(monkeypatch):
     # Mock the fetcher's fetch method
     expected_changelog = StudentChangeLog(academic_status=AcademicStatus(student_id='20200001', name='홍길동'))
     mock_result = MjuUnivAuthResult(request_succeeded=True, credentials_valid=True, data=expected_changelog)
-    monkeypatch.setattr(StudentChangeLogFetcher, 'fetch', lambda self: mock_result)
+    monkeypatch.setattr(StudentChangeLogFetcher, 'fetch', lambda self, fields=None: mock_result)
 
     # Call the method
     result = auth.get_student_changelog()
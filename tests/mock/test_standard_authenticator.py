@@ -1,5 +1,6 @@
 import pytest
 import requests
+from urllib.parse import parse_qs
 import requests_mock
 from mju_univ_auth.authenticator.standard_authenticator import StandardAuthenticator
 from mju_univ_auth.config import SERVICES
@@ -164,4 +165,170 @@ def test_is_session_valid_failure(auth, requests_mock):
 
 def test_is_session_valid_no_session(auth):
     """Tests when no session exists on the authenticator."""
-    assert auth.is_session_valid('msi') is False
\ No newline at end of file
+    assert auth.is_session_valid('msi') is False
+
+def test_verify_credentials_skips_service_requests(auth, requests_mock):
+    """Verification stops at the SSO login response and never touches the service host."""
+    service_config = SERVICES['msi']
+    requests_mock.get(service_config.auth_url, text=LOGIN_PAGE_HTML)
+    requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do",
+                       text=REDIRECT_FORM_HTML.format(final_url=service_config.final_url))
+    final = requests_mock.post(service_config.final_url, text=FINAL_PAGE_HTML)
+
+    result = auth.verify_credentials('msi')
+
+    assert result.success
+    assert result.data.round_trips == 2
+    assert result.data.skipped_url == service_config.final_url
+    assert not final.called
+    assert auth.session is None
+
+
+def test_verify_credentials_invalid(auth, requests_mock):
+    """Rejected credentials are reported like a failed login."""
+    requests_mock.get(SERVICES['msi'].auth_url, text=LOGIN_PAGE_HTML)
+    requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do", text=INVALID_CRED_HTML)
+
+    result = auth.verify_credentials('msi')
+
+    assert result.request_succeeded is True
+    assert result.credentials_valid is False
+
+
+def test_login_services_reuses_sso_session(auth, requests_mock):
+    """Only the first service posts credentials; the others follow the SSO redirect chain."""
+    msi, lms = SERVICES['msi'], SERVICES['lms']
+    requests_mock.get(msi.auth_url, text=LOGIN_PAGE_HTML)
+    login_post = requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do",
+                                    text=REDIRECT_FORM_HTML.format(final_url=msi.final_url))
+    requests_mock.post(msi.final_url, text=FINAL_PAGE_HTML)
+    requests_mock.get(lms.auth_url, text=REDIRECT_FORM_HTML.format(final_url=lms.final_url))
+    requests_mock.post(lms.final_url, text=FINAL_PAGE_HTML)
+
+    results = auth.login_services(['msi', 'lms', 'unknown'])
+
+    assert list(results) == ['msi', 'lms', 'unknown']
+    assert results['msi'].success and results['lms'].success
+    assert results['lms'].data is not results['msi'].data
+    assert results['unknown'].error_code.value == 'SERVICE_NOT_FOUND_ERROR'
+    assert login_post.call_count == 1
+    assert auth.session is results['msi'].data
+
+
+def test_login_services_propagates_credential_failure(auth, requests_mock):
+    """A rejected SSO login fails every requested service without further requests."""
+    requests_mock.get(SERVICES['msi'].auth_url, text=LOGIN_PAGE_HTML)
+    requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do", text=INVALID_CRED_HTML)
+
+    results = auth.login_services(['msi', 'lms'])
+
+    assert not results['msi'].success and not results['lms'].success
+    assert results['lms'].credentials_valid is False
+    assert requests_mock.call_count == 2
+
+
+def test_login_services_falls_back_to_one_login_post_per_expired_handoff(auth, requests_mock):
+    """Handoffs that hit the login form post credentials one at a time, each with its own page's token."""
+    msi = SERVICES['msi']
+    services = {'lms': SERVICES['lms'], 'portal': SERVICES['portal']}
+    requests_mock.get(msi.auth_url, text=LOGIN_PAGE_HTML)
+    requests_mock.post(msi.final_url, text=FINAL_PAGE_HTML)
+    final_urls = {'dummycsrftoken': msi.final_url}
+    for name, config in services.items():
+        final_urls[f'token-{name}'] = config.final_url
+        requests_mock.get(config.auth_url, text=LOGIN_PAGE_HTML.replace('dummycsrftoken', f'token-{name}'))
+        requests_mock.post(config.final_url, text=FINAL_PAGE_HTML)
+
+    def login_post(request, context):
+        token = parse_qs(request.text)['c_r_t'][0]
+        return REDIRECT_FORM_HTML.format(final_url=final_urls[token])
+
+    requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do", text=login_post)
+
+    results = auth.login_services(['msi', *services])
+
+    assert all(result.success for result in results.values())
+    posts = [r for r in requests_mock.request_history if r.url.endswith('/sso/process/login.do')]
+    assert [parse_qs(post.text)['c_r_t'][0] for post in posts] == ['dummycsrftoken', 'token-lms', 'token-portal']
+    for name, config in services.items():
+        page_fetches = [r for r in requests_mock.request_history if r.url == config.auth_url]
+        assert len(page_fetches) == 2   # parallel handoff without fallback, then the sequential login
+
+
+def test_reauthenticate_follows_sso_redirect_chain_only(auth, requests_mock):
+    """An expired service session is refreshed without posting credentials again."""
+    msi = SERVICES['msi']
+    requests_mock.get(msi.auth_url, text=REDIRECT_FORM_HTML.format(final_url=msi.final_url))
+    requests_mock.post(msi.final_url, text=FINAL_PAGE_HTML)
+    login_post = requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do", text=FINAL_PAGE_HTML)
+    session = requests.Session()
+
+    result = auth.reauthenticate(session, 'msi')
+
+    assert result.success
+    assert result.data is session and auth.session is session
+    assert not login_post.called
+
+
+def test_reauthenticate_without_fallback_reports_expired_sso_session(auth, requests_mock):
+    """When the SSO session is gone too, reauthentication can refuse to post credentials."""
+    requests_mock.get(SERVICES['msi'].auth_url, text=LOGIN_PAGE_HTML)
+
+    result = auth.reauthenticate(requests.Session(), 'msi', login_fallback=False)
+
+    assert result.error_code.value == 'SESSION_EXPIRED_ERROR'
+    assert requests_mock.call_count == 1
+
+
+def test_password_material_is_derived_while_login_page_is_fetched(auth, requests_mock):
+    """Session-key derivation starts before the login page arrives and feeds the login POST."""
+    service_config = SERVICES['msi']
+    started_before_page = []
+
+    def login_page(request, context):
+        started_before_page.append(auth._password_material is not None)
+        return LOGIN_PAGE_HTML
+
+    requests_mock.get(service_config.auth_url, text=login_page)
+    login_post = requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do",
+                                    text=REDIRECT_FORM_HTML.format(final_url=service_config.final_url))
+    requests_mock.post(service_config.final_url, text=FINAL_PAGE_HTML)
+
+    assert auth.login('msi').success
+    assert started_before_page == [True]
+    assert 'pw_enc=encrypted_aes_data' in login_post.last_request.text
+    assert auth._password_material is None
+
+
+def test_stream_pages_reads_login_page_only_up_to_the_needed_fields(requests_mock):
+    """With stream_pages the login page is read until public-key, c_r_t and the form action appear."""
+    service_config = SERVICES['msi']
+    long_login_page = LOGIN_PAGE_HTML + '<p>약관</p>' * 20000
+    auth = StandardAuthenticator(user_id="testuser", user_pw="testpass", stream_pages=True)
+    requests_mock.get(service_config.auth_url, text=long_login_page)
+    requests_mock.post("https://sso.mju.ac.kr/sso/process/login.do",
+                       text=REDIRECT_FORM_HTML.format(final_url=service_config.final_url))
+    requests_mock.post(service_config.final_url, text=FINAL_PAGE_HTML)
+
+    assert auth.login('msi').success
+    assert auth.login_stats.bytes_received < len(long_login_page.encode('utf-8')) // 10
+
+
+@pytest.mark.parametrize("url, body, expected", [
+    (SERVICES['msi'].final_url, FINAL_PAGE_HTML + '<p>x</p>' * 5000, True),
+    (SERVICES['msi'].final_url, LOGIN_PAGE_HTML + '<p>x</p>' * 5000, False),
+    (SERVICES['msi'].auth_url, LOGIN_PAGE_HTML + '<a>로그아웃</a>', False),
+])
+def test_stream_pages_session_check_matches_full_read(requests_mock, url, body, expected):
+    """Streaming session checks reach the same decision as reading the whole page."""
+    if url == SERVICES['msi'].final_url:
+        requests_mock.get(url, text=body)
+    else:
+        # The service redirects an expired session to the SSO login page
+        requests_mock.get(SERVICES['msi'].final_url, status_code=302, headers={'Location': url})
+        requests_mock.get(url, text=body)
+
+    for stream_pages in (False, True):
+        auth = StandardAuthenticator(user_id="testuser", user_pw="testpass", stream_pages=stream_pages)
+        auth._session = requests.Session()
+        assert auth.is_session_valid('msi') is expected
@@ -80,4 +80,17 @@ def test_student_card_fetcher_parse_error(mock_fetcher, monkeypatch):
     # Assert
     assert not result.success
     assert result.error_code == 'PARSING_ERROR'
-    assert '학생 프로필 테이블을 찾을 수 없습니다' in result.error_message
\ No newline at end of file
+    assert '학생 프로필 테이블을 찾을 수 없습니다' in result.error_message
+
+@pytest.mark.parametrize("encoding", ['utf-8', 'euc-kr'])
+def test_student_card_fetcher_parses_raw_bytes(mock_fetcher, monkeypatch, encoding):
+    """The page body is parsed as bytes in the response's declared encoding, without decoding to str first."""
+    response = MagicMock(content=STUDENT_CARD_HTML.encode(encoding),
+                         headers={'Content-Type': f'text/html; charset={encoding}'})
+    monkeypatch.setattr(mock_fetcher, '_access_student_card_page', lambda: mock_fetcher._read_body(response))
+
+    result = mock_fetcher.fetch()
+
+    assert result.success
+    assert result.data.student_profile.name_korean == '김명지'
+    assert result.data.personal_contact.resident_registration_address.address == '경기도 용인시'
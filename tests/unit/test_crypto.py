@@ -0,0 +1,110 @@
+import base64
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from mju_univ_auth.infrastructure.crypto import (
+    RSA_KEY_CACHE_SIZE,
+    clear_rsa_key_cache,
+    encrypt_passwords,
+    encrypt_with_aes,
+    encrypt_with_rsa,
+    generate_session_key,
+    rsa_key_cache_info,
+)
+
+
+def _key_pair():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=1024)
+    der = private_key.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_key, base64.b64encode(der).decode('ascii')
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_rsa_key_cache()
+    yield
+    clear_rsa_key_cache()
+
+
+def test_public_key_is_loaded_once_per_key():
+    private_key, public_key = _key_pair()
+
+    ciphertexts = [encrypt_with_rsa(f"key,{i}", public_key) for i in range(3)]
+
+    info = rsa_key_cache_info()
+    assert (info.misses, info.hits, info.currsize) == (1, 2, 1)
+    for i, ciphertext in enumerate(ciphertexts):
+        assert private_key.decrypt(base64.b64decode(ciphertext), padding.PKCS1v15()) == f"key,{i}".encode()
+
+
+def test_rotated_key_is_cached_separately_and_cache_is_bounded():
+    keys = [_key_pair()[1] for _ in range(RSA_KEY_CACHE_SIZE + 1)]
+    for public_key in keys:
+        encrypt_with_rsa("data", public_key)
+
+    info = rsa_key_cache_info()
+    assert info.misses == RSA_KEY_CACHE_SIZE + 1
+    assert info.currsize == RSA_KEY_CACHE_SIZE
+
+
+def test_invalid_key_is_not_cached():
+    with pytest.raises(ValueError):
+        encrypt_with_rsa("data", "not-a-key")
+    assert rsa_key_cache_info().currsize == 0
+
+
+def test_batch_is_byte_identical_to_one_by_one_encryption():
+    private_key, public_key = _key_pair()
+    passwords = ['pw-0', '비밀번호-1', 'x' * 40, '']
+    key_infos = [generate_session_key(32) for _ in passwords]
+    timestamps = [str(1700000000000 + i) for i in range(len(passwords))]
+
+    batch = encrypt_passwords(passwords, public_key, key_infos=key_infos, timestamps=timestamps)
+
+    for password, key_info, timestamp, encrypted in zip(passwords, key_infos, timestamps, batch):
+        assert encrypted.pw_enc == encrypt_with_aes(password, key_info)
+        one_by_one = encrypt_with_rsa(f"{key_info['keyStr']},{timestamp}", public_key)
+        # PKCS#1 v1.5 padding is random, so encsymka is compared after decryption
+        assert (private_key.decrypt(base64.b64decode(encrypted.encsymka), padding.PKCS1v15())
+                == private_key.decrypt(base64.b64decode(one_by_one), padding.PKCS1v15()))
+
+
+def test_batch_stamps_each_password_when_it_is_encrypted():
+    private_key, public_key = _key_pair()
+    key_infos = [generate_session_key(32) for _ in range(3)]
+
+    before = int(time.time() * 1000)
+    batch = encrypt_passwords(['a', 'b', 'c'], public_key, key_infos=key_infos)
+    after = int(time.time() * 1000)
+
+    stamps = []
+    for key_info, encrypted in zip(key_infos, batch):
+        key_str, stamp = private_key.decrypt(base64.b64decode(encrypted.encsymka), padding.PKCS1v15()).decode().rsplit(',', 1)
+        assert key_str == key_info['keyStr']
+        stamps.append(int(stamp))
+    assert before <= stamps[0] <= stamps[1] <= stamps[2] <= after
+
+
+def test_batch_over_process_pool_keeps_input_order():
+    private_key, public_key = _key_pair()
+    passwords = [f'pw-{i}' for i in range(7)]
+    key_infos = [generate_session_key(32) for _ in passwords]
+
+    batch = encrypt_passwords(passwords, public_key, key_infos=key_infos, processes=2, chunk_size=2)
+
+    assert [e.pw_enc for e in batch] == [encrypt_with_aes(p, k) for p, k in zip(passwords, key_infos)]
+    for key_info, encrypted in zip(key_infos, batch):
+        plain = private_key.decrypt(base64.b64decode(encrypted.encsymka), padding.PKCS1v15())
+        assert plain.decode().startswith(f"{key_info['keyStr']},")
+
+
+def test_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        encrypt_passwords(['a', 'b'], 'unused', key_infos=[generate_session_key(32)])
+    with pytest.raises(ValueError):
+        encrypt_passwords(['a', 'b'], 'unused', timestamps=['1'])
@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from mju_univ_auth import ParseCache, use_parse_cache
+from mju_univ_auth.domain.student_card import PersonalContact
+from mju_univ_auth.exceptions import ParsingError
+from mju_univ_auth.fetcher.student_basicinfo_fetcher import StudentBasicInfoFetcher
+from mju_univ_auth.fetcher.student_card_fetcher import StudentCardFetcher
+from mju_univ_auth.fetcher.student_changelog_fetcher import StudentChangeLogFetcher
+from tests.golden import load_corpus
+
+PAGES = {page.kind: page for page in load_corpus()}
+FETCHERS = {
+    'student_card': (lambda backend: StudentCardFetcher(session=None, user_pw='', parser_backend=backend),
+                     '_parse_student_card'),
+    'student_changelog': (lambda backend: StudentChangeLogFetcher(session=None, parser_backend=backend),
+                          '_parse_student_changelog'),
+    'home': (lambda backend: StudentBasicInfoFetcher(session=None, parser_backend=backend), '_parse_basic_info'),
+}
+
+
+def parse(kind, fields=None, backend=None):
+    """Parses a golden page the way fetch(fields=...) does after the network steps."""
+    create, method = FETCHERS[kind]
+    fetcher = create(backend)
+    fetcher._encoding = PAGES[kind].encoding
+    fetcher._parts = fetcher.page_parts(fields)
+    return getattr(fetcher, method)(PAGES[kind].body)
+
+
+def pick(model, path):
+    for name in path.split('.'):
+        model = getattr(model, name)
+    return model
+
+
+@pytest.mark.parametrize("fields, parts", [
+    (None, None),
+    ({'student_profile.name_korean', 'student_profile.student_id'}, {'fields'}),
+    ({'student_profile.photo_base64'}, {'photo_src'}),
+    ({'student_profile'}, {'fields', 'photo_src'}),
+    ({'personal_contact.current_residence_address.postal_code'}, {'inputs'}),
+    ('raw_html_data', {'raw_html_data'}),
+    (set(), set()),
+])
+def test_fields_map_to_page_parts(fields, parts):
+    assert StudentCardFetcher.page_parts(fields) == (None if parts is None else frozenset(parts))
+
+
+def test_unknown_field_is_rejected_before_any_request():
+    session = MagicMock()
+
+    with pytest.raises(ValueError, match='student_profile.nickname'):
+        StudentCardFetcher(session=session, user_pw='pw').fetch(fields={'student_profile.nickname'})
+    session.get.assert_not_called()
+
+
+@pytest.mark.parametrize("backend", ['lxml', 'bs4'])
+@pytest.mark.parametrize("kind, fields", [
+    ('student_card', {'student_profile.name_korean', 'student_profile.student_id'}),
+    ('student_card', {'personal_contact.email', 'student_profile.photo_base64'}),
+    ('student_changelog', {'academic_status.status', 'change_log_list'}),
+    ('student_changelog', {'cumulative_leave_semesters'}),
+    ('home', {'department', 'last_access_ip'}),
+])
+def test_projection_matches_full_parse_on_requested_fields(kind, fields, backend):
+    full = parse(kind, backend=backend)
+    projected = parse(kind, fields, backend)
+
+    for path in fields:
+        assert pick(projected, path) == pick(full, path)
+    assert projected.raw_html_data == ''
+
+
+def test_unrequested_parts_keep_model_defaults():
+    card = parse('student_card', {'student_profile.student_id'})
+
+    assert card.student_profile.student_id == '60200001'
+    assert card.student_profile.photo_base64 == ''
+    assert card.personal_contact == PersonalContact()
+
+
+def test_missing_table_only_fails_when_its_fields_are_requested():
+    fetcher = StudentCardFetcher(session=None, user_pw='')
+    without_contact = PAGES['student_card'].text.replace('<hr', '<br')
+
+    fetcher._parts = fetcher.page_parts({'student_profile.name_korean'})
+    assert fetcher._parse_student_card(without_contact).student_profile.name_korean
+
+    fetcher._parts = fetcher.page_parts({'personal_contact.email'})
+    with pytest.raises(ParsingError, match='개인 연락처'):
+        fetcher._parse_student_card(without_contact)
+
+
+def test_parse_cache_keeps_projections_apart():
+    previous = use_parse_cache(ParseCache())
+    try:
+        projected = parse('student_card', {'student_profile.student_id'})
+        full = parse('student_card')
+    finally:
+        use_parse_cache(previous)
+
+    assert projected.personal_contact == PersonalContact()
+    assert full.personal_contact.email
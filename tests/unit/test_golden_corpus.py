@@ -0,0 +1,64 @@
+import pytest
+
+from mju_univ_auth.fetcher.student_basicinfo_fetcher import StudentBasicInfoFetcher
+from mju_univ_auth.fetcher.student_card_fetcher import StudentCardFetcher
+from mju_univ_auth.fetcher.student_changelog_fetcher import StudentChangeLogFetcher
+from tests.golden import canonical_markup, load_corpus, observe
+
+CORPUS = load_corpus()
+MSI_PAGES = [page for page in CORPUS if page.kind in ('home', 'student_card', 'student_changelog')]
+
+
+def _ids(pages):
+    return [page.name for page in pages]
+
+
+def test_corpus_covers_every_page_kind_at_full_size():
+    """The latest version has each page kind, and the MSI pages carry real-sized chrome and the photo."""
+    sizes = {page.kind: len(page.body) for page in CORPUS}
+
+    assert set(sizes) == {'login', 'redirect', 'home', 'student_card', 'student_changelog'}
+    assert sizes['student_card'] > 200 * 1024
+    assert sizes['home'] > 100 * 1024
+
+
+@pytest.mark.parametrize("page", CORPUS, ids=_ids(CORPUS))
+@pytest.mark.parametrize("backend", ['lxml', 'bs4'])
+def test_parse_results_match_the_manifest(page, backend):
+    """Every parser backend reproduces the results recorded when the corpus version was cut."""
+    assert observe(page, backend) == page.expected
+
+
+@pytest.mark.parametrize("page", MSI_PAGES, ids=_ids(MSI_PAGES))
+def test_lxml_raw_html_data_is_the_same_markup_as_bs4(page):
+    """The lxml backend serializes raw_html_data from its own tree, yet it describes the same markup as bs4."""
+    def raw_html_data(backend):
+        if page.kind == 'home':
+            fetcher = StudentBasicInfoFetcher(session=None, parser_backend=backend)
+            fetcher._encoding = page.encoding
+            return fetcher._parse_basic_info(page.body).raw_html_data
+        if page.kind == 'student_card':
+            fetcher = StudentCardFetcher(session=None, user_pw='', parser_backend=backend)
+            fetcher._encoding = page.encoding
+            return fetcher._parse_student_card(page.body).raw_html_data
+        fetcher = StudentChangeLogFetcher(session=None, parser_backend=backend)
+        fetcher._encoding = page.encoding
+        return fetcher._parse_student_changelog(page.body).raw_html_data
+
+    lxml_markup, soup_markup = raw_html_data('lxml'), raw_html_data('bs4')
+
+    assert lxml_markup.startswith('<div class=')
+    assert canonical_markup(lxml_markup) == canonical_markup(soup_markup)
+    # only void-element and boolean-attribute spellings differ, so the strings stay close in size
+    assert abs(len(lxml_markup) - len(soup_markup)) < 0.01 * len(soup_markup)
+
+
+def test_corpus_personal_values_are_synthetic():
+    """Anonymization: the only student, phone, e-mail and IP values are the synthetic ones."""
+    card = next(page for page in CORPUS if page.kind == 'student_card').expected
+    home = next(page for page in CORPUS if page.kind == 'home').expected
+
+    assert card['student_profile']['student_id'] == '60200001'
+    assert card['personal_contact']['mobile_number'].startswith('010-0000-')
+    assert card['personal_contact']['email'].endswith('@example.com')
+    assert home['basic_info']['last_access_ip'].startswith('192.0.2.')
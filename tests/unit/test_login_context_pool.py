@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+from mju_univ_auth import LoginContextPool, StandardAuthenticator
+from mju_univ_auth.config import SERVICES
+from mju_univ_auth.exceptions import ServiceNotFoundError
+
+MSI = SERVICES['msi']
+LOGIN_ACTION_URL = 'https://sso.mju.ac.kr/sso/process/login.do'
+
+LOGIN_PAGE_HTML = """
+<html><body>
+    <form id="signin-form" action="/sso/process/login.do">
+        <input type="hidden" id="public-key" value="pooled-public-key" />
+        <input type="hidden" id="c_r_t" value="pooled-csrf" />
+    </form>
+</body></html>
+"""
+
+AUTO_SUBMIT_HTML = f"""
+<html><body onLoad="document.login.submit();">
+    <form name="login" action="{MSI.final_url}" method="post">
+        <input type="hidden" name="token" value="one-time-token">
+    </form>
+</body></html>
+"""
+
+FINAL_PAGE_HTML = "<html><body><a href='/logout'>로그아웃</a></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def stub_payload(monkeypatch):
+    """Skips the RSA/AES work; the pool only changes where step 1 comes from."""
+    monkeypatch.setattr(
+        StandardAuthenticator, '_prepare_encrypted_data',
+        lambda self: {'user_id': self._user_id, 'c_r_t': self._csrf_token},
+    )
+
+
+@pytest.fixture
+def sso(requests_mock):
+    login_page = requests_mock.get(MSI.auth_url, text=LOGIN_PAGE_HTML)
+    login_post = requests_mock.post(LOGIN_ACTION_URL, text=AUTO_SUBMIT_HTML)
+    requests_mock.post(MSI.final_url, text=FINAL_PAGE_HTML)
+    return login_page, login_post
+
+
+def test_login_starts_from_pooled_context(sso):
+    login_page, login_post = sso
+    pool = LoginContextPool(services=('msi',), size=2, ttl=60)
+    pool.fill()
+    assert login_page.call_count == 2
+
+    auth = StandardAuthenticator('60200001', 'pw', single_flight=False, context_pool=pool)
+    result = auth.login('msi')
+
+    assert result.success
+    assert login_page.call_count == 2
+    assert 'c_r_t=pooled-csrf' in login_post.last_request.text
+    assert auth.login_stats.round_trips == 2
+
+    metrics = pool.metrics()
+    assert (metrics.hits, metrics.misses, metrics.ready) == (1, 0, 1)
+    assert metrics.hit_rate == 1.0
+    pool.close()
+
+
+def test_empty_or_stale_pool_falls_back_to_login_page(sso):
+    login_page, _ = sso
+    pool = LoginContextPool(services=('msi',), size=1, ttl=0.01)
+    pool.fill()
+    time.sleep(0.02)
+
+    result = StandardAuthenticator('60200001', 'pw', single_flight=False, context_pool=pool).login('msi')
+
+    assert result.success
+    assert login_page.call_count == 2
+    metrics = pool.metrics()
+    assert (metrics.hits, metrics.misses, metrics.expired) == (0, 1, 1)
+    assert metrics.hit_rate == 0.0
+
+
+def test_background_thread_refills_after_acquire(sso):
+    with LoginContextPool(services=('msi',), size=1, ttl=60) as pool:
+        deadline = time.monotonic() + 5
+        while pool.metrics().ready < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        context = pool.acquire('msi')
+        assert context is not None and context.response.round_trips == 0
+
+        while pool.metrics().prefetched < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.metrics().ready == 1
+
+
+def test_streaming_prefetch_keeps_only_the_login_page_head(requests_mock):
+    requests_mock.get(MSI.auth_url, text=LOGIN_PAGE_HTML + '<p>terms</p>' * 5000)
+    pool = LoginContextPool(services=('msi',), size=1, stream_pages=True)
+
+    context = pool.prefetch('msi')
+
+    assert len(context.response.text) < 10000
+    assert 'pooled-csrf' in context.response.text
+    context.session.close()
+
+
+def test_prefetch_rejects_non_login_page(requests_mock):
+    requests_mock.get(MSI.auth_url, text='<html>maintenance</html>')
+    pool = LoginContextPool(services=('msi',), size=1)
+
+    pool.fill()
+
+    metrics = pool.metrics()
+    assert (metrics.prefetch_failures, metrics.ready) == (1, 0)
+
+
+def test_unknown_service():
+    with pytest.raises(ServiceNotFoundError):
+        LoginContextPool(services=('unknown',))
@@ -0,0 +1,178 @@
+import pytest
+from bs4 import BeautifulSoup
+from unittest.mock import MagicMock
+
+from mju_univ_auth.exceptions import ParsingError
+from mju_univ_auth.fetcher.student_basicinfo_fetcher import StudentBasicInfoFetcher
+from mju_univ_auth.fetcher.student_card_fetcher import StudentCardFetcher
+from mju_univ_auth.fetcher.student_changelog_fetcher import StudentChangeLogFetcher
+from mju_univ_auth.infrastructure.lxml_html import markup_of, parse_html, text_of
+from tests.golden import canonical_markup
+
+# MSI pages as served: attribute soup, comments, inline scripts, entities and value-less boolean attributes.
+CARD_PAGE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="UTF-8"><title>학생카드</title>
+<script>var a = 1 < 2 && "x" > 'y';</script></head>
+<body>
+<div class="card-item  basic" data-x='a "q"'>
+  <!-- 학생 사진 -->
+  <div id="pictureInclude" class="photo">
+    <img src="data:image/jpg;base64,iVBORw0KGgo=" alt=사진 >
+    <div class="flex-table profile">
+      <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data"> 60200001 </div></div>
+      <div class="flex-table-item"><div class="item-title">한글성명</div><div class="item-data">김&nbsp;명지</div></div>
+      <div class="flex-table-item"><div class="item-title">학년</div><div class="item-data">3 학년</div></div>
+      <div class="flex-table-item"><div class="item-title">학적상태</div><div class="item-data">재학<script>x()</script></div></div>
+      <div class="flex-table-item"><div class="item-title">학부(과)</div><div class="item-data">ICT융합대학 <b>컴퓨터공학과</b></div></div>
+      <div class="flex-table-item"><div class="item-title">상담교수</div><div class="item-data">홍길동 &amp; 이몽룡</div></div>
+      <div class="flex-table-item"><div class="item-title">학생설계전공지도교수</div><div class="item-data">()</div></div>
+    </div>
+  </div>
+  <hr>
+  <div class="flex-table">
+    <input type="text" name="nm_eng" value="KIM" readonly>
+    <input type="text" name="nm_eng2" value="MYONG&quot;JI" disabled="disabled">
+    <input type="text" name="std_tel" value="">
+    <input type="text" name="htel" value="010-1234-5678">
+    <input type="text" name="email" value="test@mju.ac.kr">
+    <input name="zip1" value="037"><input name="zip2" value="24">
+    <input name="addr1" value="서울특별시 서대문구 거북골로 34"><input name="addr2">
+    <input name="zip1_2" value="170"><input name="zip2_2" value="58">
+    <input name="addr1_2" value="경기도 용인시 처인구"><input name="addr2_2" value="명지로 116 &lt;A동&gt;">
+  </div>
+</div>
+</body></html>"""
+
+CHANGELOG_PAGE = """<html><body>
+<div class="card-item basic">
+  <div class="flex-table">
+    <div class="flex-table-item"><div class="item-title">학번</div><div class="item-data">60200001</div></div>
+    <div class="flex-table-item"><div class="item-title">성명</div><div class="item-data">김명지</div></div>
+    <div class="flex-table-item"><div class="item-title">학적상태</div><div class="item-data">휴학</div></div>
+    <div class="flex-table-item"><div class="item-title">학년</div><div class="item-data">2</div></div>
+    <div class="flex-table-item"><div class="item-title">이수학기</div><div class="item-data">3</div></div>
+    <div class="flex-table-item"><div class="item-title">학부(과)</div><div class="item-data">경영학과</div></div>
+  </div>
+</div>
+<div class="card-item basic">
+  <div class="data-title small">누적 휴학 : <span style="color:red"> 총 2학기 </span></div>
+  <div class="read-table"><table>
+    <thead><tr><th>년도</th><th>학기</th><th>변동</th><th>일자</th><th>만료</th><th>사유</th></tr></thead>
+    <tbody>
+      <tr><td>2023</td><td>1학기</td><td>군입대휴학</td><td>2023-01-10</td><td>2025-02-28</td><td></td></tr>
+      <tr><td colspan="6">합계</td></tr>
+      <tr><td>2025</td><td>2학기</td><td>복학</td><td>2025-08-20</td><td></td><td>전역 <!-- memo --></td></tr>
+    </tbody>
+  </table></div>
+</div>
+</body></html>"""
+
+BASIC_INFO_PAGE = """<html><body>
+<div class="main-user-info">
+  <div class="info-cell"><div class="title">소 속 :</div><div class="value">컴퓨터공학과</div></div>
+  <div class="info-cell"><div class="title">구 분 :</div><div class="value">학부생</div></div>
+  <div class="info-cell"><div class="title">학 년 :</div><div class="value">3학년</div></div>
+  <div class="info-cell"><div class="title">최근접속시간 :</div><div class="value">2025-03-02 09:10:11</div></div>
+  <div class="info-cell"><div class="title">최근접속IP :</div><div class="value">10.0.0.1</div></div>
+</div>
+</body></html>"""
+
+MARKUP_CASES = [
+    '<div z="1" a="q&quot;x" b="it&#39;s &quot;" class="  b   a ">t &amp; &lt;<br><!-- c --></div>',
+    '<div><script>if (a<b && c) x()</script><style>p>a{}</style><textarea>a&lt;b</textarea></div>',
+    '<div><template><i>t</i></template><td headers=" h1  h2">x</td><img src=x alt=></div>',
+    '<div><input type="checkbox" checked><select multiple><option selected>1</option></select></div>',
+    '<div><input readonly="readonly" name="a"><a rel=" nofollow  x" href="?a=1&b=2">링크</a>\xa0</div>',
+    '<div>\n  <span> </span>\t<pre>\n  keep  </pre><textarea>  </textarea>\n</div>',
+]
+
+
+def _fetchers(cls, **kwargs):
+    return [cls(session=MagicMock(), parser_backend=name, **kwargs) for name in ('lxml', 'bs4')]
+
+
+@pytest.mark.parametrize("markup", MARKUP_CASES)
+def test_text_of_matches_beautifulsoup(markup):
+    """text_of() matches get_text(strip=True)."""
+    tag = BeautifulSoup(markup, 'lxml').div
+    node = parse_html(markup).find('.//div')
+
+    assert text_of(node) == tag.get_text(strip=True)
+
+
+@pytest.mark.parametrize("markup", MARKUP_CASES)
+def test_markup_of_is_the_same_markup_as_str_of_tag(markup):
+    """markup_of() differs from str(tag) only in HTML spellings (<br>, bare boolean attributes)."""
+    tag = BeautifulSoup(markup, 'lxml').div
+    node = parse_html(markup).find('.//div')
+
+    assert canonical_markup(markup_of(node)) == canonical_markup(str(tag))
+
+
+def test_markup_of_sorts_attributes_and_collapses_blank_text():
+    """Attributes come out in name order, class is tidied and blank text shrinks to one newline or space, except in <pre>."""
+    node = parse_html('<div z="1" class=" b  a">\n  <i>x</i> \t <pre>\n  </pre><br></div>tail').find('.//div')
+
+    assert markup_of(node) == '<div class="b a" z="1">\n<i>x</i> <pre>\n  </pre><br></div>'
+
+
+def test_parse_html_handles_empty_and_bytes_documents():
+    """Empty documents give an empty tree; bytes are decoded in the given encoding."""
+    assert len(parse_html('')) == 0
+    assert len(parse_html(b'  ')) == 0
+    assert text_of(parse_html('<p>명지</p>'.encode('euc-kr'), 'euc_kr')) == '명지'
+
+
+@pytest.mark.parametrize("encoding", ['utf-8', 'euc-kr'])
+def test_student_card_backends_produce_identical_models(encoding):
+    """The lxml and BeautifulSoup backends build the same StudentCard; raw_html_data is the same markup."""
+    lxml_fetcher, soup_fetcher = _fetchers(StudentCardFetcher, user_pw='pw')
+    for fetcher in (lxml_fetcher, soup_fetcher):
+        fetcher._encoding = encoding
+    body = CARD_PAGE.replace('UTF-8', encoding).encode(encoding)
+
+    card = lxml_fetcher._parse_student_card(body)
+    soup_card = soup_fetcher._parse_student_card(body)
+
+    assert card.model_copy(update={'raw_html_data': ''}) == soup_card.model_copy(update={'raw_html_data': ''})
+    assert canonical_markup(card.raw_html_data) == canonical_markup(soup_card.raw_html_data)
+    assert card.student_profile.name_korean == '김\xa0명지'
+    assert card.student_profile.college_department == 'ICT융합대학컴퓨터공학과'
+    assert card.personal_contact.english_givenname == 'MYONG"JI'
+    assert card.personal_contact.resident_registration_address.address == '경기도 용인시 처인구 명지로 116 <A동>'
+    assert card.raw_html_data.startswith('<div class="card-item basic"')
+
+
+def test_student_changelog_backends_produce_identical_models():
+    """The lxml and BeautifulSoup backends build the same StudentChangeLog."""
+    lxml_fetcher, soup_fetcher = _fetchers(StudentChangeLogFetcher)
+
+    changelog = lxml_fetcher._parse_student_changelog(CHANGELOG_PAGE)
+
+    assert changelog == soup_fetcher._parse_student_changelog(CHANGELOG_PAGE)
+    assert changelog.cumulative_leave_semesters == '총 2학기'
+    assert [entry.change_type for entry in changelog.change_log_list] == ['군입대휴학', '복학']
+
+
+def test_student_basicinfo_backends_produce_identical_models():
+    """The lxml and BeautifulSoup backends build the same StudentBasicInfo."""
+    lxml_fetcher, soup_fetcher = _fetchers(StudentBasicInfoFetcher)
+
+    info = lxml_fetcher._parse_basic_info(BASIC_INFO_PAGE)
+
+    assert info == soup_fetcher._parse_basic_info(BASIC_INFO_PAGE)
+    assert info.last_access_ip == '10.0.0.1'
+
+
+@pytest.mark.parametrize("name", ['lxml', 'bs4'])
+def test_backends_raise_the_same_parsing_errors(name):
+    """Both backends report a missing table with the same ParsingError."""
+    fetcher = StudentCardFetcher(session=MagicMock(), user_pw='pw', parser_backend=name)
+
+    with pytest.raises(ParsingError, match='개인 연락처 테이블을 찾을 수 없습니다'):
+        fetcher._parse_student_card(CARD_PAGE.replace('<hr>', ''))
+
+
+def test_unknown_parser_backend_is_rejected():
+    with pytest.raises(ValueError):
+        StudentBasicInfoFetcher(session=MagicMock(), parser_backend='html5lib')
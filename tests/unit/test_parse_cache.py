@@ -0,0 +1,162 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from mju_univ_auth import ParseCache, use_parse_cache
+from mju_univ_auth.exceptions import ParsingError
+from mju_univ_auth.fetcher.student_basicinfo_fetcher import StudentBasicInfoFetcher
+from mju_univ_auth.infrastructure.parser import HTMLParser, PageSnapshot, PageState
+
+BASIC_INFO_PAGE = """<html><body>
+<div class="main-user-info">
+  <div class="info-cell"><div class="title">소 속 :</div><div class="value">컴퓨터공학과</div></div>
+  <div class="info-cell"><div class="title">최근접속IP :</div><div class="value">10.0.0.1</div></div>
+</div>
+</body></html>"""
+
+
+@pytest.fixture
+def installed():
+    """Installs an empty cache for the test and always uninstalls it afterwards."""
+    cache = ParseCache(max_entries=8)
+    previous = use_parse_cache(cache)
+    yield cache
+    use_parse_cache(previous)
+
+
+class Counter:
+    def __init__(self, value='parsed'):
+        self.calls = 0
+        self.value = value
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_same_body_is_parsed_once():
+    cache = ParseCache()
+    parse = Counter()
+
+    assert cache.get_or_parse('page', '<p>a</p>', parse) == 'parsed'
+    assert cache.get_or_parse('page', '<p>a</p>', parse) == 'parsed'
+    assert cache.get_or_parse('page', b'<p>a</p>', parse) == 'parsed'  # same bytes as the utf-8 str
+
+    metrics = cache.metrics()
+    assert parse.calls == 1
+    assert (metrics.hits, metrics.misses, metrics.entries) == (2, 1, 1)
+    assert metrics.hit_rate_of('page') == pytest.approx(2 / 3)
+
+
+def test_kind_and_variant_are_part_of_the_key():
+    cache = ParseCache()
+    parse = Counter()
+
+    cache.get_or_parse('a', '<p/>', parse)
+    cache.get_or_parse('b', '<p/>', parse)
+    cache.get_or_parse('a', '<p/>', parse, 'euc-kr')
+
+    assert parse.calls == 3
+    assert cache.metrics().misses_by_kind == {'a': 2, 'b': 1}
+
+
+def test_least_recently_used_entry_is_evicted_by_count():
+    cache = ParseCache(max_entries=2)
+    cache.get_or_parse('page', 'one', Counter())
+    cache.get_or_parse('page', 'two', Counter())
+    cache.get_or_parse('page', 'one', Counter())   # 'one' becomes most recent
+    cache.get_or_parse('page', 'three', Counter())
+
+    parse = Counter()
+    cache.get_or_parse('page', 'one', parse)
+    cache.get_or_parse('page', 'two', parse)
+
+    assert parse.calls == 1  # only 'two' was evicted
+    assert cache.metrics().evictions >= 1
+
+
+def test_memory_bound_evicts_and_skips_oversized_results():
+    cache = ParseCache(max_bytes=30_000)
+    cache.get_or_parse('page', 'one', Counter('x' * 12_000))
+    cache.get_or_parse('page', 'two', Counter('y' * 12_000))
+    cache.get_or_parse('page', 'three', Counter('z' * 12_000))
+    cache.get_or_parse('page', 'huge', Counter('h' * 40_000))
+
+    metrics = cache.metrics()
+    assert metrics.entries == 2
+    assert metrics.evictions == 1
+    assert metrics.oversized == 1
+    assert metrics.bytes <= 30_000
+
+
+def test_failed_parses_are_not_remembered():
+    cache = ParseCache()
+
+    def fail():
+        raise ParsingError("테이블을 찾을 수 없습니다.")
+
+    with pytest.raises(ParsingError):
+        cache.get_or_parse('page', '<p/>', fail)
+
+    assert cache.get_or_parse('page', '<p/>', Counter()) == 'parsed'
+    assert cache.metrics().misses == 2
+
+
+def test_clear_drops_entries_but_keeps_counters():
+    cache = ParseCache()
+    cache.get_or_parse('page', '<p/>', Counter())
+    cache.clear()
+
+    metrics = cache.metrics()
+    assert (metrics.entries, metrics.bytes, metrics.misses) == (0, 0, 1)
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        ParseCache(max_entries=0)
+
+
+def test_html_parser_reuses_page_state(installed):
+    html = '<form id="f" action="/next"><input name="a" value="1"></form><a href="logout">로그아웃</a>'
+
+    assert HTMLParser.classify_page(html) is HTMLParser.classify_page(html)
+    assert HTMLParser.extract_form_data(html) == ('/next', {'a': '1'})
+    assert HTMLParser.has_logout_button(html)
+    assert installed.metrics().hits_by_kind['page_state'] == 3
+
+
+def test_page_state_is_cached_as_an_eager_snapshot_without_the_page(installed):
+    html = ('<form action="/next"><input name="token" value="' + 'x' * 4000 + '"></form>'
+            + '<p>' + 'y' * 50000 + '</p><script>alert("잘못된 비밀번호")</script>')
+
+    page = HTMLParser.classify_page(html)
+
+    assert isinstance(page, PageSnapshot)
+    assert page == PageState(html).snapshot()
+    assert page.error_message == '잘못된 비밀번호'
+    # the size estimate covers the computed form data but not the 50 KB page it came from
+    assert 4000 < installed.metrics().bytes < 20000
+
+
+def test_page_state_stays_lazy_without_a_cache():
+    assert isinstance(HTMLParser.classify_page('<p>hello</p>'), PageState)
+
+
+def test_fetcher_reuses_page_data_but_returns_fresh_models(installed):
+    fetcher = StudentBasicInfoFetcher(session=MagicMock())
+
+    first = fetcher._parse_basic_info(BASIC_INFO_PAGE)
+    first.department = '변경됨'
+    second = fetcher._parse_basic_info(BASIC_INFO_PAGE)
+
+    assert second.department == '컴퓨터공학과'
+    assert second is not first
+    assert installed.metrics().hits_by_kind == {'student_basicinfo': 1}
+
+
+def test_fetcher_cache_key_includes_the_backend(installed):
+    for name in ('lxml', 'bs4', 'lxml'):
+        StudentBasicInfoFetcher(session=MagicMock(), parser_backend=name)._parse_basic_info(BASIC_INFO_PAGE)
+
+    metrics = installed.metrics()
+    assert (metrics.hits, metrics.misses) == (1, 2)
@@ -0,0 +1,123 @@
+import pytest
+
+from mju_univ_auth import ParsePool, use_parse_pool
+from mju_univ_auth.exceptions import ParsingError
+from mju_univ_auth.fetcher.student_card_fetcher import StudentCardFetcher
+from tests.golden import load_corpus
+
+CARD_PAGE = next(page for page in load_corpus() if page.kind == 'student_card')
+
+
+@pytest.fixture(scope='module')
+def pool():
+    """One spawned worker shared by the module (starting a worker takes about a second)."""
+    with ParsePool(workers=1, max_queue=0) as started:
+        yield started
+
+
+@pytest.fixture
+def installed(pool):
+    previous = use_parse_pool(pool)
+    yield pool
+    use_parse_pool(previous)
+
+
+def parse_card(backend='lxml', fields=None):
+    fetcher = StudentCardFetcher(session=None, user_pw='', parser_backend=backend)
+    fetcher._encoding = CARD_PAGE.encoding
+    fetcher._parts = fetcher.page_parts(fields)
+    return fetcher._parse_student_card(CARD_PAGE.body)
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return 'local'
+
+
+@pytest.mark.parametrize("backend", ['lxml', 'bs4'])
+def test_worker_result_matches_in_thread_parse(installed, backend):
+    before = installed.metrics()
+    pooled = parse_card(backend)
+    after = installed.metrics()
+
+    use_parse_pool(None)
+    assert pooled == parse_card(backend)
+    assert after.offloaded == before.offloaded + 1
+    assert after.busy_seconds > before.busy_seconds
+    assert after.in_flight == 0
+
+
+def test_projection_is_applied_in_the_worker(installed):
+    card = parse_card(fields={'student_profile.student_id'})
+
+    assert card.student_profile.student_id == '60200001'
+    assert card.raw_html_data == ''
+
+
+def test_parsing_errors_are_raised_in_the_calling_thread(pool):
+    before = pool.metrics()
+    local = Counter()
+
+    with pytest.raises(ParsingError):
+        pool.parse('student_card', 'lxml', b'<html></html>', 'utf-8', None, local)
+
+    after = pool.metrics()
+    assert local.calls == 0
+    assert (after.failed, after.in_flight) == (before.failed + 1, 0)
+
+
+def test_saturated_pool_parses_in_the_calling_thread(pool):
+    assert pool._reserve() is not None   # the only slot (workers=1, max_queue=0)
+    try:
+        before = pool.metrics()
+        local = Counter()
+
+        assert pool.parse('student_card', 'lxml', CARD_PAGE.body, 'utf-8', None, local) == 'local'
+        after = pool.metrics()
+    finally:
+        pool._release()
+
+    assert local.calls == 1
+    assert before.in_flight == 1
+    assert after.fallbacks == before.fallbacks + 1
+
+
+def test_backends_missing_from_workers_are_never_offloaded(pool):
+    before = pool.metrics()
+    local = Counter()
+
+    assert pool.parse('student_card', 'custom', CARD_PAGE.body, 'utf-8', None, local) == 'local'
+    assert pool.metrics().offloaded == before.offloaded
+    assert pool.metrics().fallbacks == before.fallbacks
+
+
+def test_unstarted_and_closed_pools_parse_in_the_calling_thread():
+    local = Counter()
+    pool = ParsePool(workers=1)
+
+    assert pool.parse('student_card', 'lxml', CARD_PAGE.body, 'utf-8', None, local) == 'local'
+    pool.close()
+    assert pool.parse('student_card', 'lxml', CARD_PAGE.body, 'utf-8', None, local) == 'local'
+    assert local.calls == 2
+    assert pool.metrics().fallbacks == 0
+    with pytest.raises(RuntimeError):
+        pool.start()
+
+
+def test_metrics_report_utilization_and_queue_depth(pool):
+    metrics = pool.metrics()
+
+    assert (metrics.workers, metrics.max_queue, metrics.queue_depth) == (1, 0, 0)
+    assert 0.0 < metrics.utilization <= 1.0
+    assert metrics.uptime_seconds > 0
+
+
+def test_invalid_sizes_are_rejected():
+    with pytest.raises(ValueError):
+        ParsePool(workers=0)
+    with pytest.raises(ValueError):
+        ParsePool(workers=1, max_queue=-1)
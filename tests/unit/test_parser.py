@@ -1,5 +1,31 @@
+import time
+
 import pytest
-from mju_univ_auth.infrastructure.parser import HTMLParser
+from unittest.mock import MagicMock
+
+from mju_univ_auth.fetcher import (
+    AsyncStudentBasicInfoFetcher,
+    AsyncStudentCardFetcher,
+    AsyncStudentChangeLogFetcher,
+    StudentBasicInfoFetcher,
+    StudentCardFetcher,
+    StudentChangeLogFetcher,
+)
+from mju_univ_auth.infrastructure.parser import (
+    PAGES,
+    HTMLParser,
+    LoginPageScanner,
+    ParserBackend,
+    SessionPageScanner,
+    declared_encoding,
+    decode_html,
+    get_parser_backend,
+    iter_tags,
+    make_soup,
+    parser_backend_names,
+    register_parser_backend,
+    use_parser_backend,
+)
 
 # Sample HTML snippets for testing
 LOGIN_PAGE_HTML = """
@@ -129,3 +155,245 @@ class TestHTMLParser:
         assert HTMLParser.has_signin_form('<div id="signin-form">...<div id="input-password">') is True
         assert HTMLParser.has_logout_button("<a>로그아웃</a>") is True
         assert HTMLParser.has_logout_button("<a>logout</a>") is True
+
+    @pytest.mark.parametrize("html", [
+        LOGIN_PAGE_HTML, JS_FORM_SUBMIT_HTML, JS_REDIRECT_HTML, ERROR_MSG_HTML_ALERT, ERROR_MSG_HTML_VAR,
+        "<html></html>",
+    ])
+    def test_classify_page_matches_individual_checks(self, html):
+        page = HTMLParser.classify_page(html)
+        action, form_data = HTMLParser.extract_form_data(html)
+        assert page.has_signin_form == HTMLParser.has_signin_form(html)
+        assert page.has_logout == HTMLParser.has_logout_button(html)
+        assert page.has_js_form_submit == HTMLParser.has_js_form_submit(html)
+        assert (page.form_action, page.form_data) == (action, form_data)
+        assert page.js_redirect == HTMLParser.extract_js_redirect(html)
+        assert page.error_message == HTMLParser.extract_error_message(html)
+
+    def test_classify_page_finds_mixed_case_logout_beyond_first_window(self):
+        html = "<p>" + "x" * 70000 + "<a href='/LogOut.do'>Sign out</a>"
+        assert HTMLParser.classify_page(html).has_logout is True
+        assert HTMLParser.classify_page("<p>" + "x" * 70000).has_logout is False
+
+
+class RecordingBackend(ParserBackend):
+    name = 'recording'
+    pages = PAGES
+
+    def __init__(self):
+        self.calls = []
+
+    def login_page_data(self, html):
+        self.calls.append(html)
+        return 'k', 'c', 'a'
+
+
+@pytest.fixture
+def restore_default_backend():
+    previous = use_parser_backend('lxml')
+    yield
+    use_parser_backend(previous)
+
+
+class TestParserBackends:
+    def test_builtin_backends_are_registered(self):
+        assert {'regex', 'bs4', 'lxml'} <= set(parser_backend_names())
+
+    @pytest.mark.parametrize("name", ['regex', 'bs4', 'lxml'])
+    @pytest.mark.parametrize("html", [LOGIN_PAGE_HTML, LOGIN_PAGE_MISSING_ELEMENTS_HTML])
+    def test_backends_extract_the_same_login_page_data(self, name, html):
+        assert get_parser_backend(name).login_page_data(html) == get_parser_backend('bs4').login_page_data(html)
+
+    @pytest.mark.parametrize("name", ['regex', 'bs4', 'lxml'])
+    def test_backends_extract_the_same_form_inputs(self, name):
+        assert get_parser_backend(name).form_inputs(JS_FORM_SUBMIT_HTML) == {"token": "abc", "user_id": "123"}
+
+    def test_html_parser_falls_back_to_the_selected_backend(self, restore_default_backend):
+        backend = RecordingBackend()
+        register_parser_backend(backend)
+        use_parser_backend('recording')
+
+        fast_path_html = '<form id="signin-form" action="/a"><input value="k1" id="public-key"><input value="c1" id="c_r_t">'
+        assert HTMLParser.extract_login_page_data(fast_path_html) == ('k1', 'c1', '/a')
+        assert backend.calls == []  # the regex fast path still comes first
+        assert HTMLParser.extract_login_page_data(LOGIN_PAGE_MISSING_ELEMENTS_HTML) == ('k', 'c', 'a')
+        assert backend.calls == [LOGIN_PAGE_MISSING_ELEMENTS_HTML]
+
+    def test_fetchers_use_the_global_backend_unless_one_is_given(self, restore_default_backend):
+        use_parser_backend('bs4')
+
+        assert StudentCardFetcher(MagicMock(), user_pw='pw')._parser is get_parser_backend('bs4')
+        assert StudentCardFetcher(MagicMock(), user_pw='pw', parser_backend='lxml')._parser is get_parser_backend('lxml')
+
+    def test_unknown_or_unsupported_backends_are_rejected(self, restore_default_backend):
+        with pytest.raises(ValueError):
+            use_parser_backend('html5lib')
+        with pytest.raises(ValueError):
+            get_parser_backend('regex', page='student_card')
+        with pytest.raises(ValueError):
+            StudentCardFetcher(MagicMock(), user_pw='pw', parser_backend='regex')
+
+    def test_partial_backends_cannot_be_installed_globally(self, restore_default_backend):
+        with pytest.raises(ValueError, match='student_card'):
+            use_parser_backend('regex')
+        assert get_parser_backend().name == 'lxml'
+
+    @pytest.mark.parametrize("name", parser_backend_names())
+    def test_every_installable_backend_builds_every_fetcher(self, name, restore_default_backend):
+        """A backend accepted by use_parser_backend() must never make a fetcher constructor fail."""
+        try:
+            use_parser_backend(name)
+        except ValueError:
+            assert not PAGES <= get_parser_backend(name).pages
+            return
+
+        for fetcher_class in (StudentCardFetcher, AsyncStudentCardFetcher):
+            assert fetcher_class(MagicMock(), user_pw='pw')._parser.name == name
+        for fetcher_class in (StudentChangeLogFetcher, StudentBasicInfoFetcher,
+                              AsyncStudentChangeLogFetcher, AsyncStudentBasicInfoFetcher):
+            assert fetcher_class(MagicMock())._parser.name == name
+
+
+class TestBodyEncoding:
+    @pytest.mark.parametrize("content_type, body, expected", [
+        ('text/html; charset=EUC-KR', b'', 'euc_kr'),
+        ('text/html', b'<html><head><meta charset="euc-kr"></head>', 'euc_kr'),
+        ('text/html', b'<meta http-equiv="Content-Type" content="text/html; charset=utf-8">', 'utf-8'),
+        (None, b'<html></html>', 'utf-8'),
+        ('text/html; charset=bogus', b'', 'utf-8'),
+    ])
+    def test_declared_encoding(self, content_type, body, expected):
+        assert declared_encoding(content_type, body) == expected
+
+    def test_meta_charset_is_only_looked_for_near_the_top(self):
+        body = b'<html>' + b' ' * 4096 + b'<meta charset="euc-kr">'
+        assert declared_encoding(None, body) == 'utf-8'
+
+    def test_bytes_are_parsed_in_the_given_encoding(self):
+        body = '<p>학적변동</p>'.encode('euc-kr')
+        assert make_soup(body, 'euc-kr').p.get_text() == '학적변동'
+        assert decode_html(body, 'euc-kr') == '<p>학적변동</p>'
+        assert decode_html('<p>str</p>') == '<p>str</p>'
+
+
+def _feed(scanner, body: bytes, chunk_size: int) -> bool:
+    """Feeds body in chunk_size pieces, stopping like the streaming reader does."""
+    for start in range(0, len(body), chunk_size):
+        if scanner.feed(body[start:start + chunk_size]):
+            return True
+    return scanner.close()
+
+
+class TestPageScanner:
+    LARGE_LOGIN_PAGE = ('<html><head><title>로그인</title></head><body>' + ' ' * 3000 + LOGIN_PAGE_HTML
+                        + '<script>/* 약관 */</script>' * 2000 + '</body></html>').encode('utf-8')
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 8192])
+    def test_login_scanner_matches_full_page_extraction_at_any_chunk_boundary(self, chunk_size):
+        scanner = LoginPageScanner()
+
+        assert _feed(scanner, self.LARGE_LOGIN_PAGE, chunk_size) is True
+        assert (scanner.public_key, scanner.csrf_token, scanner.form_action) == \
+            HTMLParser.extract_login_page_data(self.LARGE_LOGIN_PAGE.decode('utf-8'))
+        assert HTMLParser.extract_login_page_data(scanner.text) == ('my-public-key', 'my-csrf-token', '/sso/login.do')
+
+    def test_login_scanner_stops_before_the_end_of_the_page(self):
+        scanner = LoginPageScanner()
+
+        _feed(scanner, self.LARGE_LOGIN_PAGE, 1024)
+
+        assert scanner.bytes_read < len(self.LARGE_LOGIN_PAGE) // 4
+
+    def test_login_scanner_reads_everything_when_a_field_is_missing(self):
+        scanner = LoginPageScanner()
+
+        assert _feed(scanner, LOGIN_PAGE_MISSING_ELEMENTS_HTML.encode('utf-8'), 16) is False
+        assert scanner.text == LOGIN_PAGE_MISSING_ELEMENTS_HTML
+
+    def test_scanner_decodes_with_declared_charset(self):
+        body = '<html><head><meta charset="euc-kr"></head><body><a>로그아웃</a></body></html>'.encode('euc-kr')
+        scanner = SessionPageScanner(logout_decides=True)
+
+        assert _feed(scanner, body, 3) is True
+        assert '로그아웃' in scanner.text
+
+    @pytest.mark.parametrize("body, logout_decides, stopped", [
+        (LOGIN_PAGE_HTML, False, True),
+        ('<a href="/logout">LogOut</a>' + 'x' * 5000, True, True),
+        ('<a href="/logout">LogOut</a>' + 'x' * 5000, False, False),
+        ('<p>nothing</p>', True, False),
+    ])
+    def test_session_scanner_agrees_with_classify_page(self, body, logout_decides, stopped):
+        scanner = SessionPageScanner(logout_decides=logout_decides)
+
+        assert _feed(scanner, body.encode('utf-8'), 5) is stopped
+        page, partial = HTMLParser.classify_page(body), HTMLParser.classify_page(scanner.text)
+        assert (partial.has_signin_form, partial.has_logout) == (page.has_signin_form, page.has_logout)
+
+    def test_text_after_the_last_tag_is_scanned_at_the_end_of_the_body(self):
+        scanner = SessionPageScanner(logout_decides=True)
+
+        assert _feed(scanner, '<p>세션</p> 로그아웃'.encode('utf-8'), 4) is True
+
+
+class TestLinearTimePatterns:
+    # Inputs that made the previous `[^>]*` / `(.+?)` patterns backtrack quadratically
+    ADVERSARIAL = {
+        'giant_tag': '<input ' + 'name="x" ' * 25000,
+        'unclosed_tags': '<input name="a" value="b" ' * 8000,
+        'alert_storm': '<script>' + "alert('\\u00" * 20000,
+        'value_storm': '<form id="signin-form" ' + 'value="k" data-id="public-key " ' * 6000,
+        'csrf_storm': 'name="_csrf" value="t" ' * 9000,
+    }
+
+    def test_attributes_are_found_in_any_order_and_quoting(self):
+        html = ("<form method=post ACTION='/next' id=\"f\">"
+                "<input value=\"1\" name='a'><input name=b value=2><input data-name=\"c\" name=\"d\"></form>")
+
+        assert [form['action'] for form in iter_tags(html, 'form')] == ['/next']
+        assert HTMLParser.extract_form_data(html) == ('/next', {'a': '1', 'b': '2'})
+
+    def test_login_page_values_in_reverse_attribute_order(self):
+        html = ('<form action="/sso/login.do" method="post" id="signin-form">'
+                '<input value="key" type="hidden" id="public-key"><input value="token" id="c_r_t"></form>')
+
+        assert HTMLParser.extract_login_page_data(html) == ('key', 'token', '/sso/login.do')
+
+    def test_csrf_header_meta_is_not_taken_for_the_token(self):
+        html = ('<meta name="_csrf_header" content="X-CSRF-TOKEN" />'
+                '<meta name="_csrf" content="meta-token" />')
+
+        assert HTMLParser.extract_csrf_token(html) == 'meta-token'
+        assert HTMLParser.extract_csrf_token('<meta name="_csrf_header" content="X-CSRF-TOKEN" />') is None
+
+    def test_extract_input_value(self):
+        html = '<input type="hidden" value="/card" name="originalurl"><input name="empty">'
+
+        assert HTMLParser.extract_input_value(html, 'originalurl') == '/card'
+        assert HTMLParser.extract_input_value(html, 'empty') is None
+        assert HTMLParser.extract_input_value(html, 'missing') is None
+
+    @pytest.mark.parametrize("html, expected", [
+        ("<script>alert('It\\'s locked');</script>", "It's locked"),
+        ('<script>alert("아이디를 확인하세요");</script>', "아이디를 확인하세요"),
+        ("<script>alert('\\u00');</script>", "\\u00"),
+    ])
+    def test_alert_messages_that_are_not_plain_escapes(self, html, expected):
+        assert HTMLParser.extract_error_message(html) == expected
+
+    @pytest.mark.parametrize("name", sorted(ADVERSARIAL))
+    def test_adversarial_input_is_parsed_in_linear_time(self, name):
+        html = self.ADVERSARIAL[name]
+        fetcher = StudentCardFetcher(session=MagicMock(), user_pw='pw')
+        fetcher._csrf_token = 'token'
+
+        started = time.perf_counter()
+        page = HTMLParser.classify_page(html)
+        page.form_action, page.form_data, page.js_redirect, page.error_message
+        HTMLParser.extract_login_page_data(html)
+        HTMLParser.extract_csrf_token(html)
+        fetcher._password_request(html)
+        fetcher._redirect_form_request(html)
+
+        # The quadratic patterns took several seconds (alert_storm: about a minute) on these inputs
+        assert time.perf_counter() - started < 1.0
@@ -0,0 +1,86 @@
+import base64
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from mju_univ_auth import SessionKeyPool, use_session_key_pool
+from mju_univ_auth.authenticator.sso_login_protocol import build_login_payload
+from mju_univ_auth.infrastructure.crypto import take_pooled_session_key
+
+
+@pytest.fixture
+def installed():
+    """Installs a filled pool for the test and always uninstalls it afterwards."""
+    pool = SessionKeyPool(size=3)
+    pool.fill()
+    previous = use_session_key_pool(pool)
+    yield pool
+    use_session_key_pool(previous)
+    pool.close()
+
+
+def test_fill_stops_at_size():
+    pool = SessionKeyPool(size=4)
+    pool.fill()
+
+    metrics = pool.metrics()
+    assert metrics.ready == 4
+    assert metrics.produced == 4
+
+
+def test_keys_are_handed_out_once_then_exhaust():
+    pool = SessionKeyPool(size=3)
+    pool.fill()
+
+    taken = [pool.take() for _ in range(4)]
+
+    assert taken[3] is None
+    assert len({key_info['keyStr'] for key_info in taken[:3]}) == 3
+    metrics = pool.metrics()
+    assert (metrics.taken, metrics.exhausted, metrics.ready, metrics.min_ready) == (3, 1, 0, 0)
+    assert metrics.hit_rate == pytest.approx(0.75)
+
+
+def test_background_thread_refills_taken_keys():
+    with SessionKeyPool(size=2) as pool:
+        deadline = time.monotonic() + 5
+        while pool.metrics().ready < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pool.take()
+        while pool.metrics().ready < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert pool.metrics().ready == 2
+        assert pool.metrics().produced == 3
+
+
+def test_resize_drops_surplus_keys():
+    pool = SessionKeyPool(size=4)
+    pool.fill()
+
+    pool.resize(2)
+
+    metrics = pool.metrics()
+    assert (metrics.size, metrics.ready) == (2, 2)
+    with pytest.raises(ValueError):
+        pool.resize(0)
+
+
+def test_login_payload_uses_installed_pool(installed):
+    payload = build_login_payload('60201234', 'pw', _public_key(), 'csrf')
+
+    assert payload['pw_enc'] and payload['encsymka']
+    assert installed.metrics().taken == 1
+
+
+def test_pooled_key_requires_matching_length(installed):
+    assert take_pooled_session_key(16) is None
+    assert installed.metrics().taken == 0
+
+
+def _public_key() -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=1024)
+    der = key.public_key().public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+    return base64.b64encode(der).decode('ascii')
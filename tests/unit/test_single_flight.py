@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mju_univ_auth.authenticator.standard_authenticator import StandardAuthenticator
+from mju_univ_auth.infrastructure.single_flight import AsyncSingleFlight, SingleFlight, login_flight_key
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow():
+        calls.append(1)
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(flights.do, 'key', slow) for _ in range(8)]
+        while flights.in_flight() == 0:
+            time.sleep(0.001)
+        time.sleep(0.05)  # let every worker join the flight
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flights.in_flight() == 0
+
+
+def test_errors_are_shared_and_results_not_cached():
+    flights = SingleFlight()
+
+    def failing():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        flights.do('key', failing)
+
+    assert flights.do('key', lambda: 1) == 1
+    assert flights.do('key', lambda: 2) == 2
+
+
+def test_on_done_receives_caller_count():
+    flights = AsyncSingleFlight()
+    seen = []
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        return 'session'
+
+    async def scenario():
+        return await asyncio.gather(*(
+            flights.do('key', slow, on_done=lambda result, callers: seen.append((result, callers)))
+            for _ in range(5)
+        ))
+
+    assert asyncio.run(scenario()) == ['session'] * 5
+    assert seen == [('session', 5)]
+
+
+def test_async_flight_survives_leader_cancellation():
+    flights = AsyncSingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return 'session'
+
+    async def scenario():
+        leader = asyncio.ensure_future(flights.do('key', slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.do('key', slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(scenario()) == 'session'
+
+
+def test_login_flight_key_separates_passwords():
+    assert login_flight_key('60200001', 'msi', 'a') == login_flight_key('60200001', 'msi', 'a')
+    assert login_flight_key('60200001', 'msi', 'a') != login_flight_key('60200001', 'msi', 'b')
+    assert 'a' not in login_flight_key('60200001', 'msi', 'a')
+
+
+def test_same_user_logins_are_coalesced(monkeypatch):
+    executed = []
+
+    def fake_execute_login(self, session, service):
+        executed.append(service)
+        time.sleep(0.05)
+        self._session = session
+
+    monkeypatch.setattr(StandardAuthenticator, '_execute_login', fake_execute_login)
+    auths = [StandardAuthenticator('60200001', 'pw') for _ in range(6)]
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda auth: auth.login('msi'), auths))
+
+    assert executed == ['msi']
+    assert all(result.success for result in results)
+    assert all(auth.session is results[0].data for auth in auths)
+
+
+def test_single_flight_can_be_disabled(monkeypatch):
+    executed = []
+
+    def fake_execute_login(self, session, service):
+        executed.append(service)
+        time.sleep(0.02)
+
+    monkeypatch.setattr(StandardAuthenticator, '_execute_login', fake_execute_login)
+    auths = [StandardAuthenticator('60200001', 'pw', single_flight=False) for _ in range(3)]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda auth: auth.login('msi'), auths))
+
+    assert len(executed) == 3
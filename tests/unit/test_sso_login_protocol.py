@@ -0,0 +1,247 @@
+import base64
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from mju_univ_auth.authenticator.sso_login_protocol import (
+    HttpResponse,
+    LoginState,
+    SSOLoginProtocol,
+    build_login_payload,
+)
+from mju_univ_auth.config import SERVICES
+from mju_univ_auth.exceptions import (
+    InvalidCredentialsError,
+    MjuUnivAuthError,
+    NetworkError,
+    ParsingError,
+    ServiceNotFoundError,
+    SessionExpiredError,
+)
+
+MSI = SERVICES['msi']
+LOGIN_ACTION_URL = 'https://sso.mju.ac.kr/sso/process/login.do'
+
+# Recorded responses (trimmed to the parts the protocol looks at)
+LOGIN_PAGE_HTML = """
+<html><body>
+    <form id="signin-form" action="/sso/process/login.do">
+        <input type="hidden" id="public-key" value="recorded-public-key" />
+        <input type="hidden" id="c_r_t" value="recorded-csrf" />
+    </form>
+</body></html>
+"""
+
+AUTO_SUBMIT_HTML = """
+<html><body onLoad="document.login.submit();">
+    <form name="login" action="{action}" method="post">
+        <input type="hidden" name="token" value="one-time-token">
+    </form>
+</body></html>
+"""
+
+JS_REDIRECT_HTML = "<script>location.href = '/index_Myiweb.jsp';</script>"
+
+FINAL_PAGE_HTML = "<html><body><a href='/logout'>로그아웃</a></body></html>"
+
+escaped_message = "아이디 또는 비밀번호가 일치하지 않습니다.".encode('unicode_escape').decode('latin-1')
+INVALID_CRED_HTML = f"""
+<html><body>
+    <form id="signin-form" action="/sso/process/login.do">
+        <input type="password" id="input-password" />
+    </form>
+    <script>alert('{escaped_message}');</script>
+</body></html>
+"""
+
+
+def stub_payload(public_key, csrf_token):
+    return {'public_key': public_key, 'c_r_t': csrf_token}
+
+
+@pytest.fixture
+def protocol():
+    return SSOLoginProtocol('60200001', 'pw', 'msi', payload_builder=stub_payload)
+
+
+def test_successful_login_with_auto_submit_form(protocol):
+    request = protocol.start()
+    assert (request.method, request.url) == ('GET', MSI.auth_url)
+
+    request = protocol.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+    assert (request.method, request.url) == ('POST', LOGIN_ACTION_URL)
+    assert request.data == {'public_key': 'recorded-public-key', 'c_r_t': 'recorded-csrf'}
+    assert request.headers['Referer'] == MSI.auth_url
+    assert protocol.state is LoginState.LOGIN_SUBMITTED
+
+    request = protocol.receive(HttpResponse(LOGIN_ACTION_URL, 200, AUTO_SUBMIT_HTML.format(action=MSI.final_url)))
+    assert (request.method, request.url) == ('POST', MSI.final_url)
+    assert request.data == {'token': 'one-time-token'}
+    assert request.headers['Origin'] == 'https://sso.mju.ac.kr'
+
+    assert protocol.receive(HttpResponse(MSI.final_url, 200, FINAL_PAGE_HTML)) is None
+    assert protocol.done
+
+
+def test_js_redirect_is_resolved_against_response_url(protocol):
+    protocol.start()
+    protocol.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+
+    request = protocol.receive(HttpResponse('https://msi.mju.ac.kr/sso/callback', 200, JS_REDIRECT_HTML))
+
+    assert (request.method, request.url) == ('GET', 'https://msi.mju.ac.kr/index_Myiweb.jsp')
+    assert protocol.state is LoginState.REDIRECTING
+
+
+def test_invalid_credentials(protocol):
+    protocol.start()
+    protocol.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+
+    with pytest.raises(InvalidCredentialsError, match='아이디 또는 비밀번호'):
+        protocol.receive(HttpResponse(LOGIN_ACTION_URL, 200, INVALID_CRED_HTML))
+    assert protocol.state is LoginState.FAILED
+
+
+def test_missing_public_key_is_parsing_error(protocol):
+    protocol.start()
+
+    with pytest.raises(ParsingError, match='public-key'):
+        protocol.receive(HttpResponse(MSI.auth_url, 200, '<html></html>'))
+
+
+def test_redirect_limit_then_validate(protocol):
+    protocol.start()
+    protocol.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+    loop_page = AUTO_SUBMIT_HTML.format(action='https://sso.mju.ac.kr/sso/loop')
+
+    for _ in range(3):
+        assert protocol.receive(HttpResponse('https://sso.mju.ac.kr/sso/loop', 200, loop_page)) is not None
+
+    with pytest.raises(MjuUnivAuthError, match='알 수 없는 오류'):
+        protocol.receive(HttpResponse('https://sso.mju.ac.kr/sso/loop', 200, loop_page))
+
+
+def test_unknown_service():
+    with pytest.raises(ServiceNotFoundError):
+        SSOLoginProtocol('60200001', 'pw', 'unknown')
+
+
+def test_protocol_misuse(protocol):
+    with pytest.raises(MjuUnivAuthError):
+        protocol.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+    protocol.start()
+    with pytest.raises(MjuUnivAuthError):
+        protocol.start()
+
+
+def test_default_payload_builder_encrypts_session_key():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    der = private_key.public_key().public_bytes(
+        serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+    payload = build_login_payload('60200001', 'pw', base64.b64encode(der).decode('ascii'), 'csrf')
+
+    assert payload['user_id'] == '60200001' and payload['c_r_t'] == 'csrf' and payload['pw'] == ''
+    key_str, timestamp = private_key.decrypt(
+        base64.b64decode(payload['encsymka']), padding.PKCS1v15()
+    ).decode('utf-8').split(',')
+    assert len(key_str) > 0 and timestamp.isdigit()
+    assert payload['pw_enc']
+
+
+@pytest.fixture
+def verifier():
+    return SSOLoginProtocol('60200001', 'pw', 'msi', payload_builder=stub_payload, verify_only=True)
+
+
+def test_verify_only_stops_at_login_response(verifier):
+    verifier.start()
+    request = verifier.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML, size=300))
+    assert request.follow_redirects is False
+
+    final = AUTO_SUBMIT_HTML.format(action=MSI.final_url)
+    assert verifier.receive(HttpResponse(LOGIN_ACTION_URL, 200, final, size=200)) is None
+
+    assert verifier.done
+    assert verifier.stats.round_trips == 2
+    assert verifier.stats.bytes_received == 500
+    assert verifier.stats.skipped_url == MSI.final_url
+
+
+def test_verify_only_rejects_invalid_credentials(verifier):
+    verifier.start()
+    verifier.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+
+    with pytest.raises(InvalidCredentialsError, match='아이디 또는 비밀번호'):
+        verifier.receive(HttpResponse(LOGIN_ACTION_URL, 200, INVALID_CRED_HTML))
+    assert verifier.stats.round_trips == 2
+
+
+def test_verify_only_follows_sso_redirect_but_not_service_redirect(verifier):
+    verifier.start()
+    verifier.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+
+    request = verifier.receive(HttpResponse(LOGIN_ACTION_URL, 302, '', location='/sso/process/next.do'))
+    assert (request.url, request.follow_redirects) == ('https://sso.mju.ac.kr/sso/process/next.do', False)
+
+    assert verifier.receive(HttpResponse(request.url, 302, '', location=MSI.final_url)) is None
+    assert verifier.done
+    assert verifier.stats.skipped_url == MSI.final_url
+
+
+def test_verify_only_does_not_accept_an_sso_redirect_loop(verifier):
+    verifier.start()
+    request = verifier.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+
+    url = LOGIN_ACTION_URL
+    for _ in range(3):  # max_redirects
+        request = verifier.receive(HttpResponse(url, 302, '', location='/sso/auth?bounce=1'))
+        url = request.url
+    with pytest.raises(NetworkError, match='리다이렉트가 너무 많습니다'):
+        verifier.receive(HttpResponse(url, 302, '', location='/sso/auth?bounce=1'))
+
+    assert not verifier.done
+    assert verifier.stats.skipped_url is None
+
+
+def test_verify_only_unknown_response(verifier):
+    verifier.start()
+    verifier.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+
+    with pytest.raises(MjuUnivAuthError, match='알 수 없는 오류'):
+        verifier.receive(HttpResponse(LOGIN_ACTION_URL, 200, '<html>maintenance</html>'))
+
+
+def test_sso_handoff_skips_credential_login():
+    protocol = SSOLoginProtocol('60200001', 'pw', 'lms', payload_builder=stub_payload, sso_handoff=True)
+    lms = SERVICES['lms']
+    protocol.start()
+
+    request = protocol.receive(HttpResponse(lms.auth_url, 200, AUTO_SUBMIT_HTML.format(action=lms.final_url)))
+
+    assert (request.method, request.url) == ('POST', lms.final_url)
+    assert protocol.handed_off
+    assert protocol.receive(HttpResponse(lms.final_url, 200, FINAL_PAGE_HTML)) is None
+    assert protocol.done and protocol.public_key is None
+
+
+def test_sso_handoff_falls_back_to_credentials_when_sso_session_expired():
+    protocol = SSOLoginProtocol('60200001', 'pw', 'msi', payload_builder=stub_payload, sso_handoff=True)
+    protocol.start()
+
+    request = protocol.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+
+    assert (request.method, request.url) == ('POST', LOGIN_ACTION_URL)
+    assert not protocol.handed_off
+
+
+def test_sso_handoff_without_login_fallback_reports_expired_sso_session():
+    protocol = SSOLoginProtocol('60200001', 'pw', 'msi', payload_builder=stub_payload,
+                                sso_handoff=True, login_fallback=False)
+    protocol.start()
+
+    with pytest.raises(SessionExpiredError):
+        protocol.receive(HttpResponse(MSI.auth_url, 200, LOGIN_PAGE_HTML))
+    assert protocol.state is LoginState.FAILED
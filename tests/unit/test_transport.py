@@ -0,0 +1,110 @@
+import socket
+
+import pytest
+
+from mju_univ_auth.authenticator.standard_authenticator import StandardAuthenticator
+from mju_univ_auth.config import POOL_CONFIG, StreamConfig
+from mju_univ_auth.infrastructure import transport
+from mju_univ_auth.infrastructure.transport import (
+    SharedHTTPAdapter,
+    configure_transport,
+    create_session,
+    get_shared_adapter,
+    read_until,
+)
+from mju_univ_auth.infrastructure.parser import HTMLParser, LoginPageScanner
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_adapter(monkeypatch):
+    """Each test starts with a fresh process-wide adapter."""
+    monkeypatch.setattr(transport, '_shared_adapter', None)
+
+
+def test_sessions_share_one_pool_but_not_cookies():
+    first = create_session()
+    second = create_session()
+
+    assert first.get_adapter('https://sso.mju.ac.kr') is second.get_adapter('https://msi.mju.ac.kr')
+    assert first.get_adapter('https://sso.mju.ac.kr') is get_shared_adapter()
+
+    first.cookies.set('JSESSIONID', 'user-a', domain='msi.mju.ac.kr')
+    assert 'JSESSIONID' not in second.cookies
+
+
+def test_closing_a_session_keeps_the_shared_pool_open():
+    adapter = get_shared_adapter()
+    pool = adapter.poolmanager.connection_from_url('https://sso.mju.ac.kr')
+
+    session = create_session()
+    session.close()
+
+    assert adapter.poolmanager.connection_from_url('https://sso.mju.ac.kr') is pool
+
+
+def test_unpooled_session_uses_private_adapter():
+    session = create_session(pooled=False)
+    assert not isinstance(session.get_adapter('https://sso.mju.ac.kr'), SharedHTTPAdapter)
+
+
+def test_configure_transport_applies_pool_and_keep_alive_settings():
+    adapter = configure_transport(pool_maxsize=64, pool_connections=4, keep_alive_idle=30)
+
+    assert adapter is get_shared_adapter()
+    assert adapter.pool_config.pool_maxsize == 64
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 64
+    socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    # 기본 설정은 변경되지 않아야 합니다.
+    assert POOL_CONFIG.pool_maxsize != 64
+
+
+def test_configure_transport_without_keep_alive():
+    adapter = configure_transport(keep_alive=False)
+    socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in socket_options
+
+
+def test_login_session_uses_shared_pool(monkeypatch):
+    captured = {}
+    monkeypatch.setattr(
+        StandardAuthenticator, '_execute_login',
+        lambda self, session, service: captured.setdefault('session', session),
+    )
+    auth = StandardAuthenticator(user_id='user', user_pw='pw')
+
+    result = auth.login('msi')
+
+    assert result.success
+    assert result.data is captured['session']
+    assert result.data.adapters['https://'] is get_shared_adapter()
+
+
+LONG_LOGIN_PAGE = (
+    '<form id="signin-form" action="/sso/login.do">'
+    '<input type="hidden" value="pk" id="public-key" /><input type="hidden" value="csrf" id="c_r_t" /></form>'
+    + '<p>terms</p>' * 20000
+).encode('utf-8')
+
+
+@pytest.mark.parametrize("drain_limit, drained", [(0, False), (len(LONG_LOGIN_PAGE), True)])
+def test_read_until_stops_once_the_scanner_is_done(requests_mock, drain_limit, drained):
+    requests_mock.get('https://sso.mju.ac.kr/login', content=LONG_LOGIN_PAGE,
+                      headers={'Content-Length': str(len(LONG_LOGIN_PAGE))})
+    response = create_session().get('https://sso.mju.ac.kr/login', stream=True)
+    scanner = LoginPageScanner()
+
+    received = read_until(response, scanner, StreamConfig(chunk_size=4096, drain_limit=drain_limit))
+
+    assert scanner.done and scanner.bytes_read == 4096
+    assert received == (len(LONG_LOGIN_PAGE) if drained else 4096)
+    assert HTMLParser.extract_login_page_data(scanner.text) == ('pk', 'csrf', '/sso/login.do')
+
+
+def test_read_until_reads_the_whole_body_when_the_scanner_never_finishes(requests_mock):
+    requests_mock.get('https://msi.mju.ac.kr/', content=b'<p>no form</p>' * 100)
+    response = create_session().get('https://msi.mju.ac.kr/', stream=True)
+    scanner = LoginPageScanner()
+
+    assert read_until(response, scanner, StreamConfig(chunk_size=64)) == 1400
+    assert not scanner.done and scanner.text == '<p>no form</p>' * 100